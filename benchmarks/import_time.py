@@ -0,0 +1,104 @@
+"""
+Measure how long it takes to import pyfrets entry points, using
+`python -X importtime`, and check that third-party dependencies are
+only imported by the modules which need them.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+# Entry points, with the modules they must not import.
+ENTRY_POINTS = {
+    "pyfrets": ["colorama", "mido", "pyfrets.chords", "pyfrets.notes"],
+    "pyfrets.archive": ["colorama", "mido"],
+    "pyfrets.batch": ["colorama", "mido"],
+    "pyfrets.cache": ["colorama", "mido"],
+    "pyfrets.catalogue": ["colorama", "mido"],
+    "pyfrets.chords": ["colorama", "mido"],
+    "pyfrets.diagrams": ["colorama", "mido"],
+    "pyfrets.fingering": ["colorama", "mido"],
+    "pyfrets.fretboards": ["colorama", "mido"],
+    "pyfrets.guitar": ["colorama", "mido"],
+    "pyfrets.scales": ["colorama", "mido"],
+    "pyfrets.server": ["colorama", "mido"],
+    "pyfrets.songs": ["colorama", "mido"],
+    "pyfrets.tabs": ["colorama", "mido"],
+    "pyfrets.tracks": ["colorama", "mido"],
+}
+
+
+def measure_import(module: str) -> dict[str, int]:
+    """
+    Import `module` in a fresh interpreter and return the cumulative
+    import time in microseconds of every module which was imported.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure import times")
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Keep the best of N measurements."
+    )
+    parser.add_argument("--baseline", help="Compare against a previous JSON result.")
+    parser.add_argument("--output", help="Write the results to a JSON file.")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.5,
+        help="Allowed relative slowdown compared to the baseline.",
+    )
+    options = parser.parse_args()
+
+    results: dict[str, int] = {}
+    errors = []
+    for module, forbidden in ENTRY_POINTS.items():
+        best: dict[str, int] = {}
+        for _ in range(options.repeat):
+            times = measure_import(module)
+            if not best or times[module] < best[module]:
+                best = times
+        results[module] = best[module]
+        print(f"{module:20} {best[module] / 1000:8.2f} ms")
+
+        for name in forbidden:
+            if name in best:
+                errors.append(f"{module} imports {name}")
+
+    if options.baseline:
+        with open(options.baseline) as fp:
+            baseline = json.load(fp)
+        for module, value in results.items():
+            if module in baseline and value > baseline[module] * (
+                1 + options.tolerance
+            ):
+                errors.append(
+                    f"{module} took {value} us, baseline is {baseline[module]} us"
+                )
+
+    if options.output:
+        with open(options.output, "w") as fp:
+            json.dump(results, fp, indent=2, sort_keys=True)
+
+    for error in errors:
+        print(f"ERROR: {error}", file=sys.stderr)
+    if errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,622 @@
+"""
+Run the pyfrets benchmarks, record throughput and peak memory usage to
+JSON and compare them against a stored baseline.
+
+Throughputs are compared relative to a calibration workload run in the
+same process, so that a baseline can be compared on another host with
+the same interpreter and platform.
+"""
+
+import argparse
+import concurrent.futures
+import json
+import os
+import pickle
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from fractions import Fraction
+from typing import Any, Callable
+
+from pyfrets import fingering
+from pyfrets.archive import Archive, write_archive
+from pyfrets.catalogue import STATE_SUFFIX, write_catalogue
+from pyfrets.chords import (
+    CHORD_QUALITIES,
+    chord_name_from_roman,
+    chord_name_to_description,
+    chord_name_to_note_names,
+    chord_name_to_pitches,
+    parse_progression,
+)
+from pyfrets.guitar import Cell, Fretboard, Orientation
+from pyfrets.notes import KEYS, key_name_to_note_names, key_name_to_pitches
+from pyfrets.scales import chord_name_to_scale_names
+from pyfrets.songs import Song, SongLibrary, build_index, dump_song, strum_song
+from pyfrets.tabs import read_tab, write_tab
+from pyfrets.tracks import Track
+
+# A benchmark performs its setup and returns a function which runs the
+# workload once and returns the number of operations performed.
+Benchmark = Callable[[float], Callable[[], int]]
+
+# Chord progressions, in roman notation.
+PROGRESSIONS = [
+    "I vi IV V",
+    "I V vi IV",
+    "ii7 V7 Imaj7 Imaj7",
+    "I7 IV7 I7 I7 IV7 IV7 I7 I7 V7 IV7 I7 V7",
+    "I IV I I7 IV IV7 I I7 V IV I V7",
+    "i/III VII6 VImaj7 V7b9 i VII#dim7 IIdim7 Vaug7 i VII6 VImaj7 V7b9 i iv7 i",
+    "I I V V V7 V7 I I IV IV I I V V7 I I I7 I7 IV IVmaj7/iii ii7 IV/I V7 V7 I I",
+    "i VII III VII i i i i i VII III VII IV IV V/iv V/iv",
+    "I ii iii IV V vi viidim",
+]
+
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(func: Benchmark) -> Benchmark:
+    BENCHMARKS[func.__name__] = func
+    return func
+
+
+def resolve_progressions(key: str) -> list[tuple[list[str], list[str]]]:
+    """
+    Return the roman numerals and chord names of the progressions which
+    can be played in `key`.
+    """
+    progressions = []
+    for progression in PROGRESSIONS:
+        romans = progression.split()
+        try:
+            chords = [chord_name_from_roman(roman, key) for roman in romans]
+            for chord in chords:
+                chord_name_to_pitches(chord)
+        except ValueError:
+            # Some progressions need double accidentals in remote keys.
+            continue
+        progressions.append((romans, chords))
+    return progressions
+
+
+def make_scale_boards() -> list[Fretboard]:
+    boards = []
+    for major, minor in KEYS:
+        board = Fretboard()
+        pitches = [p % 12 for p in key_name_to_pitches(major)]
+        names = key_name_to_note_names(major)
+        for pos, pitch in board.walk():
+            if pitch % 12 in pitches:
+                idx = pitches.index(pitch % 12)
+                board.set(pos, Cell(color="red" if idx else "black", text=names[idx]))
+        boards.append(board)
+    return boards
+
+
+@benchmark
+def lead_sheets(size: float) -> Callable[[], int]:
+    """
+    Resolve a corpus of lead sheets in every key and compute their pitches.
+    """
+    sheets = [
+        (key, romans)
+        for pair in KEYS
+        for key in pair
+        for romans, chords in resolve_progressions(key)
+    ] * max(1, round(10 * size))
+
+    def run() -> int:
+        count = 0
+        for key, romans in sheets:
+            for roman in romans:
+                chord_name_to_pitches(chord_name_from_roman(roman, key))
+                count += 1
+        return count
+
+    return run
+
+
+@benchmark
+def chord_chart(size: float) -> Callable[[], int]:
+    """
+    Parse a chord chart of 100,000 chords with bars, repeats and sections.
+    """
+    lines: list[str] = []
+    count = 0
+    while count < 100000 * size:
+        progression = PROGRESSIONS[len(lines) % len(PROGRESSIONS)].split()
+        bars = " | ".join(
+            " ".join(progression[i : i + 2]) for i in range(0, len(progression), 2)
+        )
+        lines.append(f"[part {len(lines)}] |: {bars} :|")
+        count += len(progression)
+    chart = "\n".join(lines)
+
+    def run() -> int:
+        parse_progression.cache_clear()
+        parse_progression(chart, roman=True)
+        return count
+
+    return run
+
+
+@benchmark
+def keys_and_chords(size: float) -> Callable[[], int]:
+    """
+    Spell all keys, then every chord quality on every note of every key.
+    """
+    keys = [key for pair in KEYS for key in pair]
+    repeat = max(1, round(size))
+
+    def run() -> int:
+        count = 0
+        for _ in range(repeat):
+            for key in keys:
+                for root in key_name_to_note_names(key):
+                    for notation in CHORD_QUALITIES:
+                        chord_name_to_note_names(root + notation)
+                        count += 1
+        return count
+
+    return run
+
+
+@benchmark
+def fingering_song(size: float) -> Callable[[], int]:
+    """
+    Find the fingering of a 1,000-chord song, starting from empty caches.
+    """
+    chords = [
+        chord
+        for romans, progression in resolve_progressions("G")
+        for chord in progression
+    ]
+    song = (chords * 1000)[: max(1, round(1000 * size))]
+
+    def run() -> int:
+        fingering.chord_name_to_voicings.cache_clear()
+        fingering._find_voicings.cache_clear()
+        fingering._transition_costs.cache_clear()
+        fingering.chord_names_to_voicings(song)
+        return len(song)
+
+    return run
+
+
+@benchmark
+def render_ansi(size: float) -> Callable[[], int]:
+    """
+    Render 10,000 fretboards to ANSI text.
+    """
+    boards = make_scale_boards()
+    count = max(1, round(10000 * size))
+
+    def run() -> int:
+        for i in range(count):
+            boards[i % len(boards)].dump_ansi(orientation=Orientation.LANDSCAPE)
+        return count
+
+    return run
+
+
+@benchmark
+def render_svg(size: float) -> Callable[[], int]:
+    """
+    Render 10,000 fretboards to SVG.
+    """
+    boards = make_scale_boards()
+    count = max(1, round(10000 * size))
+
+    def run() -> int:
+        for i in range(count):
+            boards[i % len(boards)].dump_svg(orientation=Orientation.LANDSCAPE)
+        return count
+
+    return run
+
+
+@benchmark
+def stream_json(size: float) -> Callable[[], int]:
+    """
+    Stream 10,000 fretboards as JSON deltas and apply them to a fretboard.
+    """
+    boards = make_scale_boards()
+    count = max(1, round(10000 * size))
+
+    def run() -> int:
+        board = Fretboard.parse_json(boards[0].dump_json())
+        for i in range(1, count):
+            previous, current = boards[(i - 1) % len(boards)], boards[i % len(boards)]
+            board.apply_json_delta(current.dump_json_delta(previous))
+        return count
+
+    return run
+
+
+@benchmark
+def track_to_midi(size: float) -> Callable[[], int]:
+    """
+    Convert a track of 1,000,000 notes to MIDI.
+    """
+    track = Track(beats_per_minute=120)
+    chords = [chord_name_to_pitches(c) for c in ["C", "Am", "Dm7", "G7"]]
+    count = 0
+    while count < 1000000 * size:
+        pitches = [p + 48 for p in chords[(count // 4) % len(chords)]]
+        track.add_notes(pitches, duration=Fraction(1, 2))
+        count += len(pitches)
+
+    def run() -> int:
+        track.to_midi()
+        return count
+
+    return run
+
+
+def make_pickle_workload(size: float) -> list[Any]:
+    """
+    Return 100 tracks of about 1,000 notes and 1,000 fretboards.
+    """
+    song = Song(chord_pattern="I vi IV V", key="C", strum_pattern="D-DU-UDU")
+    tracks = [strum_song(song, repeat=14) for _ in range(max(1, round(100 * size)))]
+    boards = make_scale_boards()
+    return tracks + [boards[i % len(boards)] for i in range(round(1000 * size))]
+
+
+@benchmark
+def pickle_objects(size: float) -> Callable[[], int]:
+    """
+    Pickle 100 tracks and 1,000 fretboards for a process pool and load
+    them back, with out-of-band buffers.
+    """
+    objects = make_pickle_workload(size)
+
+    def run() -> int:
+        buffers: list[pickle.PickleBuffer] = []
+        data = pickle.dumps(objects, protocol=5, buffer_callback=buffers.append)
+        pickle.loads(data, buffers=buffers)
+        return len(objects)
+
+    return run
+
+
+@benchmark
+def pickle_objects_state(size: float) -> Callable[[], int]:
+    """
+    Pickle the same objects as `pickle_objects` as their attributes, the
+    way they were pickled before they reduced to columns.
+    """
+    objects = make_pickle_workload(size)
+
+    def run() -> int:
+        data = pickle.dumps([(type(obj), obj.__dict__) for obj in objects], protocol=5)
+        for cls, state in pickle.loads(data):
+            obj = cls.__new__(cls)
+            obj.__dict__.update(state)
+        return len(objects)
+
+    return run
+
+
+@benchmark
+def song_library(size: float) -> Callable[[], int]:
+    """
+    Open 1,000 songs by name from a library of 50,000 songs.
+    """
+    keys = [key for pair in KEYS for key in pair]
+    count = max(1, round(50000 * size))
+    # The directory is removed once the benchmark is garbage collected.
+    tmpdir = tempfile.TemporaryDirectory()
+    path = os.path.join(tmpdir.name, "songs.jsonl")
+    with open(path, "w") as fp:
+        for idx in range(count):
+            song = Song(
+                chord_pattern=PROGRESSIONS[idx % len(PROGRESSIONS)],
+                key=keys[idx % len(keys)],
+                name=f"song-{idx}",
+            )
+            fp.write(dump_song(song) + "\n")
+    build_index(path)
+    names = [f"song-{idx}" for idx in random.Random(0).choices(range(count), k=1000)]
+
+    def run() -> int:
+        assert tmpdir
+        with SongLibrary(path) as library:
+            for name in names:
+                library[name]
+        return len(names)
+
+    return run
+
+
+@benchmark
+def archive_scan(size: float) -> Callable[[], int]:
+    """
+    Scan the pitches of 1,000,000 notes in an archive of 1,000 tracks, then
+    load 100 tracks at random.
+    """
+    song = Song(chord_pattern="I vi IV V", key="C", strum_pattern="D-DU-UDU")
+    track = strum_song(song, repeat=max(1, round(1000 * size / 72)))
+    count = 1000
+    # The directory is removed once the benchmark is garbage collected.
+    tmpdir = tempfile.TemporaryDirectory()
+    path = os.path.join(tmpdir.name, "tracks.pyfa")
+    write_archive(path, [track] * count)
+    indices = random.Random(0).choices(range(count), k=100)
+
+    def run() -> int:
+        assert tmpdir
+        notes = 0
+        with Archive(path) as archive:
+            for archived in archive:
+                notes += len(archived.pitches)
+                sum(archived.pitches)
+            for idx in indices:
+                archive[idx].to_track()
+        return notes
+
+    return run
+
+
+@benchmark
+def tab_file(size: float) -> Callable[[], int]:
+    """
+    Write a tab of 100,000 strummed chords to a file and read it back.
+    """
+    song = Song(
+        chord_pattern=" ".join(
+            " ".join(romans) for romans, chords in resolve_progressions("G")
+        ),
+        key="G",
+        name="tab",
+        strum_pattern="D-DU-UDU",
+    )
+    chords = len(strum_song(song)._chords)
+    track = strum_song(song, repeat=max(1, round(100000 * size / chords)))
+    # The directory is removed once the benchmark is garbage collected.
+    tmpdir = tempfile.TemporaryDirectory()
+    path = os.path.join(tmpdir.name, "song.tab")
+
+    def run() -> int:
+        assert tmpdir
+        with open(path, "w") as fp:
+            write_tab(track, fp)
+        with open(path) as fp:
+            return len(read_tab(fp)._chords)
+
+    return run
+
+
+@benchmark
+def catalogue_export(size: float) -> Callable[[], int]:
+    """
+    Write the catalogue of every chord to a JSON-lines file, in the current
+    process so that the measure does not depend on the number of CPUs.
+    """
+    repeat = max(1, round(size))
+    # The directory is removed once the benchmark is garbage collected.
+    tmpdir = tempfile.TemporaryDirectory()
+    path = os.path.join(tmpdir.name, "catalogue.jsonl")
+
+    def run() -> int:
+        assert tmpdir
+        count = 0
+        for _ in range(repeat):
+            # Without the state file, the whole catalogue is written again.
+            if os.path.exists(path + STATE_SUFFIX):
+                os.unlink(path + STATE_SUFFIX)
+            count += write_catalogue(path, jobs=1)
+        return count
+
+    return run
+
+
+def make_threaded_lookups(threads: int) -> Benchmark:
+    """
+    Return a benchmark looking chords, scales and keys up from `threads`
+    threads at once, to measure how lookups scale with threads.
+    """
+
+    def threaded_lookups(size: float) -> Callable[[], int]:
+        keys = [key for pair in KEYS for key in pair]
+        chords = [
+            root + notation
+            for key in keys
+            for root in key_name_to_note_names(key)
+            for notation in CHORD_QUALITIES
+        ]
+        repeat = max(1, round(size))
+
+        def lookup() -> int:
+            count = 0
+            for _ in range(repeat):
+                for key in keys:
+                    key_name_to_note_names(key)
+                    count += 1
+                for chord in chords:
+                    chord_name_to_description(chord)
+                    chord_name_to_scale_names(chord)
+                    count += 1
+            return count
+
+        def run() -> int:
+            with concurrent.futures.ThreadPoolExecutor(threads) as executor:
+                futures = [executor.submit(lookup) for _ in range(threads)]
+                return sum(future.result() for future in futures)
+
+        return run
+
+    return threaded_lookups
+
+
+for threads in (1, 4):
+    BENCHMARKS[f"threaded_lookups_{threads}"] = make_threaded_lookups(threads)
+
+
+def get_environment() -> dict[str, str]:
+    """
+    Return the interpreter and platform the benchmarks run on, which
+    results can only be compared within.
+    """
+    return {
+        "implementation": platform.python_implementation(),
+        "python": platform.python_version(),
+        "system": platform.system(),
+        "machine": platform.machine(),
+    }
+
+
+def calibrate(*, repeat: int) -> float:
+    """
+    Return the throughput of a fixed pure Python workload, which does not
+    depend on pyfrets, to normalise results by the speed of the host.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        counts: dict[str, int] = {}
+        for i in range(200000):
+            key = str(i % 997)
+            counts[key] = counts.get(key, 0) + 1
+        sorted(counts.items(), key=lambda item: (item[1], item[0]))
+        best = min(best, time.perf_counter() - start)
+    return 200000 / best
+
+
+def measure(benchmark: Benchmark, *, repeat: int, size: float) -> dict[str, float]:
+    """
+    Return the best throughput of `benchmark` and its peak memory usage.
+    """
+    run = benchmark(size)
+    best = float("inf")
+    ops = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ops = run()
+        best = min(best, time.perf_counter() - start)
+
+    # Memory is traced in a separate run, as tracing slows down execution.
+    tracemalloc.start()
+    try:
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {"ops": ops, "ops_per_sec": ops / best, "peak_memory": peak}
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    *,
+    scale: float,
+    tolerance: float,
+) -> list[str]:
+    """
+    Return the regressions of `results` compared to `baseline`, whose
+    throughputs are multiplied by `scale`, the relative speed of this host.
+    """
+    errors = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        expected = baseline[name]
+        expected_ops_per_sec = expected["ops_per_sec"] * scale
+        if result["ops_per_sec"] < expected_ops_per_sec * (1 - tolerance):
+            errors.append(
+                f"{name}: {result['ops_per_sec']:.1f} ops/s, "
+                f"baseline is {expected_ops_per_sec:.1f} ops/s on this host"
+            )
+        if result["peak_memory"] > expected["peak_memory"] * (1 + tolerance):
+            errors.append(
+                f"{name}: {result['peak_memory']:.0f} bytes peak, "
+                f"baseline is {expected['peak_memory']:.0f} bytes"
+            )
+    return errors
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run pyfrets benchmarks")
+    parser.add_argument(
+        "names", nargs="*", help="The benchmarks to run, by default all of them."
+    )
+    parser.add_argument("--baseline", help="Compare against a previous JSON result.")
+    parser.add_argument("--output", help="Write the results to a JSON file.")
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Keep the best of N measurements."
+    )
+    parser.add_argument(
+        "--size",
+        type=float,
+        default=1.0,
+        help="Scale the workloads, for instance 0.1 for a quick run.",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed relative regression compared to the baseline.",
+    )
+    options = parser.parse_args()
+
+    for name in options.names:
+        if name not in BENCHMARKS:
+            parser.error(f"Unknown benchmark {name}")
+
+    calibration = calibrate(repeat=options.repeat)
+    results = {}
+    for name in options.names or BENCHMARKS:
+        result = measure(BENCHMARKS[name], repeat=options.repeat, size=options.size)
+        results[name] = result
+        print(
+            f"{name:20} {result['ops_per_sec']:12.1f} ops/s "
+            f"{result['peak_memory'] / 1024:10.1f} KiB peak"
+        )
+
+    if options.output:
+        with open(options.output, "w") as fp:
+            json.dump(
+                {
+                    "calibration": calibration,
+                    "environment": get_environment(),
+                    "size": options.size,
+                    "results": results,
+                },
+                fp,
+                indent=2,
+                sort_keys=True,
+            )
+
+    if options.baseline:
+        with open(options.baseline) as fp:
+            baseline = json.load(fp)
+        if baseline["size"] != options.size:
+            parser.error(f"The baseline was recorded with --size {baseline['size']}")
+        # Throughputs and memory usage are not comparable across
+        # interpreters, and the calibration only accounts for the host speed.
+        if baseline.get("environment") != get_environment():
+            print(
+                f"WARNING: the baseline was recorded on {baseline.get('environment')}"
+                f", not compared on {get_environment()}",
+                file=sys.stderr,
+            )
+            return
+        errors = compare(
+            results,
+            baseline["results"],
+            scale=calibration / baseline["calibration"],
+            tolerance=options.tolerance,
+        )
+        for error in errors:
+            print(f"ERROR: {error}", file=sys.stderr)
+        if errors:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+import argparse
+
+from pyfrets.batch import load_manifest, render_batch
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Render songs, scales and chords")
+    parser.add_argument("manifest", help="The manifest describing what to render.")
+    parser.add_argument(
+        "--jobs", type=int, help="The number of processes, by default one per CPU."
+    )
+    parser.add_argument(
+        "--output-dir", default=".", help="The directory to write files to."
+    )
+    options = parser.parse_args()
+
+    result = render_batch(
+        load_manifest(options.manifest),
+        options.output_dir,
+        jobs=options.jobs,
+    )
+    print(f"Rendered {len(result.rendered)} items, skipped {len(result.skipped)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,42 +1,24 @@
 import argparse
 import sys
 
-from pyfrets.chords import (
-    chord_name_to_interval_names,
-    chord_name_to_note_names,
-    chord_name_to_pitches,
+from pyfrets.chords import chord_name_to_interval_names, chord_name_to_note_names
+from pyfrets.fretboards import (
+    DIATONIC_NOTE_FUNCTIONS,
+    chord_name_to_fretboard,
+    key_name_to_fretboard,
+    scale_name_to_fretboard,
 )
-from pyfrets.guitar import Cell, Fretboard, Orientation
+from pyfrets.guitar import TUNINGS, Fretboard, Orientation
 from pyfrets.notes import (
     key_name_to_note_names,
-    key_name_to_pitches,
+    key_root_name,
     prettify_interval,
     prettify_note,
 )
+from pyfrets.scales import SCALES, scale_name_to_note_names
 
-SCALE_NOTE_COLORS = ["red", "black", "green", "magenta", "blue", "black", "magenta"]
-DIATONIC_NOTE_FUNCTIONS = ["R", "2", "3", "4", "5", "6", "7"]
-PENTATONIC_NOTE_FUNCTIONS = ["R", "3", "4", "5", "7"]
-
-
-def plot_notes(
-    *,
-    basename: str,
-    note_colors: list[str],
-    note_texts: list[str],
-    note_values: list[int],
-    orientation: Orientation,
-) -> None:
-    # Place notes on fretboard.
-    board = Fretboard()
-    note_values = [i % 12 for i in note_values]
-    for pos, note_value in board.walk():
-        try:
-            idx = note_values.index(note_value % 12)
-        except ValueError:
-            continue
-        board.set(pos, Cell(color=note_colors[idx], text=note_texts[idx]))
 
+def plot_notes(*, basename: str, board: Fretboard, orientation: Orientation) -> None:
     # Display fretboard.
     sys.stdout.write(board.dump_ansi(orientation=orientation))
 
@@ -52,17 +34,31 @@ def main() -> None:
         action="store_true",
         help="Show note names instead of their function.",
     )
+    parser.add_argument(
+        "--capo", type=int, default=0, help="The fret on which to place a capo."
+    )
     parser.add_argument(
         "--portrait",
         action="store_true",
         help="Show the fretboard in portrait mode.",
     )
+    parser.add_argument(
+        "--tuning",
+        choices=sorted(TUNINGS.keys()),
+        default="standard",
+        help="The tuning of the strings.",
+    )
 
     subparsers = parser.add_subparsers(
         dest="command", required=True, help="The command to run."
     )
     subparser = subparsers.add_parser("scale", help="Show the notes of a scale.")
     subparser.add_argument("--pentatonic", action="store_true")
+    subparser.add_argument(
+        "--scale",
+        choices=sorted(SCALES.keys()),
+        help="Show a scale starting on the key's root instead of the key.",
+    )
     subparser.add_argument("key")
 
     subparser = subparsers.add_parser("chord", help="Show the notes of a chord.")
@@ -76,43 +72,55 @@ def main() -> None:
 
     # Determine notes.
     if options.command == "scale":
-        names = key_name_to_note_names(options.key)
-        pitches = key_name_to_pitches(options.key)
-        if options.pentatonic:
-            # Pentatonic scale.
-            note_functions = PENTATONIC_NOTE_FUNCTIONS
-            scale_type = "pentatonic"
-        else:
-            # Diatonic scale.
-            note_functions = DIATONIC_NOTE_FUNCTIONS
-            scale_type = "diatonic"
-
         if options.key[0] == options.key[0].upper():
             key_type = "major"
         else:
             key_type = "minor"
-        note_indexes = [DIATONIC_NOTE_FUNCTIONS.index(n) for n in note_functions]
-        note_names = [prettify_interval(names[i]) for i in note_indexes]
-        note_values = [pitches[i] for i in note_indexes]
+
+        if options.pentatonic or options.scale:
+            # Scale from the registry.
+            scale_name = options.scale or f"{key_type} pentatonic"
+            root_name = key_root_name(options.key)
+            intervals = SCALES[scale_name].intervals
+            note_functions = [
+                "R" if i == "1" else prettify_interval(i) for i in intervals
+            ]
+            note_names = [
+                prettify_note(n)
+                for n in scale_name_to_note_names(root_name, scale_name)
+            ]
+            board = scale_name_to_fretboard(
+                root_name,
+                scale_name,
+                note_names=options.note_names,
+                tuning=options.tuning,
+                capo=options.capo,
+            )
+            basename = f"{scale_name.replace(' ', '-')}-{root_name.lower()}"
+        else:
+            # Diatonic scale.
+            names = key_name_to_note_names(options.key)
+            note_functions = DIATONIC_NOTE_FUNCTIONS
+            note_names = [prettify_interval(name) for name in names]
+            board = key_name_to_fretboard(
+                options.key,
+                note_names=options.note_names,
+                tuning=options.tuning,
+                capo=options.capo,
+            )
+            basename = f"diatonic-{options.key.lower()}-{key_type}"
 
         # Display note names.
         for function, name in zip(note_functions, note_names):
             sys.stdout.write(f"{function} = {name}\n")
 
-        plot_notes(
-            basename=f"{scale_type}-{options.key.lower()}-{key_type}",
-            note_colors=[SCALE_NOTE_COLORS[i] for i in note_indexes],
-            note_texts=note_names if options.note_names else note_functions,
-            note_values=note_values,
-            orientation=orientation,
-        )
+        plot_notes(basename=basename, board=board, orientation=orientation)
 
     else:
         note_functions = [
             prettify_interval(i) for i in chord_name_to_interval_names(options.chord)
         ]
         note_names = [prettify_note(n) for n in chord_name_to_note_names(options.chord)]
-        note_values = chord_name_to_pitches(options.chord)
 
         # Display note names.
         for function, name in zip(note_functions, note_names):
@@ -120,9 +128,12 @@ def main() -> None:
 
         plot_notes(
             basename=f"chord-{options.chord}",
-            note_colors=[SCALE_NOTE_COLORS[i] for i in range(len(note_values))],
-            note_texts=note_names if options.note_names else note_functions,
-            note_values=note_values,
+            board=chord_name_to_fretboard(
+                options.chord,
+                note_names=options.note_names,
+                tuning=options.tuning,
+                capo=options.capo,
+            ),
             orientation=orientation,
         )
 
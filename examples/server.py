@@ -0,0 +1,34 @@
+import argparse
+import asyncio
+
+from pyfrets.server import Server
+
+
+async def serve(*, host: str, library: str, port: int, workers: int) -> None:
+    server = Server(library_path=library, max_workers=workers)
+    await server.start(host, port)
+    print(f"Serving on http://{host}:{server.port}/")
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve chords, scales and songs")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--library", help="The song library to serve songs from.")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--workers", type=int, default=4, help="The number of rendering processes."
+    )
+    options = parser.parse_args()
+
+    asyncio.run(
+        serve(
+            host=options.host,
+            library=options.library,
+            port=options.port,
+            workers=options.workers,
+        )
+    )
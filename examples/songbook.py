@@ -0,0 +1,47 @@
+import argparse
+import html
+import os
+
+from pyfrets.diagrams import chord_names_to_chord_box_sheet
+from pyfrets.songs import load_songs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Write a songbook page showing the chords of each song"
+    )
+    parser.add_argument("library", help="The song library to read songs from.")
+    parser.add_argument(
+        "--output-dir", default=".", help="The directory to write files to."
+    )
+    options = parser.parse_args()
+
+    with open(options.library, "rb") as fp:
+        songs = [
+            (song.name, list(dict.fromkeys(song.chord_names)))
+            for song in load_songs(fp)
+        ]
+
+    # Every chord box is drawn once, in a sprite sheet shared by all songs.
+    sheet = chord_names_to_chord_box_sheet(
+        chord for name, chords in songs for chord in chords
+    )
+    with open(os.path.join(options.output_dir, "songbook.svg"), "w") as fp:
+        fp.write(sheet.svg)
+
+    with open(os.path.join(options.output_dir, "songbook.html"), "w") as fp:
+        fp.write("<!DOCTYPE html>\n<html><body>\n")
+        for name, chords in songs:
+            fp.write(f"<h2>{html.escape(name)}</h2>\n<p>\n")
+            for chord in chords:
+                fp.write(
+                    f'<svg width="92" height="94"><title>{html.escape(chord)}</title>'
+                    f'<use href="songbook.svg#{sheet.ids[chord]}"/></svg>\n'
+                )
+            fp.write("</p>\n")
+        fp.write("</body></html>\n")
+    print(f"Wrote {len(sheet.ids)} chords for {len(songs)} songs")
+
+
+if __name__ == "__main__":
+    main()
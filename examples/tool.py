@@ -1,6 +1,5 @@
 import argparse
-import dataclasses
-from fractions import Fraction
+import os
 from typing import Iterable
 
 import mido
@@ -8,8 +7,9 @@ import mido
 from pyfrets.chords import (
     chord_name_from_roman,
     chord_name_to_note_names,
-    chord_name_to_pitches,
 )
+from pyfrets.fretboards import song_to_animated_svg
+from pyfrets.guitar import Orientation
 from pyfrets.notes import (
     MAJOR_KEYS,
     MAJOR_SCALE_ROMAN,
@@ -20,15 +20,10 @@ from pyfrets.notes import (
     prettify_key,
     prettify_note,
 )
-from pyfrets.tracks import Track
+from pyfrets.songs import Song, SongLibrary, strum_song
+from pyfrets.tabs import write_tab
 
-
-@dataclasses.dataclass
-class Song:
-    chord_pattern: str
-    key: str
-    beats_per_minute: int = 120
-    strum_pattern: str = "D-D-D-D-"
+LIBRARY_PATH = os.path.join(os.path.dirname(__file__), "songs.jsonl")
 
 
 def print_key_chords(key: str, romans: Iterable[str]) -> None:
@@ -52,10 +47,8 @@ def print_key_chords(key: str, romans: Iterable[str]) -> None:
 
 
 def print_song_info(song: Song) -> None:
-    chord_pattern_roman = song.chord_pattern.split()
-    chord_pattern_name = [
-        chord_name_from_roman(c, song.key) for c in chord_pattern_roman
-    ]
+    chord_pattern_roman = song.romans
+    chord_pattern_name = song.chord_names
 
     # Print chord pattern.
     print_key_chords(song.key, set(chord_pattern_roman))
@@ -70,44 +63,20 @@ def print_song_info(song: Song) -> None:
     print()
 
 
-def strum_song(*, repeat: int, song: Song) -> Track:
-    track = Track(beats_per_minute=song.beats_per_minute)
-
-    chord_pattern_roman = song.chord_pattern.split()
-    chord_pattern_name = [
-        chord_name_from_roman(c, song.key) for c in chord_pattern_roman
-    ]
-
-    half_beat = Fraction(1, 2)
-    strum_events: list[list[Fraction]] = []
-    for chunk in song.strum_pattern.split("/"):
-        events = []
-        assert chunk[0] in ("D", "U"), "strum pattern chunk must start with a strum"
-        for strum in chunk:
-            if strum in ("D", "U"):
-                events.append(half_beat)
-            else:
-                assert strum == "-"
-                events[-1] += half_beat
-        strum_events.append(events)
-
-    strum_index = 0
-    for _ in range(repeat):
-        for chord_name in chord_pattern_name:
-            pitches = [p + 48 for p in chord_name_to_pitches(chord_name)]
-            for duration in strum_events[strum_index]:
-                track.add_notes(duration=duration, pitches=pitches)
-            strum_index = (strum_index + 1) % len(strum_events)
-
-    return track
-
-
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Play with notes")
     parser.add_argument("command", choices=["chords", "notes", "render"])
+    parser.add_argument(
+        "--library", default=LIBRARY_PATH, help="The song library to read songs from."
+    )
     parser.add_argument("--minor", action="store_true")
     parser.add_argument("--repeat", type=int, default=1)
     parser.add_argument("--song")
+    parser.add_argument(
+        "--voice-leading",
+        action="store_true",
+        help="Choose chord inversions to minimise motion between chords.",
+    )
     options = parser.parse_args()
 
     if options.command == "chords":
@@ -130,72 +99,24 @@ if __name__ == "__main__":
                 )
             )
     else:
-        songs = {
-            "50s": Song(
-                chord_pattern="I vi IV V",
-                key="C",
-            ),
-            "50-ways-to-leave-your-lover": Song(
-                chord_pattern="i/III VII6 VImaj7 V7b9 "
-                + "i VII#dim7 IIdim7 Vaug7 "
-                + "i VII6 VImaj7 V7b9 "
-                + "i iv7 i",
-                key="e",
-                strum_pattern="D---",
-            ),
-            "blueforyou": Song(
-                beats_per_minute=90,
-                chord_pattern="I7 IV7 I7 I7 " + "IV7 IV7 I7 I7 " + "V7 IV7 I7 V7",
-                key="D",
-            ),
-            "blues": Song(
-                chord_pattern="I7 I7 I7 I7 IV7 IV7 I7 I7 V7 IV7 I7 V7",
-                key="a",
-            ),
-            "blues-quick-change": Song(
-                chord_pattern="I7 IV7 I7 I7 IV7 IV7 I7 I7 V7 IV7 I7 V7",
-                key="a",
-            ),
-            "blues-slow-change": Song(
-                chord_pattern="I7 I7 I7 I7 IV7 IV7 I7 I7 V7 V7 I7 I7",
-                key="a",
-            ),
-            "blues7": Song(
-                chord_pattern="I IV I I7 IV IV7 I I7 V IV I V7",
-                key="a",
-                strum_pattern="D-DU-UD-/D-DU-UDU",
-            ),
-            "heyjude": Song(
-                beats_per_minute=150,
-                chord_pattern=(
-                    "I I V V V7 V7 I I IV IV I I V V7 I I "  # verse
-                    + "I7 I7 IV IVmaj7/iii ii7 IV/I V7 V7 I I"  # chorus
-                ),
-                key="F",
-                strum_pattern="D-D-D-DU",
-            ),
-            "key": Song(
-                chord_pattern="I ii iii IV V vi viidim",
-                key="A",
-            ),
-            "paintitblack": Song(
-                beats_per_minute=160,
-                chord_pattern="i VII III VII i i i i i VII III VII IV IV V/iv V/iv",
-                key="e",
-                strum_pattern="D-DU/DUD/U-UD/U-UD-",
-            ),
-            "pop": Song(
-                chord_pattern="I V vi IV",
-                key="C",
-            ),
-        }
-        assert options.song in songs, "Please specify a song with --song"
-        song = songs[options.song]
+        with SongLibrary(options.library) as library:
+            assert options.song in library, "Please specify a song with --song"
+            song = library[options.song]
 
         print_song_info(song)
-        track = strum_song(repeat=options.repeat, song=song)
+        track = strum_song(
+            song, repeat=options.repeat, voice_leading=options.voice_leading
+        )
 
         # Save to MIDI file.
         mid_file = mido.MidiFile()
         mid_file.tracks.append(track.to_midi())
         mid_file.save(options.song + ".mid")
+
+        # Save the chords to an animated SVG image.
+        with open(options.song + ".svg", "w") as fp:
+            fp.write(song_to_animated_svg(song, orientation=Orientation.LANDSCAPE))
+
+        # Save the strummed chords to a tab.
+        with open(options.song + ".tab", "w") as fp:
+            write_tab(track, fp)
@@ -1 +1,325 @@
+import importlib
+
+# Avoid importing `typing` at runtime, type checkers treat this as True.
+TYPE_CHECKING = False
+
 __version__ = "0.1.0"
+
+# Public names, imported from their module on first access.
+_LAZY_ATTRIBUTES = {
+    # archive
+    "Archive": "pyfrets.archive",
+    "ArchiveWriter": "pyfrets.archive",
+    "ArchivedTrack": "pyfrets.archive",
+    "write_archive": "pyfrets.archive",
+    # batch
+    "BatchResult": "pyfrets.batch",
+    "ChordItem": "pyfrets.batch",
+    "ScaleItem": "pyfrets.batch",
+    "SongItem": "pyfrets.batch",
+    "load_manifest": "pyfrets.batch",
+    "parse_manifest": "pyfrets.batch",
+    "render_batch": "pyfrets.batch",
+    # cache
+    "CacheStats": "pyfrets.cache",
+    "RenderCache": "pyfrets.cache",
+    "fretboard_key": "pyfrets.cache",
+    "song_key": "pyfrets.cache",
+    "track_key": "pyfrets.cache",
+    # catalogue
+    "iter_catalogue": "pyfrets.catalogue",
+    "write_catalogue": "pyfrets.catalogue",
+    # chords
+    "CHORD_QUALITIES": "pyfrets.chords",
+    "Progression": "pyfrets.chords",
+    "Quality": "pyfrets.chords",
+    "Repeat": "pyfrets.chords",
+    "chord_name_from_roman": "pyfrets.chords",
+    "chord_name_to_description": "pyfrets.chords",
+    "chord_name_to_interval_names": "pyfrets.chords",
+    "chord_name_to_note_names": "pyfrets.chords",
+    "chord_name_to_pitches": "pyfrets.chords",
+    "chord_names_to_voice_leading": "pyfrets.chords",
+    "parse_progression": "pyfrets.chords",
+    "register_chord_quality": "pyfrets.chords",
+    # diagrams
+    "SpriteSheet": "pyfrets.diagrams",
+    "chord_names_to_chord_box_sheet": "pyfrets.diagrams",
+    "dump_chord_box": "pyfrets.diagrams",
+    "dump_chord_box_sheet": "pyfrets.diagrams",
+    # fingering
+    "Voicing": "pyfrets.fingering",
+    "chord_name_to_voicings": "pyfrets.fingering",
+    "chord_names_to_voicings": "pyfrets.fingering",
+    # fretboards
+    "chord_name_to_fretboard": "pyfrets.fretboards",
+    "chord_names_to_animated_svg": "pyfrets.fretboards",
+    "key_name_to_fretboard": "pyfrets.fretboards",
+    "notes_to_fretboard": "pyfrets.fretboards",
+    "scale_name_to_fretboard": "pyfrets.fretboards",
+    "song_to_animated_svg": "pyfrets.fretboards",
+    # guitar
+    "Cell": "pyfrets.guitar",
+    "Fretboard": "pyfrets.guitar",
+    "Orientation": "pyfrets.guitar",
+    "dump_animated_svg": "pyfrets.guitar",
+    "register_tuning": "pyfrets.guitar",
+    "TUNINGS": "pyfrets.guitar",
+    "Tuning": "pyfrets.guitar",
+    # instrumentation
+    "FunctionStats": "pyfrets.instrumentation",
+    "collect_stats": "pyfrets.instrumentation",
+    "enable_stats": "pyfrets.instrumentation",
+    "stats": "pyfrets.instrumentation",
+    # notes
+    "KEYS": "pyfrets.notes",
+    "Key": "pyfrets.notes",
+    "Note": "pyfrets.notes",
+    "SpelledNote": "pyfrets.notes",
+    "key_name_to_chord_names": "pyfrets.notes",
+    "key_name_to_note_names": "pyfrets.notes",
+    "key_name_to_pitches": "pyfrets.notes",
+    "key_name_to_signature": "pyfrets.notes",
+    "note_name_from_roman": "pyfrets.notes",
+    "note_name_to_pitch": "pyfrets.notes",
+    "prettify_chord": "pyfrets.notes",
+    "prettify_interval": "pyfrets.notes",
+    "prettify_key": "pyfrets.notes",
+    "prettify_note": "pyfrets.notes",
+    # scales
+    "SCALES": "pyfrets.scales",
+    "Scale": "pyfrets.scales",
+    "chord_name_to_scale_names": "pyfrets.scales",
+    "scale_name_to_chord_names": "pyfrets.scales",
+    "scale_name_to_note_names": "pyfrets.scales",
+    "register_scale": "pyfrets.scales",
+    "scale_name_to_pitches": "pyfrets.scales",
+    # server
+    "Server": "pyfrets.server",
+    # songs
+    "Section": "pyfrets.songs",
+    "Song": "pyfrets.songs",
+    "SongLibrary": "pyfrets.songs",
+    "build_index": "pyfrets.songs",
+    "dump_song": "pyfrets.songs",
+    "load_songs": "pyfrets.songs",
+    "parse_song": "pyfrets.songs",
+    "strum_song": "pyfrets.songs",
+    # tabs
+    "read_tab": "pyfrets.tabs",
+    "write_tab": "pyfrets.tabs",
+    # tracks
+    "Track": "pyfrets.tracks",
+    "TrackNote": "pyfrets.tracks",
+}
+
+__all__ = [
+    "Archive",
+    "ArchiveWriter",
+    "ArchivedTrack",
+    "BatchResult",
+    "CHORD_QUALITIES",
+    "CacheStats",
+    "Cell",
+    "ChordItem",
+    "Fretboard",
+    "FunctionStats",
+    "KEYS",
+    "Key",
+    "Note",
+    "Orientation",
+    "Progression",
+    "Quality",
+    "RenderCache",
+    "Repeat",
+    "SCALES",
+    "Scale",
+    "ScaleItem",
+    "Section",
+    "Server",
+    "Song",
+    "SongItem",
+    "SongLibrary",
+    "SpelledNote",
+    "SpriteSheet",
+    "TUNINGS",
+    "Track",
+    "TrackNote",
+    "Tuning",
+    "Voicing",
+    "build_index",
+    "chord_name_from_roman",
+    "chord_name_to_description",
+    "chord_name_to_fretboard",
+    "chord_name_to_interval_names",
+    "chord_name_to_note_names",
+    "chord_name_to_pitches",
+    "chord_name_to_scale_names",
+    "chord_name_to_voicings",
+    "chord_names_to_animated_svg",
+    "chord_names_to_chord_box_sheet",
+    "chord_names_to_voice_leading",
+    "chord_names_to_voicings",
+    "collect_stats",
+    "dump_animated_svg",
+    "dump_chord_box",
+    "dump_chord_box_sheet",
+    "dump_song",
+    "enable_stats",
+    "fretboard_key",
+    "iter_catalogue",
+    "key_name_to_chord_names",
+    "key_name_to_fretboard",
+    "key_name_to_note_names",
+    "key_name_to_pitches",
+    "key_name_to_signature",
+    "load_manifest",
+    "load_songs",
+    "note_name_from_roman",
+    "note_name_to_pitch",
+    "notes_to_fretboard",
+    "parse_manifest",
+    "parse_progression",
+    "parse_song",
+    "prettify_chord",
+    "prettify_interval",
+    "prettify_key",
+    "prettify_note",
+    "read_tab",
+    "register_chord_quality",
+    "register_scale",
+    "register_tuning",
+    "render_batch",
+    "scale_name_to_chord_names",
+    "scale_name_to_fretboard",
+    "scale_name_to_note_names",
+    "scale_name_to_pitches",
+    "song_key",
+    "song_to_animated_svg",
+    "stats",
+    "strum_song",
+    "track_key",
+    "write_archive",
+    "write_catalogue",
+    "write_tab",
+]
+
+if TYPE_CHECKING:
+    from pyfrets.archive import Archive, ArchivedTrack, ArchiveWriter, write_archive
+    from pyfrets.batch import (
+        BatchResult,
+        ChordItem,
+        ScaleItem,
+        SongItem,
+        load_manifest,
+        parse_manifest,
+        render_batch,
+    )
+    from pyfrets.cache import (
+        CacheStats,
+        RenderCache,
+        fretboard_key,
+        song_key,
+        track_key,
+    )
+    from pyfrets.catalogue import iter_catalogue, write_catalogue
+    from pyfrets.chords import (
+        CHORD_QUALITIES,
+        Progression,
+        Quality,
+        Repeat,
+        chord_name_from_roman,
+        chord_name_to_description,
+        chord_name_to_interval_names,
+        chord_name_to_note_names,
+        chord_name_to_pitches,
+        chord_names_to_voice_leading,
+        parse_progression,
+        register_chord_quality,
+    )
+    from pyfrets.diagrams import (
+        SpriteSheet,
+        chord_names_to_chord_box_sheet,
+        dump_chord_box,
+        dump_chord_box_sheet,
+    )
+    from pyfrets.fingering import (
+        Voicing,
+        chord_name_to_voicings,
+        chord_names_to_voicings,
+    )
+    from pyfrets.fretboards import (
+        chord_name_to_fretboard,
+        chord_names_to_animated_svg,
+        key_name_to_fretboard,
+        notes_to_fretboard,
+        scale_name_to_fretboard,
+        song_to_animated_svg,
+    )
+    from pyfrets.guitar import (
+        TUNINGS,
+        Cell,
+        Fretboard,
+        Orientation,
+        Tuning,
+        dump_animated_svg,
+        register_tuning,
+    )
+    from pyfrets.instrumentation import (
+        FunctionStats,
+        collect_stats,
+        enable_stats,
+        stats,
+    )
+    from pyfrets.notes import (
+        KEYS,
+        Key,
+        Note,
+        SpelledNote,
+        key_name_to_chord_names,
+        key_name_to_note_names,
+        key_name_to_pitches,
+        key_name_to_signature,
+        note_name_from_roman,
+        note_name_to_pitch,
+        prettify_chord,
+        prettify_interval,
+        prettify_key,
+        prettify_note,
+    )
+    from pyfrets.scales import (
+        SCALES,
+        Scale,
+        chord_name_to_scale_names,
+        register_scale,
+        scale_name_to_chord_names,
+        scale_name_to_note_names,
+        scale_name_to_pitches,
+    )
+    from pyfrets.server import Server
+    from pyfrets.songs import (
+        Section,
+        Song,
+        SongLibrary,
+        build_index,
+        dump_song,
+        load_songs,
+        parse_song,
+        strum_song,
+    )
+    from pyfrets.tabs import read_tab, write_tab
+    from pyfrets.tracks import Track, TrackNote
+
+
+def __getattr__(name: str) -> object:
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,69 @@
+"""
+Build the prebuilt theory tables loaded by `pyfrets.notes` and `pyfrets.chords`.
+
+Run `python -m pyfrets._build_tables` after changing keys or chord qualities.
+"""
+
+import os
+
+from pyfrets.chords import (
+    CHORD_QUALITIES,
+    ChordEntry,
+    _compute_chord,
+    _get_chord_inputs,
+)
+from pyfrets.notes import KEYS, KeyEntry, _compute_key, _get_key_inputs
+
+TABLES_PATH = os.path.join(os.path.dirname(__file__), "_tables.py")
+
+
+def build_key_table() -> dict[str, KeyEntry]:
+    return {name: _compute_key(name) for pair in KEYS for name in pair}
+
+
+def build_chord_table() -> dict[str, ChordEntry]:
+    roots = sorted(
+        set(name for entry in build_key_table().values() for name in entry[0])
+    )
+    return {
+        root + notation: _compute_chord(root + notation)
+        for root in roots
+        for notation in CHORD_QUALITIES
+    }
+
+
+def render_tables() -> str:
+    """
+    Return the source code of the `_tables` module.
+    """
+    lines = [
+        '"""',
+        "Prebuilt theory tables, generated by `python -m pyfrets._build_tables`.",
+        "",
+        "Do not edit by hand.",
+        '"""',
+        "",
+        f"KEY_INPUTS = {_get_key_inputs()!r}",
+        "",
+        "KEYS: dict[str, tuple[tuple[str, ...], tuple[int, ...], int, tuple[str, ...]]]"
+        " = {",
+    ]
+    for name, key_entry in build_key_table().items():
+        lines.append(f"    {name!r}: {key_entry!r},")
+    lines += [
+        "}",
+        "",
+        f"CHORD_INPUTS = {_get_chord_inputs()!r}",
+        "",
+        "CHORDS: dict[str, tuple[tuple[str, ...], tuple[int, ...], tuple[str, ...]]]"
+        " = {",
+    ]
+    for name, chord_entry in build_chord_table().items():
+        lines.append(f"    {name!r}: {chord_entry!r},")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    with open(TABLES_PATH, "w") as fp:
+        fp.write(render_tables())
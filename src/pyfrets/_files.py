@@ -0,0 +1,27 @@
+import os
+import tempfile
+
+
+def create_temporary(path: str) -> tuple[int, str]:
+    """
+    Create a temporary file next to `path`, to be moved to `path` once it
+    is written, and return its descriptor and path.
+
+    Temporary files have unique names, so that concurrent writers of the
+    same path do not overwrite each other's file.
+    """
+    return tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=".", suffix=".tmp")
+
+
+def write_atomic(path: str, data: bytes) -> None:
+    """
+    Write `data` to `path` so that readers never see a partial file.
+    """
+    fd, tmp_path = create_temporary(path)
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            fp.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
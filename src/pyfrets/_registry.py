@@ -0,0 +1,124 @@
+import threading
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    TypeVar,
+    overload,
+)
+
+T = TypeVar("T")
+
+
+class Snapshot(Mapping[str, T]):
+    """
+    An immutable version of the entries of a registry.
+
+    Snapshots compare and hash by identity, so that data derived from the
+    entries can be memoized per snapshot.
+    """
+
+    __slots__ = ("_entries",)
+
+    def __init__(self, entries: dict[str, T]) -> None:
+        self._entries = entries
+
+    def __eq__(self, other: object) -> bool:
+        return self is other
+
+    def __getitem__(self, name: str) -> T:
+        return self._entries[name]
+
+    def __hash__(self) -> int:
+        return id(self)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"Snapshot({self._entries!r})"
+
+
+class Registry(Mapping[str, T]):
+    """
+    A mapping of named entries which can be read from any thread.
+
+    Readers use the current snapshot without locking. Entries are added by
+    publishing a new snapshot holding a copy of the entries, and are never
+    replaced or removed, so data derived from a snapshot stays valid for
+    later snapshots.
+    """
+
+    def __init__(self, entries: Iterable[T], key: Callable[[T], str]) -> None:
+        self._key = key
+        self._lock = threading.Lock()
+        self._snapshot = Snapshot({key(entry): entry for entry in entries})
+
+    def __getitem__(self, name: str) -> T:
+        return self._snapshot[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._snapshot)
+
+    def __len__(self) -> int:
+        return len(self._snapshot)
+
+    def __repr__(self) -> str:
+        return f"Registry({dict(self._snapshot)!r})"
+
+    def register(self, entry: T) -> None:
+        """
+        Add `entry` to the registry.
+        """
+        name = self._key(entry)
+        with self._lock:
+            if name in self._snapshot:
+                raise ValueError("%s is already registered" % name)
+            entries = dict(self._snapshot)
+            entries[name] = entry
+            self._snapshot = Snapshot(entries)
+
+    def snapshot(self) -> Snapshot[T]:
+        """
+        Return the current entries of the registry.
+        """
+        return self._snapshot
+
+
+class cached_property(Generic[T]):
+    """
+    A property computed once per instance, which unlike
+    `functools.cached_property` does not lock on Python < 3.12.
+
+    Threads racing to compute the value may each call the getter, but all
+    of them return the first value stored.
+    """
+
+    def __init__(self, func: Callable[[Any], T]) -> None:
+        self.func = func
+        self.name: Optional[str] = None
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(
+        self, instance: None, owner: Optional[type] = None
+    ) -> "cached_property[T]": ...
+
+    @overload
+    def __get__(self, instance: object, owner: Optional[type] = None) -> T: ...
+
+    def __get__(self, instance: Optional[object], owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        assert self.name is not None, "cached_property must be set on a class"
+        return instance.__dict__.setdefault(self.name, self.func(instance))
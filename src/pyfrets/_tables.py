@@ -0,0 +1,675 @@
+"""
+Prebuilt theory tables, generated by `python -m pyfrets._build_tables`.
+
+Do not edit by hand.
+"""
+
+KEY_INPUTS = ((('Cb', 'ab'), ('Gb', 'eb'), ('Db', 'bb'), ('Ab', 'f'), ('Eb', 'c'), ('Bb', 'g'), ('F', 'd'), ('C', 'a'), ('G', 'e'), ('D', 'b'), ('A', 'f#'), ('E', 'c#'), ('B', 'g#'), ('F#', 'd#'), ('C#', 'a#')), (0, 2, 4, 5, 7, 9, 11), ('I', 'ii', 'iii', 'IV', 'V', 'vi', 'viidim'), (0, 2, 3, 5, 7, 8, 10), ('i', 'iidim', 'III', 'iv', 'v', 'VI', 'VII'))
+
+KEYS: dict[str, tuple[tuple[str, ...], tuple[int, ...], int, tuple[str, ...]]] = {
+    'Cb': (('Cb', 'Db', 'Eb', 'Fb', 'Gb', 'Ab', 'Bb'), (11, 1, 3, 4, 6, 8, 10), -7, ('Cb', 'Dbm', 'Ebm', 'Fb', 'Gb', 'Abm', 'Bbdim')),
+    'ab': (('Ab', 'Bb', 'Cb', 'Db', 'Eb', 'Fb', 'Gb'), (8, 10, 11, 1, 3, 4, 6), -7, ('Abm', 'Bbdim', 'Cb', 'Dbm', 'Ebm', 'Fb', 'Gb')),
+    'Gb': (('Gb', 'Ab', 'Bb', 'Cb', 'Db', 'Eb', 'F'), (6, 8, 10, 11, 1, 3, 5), -6, ('Gb', 'Abm', 'Bbm', 'Cb', 'Db', 'Ebm', 'Fdim')),
+    'eb': (('Eb', 'F', 'Gb', 'Ab', 'Bb', 'Cb', 'Db'), (3, 5, 6, 8, 10, 11, 1), -6, ('Ebm', 'Fdim', 'Gb', 'Abm', 'Bbm', 'Cb', 'Db')),
+    'Db': (('Db', 'Eb', 'F', 'Gb', 'Ab', 'Bb', 'C'), (1, 3, 5, 6, 8, 10, 0), -5, ('Db', 'Ebm', 'Fm', 'Gb', 'Ab', 'Bbm', 'Cdim')),
+    'bb': (('Bb', 'C', 'Db', 'Eb', 'F', 'Gb', 'Ab'), (10, 0, 1, 3, 5, 6, 8), -5, ('Bbm', 'Cdim', 'Db', 'Ebm', 'Fm', 'Gb', 'Ab')),
+    'Ab': (('Ab', 'Bb', 'C', 'Db', 'Eb', 'F', 'G'), (8, 10, 0, 1, 3, 5, 7), -4, ('Ab', 'Bbm', 'Cm', 'Db', 'Eb', 'Fm', 'Gdim')),
+    'f': (('F', 'G', 'Ab', 'Bb', 'C', 'Db', 'Eb'), (5, 7, 8, 10, 0, 1, 3), -4, ('Fm', 'Gdim', 'Ab', 'Bbm', 'Cm', 'Db', 'Eb')),
+    'Eb': (('Eb', 'F', 'G', 'Ab', 'Bb', 'C', 'D'), (3, 5, 7, 8, 10, 0, 2), -3, ('Eb', 'Fm', 'Gm', 'Ab', 'Bb', 'Cm', 'Ddim')),
+    'c': (('C', 'D', 'Eb', 'F', 'G', 'Ab', 'Bb'), (0, 2, 3, 5, 7, 8, 10), -3, ('Cm', 'Ddim', 'Eb', 'Fm', 'Gm', 'Ab', 'Bb')),
+    'Bb': (('Bb', 'C', 'D', 'Eb', 'F', 'G', 'A'), (10, 0, 2, 3, 5, 7, 9), -2, ('Bb', 'Cm', 'Dm', 'Eb', 'F', 'Gm', 'Adim')),
+    'g': (('G', 'A', 'Bb', 'C', 'D', 'Eb', 'F'), (7, 9, 10, 0, 2, 3, 5), -2, ('Gm', 'Adim', 'Bb', 'Cm', 'Dm', 'Eb', 'F')),
+    'F': (('F', 'G', 'A', 'Bb', 'C', 'D', 'E'), (5, 7, 9, 10, 0, 2, 4), -1, ('F', 'Gm', 'Am', 'Bb', 'C', 'Dm', 'Edim')),
+    'd': (('D', 'E', 'F', 'G', 'A', 'Bb', 'C'), (2, 4, 5, 7, 9, 10, 0), -1, ('Dm', 'Edim', 'F', 'Gm', 'Am', 'Bb', 'C')),
+    'C': (('C', 'D', 'E', 'F', 'G', 'A', 'B'), (0, 2, 4, 5, 7, 9, 11), 0, ('C', 'Dm', 'Em', 'F', 'G', 'Am', 'Bdim')),
+    'a': (('A', 'B', 'C', 'D', 'E', 'F', 'G'), (9, 11, 0, 2, 4, 5, 7), 0, ('Am', 'Bdim', 'C', 'Dm', 'Em', 'F', 'G')),
+    'G': (('G', 'A', 'B', 'C', 'D', 'E', 'F#'), (7, 9, 11, 0, 2, 4, 6), 1, ('G', 'Am', 'Bm', 'C', 'D', 'Em', 'F#dim')),
+    'e': (('E', 'F#', 'G', 'A', 'B', 'C', 'D'), (4, 6, 7, 9, 11, 0, 2), 1, ('Em', 'F#dim', 'G', 'Am', 'Bm', 'C', 'D')),
+    'D': (('D', 'E', 'F#', 'G', 'A', 'B', 'C#'), (2, 4, 6, 7, 9, 11, 1), 2, ('D', 'Em', 'F#m', 'G', 'A', 'Bm', 'C#dim')),
+    'b': (('B', 'C#', 'D', 'E', 'F#', 'G', 'A'), (11, 1, 2, 4, 6, 7, 9), 2, ('Bm', 'C#dim', 'D', 'Em', 'F#m', 'G', 'A')),
+    'A': (('A', 'B', 'C#', 'D', 'E', 'F#', 'G#'), (9, 11, 1, 2, 4, 6, 8), 3, ('A', 'Bm', 'C#m', 'D', 'E', 'F#m', 'G#dim')),
+    'f#': (('F#', 'G#', 'A', 'B', 'C#', 'D', 'E'), (6, 8, 9, 11, 1, 2, 4), 3, ('F#m', 'G#dim', 'A', 'Bm', 'C#m', 'D', 'E')),
+    'E': (('E', 'F#', 'G#', 'A', 'B', 'C#', 'D#'), (4, 6, 8, 9, 11, 1, 3), 4, ('E', 'F#m', 'G#m', 'A', 'B', 'C#m', 'D#dim')),
+    'c#': (('C#', 'D#', 'E', 'F#', 'G#', 'A', 'B'), (1, 3, 4, 6, 8, 9, 11), 4, ('C#m', 'D#dim', 'E', 'F#m', 'G#m', 'A', 'B')),
+    'B': (('B', 'C#', 'D#', 'E', 'F#', 'G#', 'A#'), (11, 1, 3, 4, 6, 8, 10), 5, ('B', 'C#m', 'D#m', 'E', 'F#', 'G#m', 'A#dim')),
+    'g#': (('G#', 'A#', 'B', 'C#', 'D#', 'E', 'F#'), (8, 10, 11, 1, 3, 4, 6), 5, ('G#m', 'A#dim', 'B', 'C#m', 'D#m', 'E', 'F#')),
+    'F#': (('F#', 'G#', 'A#', 'B', 'C#', 'D#', 'E#'), (6, 8, 10, 11, 1, 3, 5), 6, ('F#', 'G#m', 'A#m', 'B', 'C#', 'D#m', 'E#dim')),
+    'd#': (('D#', 'E#', 'F#', 'G#', 'A#', 'B', 'C#'), (3, 5, 6, 8, 10, 11, 1), 6, ('D#m', 'E#dim', 'F#', 'G#m', 'A#m', 'B', 'C#')),
+    'C#': (('C#', 'D#', 'E#', 'F#', 'G#', 'A#', 'B#'), (1, 3, 5, 6, 8, 10, 0), 7, ('C#', 'D#m', 'E#m', 'F#', 'G#', 'A#m', 'B#dim')),
+    'a#': (('A#', 'B#', 'C#', 'D#', 'E#', 'F#', 'G#'), (10, 0, 1, 3, 5, 6, 8), 7, ('A#m', 'B#dim', 'C#', 'D#m', 'E#m', 'F#', 'G#')),
+}
+
+CHORD_INPUTS = (('', ('1', '3', '5')), ('m', ('1', 'b3', '5')), ('aug', ('1', '3', '#5')), ('dim', ('1', 'b3', 'b5')), ('sus2', ('1', '2', '5')), ('sus4', ('1', '4', '5')), ('6', ('1', '3', '5', '6')), ('m6', ('1', 'b3', '5', '6')), ('7', ('1', '3', '5', 'b7')), ('7b5', ('1', '3', 'b5', 'b7')), ('maj7', ('1', '3', '5', '7')), ('m7', ('1', 'b3', '5', 'b7')), ('m7b5', ('1', 'b3', 'b5', 'b7')), ('mmaj7', ('1', 'b3', '5', '7')), ('aug7', ('1', '3', '#5', 'b7')), ('augmaj7', ('1', '3', '#5', '7')), ('dim7', ('1', 'b3', 'b5', 'bb7')), ('dimmaj7', ('1', 'b3', 'b5', '7')), ('add4', ('1', '3', '4', '5')), ('madd4', ('1', 'b3', '4', '5')), ('add9', ('1', '3', '4', '9')), ('madd9', ('1', 'b3', '4', '9')), ('9', ('1', '3', '5', 'b7', '9')), ('maj9', ('1', '3', '5', '7', '9')), ('m9', ('1', 'b3', '5', 'b7', '9')), ('7b9', ('1', '3', '5', 'b7', 'b9')), ('11', ('1', '3', '5', 'b7', '9', '11')), ('7#11', ('1', '3', '5', 'b7', '9', '#11')), ('maj11', ('1', '3', '5', '7', '9', '11')), ('m11', ('1', 'b3', '5', 'b7', '9', '11')))
+
+CHORDS: dict[str, tuple[tuple[str, ...], tuple[int, ...], tuple[str, ...]]] = {
+    'A': (('A', 'C#', 'E'), (9, 13, 16), ('1', '3', '5')),
+    'Am': (('A', 'C', 'E'), (9, 12, 16), ('1', 'b3', '5')),
+    'Aaug': (('A', 'C#', 'E#'), (9, 13, 17), ('1', '3', '#5')),
+    'Adim': (('A', 'C', 'Eb'), (9, 12, 15), ('1', 'b3', 'b5')),
+    'Asus2': (('A', 'B', 'E'), (9, 11, 16), ('1', '2', '5')),
+    'Asus4': (('A', 'D', 'E'), (9, 14, 16), ('1', '4', '5')),
+    'A6': (('A', 'C#', 'E', 'F#'), (9, 13, 16, 18), ('1', '3', '5', '6')),
+    'Am6': (('A', 'C', 'E', 'F#'), (9, 12, 16, 18), ('1', 'b3', '5', '6')),
+    'A7': (('A', 'C#', 'E', 'G'), (9, 13, 16, 19), ('1', '3', '5', 'b7')),
+    'A7b5': (('A', 'C#', 'Eb', 'G'), (9, 13, 15, 19), ('1', '3', 'b5', 'b7')),
+    'Amaj7': (('A', 'C#', 'E', 'G#'), (9, 13, 16, 20), ('1', '3', '5', '7')),
+    'Am7': (('A', 'C', 'E', 'G'), (9, 12, 16, 19), ('1', 'b3', '5', 'b7')),
+    'Am7b5': (('A', 'C', 'Eb', 'G'), (9, 12, 15, 19), ('1', 'b3', 'b5', 'b7')),
+    'Ammaj7': (('A', 'C', 'E', 'G#'), (9, 12, 16, 20), ('1', 'b3', '5', '7')),
+    'Aaug7': (('A', 'C#', 'E#', 'G'), (9, 13, 17, 19), ('1', '3', '#5', 'b7')),
+    'Aaugmaj7': (('A', 'C#', 'E#', 'G#'), (9, 13, 17, 20), ('1', '3', '#5', '7')),
+    'Adim7': (('A', 'C', 'Eb', 'Gb'), (9, 12, 15, 18), ('1', 'b3', 'b5', 'bb7')),
+    'Adimmaj7': (('A', 'C', 'Eb', 'G#'), (9, 12, 15, 20), ('1', 'b3', 'b5', '7')),
+    'Aadd4': (('A', 'C#', 'D', 'E'), (9, 13, 14, 16), ('1', '3', '4', '5')),
+    'Amadd4': (('A', 'C', 'D', 'E'), (9, 12, 14, 16), ('1', 'b3', '4', '5')),
+    'Aadd9': (('A', 'C#', 'D', 'B'), (9, 13, 14, 23), ('1', '3', '4', '9')),
+    'Amadd9': (('A', 'C', 'D', 'B'), (9, 12, 14, 23), ('1', 'b3', '4', '9')),
+    'A9': (('A', 'C#', 'E', 'G', 'B'), (9, 13, 16, 19, 23), ('1', '3', '5', 'b7', '9')),
+    'Amaj9': (('A', 'C#', 'E', 'G#', 'B'), (9, 13, 16, 20, 23), ('1', '3', '5', '7', '9')),
+    'Am9': (('A', 'C', 'E', 'G', 'B'), (9, 12, 16, 19, 23), ('1', 'b3', '5', 'b7', '9')),
+    'A7b9': (('A', 'C#', 'E', 'G', 'Bb'), (9, 13, 16, 19, 22), ('1', '3', '5', 'b7', 'b9')),
+    'A11': (('A', 'C#', 'E', 'G', 'B', 'D'), (9, 13, 16, 19, 23, 26), ('1', '3', '5', 'b7', '9', '11')),
+    'A7#11': (('A', 'C#', 'E', 'G', 'B', 'D#'), (9, 13, 16, 19, 23, 27), ('1', '3', '5', 'b7', '9', '#11')),
+    'Amaj11': (('A', 'C#', 'E', 'G#', 'B', 'D'), (9, 13, 16, 20, 23, 26), ('1', '3', '5', '7', '9', '11')),
+    'Am11': (('A', 'C', 'E', 'G', 'B', 'D'), (9, 12, 16, 19, 23, 26), ('1', 'b3', '5', 'b7', '9', '11')),
+    'A#': (('A#', 'C##', 'E#'), (10, 14, 17), ('1', '3', '5')),
+    'A#m': (('A#', 'C#', 'E#'), (10, 13, 17), ('1', 'b3', '5')),
+    'A#aug': (('A#', 'C##', 'E##'), (10, 14, 18), ('1', '3', '#5')),
+    'A#dim': (('A#', 'C#', 'E'), (10, 13, 16), ('1', 'b3', 'b5')),
+    'A#sus2': (('A#', 'B#', 'E#'), (10, 12, 17), ('1', '2', '5')),
+    'A#sus4': (('A#', 'D#', 'E#'), (10, 15, 17), ('1', '4', '5')),
+    'A#6': (('A#', 'C##', 'E#', 'F##'), (10, 14, 17, 19), ('1', '3', '5', '6')),
+    'A#m6': (('A#', 'C#', 'E#', 'F##'), (10, 13, 17, 19), ('1', 'b3', '5', '6')),
+    'A#7': (('A#', 'C##', 'E#', 'G#'), (10, 14, 17, 20), ('1', '3', '5', 'b7')),
+    'A#7b5': (('A#', 'C##', 'E', 'G#'), (10, 14, 16, 20), ('1', '3', 'b5', 'b7')),
+    'A#maj7': (('A#', 'C##', 'E#', 'G##'), (10, 14, 17, 21), ('1', '3', '5', '7')),
+    'A#m7': (('A#', 'C#', 'E#', 'G#'), (10, 13, 17, 20), ('1', 'b3', '5', 'b7')),
+    'A#m7b5': (('A#', 'C#', 'E', 'G#'), (10, 13, 16, 20), ('1', 'b3', 'b5', 'b7')),
+    'A#mmaj7': (('A#', 'C#', 'E#', 'G##'), (10, 13, 17, 21), ('1', 'b3', '5', '7')),
+    'A#aug7': (('A#', 'C##', 'E##', 'G#'), (10, 14, 18, 20), ('1', '3', '#5', 'b7')),
+    'A#augmaj7': (('A#', 'C##', 'E##', 'G##'), (10, 14, 18, 21), ('1', '3', '#5', '7')),
+    'A#dim7': (('A#', 'C#', 'E', 'G'), (10, 13, 16, 19), ('1', 'b3', 'b5', 'bb7')),
+    'A#dimmaj7': (('A#', 'C#', 'E', 'G##'), (10, 13, 16, 21), ('1', 'b3', 'b5', '7')),
+    'A#add4': (('A#', 'C##', 'D#', 'E#'), (10, 14, 15, 17), ('1', '3', '4', '5')),
+    'A#madd4': (('A#', 'C#', 'D#', 'E#'), (10, 13, 15, 17), ('1', 'b3', '4', '5')),
+    'A#add9': (('A#', 'C##', 'D#', 'B#'), (10, 14, 15, 24), ('1', '3', '4', '9')),
+    'A#madd9': (('A#', 'C#', 'D#', 'B#'), (10, 13, 15, 24), ('1', 'b3', '4', '9')),
+    'A#9': (('A#', 'C##', 'E#', 'G#', 'B#'), (10, 14, 17, 20, 24), ('1', '3', '5', 'b7', '9')),
+    'A#maj9': (('A#', 'C##', 'E#', 'G##', 'B#'), (10, 14, 17, 21, 24), ('1', '3', '5', '7', '9')),
+    'A#m9': (('A#', 'C#', 'E#', 'G#', 'B#'), (10, 13, 17, 20, 24), ('1', 'b3', '5', 'b7', '9')),
+    'A#7b9': (('A#', 'C##', 'E#', 'G#', 'B'), (10, 14, 17, 20, 23), ('1', '3', '5', 'b7', 'b9')),
+    'A#11': (('A#', 'C##', 'E#', 'G#', 'B#', 'D#'), (10, 14, 17, 20, 24, 27), ('1', '3', '5', 'b7', '9', '11')),
+    'A#7#11': (('A#', 'C##', 'E#', 'G#', 'B#', 'D##'), (10, 14, 17, 20, 24, 28), ('1', '3', '5', 'b7', '9', '#11')),
+    'A#maj11': (('A#', 'C##', 'E#', 'G##', 'B#', 'D#'), (10, 14, 17, 21, 24, 27), ('1', '3', '5', '7', '9', '11')),
+    'A#m11': (('A#', 'C#', 'E#', 'G#', 'B#', 'D#'), (10, 13, 17, 20, 24, 27), ('1', 'b3', '5', 'b7', '9', '11')),
+    'Ab': (('Ab', 'C', 'Eb'), (8, 12, 15), ('1', '3', '5')),
+    'Abm': (('Ab', 'Cb', 'Eb'), (8, 11, 15), ('1', 'b3', '5')),
+    'Abaug': (('Ab', 'C', 'E'), (8, 12, 16), ('1', '3', '#5')),
+    'Abdim': (('Ab', 'Cb', 'Ebb'), (8, 11, 14), ('1', 'b3', 'b5')),
+    'Absus2': (('Ab', 'Bb', 'Eb'), (8, 10, 15), ('1', '2', '5')),
+    'Absus4': (('Ab', 'Db', 'Eb'), (8, 13, 15), ('1', '4', '5')),
+    'Ab6': (('Ab', 'C', 'Eb', 'F'), (8, 12, 15, 17), ('1', '3', '5', '6')),
+    'Abm6': (('Ab', 'Cb', 'Eb', 'F'), (8, 11, 15, 17), ('1', 'b3', '5', '6')),
+    'Ab7': (('Ab', 'C', 'Eb', 'Gb'), (8, 12, 15, 18), ('1', '3', '5', 'b7')),
+    'Ab7b5': (('Ab', 'C', 'Ebb', 'Gb'), (8, 12, 14, 18), ('1', '3', 'b5', 'b7')),
+    'Abmaj7': (('Ab', 'C', 'Eb', 'G'), (8, 12, 15, 19), ('1', '3', '5', '7')),
+    'Abm7': (('Ab', 'Cb', 'Eb', 'Gb'), (8, 11, 15, 18), ('1', 'b3', '5', 'b7')),
+    'Abm7b5': (('Ab', 'Cb', 'Ebb', 'Gb'), (8, 11, 14, 18), ('1', 'b3', 'b5', 'b7')),
+    'Abmmaj7': (('Ab', 'Cb', 'Eb', 'G'), (8, 11, 15, 19), ('1', 'b3', '5', '7')),
+    'Abaug7': (('Ab', 'C', 'E', 'Gb'), (8, 12, 16, 18), ('1', '3', '#5', 'b7')),
+    'Abaugmaj7': (('Ab', 'C', 'E', 'G'), (8, 12, 16, 19), ('1', '3', '#5', '7')),
+    'Abdim7': (('Ab', 'Cb', 'Ebb', 'Gbb'), (8, 11, 14, 17), ('1', 'b3', 'b5', 'bb7')),
+    'Abdimmaj7': (('Ab', 'Cb', 'Ebb', 'G'), (8, 11, 14, 19), ('1', 'b3', 'b5', '7')),
+    'Abadd4': (('Ab', 'C', 'Db', 'Eb'), (8, 12, 13, 15), ('1', '3', '4', '5')),
+    'Abmadd4': (('Ab', 'Cb', 'Db', 'Eb'), (8, 11, 13, 15), ('1', 'b3', '4', '5')),
+    'Abadd9': (('Ab', 'C', 'Db', 'Bb'), (8, 12, 13, 22), ('1', '3', '4', '9')),
+    'Abmadd9': (('Ab', 'Cb', 'Db', 'Bb'), (8, 11, 13, 22), ('1', 'b3', '4', '9')),
+    'Ab9': (('Ab', 'C', 'Eb', 'Gb', 'Bb'), (8, 12, 15, 18, 22), ('1', '3', '5', 'b7', '9')),
+    'Abmaj9': (('Ab', 'C', 'Eb', 'G', 'Bb'), (8, 12, 15, 19, 22), ('1', '3', '5', '7', '9')),
+    'Abm9': (('Ab', 'Cb', 'Eb', 'Gb', 'Bb'), (8, 11, 15, 18, 22), ('1', 'b3', '5', 'b7', '9')),
+    'Ab7b9': (('Ab', 'C', 'Eb', 'Gb', 'Bbb'), (8, 12, 15, 18, 21), ('1', '3', '5', 'b7', 'b9')),
+    'Ab11': (('Ab', 'C', 'Eb', 'Gb', 'Bb', 'Db'), (8, 12, 15, 18, 22, 25), ('1', '3', '5', 'b7', '9', '11')),
+    'Ab7#11': (('Ab', 'C', 'Eb', 'Gb', 'Bb', 'D'), (8, 12, 15, 18, 22, 26), ('1', '3', '5', 'b7', '9', '#11')),
+    'Abmaj11': (('Ab', 'C', 'Eb', 'G', 'Bb', 'Db'), (8, 12, 15, 19, 22, 25), ('1', '3', '5', '7', '9', '11')),
+    'Abm11': (('Ab', 'Cb', 'Eb', 'Gb', 'Bb', 'Db'), (8, 11, 15, 18, 22, 25), ('1', 'b3', '5', 'b7', '9', '11')),
+    'B': (('B', 'D#', 'F#'), (11, 15, 18), ('1', '3', '5')),
+    'Bm': (('B', 'D', 'F#'), (11, 14, 18), ('1', 'b3', '5')),
+    'Baug': (('B', 'D#', 'F##'), (11, 15, 19), ('1', '3', '#5')),
+    'Bdim': (('B', 'D', 'F'), (11, 14, 17), ('1', 'b3', 'b5')),
+    'Bsus2': (('B', 'C#', 'F#'), (11, 13, 18), ('1', '2', '5')),
+    'Bsus4': (('B', 'E', 'F#'), (11, 16, 18), ('1', '4', '5')),
+    'B6': (('B', 'D#', 'F#', 'G#'), (11, 15, 18, 20), ('1', '3', '5', '6')),
+    'Bm6': (('B', 'D', 'F#', 'G#'), (11, 14, 18, 20), ('1', 'b3', '5', '6')),
+    'B7': (('B', 'D#', 'F#', 'A'), (11, 15, 18, 21), ('1', '3', '5', 'b7')),
+    'B7b5': (('B', 'D#', 'F', 'A'), (11, 15, 17, 21), ('1', '3', 'b5', 'b7')),
+    'Bmaj7': (('B', 'D#', 'F#', 'A#'), (11, 15, 18, 22), ('1', '3', '5', '7')),
+    'Bm7': (('B', 'D', 'F#', 'A'), (11, 14, 18, 21), ('1', 'b3', '5', 'b7')),
+    'Bm7b5': (('B', 'D', 'F', 'A'), (11, 14, 17, 21), ('1', 'b3', 'b5', 'b7')),
+    'Bmmaj7': (('B', 'D', 'F#', 'A#'), (11, 14, 18, 22), ('1', 'b3', '5', '7')),
+    'Baug7': (('B', 'D#', 'F##', 'A'), (11, 15, 19, 21), ('1', '3', '#5', 'b7')),
+    'Baugmaj7': (('B', 'D#', 'F##', 'A#'), (11, 15, 19, 22), ('1', '3', '#5', '7')),
+    'Bdim7': (('B', 'D', 'F', 'Ab'), (11, 14, 17, 20), ('1', 'b3', 'b5', 'bb7')),
+    'Bdimmaj7': (('B', 'D', 'F', 'A#'), (11, 14, 17, 22), ('1', 'b3', 'b5', '7')),
+    'Badd4': (('B', 'D#', 'E', 'F#'), (11, 15, 16, 18), ('1', '3', '4', '5')),
+    'Bmadd4': (('B', 'D', 'E', 'F#'), (11, 14, 16, 18), ('1', 'b3', '4', '5')),
+    'Badd9': (('B', 'D#', 'E', 'C#'), (11, 15, 16, 25), ('1', '3', '4', '9')),
+    'Bmadd9': (('B', 'D', 'E', 'C#'), (11, 14, 16, 25), ('1', 'b3', '4', '9')),
+    'B9': (('B', 'D#', 'F#', 'A', 'C#'), (11, 15, 18, 21, 25), ('1', '3', '5', 'b7', '9')),
+    'Bmaj9': (('B', 'D#', 'F#', 'A#', 'C#'), (11, 15, 18, 22, 25), ('1', '3', '5', '7', '9')),
+    'Bm9': (('B', 'D', 'F#', 'A', 'C#'), (11, 14, 18, 21, 25), ('1', 'b3', '5', 'b7', '9')),
+    'B7b9': (('B', 'D#', 'F#', 'A', 'C'), (11, 15, 18, 21, 24), ('1', '3', '5', 'b7', 'b9')),
+    'B11': (('B', 'D#', 'F#', 'A', 'C#', 'E'), (11, 15, 18, 21, 25, 28), ('1', '3', '5', 'b7', '9', '11')),
+    'B7#11': (('B', 'D#', 'F#', 'A', 'C#', 'E#'), (11, 15, 18, 21, 25, 29), ('1', '3', '5', 'b7', '9', '#11')),
+    'Bmaj11': (('B', 'D#', 'F#', 'A#', 'C#', 'E'), (11, 15, 18, 22, 25, 28), ('1', '3', '5', '7', '9', '11')),
+    'Bm11': (('B', 'D', 'F#', 'A', 'C#', 'E'), (11, 14, 18, 21, 25, 28), ('1', 'b3', '5', 'b7', '9', '11')),
+    'B#': (('B#', 'D##', 'F##'), (0, 4, 7), ('1', '3', '5')),
+    'B#m': (('B#', 'D#', 'F##'), (0, 3, 7), ('1', 'b3', '5')),
+    'B#aug': (('B#', 'D##', 'F###'), (0, 4, 8), ('1', '3', '#5')),
+    'B#dim': (('B#', 'D#', 'F#'), (0, 3, 6), ('1', 'b3', 'b5')),
+    'B#sus2': (('B#', 'C##', 'F##'), (0, 2, 7), ('1', '2', '5')),
+    'B#sus4': (('B#', 'E#', 'F##'), (0, 5, 7), ('1', '4', '5')),
+    'B#6': (('B#', 'D##', 'F##', 'G##'), (0, 4, 7, 9), ('1', '3', '5', '6')),
+    'B#m6': (('B#', 'D#', 'F##', 'G##'), (0, 3, 7, 9), ('1', 'b3', '5', '6')),
+    'B#7': (('B#', 'D##', 'F##', 'A#'), (0, 4, 7, 10), ('1', '3', '5', 'b7')),
+    'B#7b5': (('B#', 'D##', 'F#', 'A#'), (0, 4, 6, 10), ('1', '3', 'b5', 'b7')),
+    'B#maj7': (('B#', 'D##', 'F##', 'A##'), (0, 4, 7, 11), ('1', '3', '5', '7')),
+    'B#m7': (('B#', 'D#', 'F##', 'A#'), (0, 3, 7, 10), ('1', 'b3', '5', 'b7')),
+    'B#m7b5': (('B#', 'D#', 'F#', 'A#'), (0, 3, 6, 10), ('1', 'b3', 'b5', 'b7')),
+    'B#mmaj7': (('B#', 'D#', 'F##', 'A##'), (0, 3, 7, 11), ('1', 'b3', '5', '7')),
+    'B#aug7': (('B#', 'D##', 'F###', 'A#'), (0, 4, 8, 10), ('1', '3', '#5', 'b7')),
+    'B#augmaj7': (('B#', 'D##', 'F###', 'A##'), (0, 4, 8, 11), ('1', '3', '#5', '7')),
+    'B#dim7': (('B#', 'D#', 'F#', 'A'), (0, 3, 6, 9), ('1', 'b3', 'b5', 'bb7')),
+    'B#dimmaj7': (('B#', 'D#', 'F#', 'A##'), (0, 3, 6, 11), ('1', 'b3', 'b5', '7')),
+    'B#add4': (('B#', 'D##', 'E#', 'F##'), (0, 4, 5, 7), ('1', '3', '4', '5')),
+    'B#madd4': (('B#', 'D#', 'E#', 'F##'), (0, 3, 5, 7), ('1', 'b3', '4', '5')),
+    'B#add9': (('B#', 'D##', 'E#', 'C##'), (0, 4, 5, 14), ('1', '3', '4', '9')),
+    'B#madd9': (('B#', 'D#', 'E#', 'C##'), (0, 3, 5, 14), ('1', 'b3', '4', '9')),
+    'B#9': (('B#', 'D##', 'F##', 'A#', 'C##'), (0, 4, 7, 10, 14), ('1', '3', '5', 'b7', '9')),
+    'B#maj9': (('B#', 'D##', 'F##', 'A##', 'C##'), (0, 4, 7, 11, 14), ('1', '3', '5', '7', '9')),
+    'B#m9': (('B#', 'D#', 'F##', 'A#', 'C##'), (0, 3, 7, 10, 14), ('1', 'b3', '5', 'b7', '9')),
+    'B#7b9': (('B#', 'D##', 'F##', 'A#', 'C#'), (0, 4, 7, 10, 13), ('1', '3', '5', 'b7', 'b9')),
+    'B#11': (('B#', 'D##', 'F##', 'A#', 'C##', 'E#'), (0, 4, 7, 10, 14, 17), ('1', '3', '5', 'b7', '9', '11')),
+    'B#7#11': (('B#', 'D##', 'F##', 'A#', 'C##', 'E##'), (0, 4, 7, 10, 14, 18), ('1', '3', '5', 'b7', '9', '#11')),
+    'B#maj11': (('B#', 'D##', 'F##', 'A##', 'C##', 'E#'), (0, 4, 7, 11, 14, 17), ('1', '3', '5', '7', '9', '11')),
+    'B#m11': (('B#', 'D#', 'F##', 'A#', 'C##', 'E#'), (0, 3, 7, 10, 14, 17), ('1', 'b3', '5', 'b7', '9', '11')),
+    'Bb': (('Bb', 'D', 'F'), (10, 14, 17), ('1', '3', '5')),
+    'Bbm': (('Bb', 'Db', 'F'), (10, 13, 17), ('1', 'b3', '5')),
+    'Bbaug': (('Bb', 'D', 'F#'), (10, 14, 18), ('1', '3', '#5')),
+    'Bbdim': (('Bb', 'Db', 'Fb'), (10, 13, 16), ('1', 'b3', 'b5')),
+    'Bbsus2': (('Bb', 'C', 'F'), (10, 12, 17), ('1', '2', '5')),
+    'Bbsus4': (('Bb', 'Eb', 'F'), (10, 15, 17), ('1', '4', '5')),
+    'Bb6': (('Bb', 'D', 'F', 'G'), (10, 14, 17, 19), ('1', '3', '5', '6')),
+    'Bbm6': (('Bb', 'Db', 'F', 'G'), (10, 13, 17, 19), ('1', 'b3', '5', '6')),
+    'Bb7': (('Bb', 'D', 'F', 'Ab'), (10, 14, 17, 20), ('1', '3', '5', 'b7')),
+    'Bb7b5': (('Bb', 'D', 'Fb', 'Ab'), (10, 14, 16, 20), ('1', '3', 'b5', 'b7')),
+    'Bbmaj7': (('Bb', 'D', 'F', 'A'), (10, 14, 17, 21), ('1', '3', '5', '7')),
+    'Bbm7': (('Bb', 'Db', 'F', 'Ab'), (10, 13, 17, 20), ('1', 'b3', '5', 'b7')),
+    'Bbm7b5': (('Bb', 'Db', 'Fb', 'Ab'), (10, 13, 16, 20), ('1', 'b3', 'b5', 'b7')),
+    'Bbmmaj7': (('Bb', 'Db', 'F', 'A'), (10, 13, 17, 21), ('1', 'b3', '5', '7')),
+    'Bbaug7': (('Bb', 'D', 'F#', 'Ab'), (10, 14, 18, 20), ('1', '3', '#5', 'b7')),
+    'Bbaugmaj7': (('Bb', 'D', 'F#', 'A'), (10, 14, 18, 21), ('1', '3', '#5', '7')),
+    'Bbdim7': (('Bb', 'Db', 'Fb', 'Abb'), (10, 13, 16, 19), ('1', 'b3', 'b5', 'bb7')),
+    'Bbdimmaj7': (('Bb', 'Db', 'Fb', 'A'), (10, 13, 16, 21), ('1', 'b3', 'b5', '7')),
+    'Bbadd4': (('Bb', 'D', 'Eb', 'F'), (10, 14, 15, 17), ('1', '3', '4', '5')),
+    'Bbmadd4': (('Bb', 'Db', 'Eb', 'F'), (10, 13, 15, 17), ('1', 'b3', '4', '5')),
+    'Bbadd9': (('Bb', 'D', 'Eb', 'C'), (10, 14, 15, 24), ('1', '3', '4', '9')),
+    'Bbmadd9': (('Bb', 'Db', 'Eb', 'C'), (10, 13, 15, 24), ('1', 'b3', '4', '9')),
+    'Bb9': (('Bb', 'D', 'F', 'Ab', 'C'), (10, 14, 17, 20, 24), ('1', '3', '5', 'b7', '9')),
+    'Bbmaj9': (('Bb', 'D', 'F', 'A', 'C'), (10, 14, 17, 21, 24), ('1', '3', '5', '7', '9')),
+    'Bbm9': (('Bb', 'Db', 'F', 'Ab', 'C'), (10, 13, 17, 20, 24), ('1', 'b3', '5', 'b7', '9')),
+    'Bb7b9': (('Bb', 'D', 'F', 'Ab', 'Cb'), (10, 14, 17, 20, 23), ('1', '3', '5', 'b7', 'b9')),
+    'Bb11': (('Bb', 'D', 'F', 'Ab', 'C', 'Eb'), (10, 14, 17, 20, 24, 27), ('1', '3', '5', 'b7', '9', '11')),
+    'Bb7#11': (('Bb', 'D', 'F', 'Ab', 'C', 'E'), (10, 14, 17, 20, 24, 28), ('1', '3', '5', 'b7', '9', '#11')),
+    'Bbmaj11': (('Bb', 'D', 'F', 'A', 'C', 'Eb'), (10, 14, 17, 21, 24, 27), ('1', '3', '5', '7', '9', '11')),
+    'Bbm11': (('Bb', 'Db', 'F', 'Ab', 'C', 'Eb'), (10, 13, 17, 20, 24, 27), ('1', 'b3', '5', 'b7', '9', '11')),
+    'C': (('C', 'E', 'G'), (0, 4, 7), ('1', '3', '5')),
+    'Cm': (('C', 'Eb', 'G'), (0, 3, 7), ('1', 'b3', '5')),
+    'Caug': (('C', 'E', 'G#'), (0, 4, 8), ('1', '3', '#5')),
+    'Cdim': (('C', 'Eb', 'Gb'), (0, 3, 6), ('1', 'b3', 'b5')),
+    'Csus2': (('C', 'D', 'G'), (0, 2, 7), ('1', '2', '5')),
+    'Csus4': (('C', 'F', 'G'), (0, 5, 7), ('1', '4', '5')),
+    'C6': (('C', 'E', 'G', 'A'), (0, 4, 7, 9), ('1', '3', '5', '6')),
+    'Cm6': (('C', 'Eb', 'G', 'A'), (0, 3, 7, 9), ('1', 'b3', '5', '6')),
+    'C7': (('C', 'E', 'G', 'Bb'), (0, 4, 7, 10), ('1', '3', '5', 'b7')),
+    'C7b5': (('C', 'E', 'Gb', 'Bb'), (0, 4, 6, 10), ('1', '3', 'b5', 'b7')),
+    'Cmaj7': (('C', 'E', 'G', 'B'), (0, 4, 7, 11), ('1', '3', '5', '7')),
+    'Cm7': (('C', 'Eb', 'G', 'Bb'), (0, 3, 7, 10), ('1', 'b3', '5', 'b7')),
+    'Cm7b5': (('C', 'Eb', 'Gb', 'Bb'), (0, 3, 6, 10), ('1', 'b3', 'b5', 'b7')),
+    'Cmmaj7': (('C', 'Eb', 'G', 'B'), (0, 3, 7, 11), ('1', 'b3', '5', '7')),
+    'Caug7': (('C', 'E', 'G#', 'Bb'), (0, 4, 8, 10), ('1', '3', '#5', 'b7')),
+    'Caugmaj7': (('C', 'E', 'G#', 'B'), (0, 4, 8, 11), ('1', '3', '#5', '7')),
+    'Cdim7': (('C', 'Eb', 'Gb', 'Bbb'), (0, 3, 6, 9), ('1', 'b3', 'b5', 'bb7')),
+    'Cdimmaj7': (('C', 'Eb', 'Gb', 'B'), (0, 3, 6, 11), ('1', 'b3', 'b5', '7')),
+    'Cadd4': (('C', 'E', 'F', 'G'), (0, 4, 5, 7), ('1', '3', '4', '5')),
+    'Cmadd4': (('C', 'Eb', 'F', 'G'), (0, 3, 5, 7), ('1', 'b3', '4', '5')),
+    'Cadd9': (('C', 'E', 'F', 'D'), (0, 4, 5, 14), ('1', '3', '4', '9')),
+    'Cmadd9': (('C', 'Eb', 'F', 'D'), (0, 3, 5, 14), ('1', 'b3', '4', '9')),
+    'C9': (('C', 'E', 'G', 'Bb', 'D'), (0, 4, 7, 10, 14), ('1', '3', '5', 'b7', '9')),
+    'Cmaj9': (('C', 'E', 'G', 'B', 'D'), (0, 4, 7, 11, 14), ('1', '3', '5', '7', '9')),
+    'Cm9': (('C', 'Eb', 'G', 'Bb', 'D'), (0, 3, 7, 10, 14), ('1', 'b3', '5', 'b7', '9')),
+    'C7b9': (('C', 'E', 'G', 'Bb', 'Db'), (0, 4, 7, 10, 13), ('1', '3', '5', 'b7', 'b9')),
+    'C11': (('C', 'E', 'G', 'Bb', 'D', 'F'), (0, 4, 7, 10, 14, 17), ('1', '3', '5', 'b7', '9', '11')),
+    'C7#11': (('C', 'E', 'G', 'Bb', 'D', 'F#'), (0, 4, 7, 10, 14, 18), ('1', '3', '5', 'b7', '9', '#11')),
+    'Cmaj11': (('C', 'E', 'G', 'B', 'D', 'F'), (0, 4, 7, 11, 14, 17), ('1', '3', '5', '7', '9', '11')),
+    'Cm11': (('C', 'Eb', 'G', 'Bb', 'D', 'F'), (0, 3, 7, 10, 14, 17), ('1', 'b3', '5', 'b7', '9', '11')),
+    'C#': (('C#', 'E#', 'G#'), (1, 5, 8), ('1', '3', '5')),
+    'C#m': (('C#', 'E', 'G#'), (1, 4, 8), ('1', 'b3', '5')),
+    'C#aug': (('C#', 'E#', 'G##'), (1, 5, 9), ('1', '3', '#5')),
+    'C#dim': (('C#', 'E', 'G'), (1, 4, 7), ('1', 'b3', 'b5')),
+    'C#sus2': (('C#', 'D#', 'G#'), (1, 3, 8), ('1', '2', '5')),
+    'C#sus4': (('C#', 'F#', 'G#'), (1, 6, 8), ('1', '4', '5')),
+    'C#6': (('C#', 'E#', 'G#', 'A#'), (1, 5, 8, 10), ('1', '3', '5', '6')),
+    'C#m6': (('C#', 'E', 'G#', 'A#'), (1, 4, 8, 10), ('1', 'b3', '5', '6')),
+    'C#7': (('C#', 'E#', 'G#', 'B'), (1, 5, 8, 11), ('1', '3', '5', 'b7')),
+    'C#7b5': (('C#', 'E#', 'G', 'B'), (1, 5, 7, 11), ('1', '3', 'b5', 'b7')),
+    'C#maj7': (('C#', 'E#', 'G#', 'B#'), (1, 5, 8, 12), ('1', '3', '5', '7')),
+    'C#m7': (('C#', 'E', 'G#', 'B'), (1, 4, 8, 11), ('1', 'b3', '5', 'b7')),
+    'C#m7b5': (('C#', 'E', 'G', 'B'), (1, 4, 7, 11), ('1', 'b3', 'b5', 'b7')),
+    'C#mmaj7': (('C#', 'E', 'G#', 'B#'), (1, 4, 8, 12), ('1', 'b3', '5', '7')),
+    'C#aug7': (('C#', 'E#', 'G##', 'B'), (1, 5, 9, 11), ('1', '3', '#5', 'b7')),
+    'C#augmaj7': (('C#', 'E#', 'G##', 'B#'), (1, 5, 9, 12), ('1', '3', '#5', '7')),
+    'C#dim7': (('C#', 'E', 'G', 'Bb'), (1, 4, 7, 10), ('1', 'b3', 'b5', 'bb7')),
+    'C#dimmaj7': (('C#', 'E', 'G', 'B#'), (1, 4, 7, 12), ('1', 'b3', 'b5', '7')),
+    'C#add4': (('C#', 'E#', 'F#', 'G#'), (1, 5, 6, 8), ('1', '3', '4', '5')),
+    'C#madd4': (('C#', 'E', 'F#', 'G#'), (1, 4, 6, 8), ('1', 'b3', '4', '5')),
+    'C#add9': (('C#', 'E#', 'F#', 'D#'), (1, 5, 6, 15), ('1', '3', '4', '9')),
+    'C#madd9': (('C#', 'E', 'F#', 'D#'), (1, 4, 6, 15), ('1', 'b3', '4', '9')),
+    'C#9': (('C#', 'E#', 'G#', 'B', 'D#'), (1, 5, 8, 11, 15), ('1', '3', '5', 'b7', '9')),
+    'C#maj9': (('C#', 'E#', 'G#', 'B#', 'D#'), (1, 5, 8, 12, 15), ('1', '3', '5', '7', '9')),
+    'C#m9': (('C#', 'E', 'G#', 'B', 'D#'), (1, 4, 8, 11, 15), ('1', 'b3', '5', 'b7', '9')),
+    'C#7b9': (('C#', 'E#', 'G#', 'B', 'D'), (1, 5, 8, 11, 14), ('1', '3', '5', 'b7', 'b9')),
+    'C#11': (('C#', 'E#', 'G#', 'B', 'D#', 'F#'), (1, 5, 8, 11, 15, 18), ('1', '3', '5', 'b7', '9', '11')),
+    'C#7#11': (('C#', 'E#', 'G#', 'B', 'D#', 'F##'), (1, 5, 8, 11, 15, 19), ('1', '3', '5', 'b7', '9', '#11')),
+    'C#maj11': (('C#', 'E#', 'G#', 'B#', 'D#', 'F#'), (1, 5, 8, 12, 15, 18), ('1', '3', '5', '7', '9', '11')),
+    'C#m11': (('C#', 'E', 'G#', 'B', 'D#', 'F#'), (1, 4, 8, 11, 15, 18), ('1', 'b3', '5', 'b7', '9', '11')),
+    'Cb': (('Cb', 'Eb', 'Gb'), (11, 15, 18), ('1', '3', '5')),
+    'Cbm': (('Cb', 'Ebb', 'Gb'), (11, 14, 18), ('1', 'b3', '5')),
+    'Cbaug': (('Cb', 'Eb', 'G'), (11, 15, 19), ('1', '3', '#5')),
+    'Cbdim': (('Cb', 'Ebb', 'Gbb'), (11, 14, 17), ('1', 'b3', 'b5')),
+    'Cbsus2': (('Cb', 'Db', 'Gb'), (11, 13, 18), ('1', '2', '5')),
+    'Cbsus4': (('Cb', 'Fb', 'Gb'), (11, 16, 18), ('1', '4', '5')),
+    'Cb6': (('Cb', 'Eb', 'Gb', 'Ab'), (11, 15, 18, 20), ('1', '3', '5', '6')),
+    'Cbm6': (('Cb', 'Ebb', 'Gb', 'Ab'), (11, 14, 18, 20), ('1', 'b3', '5', '6')),
+    'Cb7': (('Cb', 'Eb', 'Gb', 'Bbb'), (11, 15, 18, 21), ('1', '3', '5', 'b7')),
+    'Cb7b5': (('Cb', 'Eb', 'Gbb', 'Bbb'), (11, 15, 17, 21), ('1', '3', 'b5', 'b7')),
+    'Cbmaj7': (('Cb', 'Eb', 'Gb', 'Bb'), (11, 15, 18, 22), ('1', '3', '5', '7')),
+    'Cbm7': (('Cb', 'Ebb', 'Gb', 'Bbb'), (11, 14, 18, 21), ('1', 'b3', '5', 'b7')),
+    'Cbm7b5': (('Cb', 'Ebb', 'Gbb', 'Bbb'), (11, 14, 17, 21), ('1', 'b3', 'b5', 'b7')),
+    'Cbmmaj7': (('Cb', 'Ebb', 'Gb', 'Bb'), (11, 14, 18, 22), ('1', 'b3', '5', '7')),
+    'Cbaug7': (('Cb', 'Eb', 'G', 'Bbb'), (11, 15, 19, 21), ('1', '3', '#5', 'b7')),
+    'Cbaugmaj7': (('Cb', 'Eb', 'G', 'Bb'), (11, 15, 19, 22), ('1', '3', '#5', '7')),
+    'Cbdim7': (('Cb', 'Ebb', 'Gbb', 'Bbbb'), (11, 14, 17, 20), ('1', 'b3', 'b5', 'bb7')),
+    'Cbdimmaj7': (('Cb', 'Ebb', 'Gbb', 'Bb'), (11, 14, 17, 22), ('1', 'b3', 'b5', '7')),
+    'Cbadd4': (('Cb', 'Eb', 'Fb', 'Gb'), (11, 15, 16, 18), ('1', '3', '4', '5')),
+    'Cbmadd4': (('Cb', 'Ebb', 'Fb', 'Gb'), (11, 14, 16, 18), ('1', 'b3', '4', '5')),
+    'Cbadd9': (('Cb', 'Eb', 'Fb', 'Db'), (11, 15, 16, 25), ('1', '3', '4', '9')),
+    'Cbmadd9': (('Cb', 'Ebb', 'Fb', 'Db'), (11, 14, 16, 25), ('1', 'b3', '4', '9')),
+    'Cb9': (('Cb', 'Eb', 'Gb', 'Bbb', 'Db'), (11, 15, 18, 21, 25), ('1', '3', '5', 'b7', '9')),
+    'Cbmaj9': (('Cb', 'Eb', 'Gb', 'Bb', 'Db'), (11, 15, 18, 22, 25), ('1', '3', '5', '7', '9')),
+    'Cbm9': (('Cb', 'Ebb', 'Gb', 'Bbb', 'Db'), (11, 14, 18, 21, 25), ('1', 'b3', '5', 'b7', '9')),
+    'Cb7b9': (('Cb', 'Eb', 'Gb', 'Bbb', 'Dbb'), (11, 15, 18, 21, 24), ('1', '3', '5', 'b7', 'b9')),
+    'Cb11': (('Cb', 'Eb', 'Gb', 'Bbb', 'Db', 'Fb'), (11, 15, 18, 21, 25, 28), ('1', '3', '5', 'b7', '9', '11')),
+    'Cb7#11': (('Cb', 'Eb', 'Gb', 'Bbb', 'Db', 'F'), (11, 15, 18, 21, 25, 29), ('1', '3', '5', 'b7', '9', '#11')),
+    'Cbmaj11': (('Cb', 'Eb', 'Gb', 'Bb', 'Db', 'Fb'), (11, 15, 18, 22, 25, 28), ('1', '3', '5', '7', '9', '11')),
+    'Cbm11': (('Cb', 'Ebb', 'Gb', 'Bbb', 'Db', 'Fb'), (11, 14, 18, 21, 25, 28), ('1', 'b3', '5', 'b7', '9', '11')),
+    'D': (('D', 'F#', 'A'), (2, 6, 9), ('1', '3', '5')),
+    'Dm': (('D', 'F', 'A'), (2, 5, 9), ('1', 'b3', '5')),
+    'Daug': (('D', 'F#', 'A#'), (2, 6, 10), ('1', '3', '#5')),
+    'Ddim': (('D', 'F', 'Ab'), (2, 5, 8), ('1', 'b3', 'b5')),
+    'Dsus2': (('D', 'E', 'A'), (2, 4, 9), ('1', '2', '5')),
+    'Dsus4': (('D', 'G', 'A'), (2, 7, 9), ('1', '4', '5')),
+    'D6': (('D', 'F#', 'A', 'B'), (2, 6, 9, 11), ('1', '3', '5', '6')),
+    'Dm6': (('D', 'F', 'A', 'B'), (2, 5, 9, 11), ('1', 'b3', '5', '6')),
+    'D7': (('D', 'F#', 'A', 'C'), (2, 6, 9, 12), ('1', '3', '5', 'b7')),
+    'D7b5': (('D', 'F#', 'Ab', 'C'), (2, 6, 8, 12), ('1', '3', 'b5', 'b7')),
+    'Dmaj7': (('D', 'F#', 'A', 'C#'), (2, 6, 9, 13), ('1', '3', '5', '7')),
+    'Dm7': (('D', 'F', 'A', 'C'), (2, 5, 9, 12), ('1', 'b3', '5', 'b7')),
+    'Dm7b5': (('D', 'F', 'Ab', 'C'), (2, 5, 8, 12), ('1', 'b3', 'b5', 'b7')),
+    'Dmmaj7': (('D', 'F', 'A', 'C#'), (2, 5, 9, 13), ('1', 'b3', '5', '7')),
+    'Daug7': (('D', 'F#', 'A#', 'C'), (2, 6, 10, 12), ('1', '3', '#5', 'b7')),
+    'Daugmaj7': (('D', 'F#', 'A#', 'C#'), (2, 6, 10, 13), ('1', '3', '#5', '7')),
+    'Ddim7': (('D', 'F', 'Ab', 'Cb'), (2, 5, 8, 11), ('1', 'b3', 'b5', 'bb7')),
+    'Ddimmaj7': (('D', 'F', 'Ab', 'C#'), (2, 5, 8, 13), ('1', 'b3', 'b5', '7')),
+    'Dadd4': (('D', 'F#', 'G', 'A'), (2, 6, 7, 9), ('1', '3', '4', '5')),
+    'Dmadd4': (('D', 'F', 'G', 'A'), (2, 5, 7, 9), ('1', 'b3', '4', '5')),
+    'Dadd9': (('D', 'F#', 'G', 'E'), (2, 6, 7, 16), ('1', '3', '4', '9')),
+    'Dmadd9': (('D', 'F', 'G', 'E'), (2, 5, 7, 16), ('1', 'b3', '4', '9')),
+    'D9': (('D', 'F#', 'A', 'C', 'E'), (2, 6, 9, 12, 16), ('1', '3', '5', 'b7', '9')),
+    'Dmaj9': (('D', 'F#', 'A', 'C#', 'E'), (2, 6, 9, 13, 16), ('1', '3', '5', '7', '9')),
+    'Dm9': (('D', 'F', 'A', 'C', 'E'), (2, 5, 9, 12, 16), ('1', 'b3', '5', 'b7', '9')),
+    'D7b9': (('D', 'F#', 'A', 'C', 'Eb'), (2, 6, 9, 12, 15), ('1', '3', '5', 'b7', 'b9')),
+    'D11': (('D', 'F#', 'A', 'C', 'E', 'G'), (2, 6, 9, 12, 16, 19), ('1', '3', '5', 'b7', '9', '11')),
+    'D7#11': (('D', 'F#', 'A', 'C', 'E', 'G#'), (2, 6, 9, 12, 16, 20), ('1', '3', '5', 'b7', '9', '#11')),
+    'Dmaj11': (('D', 'F#', 'A', 'C#', 'E', 'G'), (2, 6, 9, 13, 16, 19), ('1', '3', '5', '7', '9', '11')),
+    'Dm11': (('D', 'F', 'A', 'C', 'E', 'G'), (2, 5, 9, 12, 16, 19), ('1', 'b3', '5', 'b7', '9', '11')),
+    'D#': (('D#', 'F##', 'A#'), (3, 7, 10), ('1', '3', '5')),
+    'D#m': (('D#', 'F#', 'A#'), (3, 6, 10), ('1', 'b3', '5')),
+    'D#aug': (('D#', 'F##', 'A##'), (3, 7, 11), ('1', '3', '#5')),
+    'D#dim': (('D#', 'F#', 'A'), (3, 6, 9), ('1', 'b3', 'b5')),
+    'D#sus2': (('D#', 'E#', 'A#'), (3, 5, 10), ('1', '2', '5')),
+    'D#sus4': (('D#', 'G#', 'A#'), (3, 8, 10), ('1', '4', '5')),
+    'D#6': (('D#', 'F##', 'A#', 'B#'), (3, 7, 10, 12), ('1', '3', '5', '6')),
+    'D#m6': (('D#', 'F#', 'A#', 'B#'), (3, 6, 10, 12), ('1', 'b3', '5', '6')),
+    'D#7': (('D#', 'F##', 'A#', 'C#'), (3, 7, 10, 13), ('1', '3', '5', 'b7')),
+    'D#7b5': (('D#', 'F##', 'A', 'C#'), (3, 7, 9, 13), ('1', '3', 'b5', 'b7')),
+    'D#maj7': (('D#', 'F##', 'A#', 'C##'), (3, 7, 10, 14), ('1', '3', '5', '7')),
+    'D#m7': (('D#', 'F#', 'A#', 'C#'), (3, 6, 10, 13), ('1', 'b3', '5', 'b7')),
+    'D#m7b5': (('D#', 'F#', 'A', 'C#'), (3, 6, 9, 13), ('1', 'b3', 'b5', 'b7')),
+    'D#mmaj7': (('D#', 'F#', 'A#', 'C##'), (3, 6, 10, 14), ('1', 'b3', '5', '7')),
+    'D#aug7': (('D#', 'F##', 'A##', 'C#'), (3, 7, 11, 13), ('1', '3', '#5', 'b7')),
+    'D#augmaj7': (('D#', 'F##', 'A##', 'C##'), (3, 7, 11, 14), ('1', '3', '#5', '7')),
+    'D#dim7': (('D#', 'F#', 'A', 'C'), (3, 6, 9, 12), ('1', 'b3', 'b5', 'bb7')),
+    'D#dimmaj7': (('D#', 'F#', 'A', 'C##'), (3, 6, 9, 14), ('1', 'b3', 'b5', '7')),
+    'D#add4': (('D#', 'F##', 'G#', 'A#'), (3, 7, 8, 10), ('1', '3', '4', '5')),
+    'D#madd4': (('D#', 'F#', 'G#', 'A#'), (3, 6, 8, 10), ('1', 'b3', '4', '5')),
+    'D#add9': (('D#', 'F##', 'G#', 'E#'), (3, 7, 8, 17), ('1', '3', '4', '9')),
+    'D#madd9': (('D#', 'F#', 'G#', 'E#'), (3, 6, 8, 17), ('1', 'b3', '4', '9')),
+    'D#9': (('D#', 'F##', 'A#', 'C#', 'E#'), (3, 7, 10, 13, 17), ('1', '3', '5', 'b7', '9')),
+    'D#maj9': (('D#', 'F##', 'A#', 'C##', 'E#'), (3, 7, 10, 14, 17), ('1', '3', '5', '7', '9')),
+    'D#m9': (('D#', 'F#', 'A#', 'C#', 'E#'), (3, 6, 10, 13, 17), ('1', 'b3', '5', 'b7', '9')),
+    'D#7b9': (('D#', 'F##', 'A#', 'C#', 'E'), (3, 7, 10, 13, 16), ('1', '3', '5', 'b7', 'b9')),
+    'D#11': (('D#', 'F##', 'A#', 'C#', 'E#', 'G#'), (3, 7, 10, 13, 17, 20), ('1', '3', '5', 'b7', '9', '11')),
+    'D#7#11': (('D#', 'F##', 'A#', 'C#', 'E#', 'G##'), (3, 7, 10, 13, 17, 21), ('1', '3', '5', 'b7', '9', '#11')),
+    'D#maj11': (('D#', 'F##', 'A#', 'C##', 'E#', 'G#'), (3, 7, 10, 14, 17, 20), ('1', '3', '5', '7', '9', '11')),
+    'D#m11': (('D#', 'F#', 'A#', 'C#', 'E#', 'G#'), (3, 6, 10, 13, 17, 20), ('1', 'b3', '5', 'b7', '9', '11')),
+    'Db': (('Db', 'F', 'Ab'), (1, 5, 8), ('1', '3', '5')),
+    'Dbm': (('Db', 'Fb', 'Ab'), (1, 4, 8), ('1', 'b3', '5')),
+    'Dbaug': (('Db', 'F', 'A'), (1, 5, 9), ('1', '3', '#5')),
+    'Dbdim': (('Db', 'Fb', 'Abb'), (1, 4, 7), ('1', 'b3', 'b5')),
+    'Dbsus2': (('Db', 'Eb', 'Ab'), (1, 3, 8), ('1', '2', '5')),
+    'Dbsus4': (('Db', 'Gb', 'Ab'), (1, 6, 8), ('1', '4', '5')),
+    'Db6': (('Db', 'F', 'Ab', 'Bb'), (1, 5, 8, 10), ('1', '3', '5', '6')),
+    'Dbm6': (('Db', 'Fb', 'Ab', 'Bb'), (1, 4, 8, 10), ('1', 'b3', '5', '6')),
+    'Db7': (('Db', 'F', 'Ab', 'Cb'), (1, 5, 8, 11), ('1', '3', '5', 'b7')),
+    'Db7b5': (('Db', 'F', 'Abb', 'Cb'), (1, 5, 7, 11), ('1', '3', 'b5', 'b7')),
+    'Dbmaj7': (('Db', 'F', 'Ab', 'C'), (1, 5, 8, 12), ('1', '3', '5', '7')),
+    'Dbm7': (('Db', 'Fb', 'Ab', 'Cb'), (1, 4, 8, 11), ('1', 'b3', '5', 'b7')),
+    'Dbm7b5': (('Db', 'Fb', 'Abb', 'Cb'), (1, 4, 7, 11), ('1', 'b3', 'b5', 'b7')),
+    'Dbmmaj7': (('Db', 'Fb', 'Ab', 'C'), (1, 4, 8, 12), ('1', 'b3', '5', '7')),
+    'Dbaug7': (('Db', 'F', 'A', 'Cb'), (1, 5, 9, 11), ('1', '3', '#5', 'b7')),
+    'Dbaugmaj7': (('Db', 'F', 'A', 'C'), (1, 5, 9, 12), ('1', '3', '#5', '7')),
+    'Dbdim7': (('Db', 'Fb', 'Abb', 'Cbb'), (1, 4, 7, 10), ('1', 'b3', 'b5', 'bb7')),
+    'Dbdimmaj7': (('Db', 'Fb', 'Abb', 'C'), (1, 4, 7, 12), ('1', 'b3', 'b5', '7')),
+    'Dbadd4': (('Db', 'F', 'Gb', 'Ab'), (1, 5, 6, 8), ('1', '3', '4', '5')),
+    'Dbmadd4': (('Db', 'Fb', 'Gb', 'Ab'), (1, 4, 6, 8), ('1', 'b3', '4', '5')),
+    'Dbadd9': (('Db', 'F', 'Gb', 'Eb'), (1, 5, 6, 15), ('1', '3', '4', '9')),
+    'Dbmadd9': (('Db', 'Fb', 'Gb', 'Eb'), (1, 4, 6, 15), ('1', 'b3', '4', '9')),
+    'Db9': (('Db', 'F', 'Ab', 'Cb', 'Eb'), (1, 5, 8, 11, 15), ('1', '3', '5', 'b7', '9')),
+    'Dbmaj9': (('Db', 'F', 'Ab', 'C', 'Eb'), (1, 5, 8, 12, 15), ('1', '3', '5', '7', '9')),
+    'Dbm9': (('Db', 'Fb', 'Ab', 'Cb', 'Eb'), (1, 4, 8, 11, 15), ('1', 'b3', '5', 'b7', '9')),
+    'Db7b9': (('Db', 'F', 'Ab', 'Cb', 'Ebb'), (1, 5, 8, 11, 14), ('1', '3', '5', 'b7', 'b9')),
+    'Db11': (('Db', 'F', 'Ab', 'Cb', 'Eb', 'Gb'), (1, 5, 8, 11, 15, 18), ('1', '3', '5', 'b7', '9', '11')),
+    'Db7#11': (('Db', 'F', 'Ab', 'Cb', 'Eb', 'G'), (1, 5, 8, 11, 15, 19), ('1', '3', '5', 'b7', '9', '#11')),
+    'Dbmaj11': (('Db', 'F', 'Ab', 'C', 'Eb', 'Gb'), (1, 5, 8, 12, 15, 18), ('1', '3', '5', '7', '9', '11')),
+    'Dbm11': (('Db', 'Fb', 'Ab', 'Cb', 'Eb', 'Gb'), (1, 4, 8, 11, 15, 18), ('1', 'b3', '5', 'b7', '9', '11')),
+    'E': (('E', 'G#', 'B'), (4, 8, 11), ('1', '3', '5')),
+    'Em': (('E', 'G', 'B'), (4, 7, 11), ('1', 'b3', '5')),
+    'Eaug': (('E', 'G#', 'B#'), (4, 8, 12), ('1', '3', '#5')),
+    'Edim': (('E', 'G', 'Bb'), (4, 7, 10), ('1', 'b3', 'b5')),
+    'Esus2': (('E', 'F#', 'B'), (4, 6, 11), ('1', '2', '5')),
+    'Esus4': (('E', 'A', 'B'), (4, 9, 11), ('1', '4', '5')),
+    'E6': (('E', 'G#', 'B', 'C#'), (4, 8, 11, 13), ('1', '3', '5', '6')),
+    'Em6': (('E', 'G', 'B', 'C#'), (4, 7, 11, 13), ('1', 'b3', '5', '6')),
+    'E7': (('E', 'G#', 'B', 'D'), (4, 8, 11, 14), ('1', '3', '5', 'b7')),
+    'E7b5': (('E', 'G#', 'Bb', 'D'), (4, 8, 10, 14), ('1', '3', 'b5', 'b7')),
+    'Emaj7': (('E', 'G#', 'B', 'D#'), (4, 8, 11, 15), ('1', '3', '5', '7')),
+    'Em7': (('E', 'G', 'B', 'D'), (4, 7, 11, 14), ('1', 'b3', '5', 'b7')),
+    'Em7b5': (('E', 'G', 'Bb', 'D'), (4, 7, 10, 14), ('1', 'b3', 'b5', 'b7')),
+    'Emmaj7': (('E', 'G', 'B', 'D#'), (4, 7, 11, 15), ('1', 'b3', '5', '7')),
+    'Eaug7': (('E', 'G#', 'B#', 'D'), (4, 8, 12, 14), ('1', '3', '#5', 'b7')),
+    'Eaugmaj7': (('E', 'G#', 'B#', 'D#'), (4, 8, 12, 15), ('1', '3', '#5', '7')),
+    'Edim7': (('E', 'G', 'Bb', 'Db'), (4, 7, 10, 13), ('1', 'b3', 'b5', 'bb7')),
+    'Edimmaj7': (('E', 'G', 'Bb', 'D#'), (4, 7, 10, 15), ('1', 'b3', 'b5', '7')),
+    'Eadd4': (('E', 'G#', 'A', 'B'), (4, 8, 9, 11), ('1', '3', '4', '5')),
+    'Emadd4': (('E', 'G', 'A', 'B'), (4, 7, 9, 11), ('1', 'b3', '4', '5')),
+    'Eadd9': (('E', 'G#', 'A', 'F#'), (4, 8, 9, 18), ('1', '3', '4', '9')),
+    'Emadd9': (('E', 'G', 'A', 'F#'), (4, 7, 9, 18), ('1', 'b3', '4', '9')),
+    'E9': (('E', 'G#', 'B', 'D', 'F#'), (4, 8, 11, 14, 18), ('1', '3', '5', 'b7', '9')),
+    'Emaj9': (('E', 'G#', 'B', 'D#', 'F#'), (4, 8, 11, 15, 18), ('1', '3', '5', '7', '9')),
+    'Em9': (('E', 'G', 'B', 'D', 'F#'), (4, 7, 11, 14, 18), ('1', 'b3', '5', 'b7', '9')),
+    'E7b9': (('E', 'G#', 'B', 'D', 'F'), (4, 8, 11, 14, 17), ('1', '3', '5', 'b7', 'b9')),
+    'E11': (('E', 'G#', 'B', 'D', 'F#', 'A'), (4, 8, 11, 14, 18, 21), ('1', '3', '5', 'b7', '9', '11')),
+    'E7#11': (('E', 'G#', 'B', 'D', 'F#', 'A#'), (4, 8, 11, 14, 18, 22), ('1', '3', '5', 'b7', '9', '#11')),
+    'Emaj11': (('E', 'G#', 'B', 'D#', 'F#', 'A'), (4, 8, 11, 15, 18, 21), ('1', '3', '5', '7', '9', '11')),
+    'Em11': (('E', 'G', 'B', 'D', 'F#', 'A'), (4, 7, 11, 14, 18, 21), ('1', 'b3', '5', 'b7', '9', '11')),
+    'E#': (('E#', 'G##', 'B#'), (5, 9, 12), ('1', '3', '5')),
+    'E#m': (('E#', 'G#', 'B#'), (5, 8, 12), ('1', 'b3', '5')),
+    'E#aug': (('E#', 'G##', 'B##'), (5, 9, 13), ('1', '3', '#5')),
+    'E#dim': (('E#', 'G#', 'B'), (5, 8, 11), ('1', 'b3', 'b5')),
+    'E#sus2': (('E#', 'F##', 'B#'), (5, 7, 12), ('1', '2', '5')),
+    'E#sus4': (('E#', 'A#', 'B#'), (5, 10, 12), ('1', '4', '5')),
+    'E#6': (('E#', 'G##', 'B#', 'C##'), (5, 9, 12, 14), ('1', '3', '5', '6')),
+    'E#m6': (('E#', 'G#', 'B#', 'C##'), (5, 8, 12, 14), ('1', 'b3', '5', '6')),
+    'E#7': (('E#', 'G##', 'B#', 'D#'), (5, 9, 12, 15), ('1', '3', '5', 'b7')),
+    'E#7b5': (('E#', 'G##', 'B', 'D#'), (5, 9, 11, 15), ('1', '3', 'b5', 'b7')),
+    'E#maj7': (('E#', 'G##', 'B#', 'D##'), (5, 9, 12, 16), ('1', '3', '5', '7')),
+    'E#m7': (('E#', 'G#', 'B#', 'D#'), (5, 8, 12, 15), ('1', 'b3', '5', 'b7')),
+    'E#m7b5': (('E#', 'G#', 'B', 'D#'), (5, 8, 11, 15), ('1', 'b3', 'b5', 'b7')),
+    'E#mmaj7': (('E#', 'G#', 'B#', 'D##'), (5, 8, 12, 16), ('1', 'b3', '5', '7')),
+    'E#aug7': (('E#', 'G##', 'B##', 'D#'), (5, 9, 13, 15), ('1', '3', '#5', 'b7')),
+    'E#augmaj7': (('E#', 'G##', 'B##', 'D##'), (5, 9, 13, 16), ('1', '3', '#5', '7')),
+    'E#dim7': (('E#', 'G#', 'B', 'D'), (5, 8, 11, 14), ('1', 'b3', 'b5', 'bb7')),
+    'E#dimmaj7': (('E#', 'G#', 'B', 'D##'), (5, 8, 11, 16), ('1', 'b3', 'b5', '7')),
+    'E#add4': (('E#', 'G##', 'A#', 'B#'), (5, 9, 10, 12), ('1', '3', '4', '5')),
+    'E#madd4': (('E#', 'G#', 'A#', 'B#'), (5, 8, 10, 12), ('1', 'b3', '4', '5')),
+    'E#add9': (('E#', 'G##', 'A#', 'F##'), (5, 9, 10, 19), ('1', '3', '4', '9')),
+    'E#madd9': (('E#', 'G#', 'A#', 'F##'), (5, 8, 10, 19), ('1', 'b3', '4', '9')),
+    'E#9': (('E#', 'G##', 'B#', 'D#', 'F##'), (5, 9, 12, 15, 19), ('1', '3', '5', 'b7', '9')),
+    'E#maj9': (('E#', 'G##', 'B#', 'D##', 'F##'), (5, 9, 12, 16, 19), ('1', '3', '5', '7', '9')),
+    'E#m9': (('E#', 'G#', 'B#', 'D#', 'F##'), (5, 8, 12, 15, 19), ('1', 'b3', '5', 'b7', '9')),
+    'E#7b9': (('E#', 'G##', 'B#', 'D#', 'F#'), (5, 9, 12, 15, 18), ('1', '3', '5', 'b7', 'b9')),
+    'E#11': (('E#', 'G##', 'B#', 'D#', 'F##', 'A#'), (5, 9, 12, 15, 19, 22), ('1', '3', '5', 'b7', '9', '11')),
+    'E#7#11': (('E#', 'G##', 'B#', 'D#', 'F##', 'A##'), (5, 9, 12, 15, 19, 23), ('1', '3', '5', 'b7', '9', '#11')),
+    'E#maj11': (('E#', 'G##', 'B#', 'D##', 'F##', 'A#'), (5, 9, 12, 16, 19, 22), ('1', '3', '5', '7', '9', '11')),
+    'E#m11': (('E#', 'G#', 'B#', 'D#', 'F##', 'A#'), (5, 8, 12, 15, 19, 22), ('1', 'b3', '5', 'b7', '9', '11')),
+    'Eb': (('Eb', 'G', 'Bb'), (3, 7, 10), ('1', '3', '5')),
+    'Ebm': (('Eb', 'Gb', 'Bb'), (3, 6, 10), ('1', 'b3', '5')),
+    'Ebaug': (('Eb', 'G', 'B'), (3, 7, 11), ('1', '3', '#5')),
+    'Ebdim': (('Eb', 'Gb', 'Bbb'), (3, 6, 9), ('1', 'b3', 'b5')),
+    'Ebsus2': (('Eb', 'F', 'Bb'), (3, 5, 10), ('1', '2', '5')),
+    'Ebsus4': (('Eb', 'Ab', 'Bb'), (3, 8, 10), ('1', '4', '5')),
+    'Eb6': (('Eb', 'G', 'Bb', 'C'), (3, 7, 10, 12), ('1', '3', '5', '6')),
+    'Ebm6': (('Eb', 'Gb', 'Bb', 'C'), (3, 6, 10, 12), ('1', 'b3', '5', '6')),
+    'Eb7': (('Eb', 'G', 'Bb', 'Db'), (3, 7, 10, 13), ('1', '3', '5', 'b7')),
+    'Eb7b5': (('Eb', 'G', 'Bbb', 'Db'), (3, 7, 9, 13), ('1', '3', 'b5', 'b7')),
+    'Ebmaj7': (('Eb', 'G', 'Bb', 'D'), (3, 7, 10, 14), ('1', '3', '5', '7')),
+    'Ebm7': (('Eb', 'Gb', 'Bb', 'Db'), (3, 6, 10, 13), ('1', 'b3', '5', 'b7')),
+    'Ebm7b5': (('Eb', 'Gb', 'Bbb', 'Db'), (3, 6, 9, 13), ('1', 'b3', 'b5', 'b7')),
+    'Ebmmaj7': (('Eb', 'Gb', 'Bb', 'D'), (3, 6, 10, 14), ('1', 'b3', '5', '7')),
+    'Ebaug7': (('Eb', 'G', 'B', 'Db'), (3, 7, 11, 13), ('1', '3', '#5', 'b7')),
+    'Ebaugmaj7': (('Eb', 'G', 'B', 'D'), (3, 7, 11, 14), ('1', '3', '#5', '7')),
+    'Ebdim7': (('Eb', 'Gb', 'Bbb', 'Dbb'), (3, 6, 9, 12), ('1', 'b3', 'b5', 'bb7')),
+    'Ebdimmaj7': (('Eb', 'Gb', 'Bbb', 'D'), (3, 6, 9, 14), ('1', 'b3', 'b5', '7')),
+    'Ebadd4': (('Eb', 'G', 'Ab', 'Bb'), (3, 7, 8, 10), ('1', '3', '4', '5')),
+    'Ebmadd4': (('Eb', 'Gb', 'Ab', 'Bb'), (3, 6, 8, 10), ('1', 'b3', '4', '5')),
+    'Ebadd9': (('Eb', 'G', 'Ab', 'F'), (3, 7, 8, 17), ('1', '3', '4', '9')),
+    'Ebmadd9': (('Eb', 'Gb', 'Ab', 'F'), (3, 6, 8, 17), ('1', 'b3', '4', '9')),
+    'Eb9': (('Eb', 'G', 'Bb', 'Db', 'F'), (3, 7, 10, 13, 17), ('1', '3', '5', 'b7', '9')),
+    'Ebmaj9': (('Eb', 'G', 'Bb', 'D', 'F'), (3, 7, 10, 14, 17), ('1', '3', '5', '7', '9')),
+    'Ebm9': (('Eb', 'Gb', 'Bb', 'Db', 'F'), (3, 6, 10, 13, 17), ('1', 'b3', '5', 'b7', '9')),
+    'Eb7b9': (('Eb', 'G', 'Bb', 'Db', 'Fb'), (3, 7, 10, 13, 16), ('1', '3', '5', 'b7', 'b9')),
+    'Eb11': (('Eb', 'G', 'Bb', 'Db', 'F', 'Ab'), (3, 7, 10, 13, 17, 20), ('1', '3', '5', 'b7', '9', '11')),
+    'Eb7#11': (('Eb', 'G', 'Bb', 'Db', 'F', 'A'), (3, 7, 10, 13, 17, 21), ('1', '3', '5', 'b7', '9', '#11')),
+    'Ebmaj11': (('Eb', 'G', 'Bb', 'D', 'F', 'Ab'), (3, 7, 10, 14, 17, 20), ('1', '3', '5', '7', '9', '11')),
+    'Ebm11': (('Eb', 'Gb', 'Bb', 'Db', 'F', 'Ab'), (3, 6, 10, 13, 17, 20), ('1', 'b3', '5', 'b7', '9', '11')),
+    'F': (('F', 'A', 'C'), (5, 9, 12), ('1', '3', '5')),
+    'Fm': (('F', 'Ab', 'C'), (5, 8, 12), ('1', 'b3', '5')),
+    'Faug': (('F', 'A', 'C#'), (5, 9, 13), ('1', '3', '#5')),
+    'Fdim': (('F', 'Ab', 'Cb'), (5, 8, 11), ('1', 'b3', 'b5')),
+    'Fsus2': (('F', 'G', 'C'), (5, 7, 12), ('1', '2', '5')),
+    'Fsus4': (('F', 'Bb', 'C'), (5, 10, 12), ('1', '4', '5')),
+    'F6': (('F', 'A', 'C', 'D'), (5, 9, 12, 14), ('1', '3', '5', '6')),
+    'Fm6': (('F', 'Ab', 'C', 'D'), (5, 8, 12, 14), ('1', 'b3', '5', '6')),
+    'F7': (('F', 'A', 'C', 'Eb'), (5, 9, 12, 15), ('1', '3', '5', 'b7')),
+    'F7b5': (('F', 'A', 'Cb', 'Eb'), (5, 9, 11, 15), ('1', '3', 'b5', 'b7')),
+    'Fmaj7': (('F', 'A', 'C', 'E'), (5, 9, 12, 16), ('1', '3', '5', '7')),
+    'Fm7': (('F', 'Ab', 'C', 'Eb'), (5, 8, 12, 15), ('1', 'b3', '5', 'b7')),
+    'Fm7b5': (('F', 'Ab', 'Cb', 'Eb'), (5, 8, 11, 15), ('1', 'b3', 'b5', 'b7')),
+    'Fmmaj7': (('F', 'Ab', 'C', 'E'), (5, 8, 12, 16), ('1', 'b3', '5', '7')),
+    'Faug7': (('F', 'A', 'C#', 'Eb'), (5, 9, 13, 15), ('1', '3', '#5', 'b7')),
+    'Faugmaj7': (('F', 'A', 'C#', 'E'), (5, 9, 13, 16), ('1', '3', '#5', '7')),
+    'Fdim7': (('F', 'Ab', 'Cb', 'Ebb'), (5, 8, 11, 14), ('1', 'b3', 'b5', 'bb7')),
+    'Fdimmaj7': (('F', 'Ab', 'Cb', 'E'), (5, 8, 11, 16), ('1', 'b3', 'b5', '7')),
+    'Fadd4': (('F', 'A', 'Bb', 'C'), (5, 9, 10, 12), ('1', '3', '4', '5')),
+    'Fmadd4': (('F', 'Ab', 'Bb', 'C'), (5, 8, 10, 12), ('1', 'b3', '4', '5')),
+    'Fadd9': (('F', 'A', 'Bb', 'G'), (5, 9, 10, 19), ('1', '3', '4', '9')),
+    'Fmadd9': (('F', 'Ab', 'Bb', 'G'), (5, 8, 10, 19), ('1', 'b3', '4', '9')),
+    'F9': (('F', 'A', 'C', 'Eb', 'G'), (5, 9, 12, 15, 19), ('1', '3', '5', 'b7', '9')),
+    'Fmaj9': (('F', 'A', 'C', 'E', 'G'), (5, 9, 12, 16, 19), ('1', '3', '5', '7', '9')),
+    'Fm9': (('F', 'Ab', 'C', 'Eb', 'G'), (5, 8, 12, 15, 19), ('1', 'b3', '5', 'b7', '9')),
+    'F7b9': (('F', 'A', 'C', 'Eb', 'Gb'), (5, 9, 12, 15, 18), ('1', '3', '5', 'b7', 'b9')),
+    'F11': (('F', 'A', 'C', 'Eb', 'G', 'Bb'), (5, 9, 12, 15, 19, 22), ('1', '3', '5', 'b7', '9', '11')),
+    'F7#11': (('F', 'A', 'C', 'Eb', 'G', 'B'), (5, 9, 12, 15, 19, 23), ('1', '3', '5', 'b7', '9', '#11')),
+    'Fmaj11': (('F', 'A', 'C', 'E', 'G', 'Bb'), (5, 9, 12, 16, 19, 22), ('1', '3', '5', '7', '9', '11')),
+    'Fm11': (('F', 'Ab', 'C', 'Eb', 'G', 'Bb'), (5, 8, 12, 15, 19, 22), ('1', 'b3', '5', 'b7', '9', '11')),
+    'F#': (('F#', 'A#', 'C#'), (6, 10, 13), ('1', '3', '5')),
+    'F#m': (('F#', 'A', 'C#'), (6, 9, 13), ('1', 'b3', '5')),
+    'F#aug': (('F#', 'A#', 'C##'), (6, 10, 14), ('1', '3', '#5')),
+    'F#dim': (('F#', 'A', 'C'), (6, 9, 12), ('1', 'b3', 'b5')),
+    'F#sus2': (('F#', 'G#', 'C#'), (6, 8, 13), ('1', '2', '5')),
+    'F#sus4': (('F#', 'B', 'C#'), (6, 11, 13), ('1', '4', '5')),
+    'F#6': (('F#', 'A#', 'C#', 'D#'), (6, 10, 13, 15), ('1', '3', '5', '6')),
+    'F#m6': (('F#', 'A', 'C#', 'D#'), (6, 9, 13, 15), ('1', 'b3', '5', '6')),
+    'F#7': (('F#', 'A#', 'C#', 'E'), (6, 10, 13, 16), ('1', '3', '5', 'b7')),
+    'F#7b5': (('F#', 'A#', 'C', 'E'), (6, 10, 12, 16), ('1', '3', 'b5', 'b7')),
+    'F#maj7': (('F#', 'A#', 'C#', 'E#'), (6, 10, 13, 17), ('1', '3', '5', '7')),
+    'F#m7': (('F#', 'A', 'C#', 'E'), (6, 9, 13, 16), ('1', 'b3', '5', 'b7')),
+    'F#m7b5': (('F#', 'A', 'C', 'E'), (6, 9, 12, 16), ('1', 'b3', 'b5', 'b7')),
+    'F#mmaj7': (('F#', 'A', 'C#', 'E#'), (6, 9, 13, 17), ('1', 'b3', '5', '7')),
+    'F#aug7': (('F#', 'A#', 'C##', 'E'), (6, 10, 14, 16), ('1', '3', '#5', 'b7')),
+    'F#augmaj7': (('F#', 'A#', 'C##', 'E#'), (6, 10, 14, 17), ('1', '3', '#5', '7')),
+    'F#dim7': (('F#', 'A', 'C', 'Eb'), (6, 9, 12, 15), ('1', 'b3', 'b5', 'bb7')),
+    'F#dimmaj7': (('F#', 'A', 'C', 'E#'), (6, 9, 12, 17), ('1', 'b3', 'b5', '7')),
+    'F#add4': (('F#', 'A#', 'B', 'C#'), (6, 10, 11, 13), ('1', '3', '4', '5')),
+    'F#madd4': (('F#', 'A', 'B', 'C#'), (6, 9, 11, 13), ('1', 'b3', '4', '5')),
+    'F#add9': (('F#', 'A#', 'B', 'G#'), (6, 10, 11, 20), ('1', '3', '4', '9')),
+    'F#madd9': (('F#', 'A', 'B', 'G#'), (6, 9, 11, 20), ('1', 'b3', '4', '9')),
+    'F#9': (('F#', 'A#', 'C#', 'E', 'G#'), (6, 10, 13, 16, 20), ('1', '3', '5', 'b7', '9')),
+    'F#maj9': (('F#', 'A#', 'C#', 'E#', 'G#'), (6, 10, 13, 17, 20), ('1', '3', '5', '7', '9')),
+    'F#m9': (('F#', 'A', 'C#', 'E', 'G#'), (6, 9, 13, 16, 20), ('1', 'b3', '5', 'b7', '9')),
+    'F#7b9': (('F#', 'A#', 'C#', 'E', 'G'), (6, 10, 13, 16, 19), ('1', '3', '5', 'b7', 'b9')),
+    'F#11': (('F#', 'A#', 'C#', 'E', 'G#', 'B'), (6, 10, 13, 16, 20, 23), ('1', '3', '5', 'b7', '9', '11')),
+    'F#7#11': (('F#', 'A#', 'C#', 'E', 'G#', 'B#'), (6, 10, 13, 16, 20, 24), ('1', '3', '5', 'b7', '9', '#11')),
+    'F#maj11': (('F#', 'A#', 'C#', 'E#', 'G#', 'B'), (6, 10, 13, 17, 20, 23), ('1', '3', '5', '7', '9', '11')),
+    'F#m11': (('F#', 'A', 'C#', 'E', 'G#', 'B'), (6, 9, 13, 16, 20, 23), ('1', 'b3', '5', 'b7', '9', '11')),
+    'Fb': (('Fb', 'Ab', 'Cb'), (4, 8, 11), ('1', '3', '5')),
+    'Fbm': (('Fb', 'Abb', 'Cb'), (4, 7, 11), ('1', 'b3', '5')),
+    'Fbaug': (('Fb', 'Ab', 'C'), (4, 8, 12), ('1', '3', '#5')),
+    'Fbdim': (('Fb', 'Abb', 'Cbb'), (4, 7, 10), ('1', 'b3', 'b5')),
+    'Fbsus2': (('Fb', 'Gb', 'Cb'), (4, 6, 11), ('1', '2', '5')),
+    'Fbsus4': (('Fb', 'Bbb', 'Cb'), (4, 9, 11), ('1', '4', '5')),
+    'Fb6': (('Fb', 'Ab', 'Cb', 'Db'), (4, 8, 11, 13), ('1', '3', '5', '6')),
+    'Fbm6': (('Fb', 'Abb', 'Cb', 'Db'), (4, 7, 11, 13), ('1', 'b3', '5', '6')),
+    'Fb7': (('Fb', 'Ab', 'Cb', 'Ebb'), (4, 8, 11, 14), ('1', '3', '5', 'b7')),
+    'Fb7b5': (('Fb', 'Ab', 'Cbb', 'Ebb'), (4, 8, 10, 14), ('1', '3', 'b5', 'b7')),
+    'Fbmaj7': (('Fb', 'Ab', 'Cb', 'Eb'), (4, 8, 11, 15), ('1', '3', '5', '7')),
+    'Fbm7': (('Fb', 'Abb', 'Cb', 'Ebb'), (4, 7, 11, 14), ('1', 'b3', '5', 'b7')),
+    'Fbm7b5': (('Fb', 'Abb', 'Cbb', 'Ebb'), (4, 7, 10, 14), ('1', 'b3', 'b5', 'b7')),
+    'Fbmmaj7': (('Fb', 'Abb', 'Cb', 'Eb'), (4, 7, 11, 15), ('1', 'b3', '5', '7')),
+    'Fbaug7': (('Fb', 'Ab', 'C', 'Ebb'), (4, 8, 12, 14), ('1', '3', '#5', 'b7')),
+    'Fbaugmaj7': (('Fb', 'Ab', 'C', 'Eb'), (4, 8, 12, 15), ('1', '3', '#5', '7')),
+    'Fbdim7': (('Fb', 'Abb', 'Cbb', 'Ebbb'), (4, 7, 10, 13), ('1', 'b3', 'b5', 'bb7')),
+    'Fbdimmaj7': (('Fb', 'Abb', 'Cbb', 'Eb'), (4, 7, 10, 15), ('1', 'b3', 'b5', '7')),
+    'Fbadd4': (('Fb', 'Ab', 'Bbb', 'Cb'), (4, 8, 9, 11), ('1', '3', '4', '5')),
+    'Fbmadd4': (('Fb', 'Abb', 'Bbb', 'Cb'), (4, 7, 9, 11), ('1', 'b3', '4', '5')),
+    'Fbadd9': (('Fb', 'Ab', 'Bbb', 'Gb'), (4, 8, 9, 18), ('1', '3', '4', '9')),
+    'Fbmadd9': (('Fb', 'Abb', 'Bbb', 'Gb'), (4, 7, 9, 18), ('1', 'b3', '4', '9')),
+    'Fb9': (('Fb', 'Ab', 'Cb', 'Ebb', 'Gb'), (4, 8, 11, 14, 18), ('1', '3', '5', 'b7', '9')),
+    'Fbmaj9': (('Fb', 'Ab', 'Cb', 'Eb', 'Gb'), (4, 8, 11, 15, 18), ('1', '3', '5', '7', '9')),
+    'Fbm9': (('Fb', 'Abb', 'Cb', 'Ebb', 'Gb'), (4, 7, 11, 14, 18), ('1', 'b3', '5', 'b7', '9')),
+    'Fb7b9': (('Fb', 'Ab', 'Cb', 'Ebb', 'Gbb'), (4, 8, 11, 14, 17), ('1', '3', '5', 'b7', 'b9')),
+    'Fb11': (('Fb', 'Ab', 'Cb', 'Ebb', 'Gb', 'Bbb'), (4, 8, 11, 14, 18, 21), ('1', '3', '5', 'b7', '9', '11')),
+    'Fb7#11': (('Fb', 'Ab', 'Cb', 'Ebb', 'Gb', 'Bb'), (4, 8, 11, 14, 18, 22), ('1', '3', '5', 'b7', '9', '#11')),
+    'Fbmaj11': (('Fb', 'Ab', 'Cb', 'Eb', 'Gb', 'Bbb'), (4, 8, 11, 15, 18, 21), ('1', '3', '5', '7', '9', '11')),
+    'Fbm11': (('Fb', 'Abb', 'Cb', 'Ebb', 'Gb', 'Bbb'), (4, 7, 11, 14, 18, 21), ('1', 'b3', '5', 'b7', '9', '11')),
+    'G': (('G', 'B', 'D'), (7, 11, 14), ('1', '3', '5')),
+    'Gm': (('G', 'Bb', 'D'), (7, 10, 14), ('1', 'b3', '5')),
+    'Gaug': (('G', 'B', 'D#'), (7, 11, 15), ('1', '3', '#5')),
+    'Gdim': (('G', 'Bb', 'Db'), (7, 10, 13), ('1', 'b3', 'b5')),
+    'Gsus2': (('G', 'A', 'D'), (7, 9, 14), ('1', '2', '5')),
+    'Gsus4': (('G', 'C', 'D'), (7, 12, 14), ('1', '4', '5')),
+    'G6': (('G', 'B', 'D', 'E'), (7, 11, 14, 16), ('1', '3', '5', '6')),
+    'Gm6': (('G', 'Bb', 'D', 'E'), (7, 10, 14, 16), ('1', 'b3', '5', '6')),
+    'G7': (('G', 'B', 'D', 'F'), (7, 11, 14, 17), ('1', '3', '5', 'b7')),
+    'G7b5': (('G', 'B', 'Db', 'F'), (7, 11, 13, 17), ('1', '3', 'b5', 'b7')),
+    'Gmaj7': (('G', 'B', 'D', 'F#'), (7, 11, 14, 18), ('1', '3', '5', '7')),
+    'Gm7': (('G', 'Bb', 'D', 'F'), (7, 10, 14, 17), ('1', 'b3', '5', 'b7')),
+    'Gm7b5': (('G', 'Bb', 'Db', 'F'), (7, 10, 13, 17), ('1', 'b3', 'b5', 'b7')),
+    'Gmmaj7': (('G', 'Bb', 'D', 'F#'), (7, 10, 14, 18), ('1', 'b3', '5', '7')),
+    'Gaug7': (('G', 'B', 'D#', 'F'), (7, 11, 15, 17), ('1', '3', '#5', 'b7')),
+    'Gaugmaj7': (('G', 'B', 'D#', 'F#'), (7, 11, 15, 18), ('1', '3', '#5', '7')),
+    'Gdim7': (('G', 'Bb', 'Db', 'Fb'), (7, 10, 13, 16), ('1', 'b3', 'b5', 'bb7')),
+    'Gdimmaj7': (('G', 'Bb', 'Db', 'F#'), (7, 10, 13, 18), ('1', 'b3', 'b5', '7')),
+    'Gadd4': (('G', 'B', 'C', 'D'), (7, 11, 12, 14), ('1', '3', '4', '5')),
+    'Gmadd4': (('G', 'Bb', 'C', 'D'), (7, 10, 12, 14), ('1', 'b3', '4', '5')),
+    'Gadd9': (('G', 'B', 'C', 'A'), (7, 11, 12, 21), ('1', '3', '4', '9')),
+    'Gmadd9': (('G', 'Bb', 'C', 'A'), (7, 10, 12, 21), ('1', 'b3', '4', '9')),
+    'G9': (('G', 'B', 'D', 'F', 'A'), (7, 11, 14, 17, 21), ('1', '3', '5', 'b7', '9')),
+    'Gmaj9': (('G', 'B', 'D', 'F#', 'A'), (7, 11, 14, 18, 21), ('1', '3', '5', '7', '9')),
+    'Gm9': (('G', 'Bb', 'D', 'F', 'A'), (7, 10, 14, 17, 21), ('1', 'b3', '5', 'b7', '9')),
+    'G7b9': (('G', 'B', 'D', 'F', 'Ab'), (7, 11, 14, 17, 20), ('1', '3', '5', 'b7', 'b9')),
+    'G11': (('G', 'B', 'D', 'F', 'A', 'C'), (7, 11, 14, 17, 21, 24), ('1', '3', '5', 'b7', '9', '11')),
+    'G7#11': (('G', 'B', 'D', 'F', 'A', 'C#'), (7, 11, 14, 17, 21, 25), ('1', '3', '5', 'b7', '9', '#11')),
+    'Gmaj11': (('G', 'B', 'D', 'F#', 'A', 'C'), (7, 11, 14, 18, 21, 24), ('1', '3', '5', '7', '9', '11')),
+    'Gm11': (('G', 'Bb', 'D', 'F', 'A', 'C'), (7, 10, 14, 17, 21, 24), ('1', 'b3', '5', 'b7', '9', '11')),
+    'G#': (('G#', 'B#', 'D#'), (8, 12, 15), ('1', '3', '5')),
+    'G#m': (('G#', 'B', 'D#'), (8, 11, 15), ('1', 'b3', '5')),
+    'G#aug': (('G#', 'B#', 'D##'), (8, 12, 16), ('1', '3', '#5')),
+    'G#dim': (('G#', 'B', 'D'), (8, 11, 14), ('1', 'b3', 'b5')),
+    'G#sus2': (('G#', 'A#', 'D#'), (8, 10, 15), ('1', '2', '5')),
+    'G#sus4': (('G#', 'C#', 'D#'), (8, 13, 15), ('1', '4', '5')),
+    'G#6': (('G#', 'B#', 'D#', 'E#'), (8, 12, 15, 17), ('1', '3', '5', '6')),
+    'G#m6': (('G#', 'B', 'D#', 'E#'), (8, 11, 15, 17), ('1', 'b3', '5', '6')),
+    'G#7': (('G#', 'B#', 'D#', 'F#'), (8, 12, 15, 18), ('1', '3', '5', 'b7')),
+    'G#7b5': (('G#', 'B#', 'D', 'F#'), (8, 12, 14, 18), ('1', '3', 'b5', 'b7')),
+    'G#maj7': (('G#', 'B#', 'D#', 'F##'), (8, 12, 15, 19), ('1', '3', '5', '7')),
+    'G#m7': (('G#', 'B', 'D#', 'F#'), (8, 11, 15, 18), ('1', 'b3', '5', 'b7')),
+    'G#m7b5': (('G#', 'B', 'D', 'F#'), (8, 11, 14, 18), ('1', 'b3', 'b5', 'b7')),
+    'G#mmaj7': (('G#', 'B', 'D#', 'F##'), (8, 11, 15, 19), ('1', 'b3', '5', '7')),
+    'G#aug7': (('G#', 'B#', 'D##', 'F#'), (8, 12, 16, 18), ('1', '3', '#5', 'b7')),
+    'G#augmaj7': (('G#', 'B#', 'D##', 'F##'), (8, 12, 16, 19), ('1', '3', '#5', '7')),
+    'G#dim7': (('G#', 'B', 'D', 'F'), (8, 11, 14, 17), ('1', 'b3', 'b5', 'bb7')),
+    'G#dimmaj7': (('G#', 'B', 'D', 'F##'), (8, 11, 14, 19), ('1', 'b3', 'b5', '7')),
+    'G#add4': (('G#', 'B#', 'C#', 'D#'), (8, 12, 13, 15), ('1', '3', '4', '5')),
+    'G#madd4': (('G#', 'B', 'C#', 'D#'), (8, 11, 13, 15), ('1', 'b3', '4', '5')),
+    'G#add9': (('G#', 'B#', 'C#', 'A#'), (8, 12, 13, 22), ('1', '3', '4', '9')),
+    'G#madd9': (('G#', 'B', 'C#', 'A#'), (8, 11, 13, 22), ('1', 'b3', '4', '9')),
+    'G#9': (('G#', 'B#', 'D#', 'F#', 'A#'), (8, 12, 15, 18, 22), ('1', '3', '5', 'b7', '9')),
+    'G#maj9': (('G#', 'B#', 'D#', 'F##', 'A#'), (8, 12, 15, 19, 22), ('1', '3', '5', '7', '9')),
+    'G#m9': (('G#', 'B', 'D#', 'F#', 'A#'), (8, 11, 15, 18, 22), ('1', 'b3', '5', 'b7', '9')),
+    'G#7b9': (('G#', 'B#', 'D#', 'F#', 'A'), (8, 12, 15, 18, 21), ('1', '3', '5', 'b7', 'b9')),
+    'G#11': (('G#', 'B#', 'D#', 'F#', 'A#', 'C#'), (8, 12, 15, 18, 22, 25), ('1', '3', '5', 'b7', '9', '11')),
+    'G#7#11': (('G#', 'B#', 'D#', 'F#', 'A#', 'C##'), (8, 12, 15, 18, 22, 26), ('1', '3', '5', 'b7', '9', '#11')),
+    'G#maj11': (('G#', 'B#', 'D#', 'F##', 'A#', 'C#'), (8, 12, 15, 19, 22, 25), ('1', '3', '5', '7', '9', '11')),
+    'G#m11': (('G#', 'B', 'D#', 'F#', 'A#', 'C#'), (8, 11, 15, 18, 22, 25), ('1', 'b3', '5', 'b7', '9', '11')),
+    'Gb': (('Gb', 'Bb', 'Db'), (6, 10, 13), ('1', '3', '5')),
+    'Gbm': (('Gb', 'Bbb', 'Db'), (6, 9, 13), ('1', 'b3', '5')),
+    'Gbaug': (('Gb', 'Bb', 'D'), (6, 10, 14), ('1', '3', '#5')),
+    'Gbdim': (('Gb', 'Bbb', 'Dbb'), (6, 9, 12), ('1', 'b3', 'b5')),
+    'Gbsus2': (('Gb', 'Ab', 'Db'), (6, 8, 13), ('1', '2', '5')),
+    'Gbsus4': (('Gb', 'Cb', 'Db'), (6, 11, 13), ('1', '4', '5')),
+    'Gb6': (('Gb', 'Bb', 'Db', 'Eb'), (6, 10, 13, 15), ('1', '3', '5', '6')),
+    'Gbm6': (('Gb', 'Bbb', 'Db', 'Eb'), (6, 9, 13, 15), ('1', 'b3', '5', '6')),
+    'Gb7': (('Gb', 'Bb', 'Db', 'Fb'), (6, 10, 13, 16), ('1', '3', '5', 'b7')),
+    'Gb7b5': (('Gb', 'Bb', 'Dbb', 'Fb'), (6, 10, 12, 16), ('1', '3', 'b5', 'b7')),
+    'Gbmaj7': (('Gb', 'Bb', 'Db', 'F'), (6, 10, 13, 17), ('1', '3', '5', '7')),
+    'Gbm7': (('Gb', 'Bbb', 'Db', 'Fb'), (6, 9, 13, 16), ('1', 'b3', '5', 'b7')),
+    'Gbm7b5': (('Gb', 'Bbb', 'Dbb', 'Fb'), (6, 9, 12, 16), ('1', 'b3', 'b5', 'b7')),
+    'Gbmmaj7': (('Gb', 'Bbb', 'Db', 'F'), (6, 9, 13, 17), ('1', 'b3', '5', '7')),
+    'Gbaug7': (('Gb', 'Bb', 'D', 'Fb'), (6, 10, 14, 16), ('1', '3', '#5', 'b7')),
+    'Gbaugmaj7': (('Gb', 'Bb', 'D', 'F'), (6, 10, 14, 17), ('1', '3', '#5', '7')),
+    'Gbdim7': (('Gb', 'Bbb', 'Dbb', 'Fbb'), (6, 9, 12, 15), ('1', 'b3', 'b5', 'bb7')),
+    'Gbdimmaj7': (('Gb', 'Bbb', 'Dbb', 'F'), (6, 9, 12, 17), ('1', 'b3', 'b5', '7')),
+    'Gbadd4': (('Gb', 'Bb', 'Cb', 'Db'), (6, 10, 11, 13), ('1', '3', '4', '5')),
+    'Gbmadd4': (('Gb', 'Bbb', 'Cb', 'Db'), (6, 9, 11, 13), ('1', 'b3', '4', '5')),
+    'Gbadd9': (('Gb', 'Bb', 'Cb', 'Ab'), (6, 10, 11, 20), ('1', '3', '4', '9')),
+    'Gbmadd9': (('Gb', 'Bbb', 'Cb', 'Ab'), (6, 9, 11, 20), ('1', 'b3', '4', '9')),
+    'Gb9': (('Gb', 'Bb', 'Db', 'Fb', 'Ab'), (6, 10, 13, 16, 20), ('1', '3', '5', 'b7', '9')),
+    'Gbmaj9': (('Gb', 'Bb', 'Db', 'F', 'Ab'), (6, 10, 13, 17, 20), ('1', '3', '5', '7', '9')),
+    'Gbm9': (('Gb', 'Bbb', 'Db', 'Fb', 'Ab'), (6, 9, 13, 16, 20), ('1', 'b3', '5', 'b7', '9')),
+    'Gb7b9': (('Gb', 'Bb', 'Db', 'Fb', 'Abb'), (6, 10, 13, 16, 19), ('1', '3', '5', 'b7', 'b9')),
+    'Gb11': (('Gb', 'Bb', 'Db', 'Fb', 'Ab', 'Cb'), (6, 10, 13, 16, 20, 23), ('1', '3', '5', 'b7', '9', '11')),
+    'Gb7#11': (('Gb', 'Bb', 'Db', 'Fb', 'Ab', 'C'), (6, 10, 13, 16, 20, 24), ('1', '3', '5', 'b7', '9', '#11')),
+    'Gbmaj11': (('Gb', 'Bb', 'Db', 'F', 'Ab', 'Cb'), (6, 10, 13, 17, 20, 23), ('1', '3', '5', '7', '9', '11')),
+    'Gbm11': (('Gb', 'Bbb', 'Db', 'Fb', 'Ab', 'Cb'), (6, 9, 13, 16, 20, 23), ('1', 'b3', '5', 'b7', '9', '11')),
+}
@@ -0,0 +1,292 @@
+"""
+Binary archives of tracks, which can be scanned or randomly accessed
+without loading them into memory.
+
+An archive starts with a header, followed by a block of columns for each
+track and ends with an index of the blocks. Each block holds the onset
+and duration of each note in ticks, the offset of each chord in the note
+columns, then the pitch and velocity of each note:
+
+    header     magic, version, ticks per beat
+    blocks     onsets (int64), durations (int64), chords (int64),
+               pitches (uint8), velocities (uint8), padded to 8 bytes
+    index      block offset, note count, chord count and tempo of each
+               track
+    trailer    index offset, track count, magic
+
+Archives are written in a single pass, one track at a time, and read by
+mapping them in memory, the columns of a track being views of the mapping.
+"""
+
+import array
+import dataclasses
+import mmap
+import os
+import struct
+import sys
+from fractions import Fraction
+from typing import IO, Iterable, Iterator, Literal, Optional
+
+from pyfrets._files import create_temporary
+from pyfrets.instrumentation import instrument
+from pyfrets.tracks import Track, TrackNote
+
+# Version of the archive format, bump it when the format changes.
+VERSION = 1
+
+# Default number of ticks per beat, as in MIDI files.
+TICKS_PER_BEAT = 480
+
+_HEADER = struct.Struct("<8sII")
+_INDEX_ENTRY = struct.Struct("<QQQQ")
+_MAGIC = b"PYFRETSA"
+_TRAILER = struct.Struct("<QQ8s")
+
+
+def _to_little_endian(column: array.array) -> bytes:  # type: ignore[type-arg]
+    if sys.byteorder == "big":
+        column.byteswap()
+    return column.tobytes()
+
+
+class ArchiveWriter:
+    """
+    A writer of the tracks of an archive at `path`.
+
+    The archive is written to a temporary file, which replaces `path` once
+    the writer is closed.
+    """
+
+    def __init__(self, path: str, *, ticks_per_beat: int = TICKS_PER_BEAT) -> None:
+        if ticks_per_beat < 1:
+            raise ValueError("Ticks per beat must be positive")
+        self.path = path
+        self.ticks_per_beat = ticks_per_beat
+        self._index = bytearray()
+        self._offset = _HEADER.size
+        fd, self._tmp_path = create_temporary(path)
+        self._fp: Optional[IO[bytes]] = os.fdopen(fd, "wb")
+        self._fp.write(_HEADER.pack(_MAGIC, VERSION, ticks_per_beat))
+
+    def __enter__(self) -> "ArchiveWriter":
+        return self
+
+    def __exit__(self, exc_type: Optional[type], *args: object) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    @instrument
+    def add_track(self, track: Track) -> None:
+        """
+        Append `track` to the archive.
+        """
+        if self._fp is None:
+            raise ValueError("Archive writer is closed")
+        onsets = array.array("q")
+        durations = array.array("q")
+        chords = array.array("q", [0])
+        pitches = array.array("B")
+        velocities = array.array("B")
+
+        time = Fraction(0)
+        try:
+            for chord in track._chords:
+                ticks = time * self.ticks_per_beat
+                for note in chord:
+                    duration = note.duration * self.ticks_per_beat
+                    if ticks.denominator != 1 or duration.denominator != 1:
+                        raise ValueError(
+                            "Duration %s is not a whole number of ticks" % note.duration
+                        )
+                    onsets.append(int(ticks))
+                    durations.append(int(duration))
+                    pitches.append(note.pitch)
+                    velocities.append(note.velocity)
+                chords.append(len(pitches))
+                if chord:
+                    time += chord[0].duration
+        except OverflowError as exc:
+            raise ValueError("Could not archive note: %s" % exc) from exc
+
+        block = b"".join(
+            _to_little_endian(column)
+            for column in (onsets, durations, chords, pitches, velocities)
+        )
+        block += bytes(-len(block) % 8)
+        self._fp.write(block)
+        self._index += _INDEX_ENTRY.pack(
+            self._offset, len(pitches), len(chords) - 1, track._beats_per_minute
+        )
+        self._offset += len(block)
+
+    def abort(self) -> None:
+        """
+        Discard the archive.
+        """
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+            os.unlink(self._tmp_path)
+
+    def close(self) -> None:
+        """
+        Write the index of the archive and move it to its path.
+        """
+        if self._fp is None:
+            return
+        try:
+            self._fp.write(self._index)
+            self._fp.write(
+                _TRAILER.pack(
+                    self._offset, len(self._index) // _INDEX_ENTRY.size, _MAGIC
+                )
+            )
+            self._fp.close()
+        except BaseException:
+            self.abort()
+            raise
+        self._fp = None
+        os.replace(self._tmp_path, self.path)
+
+
+def write_archive(
+    path: str, tracks: Iterable[Track], *, ticks_per_beat: int = TICKS_PER_BEAT
+) -> int:
+    """
+    Write the specified `tracks` to an archive at `path`, and return the
+    number of tracks written.
+    """
+    count = 0
+    with ArchiveWriter(path, ticks_per_beat=ticks_per_beat) as writer:
+        for track in tracks:
+            writer.add_track(track)
+            count += 1
+    return count
+
+
+@dataclasses.dataclass(frozen=True)
+class ArchivedTrack:
+    """
+    A track of an archive, whose columns are views of the archive.
+
+    The notes of chord `i` are the notes `chords[i]` to `chords[i + 1]`.
+    """
+
+    beats_per_minute: int
+    ticks_per_beat: int
+    onsets: memoryview
+    durations: memoryview
+    chords: memoryview
+    pitches: memoryview
+    velocities: memoryview
+
+    def __len__(self) -> int:
+        return len(self.pitches)
+
+    def to_track(self) -> Track:
+        """
+        Return the track stored in the archive.
+        """
+        track = Track(beats_per_minute=self.beats_per_minute)
+        chords = self.chords.tolist()
+        durations = self.durations.tolist()
+        pitches = self.pitches.tolist()
+        velocities = self.velocities.tolist()
+        for start, end in zip(chords, chords[1:]):
+            track._chords.append(
+                [
+                    TrackNote(
+                        duration=Fraction(durations[idx], self.ticks_per_beat),
+                        pitch=pitches[idx],
+                        velocity=velocities[idx],
+                    )
+                    for idx in range(start, end)
+                ]
+            )
+        return track
+
+
+class Archive:
+    """
+    An archive of tracks at `path`, mapped in memory.
+
+    Tracks can be accessed by their position in the archive. The mapping
+    is closed with the archive, or once the views of its tracks are
+    released if they are still in use.
+    """
+
+    def __init__(self, path: str) -> None:
+        if sys.byteorder != "little":
+            raise ValueError("Archives can only be mapped on little-endian systems")
+        self.path = path
+        with open(path, "rb") as fp:
+            size = os.fstat(fp.fileno()).st_size
+            if size < _HEADER.size + _TRAILER.size:
+                raise ValueError("%s is not a track archive" % path)
+            magic, version, ticks_per_beat = _HEADER.unpack(fp.read(_HEADER.size))
+            fp.seek(size - _TRAILER.size)
+            index_offset, count, trailer_magic = _TRAILER.unpack(fp.read())
+            if magic != _MAGIC or trailer_magic != _MAGIC:
+                raise ValueError("%s is not a track archive" % path)
+            if version != VERSION:
+                raise ValueError("Unsupported archive version %d" % version)
+            if index_offset + count * _INDEX_ENTRY.size != size - _TRAILER.size:
+                raise ValueError("%s is truncated" % path)
+            self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self.ticks_per_beat: int = ticks_per_beat
+        self._count: int = count
+        self._view = memoryview(self._mmap)
+        self._index = self._view[index_offset : size - _TRAILER.size].cast("Q")
+
+    def __enter__(self) -> "Archive":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def __getitem__(self, idx: int) -> ArchivedTrack:
+        if idx < 0:
+            idx += self._count
+        if not 0 <= idx < self._count:
+            raise IndexError("Track index out of range")
+        offset, notes, chords, beats_per_minute = self._index[4 * idx : 4 * idx + 4]
+
+        def column(fmt: Literal["B", "q"], count: int) -> memoryview:
+            nonlocal offset
+            size = count * struct.calcsize(fmt)
+            view = self._view[offset : offset + size].cast(fmt)
+            offset += size
+            return view
+
+        return ArchivedTrack(
+            beats_per_minute=beats_per_minute,
+            ticks_per_beat=self.ticks_per_beat,
+            onsets=column("q", notes),
+            durations=column("q", notes),
+            chords=column("q", chords + 1),
+            pitches=column("B", notes),
+            velocities=column("B", notes),
+        )
+
+    def __iter__(self) -> Iterator[ArchivedTrack]:
+        for idx in range(self._count):
+            yield self[idx]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        """
+        Unmap the archive.
+        """
+        self._index.release()
+        self._view.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Views of tracks are still in use, the mapping is closed once
+            # they are garbage collected.
+            pass
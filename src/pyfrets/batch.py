@@ -0,0 +1,271 @@
+"""
+Render songs, scales and chords in batches.
+
+A manifest describes the items to render, for instance:
+
+    {
+        "library": "songs.jsonl",
+        "chords": ["C", "Am7"],
+        "scales": [{"root": "A", "scale": "minor pentatonic"}],
+        "songs": ["heyjude", {"name": "blues", "repeat": 2}],
+        "formats": ["ansi", "svg"]
+    }
+
+Items are rendered by a pool of processes. Each output file is written
+atomically, and items whose inputs have not changed since the previous
+batch are skipped.
+"""
+
+import dataclasses
+import hashlib
+import json
+import os
+from typing import Any, Optional, Sequence, Union
+
+from pyfrets import __version__
+from pyfrets._files import write_atomic
+from pyfrets.chords import _parse_chord_name
+from pyfrets.fretboards import chord_name_to_fretboard, scale_name_to_fretboard
+from pyfrets.guitar import RENDERER_VERSION as FRETBOARD_RENDERER_VERSION
+from pyfrets.guitar import Fretboard, Orientation
+from pyfrets.notes import NOTE_ALPHABET, note_name_to_pitch
+from pyfrets.scales import SCALES
+from pyfrets.songs import Song, SongLibrary, strum_song
+from pyfrets.tracks import RENDERER_VERSION as TRACK_RENDERER_VERSION
+
+# File recording the input hashes of the rendered items.
+STATE_FILENAME = ".pyfrets-batch.json"
+
+FRETBOARD_FORMATS = ("ansi", "svg")
+
+
+def _dump_fretboard(board: Fretboard, fmt: str, portrait: bool) -> bytes:
+    orientation = Orientation.PORTRAIT if portrait else Orientation.LANDSCAPE
+    if fmt == "ansi":
+        return board.dump_ansi(orientation=orientation).encode("utf8")
+    else:
+        return board.dump_svg(orientation=orientation).encode("utf8")
+
+
+@dataclasses.dataclass(frozen=True)
+class ChordItem:
+    chord: str
+    formats: tuple[str, ...] = ("svg",)
+    note_names: bool = False
+    portrait: bool = False
+
+    @property
+    def basename(self) -> str:
+        return "chord-" + self.chord.replace("/", "-over-")
+
+    def render(self, fmt: str) -> bytes:
+        board = chord_name_to_fretboard(self.chord, note_names=self.note_names)
+        return _dump_fretboard(board, fmt, self.portrait)
+
+
+@dataclasses.dataclass(frozen=True)
+class ScaleItem:
+    root: str
+    scale: str
+    formats: tuple[str, ...] = ("svg",)
+    note_names: bool = False
+    portrait: bool = False
+
+    @property
+    def basename(self) -> str:
+        return f"{self.scale.replace(' ', '-')}-{self.root.lower()}"
+
+    def render(self, fmt: str) -> bytes:
+        board = scale_name_to_fretboard(
+            self.root, self.scale, note_names=self.note_names
+        )
+        return _dump_fretboard(board, fmt, self.portrait)
+
+
+@dataclasses.dataclass(frozen=True)
+class SongItem:
+    song: Song
+    repeat: int = 1
+    voice_leading: bool = False
+    formats: tuple[str, ...] = ("mid",)
+
+    @property
+    def basename(self) -> str:
+        return self.song.name
+
+    def render(self, fmt: str) -> bytes:
+        track = strum_song(
+            self.song, repeat=self.repeat, voice_leading=self.voice_leading
+        )
+        return track.dump_midi()
+
+
+Item = Union[ChordItem, ScaleItem, SongItem]
+
+
+@dataclasses.dataclass
+class BatchResult:
+    rendered: list[str] = dataclasses.field(default_factory=list)
+    skipped: list[str] = dataclasses.field(default_factory=list)
+
+
+def _get_formats(data: dict[str, Any]) -> tuple[str, ...]:
+    formats = tuple(data.get("formats", ["svg"]))
+    for fmt in formats:
+        if fmt not in FRETBOARD_FORMATS:
+            raise ValueError("Unknown format %s" % fmt)
+    return formats
+
+
+def parse_manifest(data: dict[str, Any], *, base_dir: str = ".") -> list[Item]:
+    """
+    Return the items described by a manifest.
+
+    The song library path is relative to `base_dir`.
+    """
+    items: list[Item] = []
+    formats = _get_formats(data)
+    note_names = bool(data.get("note_names", False))
+    portrait = bool(data.get("portrait", False))
+
+    for chord in data.get("chords", []):
+        _parse_chord_name(chord, NOTE_ALPHABET)
+        if "/" in chord and not note_names:
+            raise ValueError("Slash chord %s requires note names" % chord)
+        items.append(
+            ChordItem(
+                chord=chord, formats=formats, note_names=note_names, portrait=portrait
+            )
+        )
+
+    for scale in data.get("scales", []):
+        if scale["scale"] not in SCALES:
+            raise ValueError("Unknown scale %s" % scale["scale"])
+        note_name_to_pitch(scale["root"])
+        items.append(
+            ScaleItem(
+                root=scale["root"],
+                scale=scale["scale"],
+                formats=formats,
+                note_names=note_names,
+                portrait=portrait,
+            )
+        )
+
+    songs = data.get("songs", [])
+    if songs:
+        if "library" not in data:
+            raise ValueError("Songs require a song library")
+        with SongLibrary(os.path.join(base_dir, data["library"])) as library:
+            for song in songs:
+                if isinstance(song, str):
+                    song = {"name": song}
+                if song["name"] not in library:
+                    raise ValueError("Unknown song %s" % song["name"])
+                items.append(
+                    SongItem(
+                        song=library[song["name"]],
+                        repeat=song.get("repeat", 1),
+                        voice_leading=song.get("voice_leading", False),
+                    )
+                )
+
+    basenames = set()
+    for item in items:
+        if item.basename in basenames:
+            raise ValueError("Duplicate output %s" % item.basename)
+        basenames.add(item.basename)
+    return items
+
+
+def load_manifest(path: str) -> list[Item]:
+    """
+    Return the items described by the manifest at `path`.
+    """
+    with open(path) as fp:
+        data = json.load(fp)
+    return parse_manifest(data, base_dir=os.path.dirname(path))
+
+
+def _hash_item(item: Item) -> str:
+    # Outputs are rendered again when their renderer changes.
+    if isinstance(item, SongItem):
+        renderer_version = TRACK_RENDERER_VERSION
+    else:
+        renderer_version = FRETBOARD_RENDERER_VERSION
+    inputs = {
+        "type": type(item).__name__,
+        "version": [__version__, renderer_version],
+        **dataclasses.asdict(item),
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode("utf8")).hexdigest()
+
+
+def _render_item(item: Item, output_dir: str) -> str:
+    for fmt in item.formats:
+        write_atomic(
+            os.path.join(output_dir, f"{item.basename}.{fmt}"), item.render(fmt)
+        )
+    return item.basename
+
+
+def render_batch(
+    items: Sequence[Item],
+    output_dir: str,
+    *,
+    chunksize: Optional[int] = None,
+    jobs: Optional[int] = None,
+) -> BatchResult:
+    """
+    Render `items` to `output_dir`, skipping those which are up to date.
+
+    Items are distributed in chunks across `jobs` processes, by default one
+    per CPU. If `jobs` is 1, items are rendered in the current process.
+    """
+    state_path = os.path.join(output_dir, STATE_FILENAME)
+    try:
+        with open(state_path) as fp:
+            state: dict[str, str] = json.load(fp)
+    except (FileNotFoundError, ValueError):
+        state = {}
+
+    result = BatchResult()
+    pending = []
+    hashes = {}
+    for item in items:
+        item_hash = hashes[item.basename] = _hash_item(item)
+        if state.get(item.basename) == item_hash and all(
+            os.path.exists(os.path.join(output_dir, f"{item.basename}.{fmt}"))
+            for fmt in item.formats
+        ):
+            result.skipped.append(item.basename)
+        else:
+            pending.append(item)
+
+    os.makedirs(output_dir, exist_ok=True)
+    try:
+        if jobs == 1 or len(pending) <= 1:
+            for item in pending:
+                basename = _render_item(item, output_dir)
+                state[basename] = hashes[basename]
+                result.rendered.append(basename)
+        else:
+            import concurrent.futures
+
+            workers = jobs or os.cpu_count() or 1
+            if chunksize is None:
+                chunksize = max(1, len(pending) // (4 * workers))
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+                for basename in pool.map(
+                    _render_item,
+                    pending,
+                    [output_dir] * len(pending),
+                    chunksize=chunksize,
+                ):
+                    state[basename] = hashes[basename]
+                    result.rendered.append(basename)
+    finally:
+        # Record the items rendered so far, even if rendering failed.
+        write_atomic(state_path, json.dumps(state, indent=2, sort_keys=True).encode())
+
+    return result
@@ -0,0 +1,270 @@
+"""
+Content-addressed cache of rendered diagrams and MIDI files.
+
+Outputs are stored on disk under the hash of their render inputs, so they
+can be shared between processes. Writes are atomic and the least recently
+used outputs are evicted when the cache grows beyond its maximum size.
+"""
+
+import dataclasses
+import hashlib
+import os
+import threading
+from typing import Callable, Optional
+
+from pyfrets import __version__
+from pyfrets._files import write_atomic
+from pyfrets.guitar import RENDERER_VERSION as FRETBOARD_RENDERER_VERSION
+from pyfrets.guitar import Fretboard, Orientation
+from pyfrets.songs import Song, dump_song, strum_song
+from pyfrets.tracks import RENDERER_VERSION as TRACK_RENDERER_VERSION
+from pyfrets.tracks import Track
+
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+
+
+def _hash(*parts: str) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def fretboard_key(board: Fretboard, fmt: str, orientation: Orientation) -> str:
+    """
+    Return the cache key of `board` rendered to `fmt` ("ansi" or "svg").
+    """
+    # Number palette entries in order of first use, so that boards showing
+    # the same cells have the same key whatever their palette.
+    table = bytearray(256)
+    entries: list[str] = []
+    for idx in dict.fromkeys(board._cells):
+        table[idx] = len(entries)
+        cell = board._palette[idx]
+        entries.append(f"{cell.color}\t{cell.text}" if cell is not None else "")
+    cells = board._cells.translate(table).hex() + "\n" + "\n".join(entries)
+    return _hash(
+        "fretboard",
+        __version__,
+        str(FRETBOARD_RENDERER_VERSION),
+        fmt,
+        orientation.value,
+        ",".join(map(str, board._layout.strings)),
+        str(board.frets),
+        str(board.capo),
+        cells,
+    )
+
+
+def track_key(track: Track, beat_time: int = 480) -> str:
+    """
+    Return the cache key of `track` rendered to a MIDI file.
+    """
+    notes = ";".join(
+        ",".join(f"{note.pitch}:{note.duration}:{note.velocity}" for note in chord)
+        for chord in track._chords
+    )
+    return _hash(
+        "track",
+        __version__,
+        str(TRACK_RENDERER_VERSION),
+        str(track._beats_per_minute),
+        str(beat_time),
+        notes,
+    )
+
+
+def song_key(song: Song, *, repeat: int = 1, voice_leading: bool = False) -> str:
+    """
+    Return the cache key of `song` strummed and rendered to a MIDI file.
+    """
+    return _hash(
+        "song",
+        __version__,
+        str(TRACK_RENDERER_VERSION),
+        dump_song(song),
+        str(repeat),
+        str(voice_leading),
+    )
+
+
+@dataclasses.dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class RenderCache:
+    """
+    A cache of rendered outputs stored in `directory`, holding at most
+    `max_size` bytes.
+    """
+
+    def __init__(self, directory: str, *, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.directory = directory
+        self.max_size = max_size
+        self._evictions = 0
+        self._hits = 0
+        self._lock = threading.Lock()
+        self._misses = 0
+        self._size: Optional[int] = None
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Return the output stored under `key`, or `None` if it is missing.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as fp:
+                data = fp.read()
+            # Mark the output as recently used.
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self._misses += 1
+            return None
+        with self._lock:
+            self._hits += 1
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """
+        Store `data` under `key`, evicting old outputs if needed.
+        """
+        path = self._path(key)
+        with self._lock:
+            self._get_size()
+        try:
+            previous_size = os.path.getsize(path)
+        except FileNotFoundError:
+            previous_size = 0
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        write_atomic(path, data)
+        with self._lock:
+            self._size = self._get_size() - previous_size + len(data)
+            if self._size > self.max_size:
+                self._evict()
+
+    def get_or_render(self, key: str, render: Callable[[], bytes]) -> bytes:
+        """
+        Return the output stored under `key`, rendering and storing it
+        if it is missing.
+        """
+        data = self.get(key)
+        if data is None:
+            data = render()
+            self.put(key, data)
+        return data
+
+    def render_fretboard(
+        self, board: Fretboard, fmt: str, *, orientation: Orientation
+    ) -> bytes:
+        """
+        Return `board` rendered to `fmt` ("ansi" or "svg").
+        """
+
+        def render() -> bytes:
+            if fmt == "ansi":
+                return board.dump_ansi(orientation=orientation).encode("utf8")
+            elif fmt == "svg":
+                return board.dump_svg(orientation=orientation).encode("utf8")
+            raise ValueError("Unknown format %s" % fmt)
+
+        return self.get_or_render(fretboard_key(board, fmt, orientation), render)
+
+    def render_song(
+        self, song: Song, *, repeat: int = 1, voice_leading: bool = False
+    ) -> bytes:
+        """
+        Return `song` strummed and rendered to a MIDI file.
+        """
+        return self.get_or_render(
+            song_key(song, repeat=repeat, voice_leading=voice_leading),
+            lambda: strum_song(
+                song, repeat=repeat, voice_leading=voice_leading
+            ).dump_midi(),
+        )
+
+    def render_track(self, track: Track, *, beat_time: int = 480) -> bytes:
+        """
+        Return `track` rendered to a MIDI file.
+        """
+        return self.get_or_render(
+            track_key(track, beat_time), lambda: track.dump_midi(beat_time)
+        )
+
+    def stats(self) -> CacheStats:
+        """
+        Return the hit, miss and eviction counts of this cache instance and
+        the size of the cache.
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=self._get_size(),
+            )
+
+    def _evict(self) -> None:
+        # Other processes may share the cache, so look at the actual files.
+        entries = []
+        for path in self._scan():
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        entries.sort()
+
+        size = sum(entry[1] for entry in entries)
+        for mtime_ns, file_size, path in entries:
+            if size <= self.max_size:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            else:
+                self._evictions += 1
+            size -= file_size
+        self._size = size
+
+    def _get_size(self) -> int:
+        if self._size is None:
+            size = 0
+            for path in self._scan():
+                try:
+                    size += os.path.getsize(path)
+                except FileNotFoundError:
+                    pass
+            self._size = size
+        return self._size
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key[2:])
+
+    def _scan(self) -> list[str]:
+        paths: list[str] = []
+        try:
+            shards = os.scandir(self.directory)
+        except FileNotFoundError:
+            return paths
+        with shards:
+            for shard in shards:
+                if not shard.is_dir():
+                    continue
+                with os.scandir(shard.path) as entries:
+                    for entry in entries:
+                        if entry.is_file() and not entry.name.startswith("."):
+                            paths.append(entry.path)
+        return paths
@@ -0,0 +1,260 @@
+"""
+Export the chord catalogue, every root with every chord quality and every
+slash bass, with the notes, intervals, pitches and voicings of each chord.
+
+The catalogue is computed by a pool of processes and streamed to a
+JSON-lines or CSV file, in a deterministic order: by quality in the order
+of `CHORD_QUALITIES`, then by root, then by bass, the chord without a bass
+coming first.
+
+Qualities are registered after the built-in ones, so regenerating the
+catalogue once qualities were added only appends their chords. A state
+file next to the catalogue records what it holds.
+"""
+
+import argparse
+import collections
+import csv
+import json
+import os
+from typing import Any, Iterable, Iterator, Optional, TextIO
+
+from pyfrets import __version__
+from pyfrets._files import create_temporary, write_atomic
+from pyfrets.chords import (
+    CHORD_QUALITIES,
+    Quality,
+    chord_name_to_description,
+    chord_name_to_note_names,
+    chord_name_to_pitches,
+    register_chord_quality,
+)
+from pyfrets.fingering import chord_name_to_voicings
+from pyfrets.notes import NOTE_ALPHABET
+
+# Version of the catalogue rows, bump it when they change.
+VERSION = 1
+
+FORMATS = ("csv", "jsonl")
+
+# Suffix of the file recording the contents of a catalogue.
+STATE_SUFFIX = ".state"
+
+# Roots and basses of the chords, with at most one accidental.
+ROOTS = tuple(
+    letter + accidental for letter in NOTE_ALPHABET for accidental in ("", "b", "#")
+)
+
+# Default maximum number of voicings per chord.
+VOICINGS = 4
+
+CSV_FIELDS = (
+    "chord",
+    "root",
+    "quality",
+    "bass",
+    "description",
+    "note_names",
+    "intervals",
+    "pitches",
+    "voicings",
+)
+
+
+def _compute_rows(quality: Quality, root: str, voicings: int) -> list[dict[str, Any]]:
+    """
+    Return the catalogue rows of the chords of `quality` built on `root`.
+    """
+    # Processes started from a fresh interpreter only know the built-in
+    # qualities.
+    if quality.notation not in CHORD_QUALITIES:
+        register_chord_quality(quality)
+
+    rows = []
+    for bass in (None,) + ROOTS:
+        chord = root + quality.notation + ("/" + bass if bass else "")
+        rows.append(
+            {
+                "chord": chord,
+                "root": root,
+                "quality": quality.notation,
+                "bass": bass,
+                "description": chord_name_to_description(chord),
+                "note_names": chord_name_to_note_names(chord),
+                "intervals": list(quality.intervals),
+                "pitches": chord_name_to_pitches(chord),
+                "voicings": [
+                    {"frets": list(voicing.frets), "fingers": list(voicing.fingers)}
+                    for voicing in chord_name_to_voicings(chord)[:voicings]
+                ],
+            }
+        )
+    return rows
+
+
+def iter_catalogue(
+    *,
+    qualities: Optional[Iterable[Quality]] = None,
+    voicings: int = VOICINGS,
+    jobs: Optional[int] = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Yield the catalogue rows of the chords of `qualities`, by default all
+    the registered qualities, with up to `voicings` voicings per chord.
+
+    Rows are computed by `jobs` processes, by default one per CPU, and
+    yielded in order. If `jobs` is 1, rows are computed in the current
+    process.
+    """
+    if qualities is None:
+        qualities = CHORD_QUALITIES.snapshot().values()
+    tasks = ((quality, root) for quality in qualities for root in ROOTS)
+
+    if jobs == 1:
+        for quality, root in tasks:
+            yield from _compute_rows(quality, root, voicings)
+        return
+
+    import concurrent.futures
+
+    workers = jobs or os.cpu_count() or 1
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        # Keep a few tasks per worker in flight, so that rows do not pile up
+        # if they are written more slowly than they are computed.
+        pending: collections.deque[concurrent.futures.Future[list[dict[str, Any]]]] = (
+            collections.deque()
+        )
+        for quality, root in tasks:
+            pending.append(pool.submit(_compute_rows, quality, root, voicings))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _format_frets(frets: list[Optional[int]]) -> str:
+    return ",".join("x" if fret is None else str(fret) for fret in frets)
+
+
+def _write_rows(
+    fp: TextIO, rows: Iterable[dict[str, Any]], fmt: str, *, header: bool
+) -> int:
+    """
+    Write `rows` to `fp` in the format `fmt`, and return their number.
+    """
+    count = 0
+    if fmt == "csv":
+        writer = csv.DictWriter(fp, fieldnames=CSV_FIELDS)
+        if header:
+            writer.writeheader()
+        for row in rows:
+            writer.writerow(
+                {
+                    **row,
+                    "bass": row["bass"] or "",
+                    "note_names": " ".join(row["note_names"]),
+                    "intervals": " ".join(row["intervals"]),
+                    "pitches": " ".join(str(pitch) for pitch in row["pitches"]),
+                    "voicings": " ".join(
+                        _format_frets(voicing["frets"]) for voicing in row["voicings"]
+                    ),
+                }
+            )
+            count += 1
+    else:
+        for row in rows:
+            fp.write(json.dumps(row, ensure_ascii=False) + "\n")
+            count += 1
+    return count
+
+
+def write_catalogue(
+    path: str,
+    *,
+    fmt: Optional[str] = None,
+    voicings: int = VOICINGS,
+    jobs: Optional[int] = None,
+) -> int:
+    """
+    Write the catalogue of the registered chord qualities to `path`, and
+    return the number of chords written.
+
+    The format is `csv` or `jsonl`, by default guessed from the extension
+    of `path`. In CSV files, lists are separated by spaces and voicings
+    are written as the frets of each string, `x` marking muted strings.
+
+    If the catalogue at `path` was written with the same options and
+    qualities have been added since, only their chords are appended.
+    """
+    if fmt is None:
+        fmt = "csv" if path.endswith(".csv") else "jsonl"
+    if fmt not in FORMATS:
+        raise ValueError("Unknown catalogue format %s" % fmt)
+
+    qualities = list(CHORD_QUALITIES.snapshot().values())
+    signature = [[quality.notation, list(quality.intervals)] for quality in qualities]
+    options = {"format": fmt, "version": [VERSION, __version__], "voicings": voicings}
+
+    # Find how many qualities the existing catalogue holds.
+    state_path = path + STATE_SUFFIX
+    done = offset = 0
+    try:
+        with open(state_path) as fp:
+            previous = json.load(fp)
+        size = os.path.getsize(path)
+        if (
+            all(previous.get(key) == value for key, value in options.items())
+            and previous["qualities"] == signature[: len(previous["qualities"])]
+            and previous["size"] <= size
+        ):
+            done = len(previous["qualities"])
+            offset = previous["size"]
+    except (AttributeError, FileNotFoundError, KeyError, TypeError, ValueError):
+        # Write the whole catalogue again.
+        done = offset = 0
+
+    rows = iter_catalogue(qualities=qualities[done:], voicings=voicings, jobs=jobs)
+    if done:
+        # Drop anything written after the recorded size by an interrupted
+        # export, then append the new chords.
+        os.truncate(path, offset)
+        with open(path, "a", encoding="utf8", newline="") as fp:
+            count = _write_rows(fp, rows, fmt, header=False)
+    else:
+        fd, tmp_path = create_temporary(path)
+        try:
+            with os.fdopen(fd, "w", encoding="utf8", newline="") as fp:
+                count = _write_rows(fp, rows, fmt, header=True)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    state = {**options, "qualities": signature, "size": os.path.getsize(path)}
+    write_atomic(state_path, json.dumps(state, indent=2, sort_keys=True).encode())
+    return count
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Export the chord catalogue")
+    parser.add_argument("path", help="The file to write, ending in .csv or .jsonl.")
+    parser.add_argument("--format", choices=FORMATS, help="The format of the file.")
+    parser.add_argument(
+        "--jobs", type=int, help="The number of processes, by default one per CPU."
+    )
+    parser.add_argument(
+        "--voicings",
+        type=int,
+        default=VOICINGS,
+        help="The maximum number of voicings per chord.",
+    )
+    options = parser.parse_args(argv)
+
+    count = write_catalogue(
+        options.path, fmt=options.format, voicings=options.voicings, jobs=options.jobs
+    )
+    print("%d chords written to %s" % (count, options.path))
+
+
+if __name__ == "__main__":
+    main()
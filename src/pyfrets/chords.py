@@ -1,14 +1,15 @@
 import dataclasses
 import functools
 import re
+from typing import Iterator, Optional, Sequence
 
+from pyfrets._registry import Registry, Snapshot, cached_property
+from pyfrets.instrumentation import instrument
 from pyfrets.notes import (
     MAJOR_SCALE,
     NOTE_ALPHABET,
     ROMAN_ALPHABET,
-    augment,
-    diminish,
-    key_name_to_note_names,
+    SpelledNote,
     note_name_from_roman,
     note_name_to_pitch,
     parse_note_alteration,
@@ -16,20 +17,22 @@ from pyfrets.notes import (
 )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True)
 class Quality:
     notation: str
     intervals: tuple[str, ...]
     description: str
 
-    @functools.cached_property
-    def pitches(self) -> list[int]:
-        return [_get_interval_pitch(i) for i in self.intervals]
+    @cached_property
+    def pitches(self) -> tuple[int, ...]:
+        return tuple(_get_interval_pitch(i) for i in self.intervals)
 
 
-CHORD_QUALITIES = {
-    quality.notation: quality
-    for quality in [
+# The note names, pitches and interval names of a chord.
+ChordEntry = tuple[tuple[str, ...], tuple[int, ...], tuple[str, ...]]
+
+CHORD_QUALITIES = Registry(
+    [
         # 3 notes
         Quality("", ("1", "3", "5"), "major triad"),
         Quality("m", ("1", "b3", "5"), "minor triad"),
@@ -64,24 +67,19 @@ CHORD_QUALITIES = {
         Quality("7#11", ("1", "3", "5", "b7", "9", "#11"), "dominant sharp eleventh"),
         Quality("maj11", ("1", "3", "5", "7", "9", "11"), "major eleventh"),
         Quality("m11", ("1", "b3", "5", "b7", "9", "11"), "minor eleventh"),
-    ]
-}
+    ],
+    key=lambda quality: quality.notation,
+)
 
 
 def _apply_interval_to_note(root: str, interval: str) -> str:
     alterations, offset = _parse_interval(interval)
-
-    # Apply the interval and alteration.
-    notes_in_key = key_name_to_note_names(root)
-    note = notes_in_key[offset % 7]
-    for alteration in alterations:
-        if alteration == "#":
-            note = augment(note)
-        else:
-            note = diminish(note)
-    return note
+    semitones = _get_interval_pitch(interval)
+    return SpelledNote.parse(root).transpose(offset, semitones).name
 
 
+@instrument
+@functools.lru_cache(maxsize=None)
 def _get_interval_pitch(interval: str) -> int:
     alterations, offset = _parse_interval(interval)
 
@@ -94,6 +92,96 @@ def _get_interval_pitch(interval: str) -> int:
     return value
 
 
+@instrument
+@functools.lru_cache(maxsize=None)
+def _get_inversions(chord: str) -> tuple[tuple[int, ...], ...]:
+    """
+    Return the inversions of the specified `chord`, keeping the bass of
+    slash chords below the other notes.
+    """
+    root_name, quality, over = _parse_chord_name(chord, NOTE_ALPHABET)
+    pitches = chord_name_to_pitches(chord)
+    upper = pitches[1:] if over else pitches
+
+    inversions = []
+    for idx in range(len(upper)):
+        inversion = sorted(upper[idx:] + [p + 12 for p in upper[:idx]])
+        if over:
+            bass = pitches[0] % 12
+            bass += 12 * ((inversion[0] - 1 - bass) // 12)
+            inversion.insert(0, bass)
+        inversions.append(tuple(inversion))
+    return tuple(inversions)
+
+
+@instrument
+def _compute_chord(chord: str) -> ChordEntry:
+    root_name, quality, over = _parse_chord_name(chord, NOTE_ALPHABET)
+    root_pitch = note_name_to_pitch(root_name)
+
+    names = [
+        _apply_interval_to_note(root_name, interval) for interval in quality.intervals
+    ]
+    pitches = shift(root_pitch, quality.pitches)
+    if over:
+        over_pitch = note_name_to_pitch(over)
+        if over_pitch >= root_pitch:
+            over_pitch -= 12
+        names.insert(0, over)
+        pitches.insert(0, over_pitch)
+
+    return tuple(names), tuple(pitches), quality.intervals
+
+
+def _get_chord_entry(chord: str) -> ChordEntry:
+    entry = _get_chord_table().get(chord)
+    if entry is None:
+        entry = _compute_chord(chord)
+    return entry
+
+
+def _get_chord_inputs() -> tuple[object, ...]:
+    """
+    Return the data from which chord tables are computed.
+    """
+    return tuple((q.notation, q.intervals) for q in CHORD_QUALITIES.values())
+
+
+@functools.lru_cache(maxsize=None)
+def _get_chord_table() -> dict[str, ChordEntry]:
+    """
+    Return the prebuilt chord table, or an empty table if it is missing or stale.
+    """
+    try:
+        from pyfrets._tables import CHORD_INPUTS, CHORDS
+    except ImportError:
+        return {}
+    if CHORD_INPUTS != _get_chord_inputs():
+        return {}
+    return CHORDS
+
+
+def _get_voice_leading_cost(a: Sequence[int], b: Sequence[int]) -> int:
+    """
+    Return the smallest total motion in semitones to move from the voices
+    in `a` to the voices in `b`, allowing voices to split or merge.
+
+    Both sequences must be sorted.
+    """
+    cols = len(b) + 1
+    previous = [0] + [1 << 30] * len(b)
+    for x in a:
+        current = [1 << 30] * cols
+        for j in range(1, cols):
+            current[j] = abs(x - b[j - 1]) + min(
+                previous[j - 1], previous[j], current[j - 1]
+            )
+        previous = current
+    return previous[-1]
+
+
+@instrument
+@functools.lru_cache(maxsize=None)
 def _parse_interval(interval: str) -> tuple[str, int]:
     m = re.match(r"^([b#]*)(\d+)$", interval)
     assert m, f"Invalid interval {interval}"
@@ -102,21 +190,74 @@ def _parse_interval(interval: str) -> tuple[str, int]:
     return alterations, offset
 
 
-def _parse_chord_name(name: str, alphabet: list[str]) -> tuple[str, Quality, str]:
+# Registering a quality replaces the snapshot, so only the grammars of the
+# current one are kept, for the note and roman alphabets.
+SNAPSHOT_CACHE_SIZE = 2
+
+
+def _get_chord_pattern(alphabet: tuple[str, ...], qualities: Snapshot[Quality]) -> str:
     alphabet_re = "(?:" + ("|".join(alphabet)) + ")[b#]?"
-    quality_re = "|".join(CHORD_QUALITIES.keys())
-    chord_re = re.compile(
-        "^(" + alphabet_re + ")(" + quality_re + ")(?:/(" + alphabet_re + "))?$"
+    quality_re = "|".join(re.escape(notation) for notation in qualities)
+    return "(" + alphabet_re + ")(" + quality_re + ")(?:/(" + alphabet_re + "))?"
+
+
+@functools.lru_cache(maxsize=SNAPSHOT_CACHE_SIZE)
+def _get_chord_regex(
+    alphabet: tuple[str, ...], qualities: Snapshot[Quality]
+) -> re.Pattern[str]:
+    """
+    Return the compiled grammar of chord names whose roots use `alphabet`
+    and whose qualities are in `qualities`.
+    """
+    return re.compile("^" + _get_chord_pattern(alphabet, qualities) + "$")
+
+
+@functools.lru_cache(maxsize=SNAPSHOT_CACHE_SIZE)
+def _get_progression_regex(
+    alphabet: tuple[str, ...], qualities: Snapshot[Quality]
+) -> re.Pattern[str]:
+    """
+    Return the compiled scanner of chord charts whose chord roots use
+    `alphabet` and whose qualities are in `qualities`. Anything which is not
+    a valid token is an error token.
+    """
+    return re.compile(
+        r"(?P<space>\s+)"
+        r"|(?P<repeat_start>\|:)"
+        r"|(?P<repeat_end>:\|\|?(?:x(?P<times>\d+))?)"
+        r"|(?P<bar>\|+(?!:))"
+        r"|\[(?P<section>[^\]\n]+)\]"
+        r"|(?P<chord>" + _get_chord_pattern(alphabet, qualities) + r")(?=[\s|\[:]|$)"
+        r"|(?P<error>\[[^\]\s]*|[^\s|\[]+|.)"
     )
-    m = chord_re.match(name)
+
+
+@instrument
+def _parse_chord_name(name: str, alphabet: list[str]) -> tuple[str, Quality, str]:
+    qualities = CHORD_QUALITIES.snapshot()
+    m = _get_chord_regex(tuple(alphabet), qualities).match(name)
     if not m:
         raise ValueError("Could not parse chord notation %s" % name)
     root = m.group(1)
-    quality = CHORD_QUALITIES[m.group(2)]
+    quality = qualities[m.group(2)]
     over = m.group(3)
     return root, quality, over
 
 
+def register_chord_quality(quality: Quality) -> None:
+    """
+    Register a chord `quality`, so that chord names using its notation can
+    be parsed.
+
+    Qualities cannot be replaced, so chords parsed before stay valid.
+    """
+    for interval in quality.intervals:
+        if not re.match(r"^[b#]*[1-9]\d*$", interval):
+            raise ValueError("Invalid interval %s" % interval)
+    CHORD_QUALITIES.register(quality)
+
+
+@instrument
 def chord_name_from_roman(roman: str, key: str) -> str:
     """
     Return a chord name for the given `roman` chord notation in the specified `key`.
@@ -126,7 +267,7 @@ def chord_name_from_roman(roman: str, key: str) -> str:
 
     # get root
     minor = numeral.islower()
-    chord = note_name_from_roman(numeral, key) + alteration
+    chord = note_name_from_roman(numeral + alteration, key)
     if minor and quality.notation != "dim":
         chord += "m"
     chord += quality.notation
@@ -149,40 +290,189 @@ def chord_name_to_description(chord: str) -> str:
     return description
 
 
+@instrument
 def chord_name_to_pitches(chord: str) -> list[int]:
     """
     Return the pitches to play the specified `chord`.
     """
-    root_name, quality, over = _parse_chord_name(chord, NOTE_ALPHABET)
-    root_pitch = note_name_to_pitch(root_name)
-
-    pitches = shift(root_pitch, quality.pitches)
-    if over:
-        over_pitch = note_name_to_pitch(over)
-        if over_pitch >= root_pitch:
-            over_pitch -= 12
-        pitches.insert(0, over_pitch)
-
-    return pitches
+    return list(_get_chord_entry(chord)[1])
 
 
+@instrument
 def chord_name_to_interval_names(chord: str) -> list[str]:
     """
     Return the interval names for the specified `chord`.
     """
-    root_name, quality, over = _parse_chord_name(chord, NOTE_ALPHABET)
-    assert not over, "Slash chords are not supported"
-    return list(quality.intervals)
+    entry = _get_chord_entry(chord)
+    assert "/" not in chord, "Slash chords are not supported"
+    return list(entry[2])
 
 
+@instrument
 def chord_name_to_note_names(chord: str) -> list[str]:
     """
     Return the note names to play the specified `chord`.
     """
-    root_name, quality, over = _parse_chord_name(chord, NOTE_ALPHABET)
-    names = [
-        _apply_interval_to_note(root_name, interval) for interval in quality.intervals
-    ]
-    if over:
-        names.insert(0, over)
-    return names
+    return list(_get_chord_entry(chord)[0])
+
+
+@instrument
+def chord_names_to_voice_leading(chords: Sequence[str]) -> list[list[int]]:
+    """
+    Return the pitches to play the specified `chords`, choosing the inversion
+    and octave of each chord to minimise motion from the previous chord.
+
+    Chords are kept within an octave and a half of the first one, so that
+    long progressions do not drift out of range.
+    """
+    voicings: list[list[int]] = []
+    previous: Sequence[int] = ()
+    center = 0.0
+    for chord in chords:
+        if not previous:
+            previous = chord_name_to_pitches(chord)
+            center = sum(previous) / len(previous)
+        else:
+            candidates = []
+            for inversion in _get_inversions(chord):
+                octave = round((center - sum(inversion) / len(inversion)) / 12)
+                for shift in (octave - 1, octave, octave + 1):
+                    candidates.append([p + 12 * shift for p in inversion])
+            previous = min(
+                candidates, key=lambda c: _get_voice_leading_cost(previous, c)
+            )
+        voicings.append(list(previous))
+    return voicings
+
+
+@dataclasses.dataclass(frozen=True)
+class Repeat:
+    start: int
+    end: int
+    times: int
+
+
+@dataclasses.dataclass(frozen=True)
+class Progression:
+    """
+    A chord progression, with its repeats kept unexpanded.
+
+    `chords` holds the chords as written, `bars` the index of the first
+    chord of each bar, `repeats` the ranges of chords played `times` times
+    and `sections` the name and range of chords of each section.
+    Iterating over a progression yields the chords as played.
+    """
+
+    chords: tuple[str, ...]
+    bars: tuple[int, ...] = ()
+    repeats: tuple[Repeat, ...] = ()
+    sections: tuple[tuple[str, int, int], ...] = ()
+
+    def __iter__(self) -> Iterator[str]:
+        position = 0
+        for repeat in self.repeats:
+            yield from self.chords[position : repeat.start]
+            for _ in range(repeat.times):
+                yield from self.chords[repeat.start : repeat.end]
+            position = repeat.end
+        yield from self.chords[position:]
+
+    def __len__(self) -> int:
+        return len(self.chords) + sum(
+            (repeat.times - 1) * (repeat.end - repeat.start) for repeat in self.repeats
+        )
+
+    def resolve(self, key: str) -> "Progression":
+        """
+        Return this progression in roman notation resolved in the specified `key`.
+        """
+        return dataclasses.replace(
+            self, chords=tuple(chord_name_from_roman(c, key) for c in self.chords)
+        )
+
+
+def _progression_error(message: str, chart: str, offset: int) -> ValueError:
+    line = chart.count("\n", 0, offset) + 1
+    column = offset - chart.rfind("\n", 0, offset)
+    return ValueError("%s (line %d, column %d)" % (message, line, column))
+
+
+# Charts can come from users, so only the most recently parsed are kept.
+PROGRESSION_CACHE_SIZE = 1024
+
+
+@instrument
+@functools.lru_cache(maxsize=PROGRESSION_CACHE_SIZE)
+def parse_progression(chart: str, *, roman: bool = False) -> Progression:
+    """
+    Return the progression written in the specified chord `chart`.
+
+    Chords are separated by whitespace or bar lines (`|`). Repeated chords
+    are enclosed in `|:` and `:|`, optionally followed by the number of
+    times they are played, for instance `:|x3`. A repeat without `|:`
+    starts after the previous repeat or at the start of the section.
+    Sections start with their name in brackets, for instance `[verse]`.
+    """
+    alphabet = ROMAN_ALPHABET if roman else NOTE_ALPHABET
+    chords: list[str] = []
+    boundaries = [0]
+    repeats: list[Repeat] = []
+    sections: list[tuple[str, int]] = []
+    repeat_start: Optional[int] = None
+    repeat_offset = 0
+    section_start = 0
+
+    regex = _get_progression_regex(tuple(alphabet), CHORD_QUALITIES.snapshot())
+    for match in regex.finditer(chart):
+        kind = match.lastgroup
+        if kind == "chord":
+            chords.append(match.group())
+            continue
+        elif kind == "space":
+            continue
+        elif kind == "repeat_start":
+            if repeat_start is not None:
+                raise _progression_error(
+                    "Repeats cannot be nested", chart, match.start()
+                )
+            repeat_start = len(chords)
+            repeat_offset = match.start()
+        elif kind == "repeat_end":
+            if repeat_start is None:
+                repeat_start = max(section_start, repeats[-1].end if repeats else 0)
+            times = int(match.group("times") or 2)
+            if repeat_start == len(chords):
+                raise _progression_error("Repeat is empty", chart, match.start())
+            if times < 1:
+                raise _progression_error(
+                    "Repeat count must be positive", chart, match.start()
+                )
+            repeats.append(Repeat(start=repeat_start, end=len(chords), times=times))
+            repeat_start = None
+        elif kind == "section":
+            if repeat_start is not None:
+                raise _progression_error(
+                    "Sections cannot start inside a repeat", chart, match.start()
+                )
+            sections.append((match.group("section").strip(), len(chords)))
+            section_start = len(chords)
+        elif kind == "error":
+            raise _progression_error(
+                "Could not parse chord notation %s" % match.group(),
+                chart,
+                match.start(),
+            )
+        boundaries.append(len(chords))
+
+    if repeat_start is not None:
+        raise _progression_error("Repeat is never closed", chart, repeat_offset)
+
+    section_ends = [start for name, start in sections[1:]] + [len(chords)]
+    return Progression(
+        chords=tuple(chords),
+        bars=tuple(sorted(b for b in set(boundaries) if b < len(chords))),
+        repeats=tuple(repeats),
+        sections=tuple(
+            (name, start, end) for (name, start), end in zip(sections, section_ends)
+        ),
+    )
@@ -0,0 +1,257 @@
+"""
+Chord box diagrams, showing how to play a voicing of a chord.
+
+A chord box shows a window of a few frets, the nut when the window starts
+on the first fret, open and muted strings above the nut, and the finger
+placed on each fretted string.
+
+A sprite sheet packs many chord boxes into a single SVG image. Each chord
+box is a `<symbol>` which can be referenced from another document, for
+instance `<use href="sheet.svg#pyfrets-chord-Am7"/>`, the parts shared by
+chord boxes such as the grid being defined once.
+"""
+
+import dataclasses
+import re
+from typing import Iterable
+
+from pyfrets.fingering import Voicing, chord_name_to_voicings
+from pyfrets.notes import prettify_chord
+
+# Minimum number of frets shown.
+MIN_FRETS = 4
+
+# Sizes of chord boxes, in pixels.
+_BOTTOM = 6
+_FRET_SPACING = 14
+_LEFT = 22
+_RIGHT = 10
+_STRING_SPACING = 12
+_TOP = 32
+
+_STYLE = (
+    "<style>"
+    ".pyfrets-name{font:bold 12px arial;text-anchor:middle}"
+    ".pyfrets-finger{font:9px arial;fill:white;text-anchor:middle}"
+    ".pyfrets-position{font:9px arial;text-anchor:end}"
+    "</style>"
+)
+
+# Markers drawn above the nut.
+_MARKERS = (
+    '<g id="pyfrets-open"><circle r="3.5" fill="none" stroke="black"/></g>'
+    '<g id="pyfrets-muted" stroke="black">'
+    '<line x1="-3" y1="-3" x2="3" y2="3"/><line x1="-3" y1="3" x2="3" y2="-3"/></g>'
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class SpriteSheet:
+    """
+    An SVG image holding chord boxes, and the ID of the symbol of each
+    chord box by chord name.
+    """
+
+    svg: str
+    ids: dict[str, str]
+
+
+def _get_size(strings: int, frets: int) -> tuple[int, int]:
+    return (
+        _LEFT + (strings - 1) * _STRING_SPACING + _RIGHT,
+        _TOP + frets * _FRET_SPACING + _BOTTOM,
+    )
+
+
+def _get_window(voicing: Voicing) -> tuple[int, int]:
+    """
+    Return the first fret and the number of frets shown for `voicing`.
+    """
+    fretted = [f for f in voicing.frets if f]
+    highest = max(fretted, default=0)
+    if highest <= MIN_FRETS:
+        return 1, MIN_FRETS
+    first = min(fretted)
+    return first, max(MIN_FRETS, highest - first + 1)
+
+
+def _dump_grid(strings: int, frets: int) -> str:
+    """
+    Return the strings and frets of a chord box, drawn from the origin.
+    """
+    width = (strings - 1) * _STRING_SPACING
+    height = frets * _FRET_SPACING
+    output = f'<g id="pyfrets-grid-{strings}x{frets}" stroke="black">'
+    for string_idx in range(strings):
+        x = string_idx * _STRING_SPACING
+        output += f'<line x1="{x}" y1="0" x2="{x}" y2="{height}"/>'
+    for fret_idx in range(frets + 1):
+        y = fret_idx * _FRET_SPACING
+        output += f'<line x1="0" y1="{y}" x2="{width}" y2="{y}"/>'
+    return output + "</g>"
+
+
+def _dump_box(voicing: Voicing, name: str) -> str:
+    """
+    Return the contents of the chord box of `voicing`, which uses the grid
+    and markers defined by the enclosing image.
+    """
+    strings = len(voicing.frets)
+    first, frets = _get_window(voicing)
+    grid_id = f"pyfrets-grid-{strings}x{frets}"
+    width = (strings - 1) * _STRING_SPACING
+
+    output = (
+        f'<text class="pyfrets-name" x="{_LEFT + width / 2:g}" y="12">'
+        f"{prettify_chord(name)}</text>"
+        f'<use href="#{grid_id}" x="{_LEFT}" y="{_TOP}"/>'
+    )
+    if first == 1:
+        output += (
+            f'<line x1="{_LEFT}" y1="{_TOP}" x2="{_LEFT + width}" y2="{_TOP}"'
+            ' stroke="black" stroke-width="4"/>'
+        )
+    else:
+        output += (
+            f'<text class="pyfrets-position" x="{_LEFT - 4}"'
+            f' y="{_TOP + _FRET_SPACING / 2 + 3:g}">{first}fr</text>'
+        )
+
+    # Draw a barre for the index finger if it frets several strings.
+    barred = [s for s, finger in enumerate(voicing.fingers) if finger == 1]
+    if len(barred) > 1:
+        y = _TOP + ((voicing.frets[barred[0]] or 0) - first + 0.5) * _FRET_SPACING
+        output += (
+            f'<line x1="{_LEFT + barred[0] * _STRING_SPACING}" y1="{y:g}"'
+            f' x2="{_LEFT + barred[-1] * _STRING_SPACING}" y2="{y:g}"'
+            ' stroke="black" stroke-width="10" stroke-linecap="round"/>'
+        )
+
+    for string_idx, (fret, finger) in enumerate(zip(voicing.frets, voicing.fingers)):
+        x = _LEFT + string_idx * _STRING_SPACING
+        if fret is None:
+            output += f'<use href="#pyfrets-muted" x="{x}" y="{_TOP - 7}"/>'
+        elif fret == 0:
+            output += f'<use href="#pyfrets-open" x="{x}" y="{_TOP - 7}"/>'
+        else:
+            y = _TOP + (fret - first + 0.5) * _FRET_SPACING
+            output += f'<circle cx="{x}" cy="{y:g}" r="5"/>'
+            if finger is not None:
+                output += (
+                    f'<text class="pyfrets-finger" x="{x}" y="{y + 3:g}">'
+                    f"{finger}</text>"
+                )
+    return output
+
+
+def dump_chord_box(voicing: Voicing, *, name: str = "") -> str:
+    """
+    Write the chord box of `voicing` to an SVG image, titled with `name`.
+    """
+    strings = len(voicing.frets)
+    frets = _get_window(voicing)[1]
+    width, height = _get_size(strings, frets)
+    return (
+        f'<svg viewBox="0 0 {width} {height}" xmlns="http://www.w3.org/2000/svg">'
+        + _STYLE
+        + "<defs>"
+        + _MARKERS
+        + _dump_grid(strings, frets)
+        + "</defs>"
+        + _dump_box(voicing, name)
+        + "</svg>"
+    )
+
+
+def _get_symbol_id(name: str, used: set[str]) -> str:
+    base = "pyfrets-chord-" + re.sub(
+        r"[^A-Za-z0-9_-]", "_", name.replace("#", "s").replace("/", "-over-")
+    )
+    symbol_id = base
+    counter = 2
+    while symbol_id in used:
+        symbol_id = f"{base}-{counter}"
+        counter += 1
+    used.add(symbol_id)
+    return symbol_id
+
+
+def dump_chord_box_sheet(
+    diagrams: Iterable[tuple[str, Voicing]], *, columns: int = 8
+) -> SpriteSheet:
+    """
+    Write the chord boxes of the specified (name, voicing) pairs to a
+    sprite sheet, laid out in `columns` columns.
+
+    Repeated pairs share a symbol. The IDs of chords with the same name
+    but different voicings get a numeric suffix, and the ID map points to
+    the first of them.
+    """
+    if columns < 1:
+        raise ValueError("Sprite sheet needs at least one column")
+
+    grids: dict[tuple[int, int], str] = {}
+    symbols: list[str] = []
+    seen: dict[tuple[str, Voicing], str] = {}
+    ids: dict[str, str] = {}
+    used_ids: set[str] = set()
+    cell_width = cell_height = 0
+    for name, voicing in diagrams:
+        if (name, voicing) in seen:
+            continue
+        symbol_id = seen[(name, voicing)] = _get_symbol_id(name, used_ids)
+        ids.setdefault(name, symbol_id)
+
+        strings = len(voicing.frets)
+        frets = _get_window(voicing)[1]
+        if (strings, frets) not in grids:
+            grids[(strings, frets)] = _dump_grid(strings, frets)
+        width, height = _get_size(strings, frets)
+        cell_width = max(cell_width, width)
+        cell_height = max(cell_height, height)
+
+        symbols.append(
+            f'<symbol id="{symbol_id}" viewBox="0 0 {width} {height}"'
+            f' width="{width}" height="{height}">{_dump_box(voicing, name)}</symbol>'
+        )
+
+    # Lay the chord boxes out on a grid of cells fitting the largest box.
+    rows = -(-len(seen) // columns)
+    sheet_width = cell_width * min(columns, len(seen))
+    sheet_height = cell_height * rows
+    layout = "".join(
+        f'<use href="#{symbol_id}" x="{idx % columns * cell_width}"'
+        f' y="{idx // columns * cell_height}"/>'
+        for idx, symbol_id in enumerate(seen.values())
+    )
+    svg = (
+        f'<svg viewBox="0 0 {sheet_width} {sheet_height}"'
+        ' xmlns="http://www.w3.org/2000/svg">'
+        + _STYLE
+        + "<defs>"
+        + _MARKERS
+        + "".join(grids.values())
+        + "".join(symbols)
+        + "</defs>"
+        + layout
+        + "</svg>"
+    )
+    return SpriteSheet(svg=svg, ids=ids)
+
+
+def chord_names_to_chord_box_sheet(
+    chords: Iterable[str], *, columns: int = 8
+) -> SpriteSheet:
+    """
+    Write the chord boxes of the easiest voicing of each of the specified
+    `chords` to a sprite sheet.
+    """
+
+    def diagrams() -> Iterable[tuple[str, Voicing]]:
+        for chord in chords:
+            voicings = chord_name_to_voicings(chord)
+            if not voicings:
+                raise ValueError("Could not find a voicing for chord %s" % chord)
+            yield chord, voicings[0]
+
+    return dump_chord_box_sheet(diagrams(), columns=columns)
@@ -0,0 +1,201 @@
+import dataclasses
+import functools
+import itertools
+from typing import Optional, Sequence
+
+from pyfrets._registry import cached_property
+from pyfrets.chords import _parse_chord_name, chord_name_to_pitches
+from pyfrets.guitar import FRETS, STRINGS
+from pyfrets.notes import NOTE_ALPHABET, note_name_to_pitch
+
+# Number of frets covered by the fretting hand.
+HAND_SPAN = 4
+
+# Maximum number of candidate voicings kept per chord.
+MAX_CANDIDATES = 16
+
+# Costs used to rank the voicings of a single chord.
+FINGER_COST = 1.0
+MUTED_STRING_COST = 1.5
+OPEN_STRING_COST = 0.0
+POSITION_COST = 0.2
+SPAN_COST = 1.0
+
+# Costs used to move from one voicing to the next.
+FINGER_CHANGE_COST = 0.5
+FRET_MOVE_COST = 1.0
+
+
+@dataclasses.dataclass(frozen=True)
+class Voicing:
+    """
+    A way of playing a chord, as the fret played on each string.
+
+    Muted strings are represented by `None`, open strings by `0`.
+    """
+
+    frets: tuple[Optional[int], ...]
+    fingers: tuple[Optional[int], ...]
+    cost: float
+
+    @cached_property
+    def placements(self) -> frozenset[tuple[int, int, int]]:
+        """
+        The (finger, string, fret) placements of the fretting hand.
+        """
+        return frozenset(
+            (finger, string_idx, fret)
+            for string_idx, (finger, fret) in enumerate(zip(self.fingers, self.frets))
+            if finger is not None and fret is not None
+        )
+
+    @cached_property
+    def position(self) -> int:
+        """
+        The lowest fretted fret, or `0` if only open strings are played.
+        """
+        return min((f for f in self.frets if f), default=0)
+
+
+def _assign_fingers(frets: tuple[Optional[int], ...]) -> tuple[Optional[int], ...]:
+    fretted = [f for f in frets if f]
+    if not fretted:
+        return tuple(None for f in frets)
+
+    # The index finger bars the lowest fret unless this would mute an open
+    # string, the other fingers are placed one per string.
+    lowest = min(fretted)
+    barred = [s for s, f in enumerate(frets) if f == lowest]
+    if any(f == 0 for f in frets[barred[0] : barred[-1]]):
+        barred = barred[:1]
+    others = sorted(
+        (fret, string_idx)
+        for string_idx, fret in enumerate(frets)
+        if fret and string_idx not in barred
+    )
+    fingers: list[Optional[int]] = [
+        1 if s in barred else None for s in range(len(frets))
+    ]
+    for finger, (fret, string_idx) in enumerate(others, start=2):
+        fingers[string_idx] = finger
+    return tuple(fingers)
+
+
+def _make_voicing(frets: tuple[Optional[int], ...]) -> Optional[Voicing]:
+    fingers = _assign_fingers(frets)
+    if max((f for f in fingers if f is not None), default=0) > 4:
+        return None
+
+    fretted = [f for f in frets if f]
+    position = min(fretted, default=0)
+    span = max(fretted, default=0) - position
+    cost = (
+        FINGER_COST * len(set(f for f in fingers if f is not None))
+        + MUTED_STRING_COST * sum(1 for f in frets if f is None)
+        + OPEN_STRING_COST * sum(1 for f in frets if f == 0)
+        + POSITION_COST * position
+        + SPAN_COST * span
+    )
+    return Voicing(frets=frets, fingers=fingers, cost=cost)
+
+
+@functools.lru_cache(maxsize=None)
+def _find_voicings(
+    pitch_classes: frozenset[int], bass: int, required: frozenset[int]
+) -> tuple[Voicing, ...]:
+    found: dict[tuple[Optional[int], ...], Voicing] = {}
+    for low in range(len(STRINGS) - 2):
+        for base in range(1, FRETS - HAND_SPAN + 1):
+            window = [0] + list(range(base, base + HAND_SPAN))
+            options = [
+                [f for f in window if (STRINGS[s] + f) % 12 in pitch_classes]
+                for s in range(low, len(STRINGS))
+            ]
+            options[0] = [f for f in options[0] if (STRINGS[low] + f) % 12 == bass]
+            for played in itertools.product(*options):
+                frets = (None,) * low + played
+                if frets in found:
+                    continue
+                sounding = {
+                    (STRINGS[s] + f) % 12 for s, f in enumerate(frets) if f is not None
+                }
+                if not required <= sounding:
+                    continue
+                voicing = _make_voicing(frets)
+                if voicing is not None:
+                    found[frets] = voicing
+
+    return tuple(sorted(found.values(), key=lambda v: v.cost)[:MAX_CANDIDATES])
+
+
+@functools.lru_cache(maxsize=None)
+def chord_name_to_voicings(chord: str) -> tuple[Voicing, ...]:
+    """
+    Return the candidate voicings for the specified `chord`, best first.
+    """
+    root_name, quality, over = _parse_chord_name(chord, NOTE_ALPHABET)
+    pitch_classes = frozenset(p % 12 for p in chord_name_to_pitches(chord))
+    bass = note_name_to_pitch(over or root_name)
+
+    # Larger chords are usually played without their fifth.
+    required = pitch_classes
+    if len(pitch_classes) > 3:
+        fifth = (note_name_to_pitch(root_name) + 7) % 12
+        if fifth != bass:
+            required = required - {fifth}
+
+    return _find_voicings(pitch_classes, bass, required)
+
+
+def _transition_cost(a: Voicing, b: Voicing) -> float:
+    return FRET_MOVE_COST * abs(a.position - b.position) + FINGER_CHANGE_COST * len(
+        b.placements - a.placements
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _transition_costs(a: str, b: str) -> tuple[tuple[float, ...], ...]:
+    return tuple(
+        tuple(_transition_cost(va, vb) for vb in chord_name_to_voicings(b))
+        for va in chord_name_to_voicings(a)
+    )
+
+
+def chord_names_to_voicings(chords: Sequence[str]) -> list[Voicing]:
+    """
+    Return the sequence of voicings which is easiest to play for the
+    specified `chords`, taking hand movements into account.
+    """
+    if not chords:
+        return []
+
+    candidates = [chord_name_to_voicings(chord) for chord in chords]
+    for chord, voicings in zip(chords, candidates):
+        if not voicings:
+            raise ValueError("Could not find a voicing for chord %s" % chord)
+
+    # Find the cheapest path using dynamic programming.
+    costs = [v.cost for v in candidates[0]]
+    backtrack: list[list[int]] = []
+    for idx in range(1, len(chords)):
+        transitions = _transition_costs(chords[idx - 1], chords[idx])
+        steps = []
+        new_costs = []
+        for j, voicing in enumerate(candidates[idx]):
+            best_cost, best_i = min(
+                (cost + row[j], i)
+                for i, (cost, row) in enumerate(zip(costs, transitions))
+            )
+            steps.append(best_i)
+            new_costs.append(best_cost + voicing.cost)
+        backtrack.append(steps)
+        costs = new_costs
+
+    # Walk back from the cheapest final voicing.
+    index = min(range(len(costs)), key=costs.__getitem__)
+    path = [index]
+    for steps in reversed(backtrack):
+        index = steps[index]
+        path.append(index)
+    path.reverse()
+    return [voicings[i] for voicings, i in zip(candidates, path)]
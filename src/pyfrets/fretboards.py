@@ -0,0 +1,168 @@
+"""
+Build fretboards showing chords, keys and scales, and animate the chords
+of songs.
+"""
+
+from typing import Iterable, Iterator
+
+from pyfrets.chords import (
+    chord_name_to_interval_names,
+    chord_name_to_note_names,
+    chord_name_to_pitches,
+)
+from pyfrets.guitar import Cell, Fretboard, Orientation, dump_animated_svg
+from pyfrets.notes import (
+    key_name_to_note_names,
+    key_name_to_pitches,
+    prettify_interval,
+    prettify_note,
+)
+from pyfrets.scales import SCALES, scale_name_to_note_names, scale_name_to_pitches
+from pyfrets.songs import Song, _parse_strum_pattern
+
+DIATONIC_NOTE_FUNCTIONS = ["R", "2", "3", "4", "5", "6", "7"]
+SCALE_NOTE_COLORS = ["red", "black", "green", "magenta", "blue", "black", "magenta"]
+
+
+def notes_to_fretboard(
+    *,
+    note_colors: list[str],
+    note_texts: list[str],
+    note_values: list[int],
+    tuning: str = "standard",
+    capo: int = 0,
+) -> Fretboard:
+    """
+    Return a fretboard showing every position of the specified notes.
+    """
+    cells: dict[int, Cell] = {}
+    for color, text, note_value in zip(note_colors, note_texts, note_values):
+        cells.setdefault(note_value % 12, Cell(color=color, text=text))
+    board = Fretboard(tuning=tuning, capo=capo)
+    board.set_pitches(cells)
+    return board
+
+
+def chord_name_to_fretboard(
+    chord: str, *, note_names: bool = False, tuning: str = "standard", capo: int = 0
+) -> Fretboard:
+    """
+    Return a fretboard showing the notes of the specified `chord`.
+    """
+    note_values = chord_name_to_pitches(chord)
+    if note_names:
+        note_texts = [prettify_note(n) for n in chord_name_to_note_names(chord)]
+    else:
+        note_texts = [prettify_interval(i) for i in chord_name_to_interval_names(chord)]
+    return notes_to_fretboard(
+        note_colors=[SCALE_NOTE_COLORS[i] for i in range(len(note_values))],
+        note_texts=note_texts,
+        note_values=note_values,
+        tuning=tuning,
+        capo=capo,
+    )
+
+
+def key_name_to_fretboard(
+    key: str, *, note_names: bool = False, tuning: str = "standard", capo: int = 0
+) -> Fretboard:
+    """
+    Return a fretboard showing the notes of the specified `key`.
+    """
+    if note_names:
+        note_texts = [prettify_note(n) for n in key_name_to_note_names(key)]
+    else:
+        note_texts = DIATONIC_NOTE_FUNCTIONS
+    return notes_to_fretboard(
+        note_colors=SCALE_NOTE_COLORS,
+        note_texts=note_texts,
+        note_values=list(key_name_to_pitches(key)),
+        tuning=tuning,
+        capo=capo,
+    )
+
+
+def scale_name_to_fretboard(
+    root: str,
+    scale: str,
+    *,
+    note_names: bool = False,
+    tuning: str = "standard",
+    capo: int = 0,
+) -> Fretboard:
+    """
+    Return a fretboard showing the notes of the specified `scale` starting
+    on `root`.
+    """
+    intervals = SCALES[scale].intervals
+    if note_names:
+        note_texts = [prettify_note(n) for n in scale_name_to_note_names(root, scale)]
+    else:
+        note_texts = ["R" if i == "1" else prettify_interval(i) for i in intervals]
+    return notes_to_fretboard(
+        note_colors=[
+            SCALE_NOTE_COLORS[(int(i.lstrip("b#")) - 1) % 7] for i in intervals
+        ],
+        note_texts=note_texts,
+        note_values=scale_name_to_pitches(root, scale),
+        tuning=tuning,
+        capo=capo,
+    )
+
+
+def chord_names_to_animated_svg(
+    chords: Iterable[tuple[str, float]],
+    *,
+    beats_per_minute: int,
+    orientation: Orientation,
+    note_names: bool = False,
+    tuning: str = "standard",
+    capo: int = 0,
+) -> str:
+    """
+    Return an SVG image showing the specified chords in turn, each for its
+    duration in beats, in a loop.
+
+    Slash chords are always shown with note names.
+    """
+    boards: dict[str, Fretboard] = {}
+
+    def frames() -> Iterator[tuple[Fretboard, float]]:
+        for chord, beats in chords:
+            board = boards.get(chord)
+            if board is None:
+                board = boards[chord] = chord_name_to_fretboard(
+                    chord,
+                    note_names=note_names or "/" in chord,
+                    tuning=tuning,
+                    capo=capo,
+                )
+            yield board, beats * 60 / beats_per_minute
+
+    return dump_animated_svg(frames(), orientation=orientation)
+
+
+def song_to_animated_svg(
+    song: Song,
+    *,
+    orientation: Orientation,
+    note_names: bool = False,
+    tuning: str = "standard",
+    capo: int = 0,
+) -> str:
+    """
+    Return an SVG image showing the chords of `song` in time with its
+    strum pattern, in a loop.
+    """
+    chunk_beats = [float(sum(c)) for c in _parse_strum_pattern(song.strum_pattern)]
+    return chord_names_to_animated_svg(
+        (
+            (chord, chunk_beats[idx % len(chunk_beats)])
+            for idx, chord in enumerate(song.chord_names)
+        ),
+        beats_per_minute=song.beats_per_minute,
+        orientation=orientation,
+        note_names=note_names,
+        tuning=tuning,
+        capo=capo,
+    )
@@ -1,16 +1,146 @@
 import dataclasses
 import enum
-from typing import Iterator, Optional
-
-from colorama import Back, Fore, Style
+import functools
+import operator
+from typing import Any, Iterable, Iterator, Optional, SupportsIndex, Union
 
+from pyfrets._registry import Registry
+from pyfrets.instrumentation import instrument
 from pyfrets.notes import Note
 
+# Default number of frets shown, including open strings.
 FRETS = 16
-STRINGS = [Note.E2, Note.A2, Note.D3, Note.G3, Note.B3, Note.E4]
 
+# Sizes of SVG images, in pixels.
+_SVG_FONT_FAMILY = "arial"
+_SVG_FONT_SIZE = "12px"
+_SVG_FRET_SPACING = 30
+_SVG_PADDING = 10
+_SVG_STRING_SPACING = 20
+
+# Version of the ANSI and SVG output, bump it when the output changes.
+RENDERER_VERSION = 1
+
+
+@dataclasses.dataclass(frozen=True)
+class Tuning:
+    name: str
+    strings: tuple[int, ...]
+    description: str
+
+
+TUNINGS = Registry(
+    [
+        # Guitar.
+        Tuning(
+            "standard",
+            (Note.E2, Note.A2, Note.D3, Note.G3, Note.B3, Note.E4),
+            "standard tuning (EADGBE)",
+        ),
+        Tuning(
+            "drop d",
+            (Note.D2, Note.A2, Note.D3, Note.G3, Note.B3, Note.E4),
+            "drop D (DADGBE)",
+        ),
+        Tuning(
+            "dadgad",
+            (Note.D2, Note.A2, Note.D3, Note.G3, Note.A3, Note.D4),
+            "DADGAD",
+        ),
+        Tuning(
+            "open g",
+            (Note.D2, Note.G2, Note.D3, Note.G3, Note.B3, Note.D4),
+            "open G (DGDGBD)",
+        ),
+        Tuning(
+            "seven string",
+            (Note.B1, Note.E2, Note.A2, Note.D3, Note.G3, Note.B3, Note.E4),
+            "seven-string guitar (BEADGBE)",
+        ),
+        # Bass.
+        Tuning("bass", (Note.E1, Note.A1, Note.D2, Note.G2), "four-string bass (EADG)"),
+        Tuning(
+            "five string bass",
+            (Note.B0, Note.E1, Note.A1, Note.D2, Note.G2),
+            "five-string bass (BEADG)",
+        ),
+    ],
+    key=lambda tuning: tuning.name,
+)
+
+# Strings of the standard tuning, from lowest to highest.
+STRINGS = list(TUNINGS["standard"].strings)
+
+
+@dataclasses.dataclass(frozen=True)
+class Layout:
+    """
+    The pitches of the positions of a fretboard, fret by fret.
+    """
+
+    capo: int
+    frets: int
+    strings: tuple[int, ...]
+    pitches: tuple[int, ...]
+    pitch_classes: bytes
+    positions: tuple[tuple[tuple[int, int], ...], ...]
+
+
+# Fretboards can come from clients, so only the most recent layouts are kept.
+LAYOUT_CACHE_SIZE = 64
+
+
+@instrument
+@functools.lru_cache(maxsize=LAYOUT_CACHE_SIZE)
+def _get_layout(tuning: Tuning, frets: int, capo: int) -> Layout:
+    """
+    Return the layout of a fretboard showing `frets` frets from the `capo`.
+    """
+    if frets < 1:
+        raise ValueError("Fretboard needs at least one fret")
+    if capo < 0:
+        raise ValueError("Capo cannot be negative")
+    # Cells index a palette of at most 255 entries, which can always be
+    # compacted if there are fewer positions.
+    if frets * len(tuning.strings) > 254:
+        raise ValueError("Fretboard has too many positions")
 
-@dataclasses.dataclass
+    strings = tuning.strings
+    pitches = tuple(
+        string_note + capo + fret for fret in range(frets) for string_note in strings
+    )
+    positions: list[list[tuple[int, int]]] = [[] for _ in range(12)]
+    for idx, pitch in enumerate(pitches):
+        positions[pitch % 12].append(divmod(idx, len(strings)))
+    return Layout(
+        capo=capo,
+        frets=frets,
+        strings=strings,
+        pitches=pitches,
+        pitch_classes=bytes(pitch % 12 for pitch in pitches),
+        positions=tuple(tuple(p) for p in positions),
+    )
+
+
+def _get_tuning(tuning: Union[str, Tuning]) -> Tuning:
+    if isinstance(tuning, str):
+        try:
+            return TUNINGS[tuning]
+        except KeyError:
+            raise ValueError("Unknown tuning %s" % tuning) from None
+    return tuning
+
+
+def register_tuning(tuning: Tuning) -> None:
+    """
+    Register a `tuning`, which cannot replace a tuning of the same name.
+    """
+    if not tuning.strings:
+        raise ValueError("Tuning needs at least one string")
+    TUNINGS.register(tuning)
+
+
+@dataclasses.dataclass(frozen=True)
 class Cell:
     color: str
     text: str
@@ -22,11 +152,57 @@ class Orientation(enum.Enum):
 
 
 class Fretboard:
-    def __init__(self) -> None:
-        self._cells: list[list[Optional[Cell]]] = [
-            [None for x in STRINGS] for f in range(FRETS)
+    """
+    A fretboard whose positions can be marked with a cell.
+
+    The fretboard shows `frets` frets starting at the `capo`, which is the
+    open strings if there is no capo. Positions are (fret, string) pairs
+    relative to the capo, strings being numbered from the lowest.
+
+    Cells are stored as a byte per position, fret by fret, holding an
+    index into a palette of distinct cells, zero marking empty positions.
+    """
+
+    def __init__(
+        self,
+        *,
+        tuning: Union[str, Tuning] = "standard",
+        frets: int = FRETS,
+        capo: int = 0,
+    ) -> None:
+        self.tuning = _get_tuning(tuning)
+        self._layout = _get_layout(self.tuning, frets, capo)
+        self._cells = bytearray(len(self._layout.pitches))
+        self._palette: list[Optional[Cell]] = [None]
+        self._palette_index: dict[tuple[str, str], int] = {}
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> Union[str, tuple[Any, ...]]:
+        # Pickle the cells as a buffer, out of band with protocol 5, and the
+        # palette as pairs, rather than pickling the layout.
+        cells: Any
+        if operator.index(protocol) >= 5:
+            import pickle
+
+            cells = pickle.PickleBuffer(self._cells)
+        else:
+            cells = bytes(self._cells)
+        palette = [
+            (cell.color, cell.text) for cell in self._palette if cell is not None
         ]
+        return (
+            _restore_fretboard,
+            (self.tuning, self.frets, self.capo, cells, palette),
+        )
+
+    @property
+    def capo(self) -> int:
+        return self._layout.capo
+
+    @property
+    def frets(self) -> int:
+        return self._layout.frets
 
+    @instrument
     def dump_ansi(self, *, orientation: Orientation) -> str:
         """
         Write to an ANSI string.
@@ -37,6 +213,8 @@ class Fretboard:
             return self._dump_ansi_portrait()
 
     def _dump_ansi_landscape(self) -> str:
+        from colorama import Back, Fore, Style
+
         def pad(i: str) -> str:
             if len(i) == 1:
                 return "-" + i + "-"
@@ -45,18 +223,23 @@ class Fretboard:
             else:
                 return i
 
+        fragments = [
+            (
+                getattr(Fore, cell.color.upper()) + pad(cell.text) + Fore.BLACK
+                if cell is not None
+                else (Fore.BLACK + pad("-") + Fore.RESET)
+            )
+            + Fore.BLACK
+            for cell in self._palette
+        ]
+        capo, frets, strings = self.capo, self.frets, self._layout.strings
+        string_count = len(strings)
         lines = []
-        empty_line = "   ||" + ("   |" * (FRETS - 1))
-        for string_idx in range(len(STRINGS) - 1, -1, -1):
-            cells = [row[string_idx] for row in self._cells]
+        empty_line = "   ||" + ("   |" * (frets - 1))
+        for string_idx in range(string_count - 1, -1, -1):
+            cells = self._cells[string_idx::string_count]
             line = "".join(
-                (
-                    getattr(Fore, cell.color.upper()) + pad(cell.text) + Fore.BLACK
-                    if cell is not None
-                    else (Fore.BLACK + pad("-") + Fore.RESET)
-                )
-                + Fore.BLACK
-                + ("|" if idx else "||")
+                fragments[cell] + ("|" if idx else "||")
                 for idx, cell in enumerate(cells)
             )
             lines.append(Back.WHITE + line)
@@ -65,11 +248,15 @@ class Fretboard:
             else:
                 lines.append(
                     Fore.WHITE
-                    + "".join([f"{i:02}  " + ("" if i else " ") for i in range(FRETS)])
+                    + "".join(
+                        [f"{capo + i:02}  " + ("" if i else " ") for i in range(frets)]
+                    )
                 )
         return "".join(line + Style.RESET_ALL + "\n" for line in lines)
 
     def _dump_ansi_portrait(self) -> str:
+        from colorama import Back, Fore, Style
+
         def pad(i: str) -> str:
             if len(i) == 1:
                 return " " + i + " "
@@ -78,34 +265,118 @@ class Fretboard:
             else:
                 return i
 
+        fragments = [
+            (
+                (getattr(Fore, cell.color.upper()) + pad(cell.text) + Fore.BLACK)
+                if cell is not None
+                else (Fore.BLACK + pad("|") + Fore.RESET)
+            )
+            for cell in self._palette
+        ]
         indent = "   "
         lines = []
-        width = 5 * len(STRINGS) - 2
-        for idx, row in enumerate(self._cells):
-            line = "  ".join(
-                (
-                    (getattr(Fore, cell.color.upper()) + pad(cell.text) + Fore.BLACK)
-                    if cell is not None
-                    else (Fore.BLACK + pad("|") + Fore.RESET)
-                )
-                for cell in row
-            )
-            lines.append(f"{idx:02} " + Back.WHITE + line)
+        width = 5 * len(self._layout.strings) - 2
+        for idx, row in enumerate(self._rows()):
+            line = "  ".join(fragments[cell] for cell in row)
+            lines.append(f"{self.capo + idx:02} " + Back.WHITE + line)
             marker = "-" if idx else "="
             lines.append(indent + Back.WHITE + Fore.BLACK + (marker * width))
         return "".join(line + Style.RESET_ALL + "\n" for line in lines)
 
+    @instrument
+    def dump_json(self) -> str:
+        """
+        Return the fretboard as compact JSON, which `parse_json` reads back.
+
+        Cells are run-length encoded fret by fret, as pairs of a count and
+        an index into a palette of (color, text) pairs, numbered from one in
+        order of appearance, zero marking empty positions.
+        """
+        import json
+
+        cells, palette = _pack_cells(self._cells, self._palette)
+        runs: list[int] = []
+        for idx in cells:
+            if runs and runs[-1] == idx:
+                runs[-2] += 1
+            else:
+                runs += (1, idx)
+
+        data: dict[str, Any] = {"tuning": self.tuning.name}
+        # Tunings which are not registered are sent with their strings.
+        if TUNINGS.get(self.tuning.name) != self.tuning:
+            data["strings"] = list(self.tuning.strings)
+        data["frets"] = self.frets
+        data["capo"] = self.capo
+        data["palette"] = palette
+        data["cells"] = runs
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+    @instrument
+    def dump_json_delta(self, previous: "Fretboard") -> str:
+        """
+        Return the changes from the `previous` fretboard to this one as
+        compact JSON, which `apply_json_delta` applies.
+
+        Changed cells are pairs of a position index, fret by fret, and an
+        index into a palette of the new cells, as in `dump_json`.
+        """
+        import json
+
+        if previous._layout != self._layout:
+            raise ValueError("Fretboards must have the same layout")
+
+        # Number the cells of the previous fretboard as in this one, cells
+        # this one does not have getting an index none of its positions use.
+        unused = min(set(range(256)).difference(self._cells))
+        table = bytearray(256)
+        for idx, cell in enumerate(previous._palette):
+            if cell is not None:
+                table[idx] = self._palette_index.get((cell.color, cell.text), unused)
+        old_cells = previous._cells.translate(table)
+
+        positions = [
+            pos
+            for pos, (idx, old_idx) in enumerate(zip(self._cells, old_cells))
+            if idx != old_idx
+        ]
+        cells, palette = _pack_cells(
+            bytes(self._cells[pos] for pos in positions), self._palette
+        )
+        changes: list[int] = []
+        for pos, idx in zip(positions, cells):
+            changes += (pos, idx)
+        return json.dumps(
+            {"palette": palette, "cells": changes},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+
+    @instrument
     def dump_svg(self, *, orientation: Orientation) -> str:
         """
         Write the fretboard to an SVG image.
         """
-        font_family = "arial"
-        font_size = "12px"
-        padding = 10
-        fret_spacing = 30
-        string_spacing = 20
-        board_width = string_spacing * (len(STRINGS) - 1)
-        board_height = fret_spacing * FRETS
+        output, text_angle = self._dump_svg_grid(orientation)
+
+        # Draw markers and number frets.
+        for fret_idx, row in enumerate(self._rows()):
+            output += self._dump_svg_fret_number(fret_idx, text_angle)
+            output += self._dump_svg_markers(fret_idx, row, text_angle)
+
+        output += "</g></svg>"
+        return output
+
+    def _dump_svg_grid(self, orientation: Orientation) -> tuple[str, int]:
+        """
+        Return the start of an SVG image drawing the strings and frets, and
+        the angle of text.
+        """
+        padding = _SVG_PADDING
+        string_spacing = _SVG_STRING_SPACING
+        strings = self._layout.strings
+        board_width = string_spacing * (len(strings) - 1)
+        board_height = _SVG_FRET_SPACING * self.frets
         image_width = board_width + 4 * padding
         image_height = board_height + 2 * padding
 
@@ -124,7 +395,7 @@ class Fretboard:
         output += f'<g transform="{svg_transform}">'
 
         # Draw strings
-        for string_idx, string_note in enumerate(STRINGS):
+        for string_idx, string_note in enumerate(strings):
             x = padding + string_idx * string_spacing
             output += (
                 f'<line x1="{x}" y1="{padding}"'
@@ -132,49 +403,333 @@ class Fretboard:
             )
 
         # Draw frets.
-        for fret_idx in range(FRETS + 1):
-            y = padding + fret_idx * fret_spacing
+        for fret_idx in range(self.frets + 1):
+            y = padding + fret_idx * _SVG_FRET_SPACING
             output += (
                 f'<line x1="{padding}" y1="{y}"'
                 f' x2="{padding + board_width}" y2="{y}"'
                 f' stroke="black" stroke-width="{2 if fret_idx == 1 else 1}"/>'
             )
+        return output, text_angle
 
-        # Draw markers and number frets.
-        for fret_idx, row in enumerate(self._cells):
-            cx = -padding
-            cy = padding + (fret_idx + 0.5) * fret_spacing
+    def _dump_svg_fret_number(self, fret_idx: int, text_angle: int) -> str:
+        cx = -_SVG_PADDING
+        cy = _SVG_PADDING + (fret_idx + 0.5) * _SVG_FRET_SPACING
+        return (
+            f'<text x="{cx}" y="{cy + 4}"'
+            f' font-family="{_SVG_FONT_FAMILY}" font-size="{_SVG_FONT_SIZE}"'
+            f' text-anchor="middle"'
+            f' transform="rotate({text_angle}, {cx}, {cy})">'
+            f"{self.capo + fret_idx}</text>\n"
+        )
 
-            output += (
-                f'<text x="{cx}" y="{cy + 4}"'
-                f' font-family="{font_family}" font-size="{font_size}"'
-                f' text-anchor="middle"'
-                f' transform="rotate({text_angle}, {cx}, {cy})">'
-                f"{fret_idx}</text>\n"
-            )
+    def _dump_svg_markers(self, fret_idx: int, row: bytearray, text_angle: int) -> str:
+        output = ""
+        cy = _SVG_PADDING + (fret_idx + 0.5) * _SVG_FRET_SPACING
+        for string_idx, cell_idx in enumerate(row):
+            cell = self._palette[cell_idx]
+            if cell is not None:
+                cx = _SVG_PADDING + string_idx * _SVG_STRING_SPACING
+                output += (
+                    f'<circle cx="{cx}" cy="{cy}" r="{_SVG_STRING_SPACING / 2.5}"'
+                    f' stroke="{cell.color}" fill="white" />'
+                )
+                output += (
+                    f'<text x="{cx}" y="{cy + 4}" fill="{cell.color}"'
+                    f' font-family="{_SVG_FONT_FAMILY}" font-size="{_SVG_FONT_SIZE}"'
+                    ' text-anchor="middle"'
+                    f' transform="rotate({text_angle}, {cx}, {cy})">'
+                    f"{cell.text}</text>"
+                )
+        return output
 
-            for string_idx, cell in enumerate(row):
-                if cell is not None:
-                    cx = padding + string_idx * string_spacing
-                    output += (
-                        f'<circle cx="{cx}" cy="{cy}" r="{string_spacing / 2.5}"'
-                        f' stroke="{cell.color}" fill="white" />'
-                    )
-                    output += (
-                        f'<text x="{cx}" y="{cy + 4}" fill="{cell.color}"'
-                        f' font-family="{font_family}" font-size="{font_size}"'
-                        ' text-anchor="middle"'
-                        f' transform="rotate({text_angle}, {cx}, {cy})">'
-                        f"{cell.text}</text>"
-                    )
+    def apply_json_delta(self, data: str) -> None:
+        """
+        Apply changes written by `dump_json_delta`.
+        """
+        import json
 
-        output += "</g></svg>"
-        return output
+        try:
+            delta = json.loads(data)
+            palette = [None] + [Cell(color, text) for color, text in delta["palette"]]
+            changes = delta["cells"]
+            if len(changes) % 2:
+                raise ValueError("Cells must hold pairs of positions and indices")
+            updates = []
+            for pos, idx in zip(changes[::2], changes[1::2]):
+                pos, idx = operator.index(pos), operator.index(idx)
+                if not 0 <= pos < len(self._cells):
+                    raise ValueError("Invalid position %s" % pos)
+                if not 0 <= idx < len(palette):
+                    raise ValueError("Invalid palette index %s" % idx)
+                updates.append((pos, palette[idx]))
+        except (KeyError, TypeError, ValueError) as exc:
+            raise ValueError("Could not parse fretboard delta: %s" % exc) from exc
+
+        for pos, cell in updates:
+            self._cells[pos] = self._intern(cell) if cell is not None else 0
+
+    def clear(self) -> None:
+        """
+        Empty every position.
+        """
+        self._cells[:] = bytes(len(self._cells))
+        del self._palette[1:]
+        self._palette_index.clear()
+
+    def copy(self) -> "Fretboard":
+        """
+        Return a copy of this fretboard.
+        """
+        board = Fretboard.__new__(Fretboard)
+        board.tuning = self.tuning
+        board._layout = self._layout
+        board._cells = self._cells[:]
+        board._palette = self._palette[:]
+        board._palette_index = self._palette_index.copy()
+        return board
+
+    def find(self, pitch: int) -> tuple[tuple[int, int], ...]:
+        """
+        Return the positions whose pitch class is that of `pitch`.
+        """
+        return self._layout.positions[pitch % 12]
+
+    def get(self, pos: tuple[int, int]) -> Optional[Cell]:
+        """
+        Return the cell at the specified (fret, string) position.
+        """
+        return self._palette[self._cells[self._offset(pos)]]
+
+    @classmethod
+    def parse_json(cls, data: str) -> "Fretboard":
+        """
+        Return the fretboard written by `dump_json`.
+        """
+        import json
+
+        try:
+            board_data = json.loads(data)
+            if "strings" in board_data:
+                strings = tuple(map(operator.index, board_data["strings"]))
+                tuning = Tuning(board_data["tuning"], strings, "")
+            else:
+                tuning = _get_tuning(board_data["tuning"])
+            frets = operator.index(board_data["frets"])
+            capo = operator.index(board_data["capo"])
+            # Check the ranges before the layout is cached.
+            strings = tuning.strings
+            if strings and (
+                min(strings) + capo < 0 or max(strings) + capo + frets > 128
+            ):
+                raise ValueError("Fretboard pitches are out of range")
+            board = cls(tuning=tuning, frets=frets, capo=capo)
+            palette = [Cell(color, text) for color, text in board_data["palette"]]
+            if len(palette) > 255:
+                raise ValueError("Palette has too many entries")
+            runs = board_data["cells"]
+            if len(runs) % 2:
+                raise ValueError("Cells must hold pairs of counts and indices")
+            counts = [operator.index(count) for count in runs[::2]]
+            idxs = [operator.index(idx) for idx in runs[1::2]]
+            # Check the runs before they are expanded.
+            if any(count < 0 for count in counts):
+                raise ValueError("Invalid run count %d" % min(counts))
+            if sum(counts) != len(board._cells):
+                raise ValueError("Cells do not match the fretboard")
+            for idx in idxs:
+                if not 0 <= idx <= len(palette):
+                    raise ValueError("Invalid palette index %d" % idx)
+            cells = b"".join(bytes((idx,)) * count for count, idx in zip(counts, idxs))
+        except (KeyError, TypeError, ValueError) as exc:
+            raise ValueError("Could not parse fretboard: %s" % exc) from exc
 
+        board._cells[:] = cells
+        board._palette.extend(palette)
+        board._palette_index = {
+            (cell.color, cell.text): idx for idx, cell in enumerate(palette, start=1)
+        }
+        return board
+
+    @instrument
     def set(self, pos: tuple[int, int], value: Optional[Cell]) -> None:
-        self._cells[pos[0]][pos[1]] = value
+        """
+        Set the cell at the specified (fret, string) position.
+        """
+        self._cells[self._offset(pos)] = self._intern(value) if value is not None else 0
+
+    def set_pitches(self, cells: dict[int, Cell]) -> None:
+        """
+        Set the cells of every position whose pitch class is a key of `cells`,
+        and empty the other positions.
+        """
+        by_class = {pitch % 12: cell for pitch, cell in cells.items()}
+        # Every position is replaced, so rather than compacting the palette
+        # while the new cells are interned, start it over if they may not fit.
+        if len(self._palette) + len(by_class) > 256:
+            del self._palette[1:]
+            self._palette_index.clear()
+        table = bytearray(256)
+        for pitch_class, cell in by_class.items():
+            table[pitch_class] = self._intern(cell)
+        self._cells[:] = self._layout.pitch_classes.translate(table)
 
     def walk(self) -> Iterator[tuple[tuple[int, int], int]]:
-        for string_idx, string_note in enumerate(STRINGS):
-            for fret in range(FRETS):
-                yield (fret, string_idx), string_note + fret
+        layout = self._layout
+        for string_idx in range(len(layout.strings)):
+            for fret in range(layout.frets):
+                yield (
+                    (fret, string_idx),
+                    layout.pitches[fret * len(layout.strings) + string_idx],
+                )
+
+    def _compact(self) -> None:
+        # Drop the palette entries which are no longer used.
+        used = sorted(set(self._cells) - {0})
+        table = bytearray(256)
+        palette: list[Optional[Cell]] = [None]
+        for idx in used:
+            table[idx] = len(palette)
+            palette.append(self._palette[idx])
+        self._cells[:] = self._cells.translate(table)
+        self._palette = palette
+        self._palette_index = {
+            (cell.color, cell.text): idx
+            for idx, cell in enumerate(palette)
+            if cell is not None
+        }
+
+    def _offset(self, pos: tuple[int, int]) -> int:
+        fret, string_idx = pos
+        string_count = len(self._layout.strings)
+        if not (0 <= fret < self._layout.frets and 0 <= string_idx < string_count):
+            raise IndexError("Position %s is not on the fretboard" % (pos,))
+        return fret * string_count + string_idx
+
+    def _intern(self, cell: Cell) -> int:
+        key = (cell.color, cell.text)
+        idx = self._palette_index.get(key)
+        if idx is None:
+            if len(self._palette) == 256:
+                # There are fewer positions than palette entries, so this
+                # always frees an entry.
+                self._compact()
+            idx = self._palette_index[key] = len(self._palette)
+            self._palette.append(cell)
+        return idx
+
+    def _rows(self) -> Iterator[bytearray]:
+        string_count = len(self._layout.strings)
+        for offset in range(0, len(self._cells), string_count):
+            yield self._cells[offset : offset + string_count]
+
+
+def _pack_cells(
+    cells: Union[bytes, bytearray], palette: list[Optional[Cell]]
+) -> tuple[Union[bytes, bytearray], list[tuple[str, str]]]:
+    """
+    Return `cells` indexing a palette of the cells they use, numbered from
+    one in order of appearance, and that palette as (color, text) pairs.
+    """
+    table = bytearray(256)
+    packed: list[tuple[str, str]] = []
+    for idx in dict.fromkeys(cells):
+        cell = palette[idx]
+        if cell is not None:
+            packed.append((cell.color, cell.text))
+            table[idx] = len(packed)
+    return cells.translate(table), packed
+
+
+def _restore_fretboard(
+    tuning: Tuning,
+    frets: int,
+    capo: int,
+    cells: bytes,
+    palette: list[tuple[str, str]],
+) -> Fretboard:
+    """
+    Return the fretboard pickled by `Fretboard.__reduce_ex__`.
+    """
+    board = Fretboard.__new__(Fretboard)
+    board.tuning = tuning
+    board._layout = _get_layout(tuning, frets, capo)
+    # Out of band buffers are used as they are if they are writable.
+    board._cells = cells if isinstance(cells, bytearray) else bytearray(cells)
+    board._palette = [None]
+    board._palette.extend(Cell(color=color, text=text) for color, text in palette)
+    board._palette_index = {entry: idx for idx, entry in enumerate(palette, start=1)}
+    return board
+
+
+@instrument
+def dump_animated_svg(
+    frames: Iterable[tuple[Fretboard, float]], *, orientation: Orientation
+) -> str:
+    """
+    Write an SVG image showing each fretboard in turn for its duration in
+    seconds, in a loop.
+
+    The strings and frets are drawn once and the markers of each distinct
+    fretboard are defined once, frames only referencing them, so the image
+    grows with the number of markers rather than with the number of frames.
+    The fretboards must have the same layout.
+    """
+    first: Optional[Fretboard] = None
+    grid = ""
+    text_angle = 0
+    groups: dict[tuple[bytes, tuple[tuple[str, str], ...]], int] = {}
+    defs: list[str] = []
+    uses: list[str] = []
+    start = 0.0
+    for board, duration in frames:
+        if first is None:
+            first = board
+            grid, text_angle = board._dump_svg_grid(orientation)
+        elif board._layout is not first._layout:
+            raise ValueError("Fretboards must have the same layout")
+        if duration <= 0:
+            raise ValueError("Frame duration must be positive")
+
+        key = (
+            bytes(board._cells),
+            tuple((c.color, c.text) for c in board._palette if c is not None),
+        )
+        group_idx = groups.get(key)
+        if group_idx is None:
+            group_idx = groups[key] = len(groups)
+            defs.append(f'<g id="pyfrets-frame-{group_idx}">')
+            for fret_idx, row in enumerate(board._rows()):
+                defs.append(board._dump_svg_markers(fret_idx, row, text_angle))
+            defs.append("</g>")
+        uses.append(
+            f'<use href="#pyfrets-frame-{group_idx}" visibility="hidden">'
+            '<set attributeName="visibility" to="visible"'
+            f' begin="pyfrets-clock.begin+{start:g}s" dur="{duration:g}s"/>'
+            "</use>"
+        )
+        start += duration
+
+    if first is None:
+        raise ValueError("Animation needs at least one frame")
+
+    # Frames are timed relative to a clock which restarts when it ends.
+    clock = (
+        '<g><animate id="pyfrets-clock" attributeName="visibility"'
+        ' from="visible" to="visible"'
+        f' begin="0s;pyfrets-clock.end" dur="{start:g}s"/></g>'
+    )
+    numbers = "".join(
+        first._dump_svg_fret_number(fret_idx, text_angle)
+        for fret_idx in range(first.frets)
+    )
+    return (
+        grid
+        + numbers
+        + "<defs>"
+        + "".join(defs)
+        + "</defs>"
+        + "".join(uses)
+        + clock
+        + "</g></svg>"
+    )
@@ -0,0 +1,155 @@
+"""
+Opt-in instrumentation of the pyfrets hot paths.
+
+Call `enable_stats`, or set the `PYFRETS_STATS` environment variable
+before importing pyfrets, to count and time calls to instrumented
+functions. Otherwise instrumented functions only check a flag.
+
+Cache statistics of memoized functions are always available.
+"""
+
+import contextlib
+import dataclasses
+import functools
+import os
+import threading
+import time
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+N = TypeVar("N", int, float)
+
+ENABLED = bool(os.environ.get("PYFRETS_STATS"))
+
+# Call counts and cumulative times, indexed by qualified function name.
+_calls: dict[str, int] = {}
+_times: dict[str, float] = {}
+_lock = threading.Lock()
+
+# Memoized functions, indexed by qualified function name.
+_caches: dict[str, Any] = {}
+
+
+@dataclasses.dataclass(frozen=True)
+class FunctionStats:
+    calls: int
+    # Cumulative time in seconds, or None if instrumentation is disabled.
+    time: Optional[float]
+    # Cache statistics, or None if the function is not memoized.
+    hits: Optional[int] = None
+    misses: Optional[int] = None
+
+    @property
+    def hit_ratio(self) -> Optional[float]:
+        if self.hits is None or self.misses is None:
+            return None
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def _get_name(func: Callable[..., Any]) -> str:
+    return f"{func.__module__}.{func.__qualname__}"
+
+
+def _subtract(after: Optional[N], before: Optional[N]) -> Optional[N]:
+    if after is None:
+        return None
+    return after - (before or 0)
+
+
+def _wrap(func: F) -> F:
+    """
+    Return a wrapper around `func` which counts and times its calls.
+    """
+    name = _get_name(func)
+    _calls[name] = 0
+    _times[name] = 0.0
+    perf_counter = time.perf_counter
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if not ENABLED:
+            return func(*args, **kwargs)
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = perf_counter() - start
+            # Instrumented functions are called from thread pools.
+            with _lock:
+                _times[name] += elapsed
+                _calls[name] += 1
+
+    # Keep the cache controls of memoized functions.
+    if hasattr(func, "cache_info"):
+        wrapper.cache_info = func.cache_info  # type: ignore[attr-defined]
+        wrapper.cache_clear = func.cache_clear  # type: ignore[attr-defined]
+    return wrapper  # type: ignore[return-value]
+
+
+def instrument(func: F) -> F:
+    """
+    Register `func` for statistics, wrapping it to count and time its calls
+    while instrumentation is enabled.
+    """
+    if hasattr(func, "cache_info"):
+        _caches[_get_name(func)] = func
+    return _wrap(func)
+
+
+def enable_stats(enabled: bool = True) -> None:
+    """
+    Start or stop counting and timing calls to instrumented functions.
+    """
+    global ENABLED
+    ENABLED = enabled
+
+
+def stats() -> dict[str, FunctionStats]:
+    """
+    Return a snapshot of the statistics of the instrumented functions.
+
+    Call counts of memoized functions come from their cache statistics
+    while instrumentation is disabled.
+    """
+    result = {}
+    with _lock:
+        calls_snapshot, times_snapshot = dict(_calls), dict(_times)
+    for name in sorted(set(calls_snapshot) | set(_caches)):
+        hits = misses = None
+        if name in _caches:
+            info = _caches[name].cache_info()
+            hits, misses = info.hits, info.misses
+        if ENABLED:
+            calls, elapsed = calls_snapshot[name], times_snapshot[name]
+        else:
+            calls, elapsed = (hits or 0) + (misses or 0), None
+        result[name] = FunctionStats(
+            calls=calls, time=elapsed, hits=hits, misses=misses
+        )
+    return result
+
+
+@contextlib.contextmanager
+def collect_stats() -> Iterator[dict[str, FunctionStats]]:
+    """
+    Collect the statistics of the functions called within the block, which
+    should not enable or disable instrumentation.
+
+    The yielded dictionary is filled when the block exits.
+    """
+    before = stats()
+    collected: dict[str, FunctionStats] = {}
+    try:
+        yield collected
+    finally:
+        for name, after in stats().items():
+            start = before.get(name, FunctionStats(calls=0, time=0.0))
+            if after.calls == start.calls:
+                continue
+            collected[name] = FunctionStats(
+                calls=after.calls - start.calls,
+                time=_subtract(after.time, start.time),
+                hits=_subtract(after.hits, start.hits),
+                misses=_subtract(after.misses, start.misses),
+            )
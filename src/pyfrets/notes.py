@@ -1,8 +1,19 @@
 import functools
-from typing import Sequence
+import re
+from typing import ClassVar, Optional, Sequence
 
 
 class Note:
+    B0 = 23
+
+    C1 = 24
+    D1 = 26
+    E1 = 28
+    F1 = 29
+    G1 = 31
+    A1 = 33
+    B1 = 35
+
     C2 = 36
     D2 = 38
     E2 = 40
@@ -38,6 +49,7 @@ NOTE_PITCHES = {
     "A": 9,
     "B": 11,
 }
+NATURAL_PITCHES = tuple(NOTE_PITCHES[name] for name in NOTE_ALPHABET)
 
 # Roman numerals.
 ROMAN_NUMERALS_LOWER = ["i", "ii", "iii", "iv", "v", "vi", "vii"]
@@ -76,6 +88,260 @@ for idx, (major, minor) in enumerate(KEYS):
     KEY_SIGNATURES[minor] = idx - 7
 
 
+class SpelledNote:
+    """
+    A note, stored as an index into `NOTE_ALPHABET`, a number of accidentals
+    (positive for sharps, negative for flats) and an optional octave.
+
+    Instances are immutable and interned, so equal notes are identical.
+    """
+
+    __slots__ = ("letter", "alteration", "octave", "name", "semitones")
+
+    letter: int
+    alteration: int
+    octave: Optional[int]
+    name: str
+    semitones: int
+
+    _instances: ClassVar[dict[tuple[int, int, Optional[int]], "SpelledNote"]] = {}
+    _parsed: ClassVar[dict[str, "SpelledNote"]] = {}
+    _pattern: ClassVar[re.Pattern[str]] = re.compile(r"^([A-G])(#*|b*)(-?\d+)?$")
+
+    def __new__(
+        cls, letter: int, alteration: int = 0, octave: Optional[int] = None
+    ) -> "SpelledNote":
+        key = (letter, alteration, octave)
+        note = cls._instances.get(key)
+        if note is None:
+            if not 0 <= letter < 7:
+                raise ValueError("Unknown note letter %d" % letter)
+            note = object.__new__(cls)
+            accidentals = "#" * alteration if alteration > 0 else "b" * -alteration
+            for name, value in (
+                ("letter", letter),
+                ("alteration", alteration),
+                ("octave", octave),
+                ("name", NOTE_ALPHABET[letter] + accidentals),
+                ("semitones", NATURAL_PITCHES[letter] + alteration),
+            ):
+                object.__setattr__(note, name, value)
+            note = cls._instances.setdefault(key, note)
+        return note
+
+    def __reduce__(self) -> tuple[type["SpelledNote"], tuple[int, int, Optional[int]]]:
+        return (SpelledNote, (self.letter, self.alteration, self.octave))
+
+    def __repr__(self) -> str:
+        return f"SpelledNote({str(self)!r})"
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError("SpelledNote is immutable")
+
+    def __str__(self) -> str:
+        return self.name if self.octave is None else f"{self.name}{self.octave}"
+
+    @classmethod
+    def parse(cls, name: str) -> "SpelledNote":
+        """
+        Parse a note name such as `C#`, `Bbb` or `E4`.
+        """
+        note = cls._parsed.get(name)
+        if note is None:
+            m = cls._pattern.match(name)
+            if not m:
+                raise ValueError("Unknown note %s" % name)
+            letter, accidentals, octave = m.groups()
+            note = cls(
+                NOTE_ALPHABET.index(letter),
+                len(accidentals) if accidentals[:1] == "#" else -len(accidentals),
+                None if octave is None else int(octave),
+            )
+            note = cls._parsed.setdefault(name, note)
+        return note
+
+    @property
+    def pitch(self) -> int:
+        """
+        The MIDI pitch of the note, which requires an octave.
+        """
+        if self.octave is None:
+            raise ValueError("Note %s has no octave" % self)
+        return 12 * (self.octave + 1) + self.semitones
+
+    @property
+    def pitch_class(self) -> int:
+        return self.semitones % 12
+
+    def alter(self, alteration: int) -> "SpelledNote":
+        """
+        Return the note with `alteration` sharps (or flats if negative) added.
+        """
+        return SpelledNote(self.letter, self.alteration + alteration, self.octave)
+
+    def interval(self, other: "SpelledNote") -> tuple[int, int]:
+        """
+        Return the interval from this note to `other`, as a number of
+        degrees and a number of semitones.
+
+        If either note has no octave, the interval is ascending and
+        smaller than an octave.
+        """
+        degrees = other.letter - self.letter
+        semitones = other.semitones - self.semitones
+        if self.octave is None or other.octave is None:
+            return degrees % 7, (semitones - 12 * (degrees // 7)) % 12
+        octaves = other.octave - self.octave
+        return degrees + 7 * octaves, semitones + 12 * octaves
+
+    def is_enharmonic(self, other: "SpelledNote") -> bool:
+        """
+        Return whether this note sounds the same as `other`.
+        """
+        if self.octave is None or other.octave is None:
+            return self.pitch_class == other.pitch_class
+        return self.pitch == other.pitch
+
+    def transpose(self, degrees: int, semitones: int) -> "SpelledNote":
+        """
+        Return the note which is `degrees` degrees and `semitones` semitones
+        above this note.
+        """
+        letter, octaves = (self.letter + degrees) % 7, (self.letter + degrees) // 7
+        natural = NATURAL_PITCHES[letter] + 12 * octaves - NATURAL_PITCHES[self.letter]
+        return SpelledNote(
+            letter,
+            self.alteration + semitones - natural,
+            None if self.octave is None else self.octave + octaves,
+        )
+
+
+# The note names, pitches, signature and chord names of a key.
+KeyEntry = tuple[tuple[str, ...], tuple[int, ...], int, tuple[str, ...]]
+
+
+def _compute_key(name: str) -> KeyEntry:
+    root = SpelledNote.parse(key_root_name(name))
+    if name.islower():
+        offsets, romans = MINOR_SCALE, MINOR_SCALE_ROMAN
+    else:
+        offsets, romans = MAJOR_SCALE, MAJOR_SCALE_ROMAN
+
+    # Name notes in the key, using one letter per degree.
+    notes = tuple(
+        root.transpose(degree, offset) for degree, offset in enumerate(offsets)
+    )
+    if any(abs(note.alteration) > 2 for note in notes):
+        raise ValueError(f"Scale {name} requires too many accidentals")
+
+    chord_names = []
+    for note, roman in zip(notes, romans):
+        if roman.endswith("dim"):
+            chord_names.append(note.name + "dim")
+        elif roman.islower():
+            chord_names.append(note.name + "m")
+        else:
+            chord_names.append(note.name)
+
+    return (
+        tuple(note.name for note in notes),
+        tuple(note.pitch_class for note in notes),
+        sum(note.alteration for note in notes),
+        tuple(chord_names),
+    )
+
+
+def _get_key_inputs() -> tuple[object, ...]:
+    """
+    Return the data from which key tables are computed.
+    """
+    return (
+        tuple(KEYS),
+        MAJOR_SCALE,
+        MAJOR_SCALE_ROMAN,
+        MINOR_SCALE,
+        MINOR_SCALE_ROMAN,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_key_table() -> dict[str, KeyEntry]:
+    """
+    Return the prebuilt key table, or an empty table if it is missing or stale.
+    """
+    try:
+        from pyfrets._tables import KEY_INPUTS, KEYS
+    except ImportError:
+        return {}
+    if KEY_INPUTS != _get_key_inputs():
+        return {}
+    return KEYS
+
+
+class Key:
+    """
+    A key, with its notes, pitches and diatonic chords precomputed.
+
+    Instances are immutable and interned, use `Key.get` to obtain one.
+    """
+
+    __slots__ = (
+        "name",
+        "notes",
+        "note_names",
+        "pitches",
+        "pitch_classes",
+        "signature",
+        "chord_names",
+    )
+
+    name: str
+    notes: tuple[SpelledNote, ...]
+    note_names: tuple[str, ...]
+    pitches: tuple[int, ...]
+    pitch_classes: frozenset[int]
+    signature: int
+    chord_names: tuple[str, ...]
+
+    _instances: ClassVar[dict[str, "Key"]] = {}
+
+    def __init__(self, name: str) -> None:
+        entry = _get_key_table().get(name)
+        if entry is None:
+            entry = _compute_key(name)
+        note_names, pitches, signature, chord_names = entry
+
+        for attr, value in (
+            ("name", name),
+            ("notes", tuple(SpelledNote.parse(n) for n in note_names)),
+            ("note_names", note_names),
+            ("pitches", pitches),
+            ("pitch_classes", frozenset(pitches)),
+            ("signature", signature),
+            ("chord_names", chord_names),
+        ):
+            object.__setattr__(self, attr, value)
+
+    def __reduce__(self) -> tuple[object, tuple[str]]:
+        return (Key.get, (self.name,))
+
+    def __repr__(self) -> str:
+        return f"Key({self.name!r})"
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError("Key is immutable")
+
+    @classmethod
+    def get(cls, name: str) -> "Key":
+        """
+        Return the key with the given `name`, such as `G` or `e`.
+        """
+        key = cls._instances.get(name)
+        if key is None:
+            key = cls._instances.setdefault(name, cls(name))
+        return key
+
+
 def shift(root: int, pitches: Sequence[int]) -> list[int]:
     return [root + x for x in pitches]
 
@@ -84,61 +350,42 @@ def augment(note: str) -> str:
     """
     Augment the given note.
     """
-    if note.endswith("b"):
-        return note[:-1]
-    else:
-        return note + "#"
+    return str(SpelledNote.parse(note).alter(1))
 
 
 def diminish(note: str) -> str:
     """
     Diminish the given note.
     """
-    if note.endswith("#"):
-        return note[:-1]
-    else:
-        return note + "b"
+    return str(SpelledNote.parse(note).alter(-1))
 
 
-@functools.lru_cache()
-def key_name_to_note_names(key: str) -> list[str]:
+def key_name_to_chord_names(key: str) -> tuple[str, ...]:
     """
-    Return the list of note names in the given `key`.
+    Return the diatonic chords in the given `key`.
     """
-    root_name = key_root_name(key)
-    root_pitch = note_name_to_pitch(root_name)
-    note_index = NOTE_ALPHABET.index(root_name[0])
-    offsets = MINOR_SCALE if key.islower() else MAJOR_SCALE
+    return Key.get(key).chord_names
 
-    if KEY_SIGNATURES.get(key, 0) < 0 or len(key) > 1 and key[1] == "b":
-        alter = diminish
-    else:
-        alter = augment
-
-    # Name notes in the key.
-    note_names = [root_name]
-    for offset in offsets[1:]:
-        note_index = (note_index + 1) % 7
-        note_pitch = (root_pitch + offset) % 12
-
-        # Find the accidental to match the pitch.
-        note_name = NOTE_ALPHABET[note_index]
-        for i in range(3):
-            if note_name_to_pitch(note_name) == note_pitch:
-                note_names.append(note_name)
-                break
-            note_name = alter(note_name)
-        else:
-            raise ValueError(f"Scale {key} requires too many accidentals")
 
-    return note_names
+def key_name_to_note_names(key: str) -> tuple[str, ...]:
+    """
+    Return the note names in the given `key`.
+    """
+    return Key.get(key).note_names
 
 
-def key_name_to_pitches(key: str) -> list[int]:
+def key_name_to_pitches(key: str) -> tuple[int, ...]:
     """
-    Return the list of pitches in the given `key`.
+    Return the pitches in the given `key`.
     """
-    return [note_name_to_pitch(name) for name in key_name_to_note_names(key)]
+    return Key.get(key).pitches
+
+
+def key_name_to_signature(key: str) -> int:
+    """
+    Return the number of sharps (or flats if negative) in the given `key`.
+    """
+    return Key.get(key).signature
 
 
 def key_root_name(key: str) -> str:
@@ -151,32 +398,20 @@ def note_name_from_roman(roman: str, key: str) -> str:
     """
     numeral, alteration = parse_note_alteration(roman)
     index = ROMAN_NUMERALS_LOWER.index(numeral.lower())
-    notes = key_name_to_note_names(key)
-    return notes[index] + alteration
+    note = SpelledNote.parse(key_name_to_note_names(key)[index])
+    return note.alter(alteration.count("#") - alteration.count("b")).name
 
 
 def note_name_to_pitch(note: str) -> int:
     """
     Return the pitch to play the specified `note`.
     """
-    try:
-        pitch = NOTE_PITCHES[note[0]]
-    except KeyError:
-        raise ValueError("Unknown note %s" % note)
-    for alteration in note[1:]:
-        if alteration == "b":
-            pitch -= 1
-        else:
-            pitch += 1
-    return pitch % 12
+    return SpelledNote.parse(note).pitch_class
 
 
 def parse_note_alteration(note: str) -> tuple[str, str]:
-    alteration = ""
-    while note.endswith("#") or note.endswith("b"):
-        alteration = note[-1] + alteration
-        note = note[:-1]
-    return note, alteration
+    stripped = note.rstrip("#b")
+    return stripped, note[len(stripped) :]
 
 
 def prettify_chord(chord: str) -> str:
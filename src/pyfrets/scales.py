@@ -0,0 +1,203 @@
+import dataclasses
+import functools
+
+from pyfrets._registry import Registry, Snapshot, cached_property
+from pyfrets.chords import (
+    CHORD_QUALITIES,
+    Quality,
+    _apply_interval_to_note,
+    _parse_chord_name,
+)
+from pyfrets.notes import MAJOR_SCALE, NOTE_ALPHABET, note_name_to_pitch, shift
+
+# Default names for intervals of scales which do not have seven notes.
+INTERVAL_NAMES = ("1", "b2", "2", "b3", "3", "4", "b5", "5", "#5", "6", "b7", "7")
+
+
+def _mask_to_pitches(mask: int) -> tuple[int, ...]:
+    return tuple(p for p in range(12) if mask >> p & 1)
+
+
+def _pitches_to_mask(pitches: tuple[int, ...]) -> int:
+    mask = 0
+    for pitch in pitches:
+        mask |= 1 << (pitch % 12)
+    return mask
+
+
+def _rotate_mask(mask: int, degree: int) -> int:
+    """
+    Return the mode of the scale `mask` which starts on its `degree`-th note.
+    """
+    pitch = _mask_to_pitches(mask)[degree]
+    return ((mask >> pitch) | (mask << (12 - pitch))) & 0xFFF
+
+
+def _transpose_mask(mask: int, offset: int) -> int:
+    return ((mask << offset) | (mask >> (12 - offset))) & 0xFFF
+
+
+@dataclasses.dataclass(frozen=True)
+class Scale:
+    name: str
+    mask: int
+    description: str
+
+    @cached_property
+    def intervals(self) -> tuple[str, ...]:
+        if len(self.pitches) != 7:
+            return tuple(INTERVAL_NAMES[p] for p in self.pitches)
+
+        # Seven-note scales have one note per degree.
+        intervals = []
+        for degree, pitch in enumerate(self.pitches):
+            alteration = pitch - MAJOR_SCALE[degree]
+            accidental = "#" * alteration if alteration > 0 else "b" * -alteration
+            intervals.append(accidental + str(degree + 1))
+        return tuple(intervals)
+
+    @cached_property
+    def pitches(self) -> tuple[int, ...]:
+        return _mask_to_pitches(self.mask)
+
+
+_MAJOR = _pitches_to_mask(MAJOR_SCALE)
+_HARMONIC_MINOR = _pitches_to_mask((0, 2, 3, 5, 7, 8, 11))
+_MELODIC_MINOR = _pitches_to_mask((0, 2, 3, 5, 7, 9, 11))
+_MAJOR_PENTATONIC = _pitches_to_mask((0, 2, 4, 7, 9))
+_MAJOR_BLUES = _pitches_to_mask((0, 2, 3, 4, 7, 9))
+_WHOLE_TONE = _pitches_to_mask((0, 2, 4, 6, 8, 10))
+_DIMINISHED = _pitches_to_mask((0, 2, 3, 5, 6, 8, 9, 11))
+
+SCALES = Registry(
+    [
+        # Modes of the major scale.
+        Scale("ionian", _MAJOR, "ionian mode (major)"),
+        Scale("dorian", _rotate_mask(_MAJOR, 1), "dorian mode"),
+        Scale("phrygian", _rotate_mask(_MAJOR, 2), "phrygian mode"),
+        Scale("lydian", _rotate_mask(_MAJOR, 3), "lydian mode"),
+        Scale("mixolydian", _rotate_mask(_MAJOR, 4), "mixolydian mode"),
+        Scale("aeolian", _rotate_mask(_MAJOR, 5), "aeolian mode (natural minor)"),
+        Scale("locrian", _rotate_mask(_MAJOR, 6), "locrian mode"),
+        # Harmonic and melodic minor.
+        Scale("harmonic minor", _HARMONIC_MINOR, "harmonic minor"),
+        Scale(
+            "phrygian dominant",
+            _rotate_mask(_HARMONIC_MINOR, 4),
+            "phrygian dominant (5th mode of harmonic minor)",
+        ),
+        Scale("melodic minor", _MELODIC_MINOR, "melodic minor"),
+        Scale(
+            "lydian dominant",
+            _rotate_mask(_MELODIC_MINOR, 3),
+            "lydian dominant (4th mode of melodic minor)",
+        ),
+        Scale(
+            "altered",
+            _rotate_mask(_MELODIC_MINOR, 6),
+            "altered (7th mode of melodic minor)",
+        ),
+        # Pentatonic and blues.
+        Scale("major pentatonic", _MAJOR_PENTATONIC, "major pentatonic"),
+        Scale(
+            "minor pentatonic", _rotate_mask(_MAJOR_PENTATONIC, 4), "minor pentatonic"
+        ),
+        Scale("major blues", _MAJOR_BLUES, "major blues"),
+        Scale("blues", _rotate_mask(_MAJOR_BLUES, 5), "minor blues"),
+        # Symmetric scales.
+        Scale("whole tone", _WHOLE_TONE, "whole tone"),
+        Scale("diminished", _DIMINISHED, "diminished (whole-half)"),
+        Scale(
+            "dominant diminished",
+            _rotate_mask(_DIMINISHED, 1),
+            "dominant diminished (half-whole)",
+        ),
+    ],
+    key=lambda scale: scale.name,
+)
+
+
+# Only the matrix of the current snapshots is kept.
+@functools.lru_cache(maxsize=1)
+def _get_compatibility(
+    qualities: Snapshot[Quality], scales: Snapshot[Scale]
+) -> tuple[
+    dict[tuple[int, str], tuple[str, ...]], dict[str, tuple[tuple[int, str], ...]]
+]:
+    """
+    Return the chord-scale compatibility matrix of the `qualities` and
+    `scales`, indexed both by (chord root offset, chord quality) and by scale.
+    """
+    quality_masks = {
+        notation: _pitches_to_mask(quality.pitches)
+        for notation, quality in qualities.items()
+    }
+
+    scales_by_chord: dict[tuple[int, str], list[str]] = {}
+    chords_by_scale: dict[str, list[tuple[int, str]]] = {}
+    for scale in scales.values():
+        chords = chords_by_scale.setdefault(scale.name, [])
+        for offset in range(12):
+            for notation, quality_mask in quality_masks.items():
+                if not _transpose_mask(quality_mask, offset) & ~scale.mask:
+                    scales_by_chord.setdefault((offset, notation), []).append(
+                        scale.name
+                    )
+                    chords.append((offset, notation))
+
+    return (
+        {k: tuple(v) for k, v in scales_by_chord.items()},
+        {k: tuple(v) for k, v in chords_by_scale.items()},
+    )
+
+
+def chord_name_to_scale_names(chord: str) -> list[str]:
+    """
+    Return the names of the scales built on the root of the specified `chord`
+    which contain all of its notes.
+    """
+    root_name, quality, over = _parse_chord_name(chord, NOTE_ALPHABET)
+    scales = SCALES.snapshot()
+    compatibility = _get_compatibility(CHORD_QUALITIES.snapshot(), scales)
+    scale_names = compatibility[0].get((0, quality.notation), ())
+    if over:
+        bass = (note_name_to_pitch(over) - note_name_to_pitch(root_name)) % 12
+        return [name for name in scale_names if scales[name].mask >> bass & 1]
+    return list(scale_names)
+
+
+def scale_name_to_chord_names(root: str, scale: str) -> list[str]:
+    """
+    Return the names of the chords whose notes all belong to the
+    specified `scale` starting on `root`.
+    """
+    scales = SCALES.snapshot()
+    intervals = dict(zip(scales[scale].pitches, scales[scale].intervals))
+    compatibility = _get_compatibility(CHORD_QUALITIES.snapshot(), scales)
+    return [
+        _apply_interval_to_note(root, intervals[offset]) + notation
+        for offset, notation in compatibility[1][scale]
+    ]
+
+
+def scale_name_to_note_names(root: str, scale: str) -> list[str]:
+    """
+    Return the note names in the specified `scale` starting on `root`.
+    """
+    return [_apply_interval_to_note(root, i) for i in SCALES[scale].intervals]
+
+
+def scale_name_to_pitches(root: str, scale: str) -> list[int]:
+    """
+    Return the pitches in the specified `scale` starting on `root`.
+    """
+    return shift(note_name_to_pitch(root), SCALES[scale].pitches)
+
+
+def register_scale(scale: Scale) -> None:
+    """
+    Register a `scale`, which cannot replace a scale of the same name.
+    """
+    if not scale.mask & 1 or scale.mask >> 12:
+        raise ValueError("Invalid scale mask %s" % bin(scale.mask))
+    SCALES.register(scale)
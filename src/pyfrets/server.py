@@ -0,0 +1,414 @@
+"""
+A small asyncio HTTP server rendering chords, scales and songs.
+
+Routes:
+
+- `/chord/{name}.svg`: the notes of a chord on the fretboard
+- `/chord/{name}.json`: the notes, pitches and intervals of a chord
+- `/scale/{key}.svg`: the notes of a key, or with `?scale=` of a scale
+  starting on the key's root
+- `/song.mid`: a song from the song library with `?name=`, or from
+  `?key=` and `?chords=` in roman notation
+- `/song.svg`: the chords of a song shown in turn, in time with the song
+
+Fretboards are in landscape orientation unless `?orientation=portrait`
+is given, and show note functions unless `?names=1` is given. They use
+the standard tuning unless `?tuning=` is given, and `?capo=` places a
+capo.
+
+Renders run in a bounded executor, and identical concurrent requests
+share a single render. Recent responses are kept in memory and carry an
+ETag so that clients can revalidate them.
+"""
+
+import asyncio
+import collections
+import concurrent.futures
+import dataclasses
+import hashlib
+import http
+import json
+import multiprocessing
+import urllib.parse
+from typing import Any, Optional
+
+from pyfrets.chords import (
+    chord_name_to_description,
+    chord_name_to_interval_names,
+    chord_name_to_note_names,
+    chord_name_to_pitches,
+)
+from pyfrets.fretboards import (
+    chord_name_to_fretboard,
+    key_name_to_fretboard,
+    scale_name_to_fretboard,
+    song_to_animated_svg,
+)
+from pyfrets.guitar import TUNINGS, Orientation
+from pyfrets.notes import KEYS, key_root_name
+from pyfrets.scales import SCALES, chord_name_to_scale_names
+from pyfrets.songs import Song, SongLibrary, parse_song, strum_song
+
+# Maximum size of a request line or header line.
+MAX_LINE_SIZE = 8192
+
+# Highest fret a capo can be placed on.
+MAX_CAPO = 12
+
+# Seconds to wait for a request on an idle connection.
+IDLE_TIMEOUT = 30.0
+
+# Seconds to receive the headers of a request, and their maximum number.
+HEADERS_TIMEOUT = 10.0
+MAX_HEADERS = 100
+
+_KEY_NAMES = frozenset(name for pair in KEYS for name in pair)
+
+# Requests are identified by their path and sorted query parameters.
+RequestKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+@dataclasses.dataclass(frozen=True)
+class Response:
+    status: int
+    content_type: str
+    body: bytes
+    etag: Optional[str] = None
+
+
+class NotFound(Exception):
+    pass
+
+
+def _get_orientation(params: dict[str, str]) -> Orientation:
+    orientation = params.get("orientation", "landscape")
+    if orientation not in ("landscape", "portrait"):
+        raise ValueError("Unknown orientation %s" % orientation)
+    return Orientation(orientation.upper())
+
+
+def _get_board_options(params: dict[str, str]) -> dict[str, Any]:
+    tuning = params.get("tuning", "standard")
+    if tuning not in TUNINGS:
+        raise ValueError("Unknown tuning %s" % tuning)
+    capo = int(params.get("capo", "0"))
+    if not 0 <= capo <= MAX_CAPO:
+        raise ValueError("Capo must be between 0 and %d" % MAX_CAPO)
+    return {"note_names": params.get("names") == "1", "tuning": tuning, "capo": capo}
+
+
+def _render_chord_json(chord: str) -> bytes:
+    data = {
+        "name": chord,
+        "description": chord_name_to_description(chord),
+        "note_names": chord_name_to_note_names(chord),
+        "pitches": chord_name_to_pitches(chord),
+        "interval_names": (
+            chord_name_to_interval_names(chord) if "/" not in chord else None
+        ),
+        "scale_names": chord_name_to_scale_names(chord),
+    }
+    return json.dumps(data, ensure_ascii=False).encode("utf8")
+
+
+def _render_chord_svg(chord: str, params: dict[str, str]) -> bytes:
+    options = _get_board_options(params)
+    if "/" in chord and not options["note_names"]:
+        raise ValueError("Slash chord %s requires note names" % chord)
+    board = chord_name_to_fretboard(chord, **options)
+    return board.dump_svg(orientation=_get_orientation(params)).encode("utf8")
+
+
+def _render_scale_svg(key: str, params: dict[str, str]) -> bytes:
+    if key not in _KEY_NAMES:
+        raise NotFound("Unknown key %s" % key)
+    options = _get_board_options(params)
+    scale = params.get("scale")
+    if scale is None:
+        board = key_name_to_fretboard(key, **options)
+    elif scale in SCALES:
+        board = scale_name_to_fretboard(key_root_name(key), scale, **options)
+    else:
+        raise ValueError("Unknown scale %s" % scale)
+    return board.dump_svg(orientation=_get_orientation(params)).encode("utf8")
+
+
+def _get_song(params: dict[str, str], library_path: Optional[str]) -> Song:
+    if "name" in params:
+        if library_path is None:
+            raise NotFound("No song library")
+        with SongLibrary(library_path) as library:
+            if params["name"] not in library:
+                raise NotFound("Unknown song %s" % params["name"])
+            return library[params["name"]]
+
+    data: dict[str, object] = {
+        "key": params.get("key", ""),
+        "chord_pattern": params.get("chords", ""),
+    }
+    if "bpm" in params:
+        data["beats_per_minute"] = int(params["bpm"])
+    if "strum" in params:
+        data["strum_pattern"] = params["strum"]
+    return parse_song(json.dumps(data))
+
+
+def _render_song_mid(params: dict[str, str], library_path: Optional[str]) -> bytes:
+    song = _get_song(params, library_path)
+    repeat = int(params.get("repeat", "1"))
+    if not 1 <= repeat <= 100:
+        raise ValueError("Repeat must be between 1 and 100")
+    track = strum_song(
+        song, repeat=repeat, voice_leading=params.get("voice_leading") == "1"
+    )
+    return track.dump_midi()
+
+
+def _render_song_svg(params: dict[str, str], library_path: Optional[str]) -> bytes:
+    song = _get_song(params, library_path)
+    svg = song_to_animated_svg(
+        song, orientation=_get_orientation(params), **_get_board_options(params)
+    )
+    return svg.encode("utf8")
+
+
+def render(request_key: RequestKey, library_path: Optional[str]) -> Response:
+    """
+    Return the response for the request identified by `request_key`.
+
+    This runs in the executor, so it must not use any server state.
+    """
+    path, query = request_key
+    params = dict(query)
+    try:
+        if path.startswith("/chord/") and path.endswith(".json"):
+            content_type = "application/json"
+            body = _render_chord_json(path[7:-5])
+        elif path.startswith("/chord/") and path.endswith(".svg"):
+            content_type = "image/svg+xml"
+            body = _render_chord_svg(path[7:-4], params)
+        elif path.startswith("/scale/") and path.endswith(".svg"):
+            content_type = "image/svg+xml"
+            body = _render_scale_svg(path[7:-4], params)
+        elif path == "/song.mid":
+            content_type = "audio/midi"
+            body = _render_song_mid(params, library_path)
+        elif path == "/song.svg":
+            content_type = "image/svg+xml"
+            body = _render_song_svg(params, library_path)
+        else:
+            raise NotFound("Not found")
+    except NotFound as exc:
+        return Response(404, "text/plain", str(exc).encode("utf8"))
+    except (AssertionError, ValueError) as exc:
+        return Response(400, "text/plain", str(exc).encode("utf8"))
+
+    etag = '"%s"' % hashlib.sha256(body).hexdigest()[:32]
+    return Response(200, content_type, body, etag=etag)
+
+
+def _get_request_key(target: str) -> RequestKey:
+    url = urllib.parse.urlsplit(target)
+    query = urllib.parse.parse_qsl(url.query)
+    return urllib.parse.unquote(url.path), tuple(sorted(query))
+
+
+async def _read_headers(reader: asyncio.StreamReader) -> dict[str, str]:
+    headers: dict[str, str] = {}
+    for _ in range(MAX_HEADERS + 1):
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            return headers
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    raise ValueError("Too many headers")
+
+
+class Server:
+    """
+    An HTTP server rendering at most `max_workers` requests at a time and
+    keeping the `cache_size` most recent responses in memory.
+
+    An `executor` can be given to run renders, by default a process pool.
+    """
+
+    def __init__(
+        self,
+        *,
+        cache_size: int = 256,
+        executor: Optional[concurrent.futures.Executor] = None,
+        library_path: Optional[str] = None,
+        max_workers: int = 4,
+    ) -> None:
+        self.cache_size = cache_size
+        self.library_path = library_path
+        self.port = 0
+
+        # Counters, for monitoring.
+        self.cache_hits = 0
+        self.coalesced = 0
+        self.renders = 0
+
+        self._cache: collections.OrderedDict[RequestKey, Response] = (
+            collections.OrderedDict()
+        )
+        self._executor = executor
+        self._max_workers = max_workers
+        self._owns_executor = executor is None
+        self._pending: dict[RequestKey, asyncio.Future[Response]] = {}
+        self._semaphore = asyncio.Semaphore(max_workers)
+        self._server: Optional[asyncio.Server] = None
+
+    async def __aenter__(self) -> "Server":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.close()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        """
+        Start listening, on a free port if `port` is 0.
+        """
+        if self._executor is None:
+            # Forked workers would inherit client connections and keep
+            # them open, so start workers from a fresh interpreter.
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        self._server = await asyncio.start_server(
+            self._handle_connection, host, port, limit=MAX_LINE_SIZE
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        assert self._server is not None, "Server is not started"
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    async def get_response(self, request_key: RequestKey) -> Response:
+        """
+        Return the response for `request_key`, from the cache, from an
+        identical request in progress or by rendering it.
+        """
+        response = self._cache.get(request_key)
+        if response is not None:
+            self._cache.move_to_end(request_key)
+            self.cache_hits += 1
+            return response
+
+        future = self._pending.get(request_key)
+        if future is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+
+        loop = asyncio.get_running_loop()
+        future = self._pending[request_key] = loop.create_future()
+        try:
+            async with self._semaphore:
+                self.renders += 1
+                response = await loop.run_in_executor(
+                    self._executor, render, request_key, self.library_path
+                )
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Avoid "exception was never retrieved" warnings.
+            future.exception()
+            raise
+        else:
+            future.set_result(response)
+            if response.status == 200:
+                self._cache[request_key] = response
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        finally:
+            del self._pending[request_key]
+        return response
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while await self._handle_request(reader, writer):
+                pass
+        except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+            pass
+        except ValueError:
+            # The request line or a header line is too long, or there are
+            # too many headers.
+            await self._write_response(
+                writer, Response(400, "text/plain", b"Bad request"), keep_alive=False
+            )
+        finally:
+            writer.close()
+
+    async def _handle_request(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> bool:
+        """
+        Handle a single request and return whether the connection stays open.
+        """
+        request_line = await asyncio.wait_for(reader.readline(), IDLE_TIMEOUT)
+        if not request_line:
+            return False
+        headers = await asyncio.wait_for(_read_headers(reader), HEADERS_TIMEOUT)
+
+        try:
+            method, target, version = request_line.decode("latin-1").split()
+        except ValueError:
+            await self._write_response(
+                writer, Response(400, "text/plain", b"Bad request"), keep_alive=False
+            )
+            return False
+        keep_alive = (
+            headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+        )
+
+        if method not in ("GET", "HEAD"):
+            # The request body is not read, so the connection cannot be reused.
+            response = Response(405, "text/plain", b"Method not allowed")
+            keep_alive = False
+        else:
+            try:
+                response = await self.get_response(_get_request_key(target))
+            except Exception:
+                response = Response(500, "text/plain", b"Internal server error")
+            if response.etag is not None and response.etag in [
+                tag.strip() for tag in headers.get("if-none-match", "").split(",")
+            ]:
+                response = dataclasses.replace(response, status=304, body=b"")
+
+        await self._write_response(
+            writer, response, head=method == "HEAD", keep_alive=keep_alive
+        )
+        return keep_alive
+
+    async def _write_response(
+        self,
+        writer: asyncio.StreamWriter,
+        response: Response,
+        *,
+        head: bool = False,
+        keep_alive: bool,
+    ) -> None:
+        status = http.HTTPStatus(response.status)
+        lines = [f"HTTP/1.1 {status.value} {status.phrase}"]
+        if response.status != 304:
+            lines.append(f"Content-Type: {response.content_type}")
+            lines.append(f"Content-Length: {len(response.body)}")
+        if response.etag is not None:
+            lines.append(f"ETag: {response.etag}")
+        lines.append("Connection: " + ("keep-alive" if keep_alive else "close"))
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        if not head:
+            writer.write(response.body)
+        await writer.drain()
@@ -0,0 +1,373 @@
+"""
+Songs and song libraries.
+
+A song library is a JSON-lines file with one song per line, for instance:
+
+    {"name": "pop", "key": "C", "chord_pattern": "I V vi IV"}
+
+Chord patterns are chord charts in roman notation, which can contain
+bar lines and repeats (see `pyfrets.chords.parse_progression`).
+
+Blank lines and lines starting with `#` are ignored. Songs can be split
+into sections which are played in order, each a number of times:
+
+    {"name": "verse-chorus", "key": "e", "beats_per_minute": 100,
+     "strum_pattern": "D-DU", "sections": [
+        {"name": "verse", "chord_pattern": "i VII", "repeat": 2},
+        {"name": "chorus", "chord_pattern": "III VII i"}]}
+
+Looking up a song by name uses an index stored next to the library,
+which maps the hash of each song name to the offset of its line.
+"""
+
+import dataclasses
+import hashlib
+import json
+import os
+import struct
+from fractions import Fraction
+from typing import IO, Any, Iterator, Optional
+
+from pyfrets._files import write_atomic
+from pyfrets.chords import (
+    Progression,
+    chord_name_to_pitches,
+    chord_names_to_voice_leading,
+    parse_progression,
+)
+from pyfrets.notes import KEYS
+from pyfrets.tracks import Track
+
+# Suffix of the index stored next to a song library.
+INDEX_SUFFIX = ".idx"
+
+# Most times a section or a repeat can be played.
+MAX_REPEAT = 100
+
+# Most chords a song can play, with sections and repeats expanded.
+MAX_CHORDS = 10000
+
+# The index header holds a magic string, the size and modification time
+# of the library and the number of slots. Each slot holds the hash of a
+# song name and the offset of its line plus one, zero marking empty slots.
+_INDEX_HEADER = struct.Struct("<8sQQQ")
+_INDEX_MAGIC = b"PYFRETS1"
+_INDEX_SLOT = struct.Struct("<QQ")
+
+_KEY_NAMES = frozenset(name for pair in KEYS for name in pair)
+
+
+@dataclasses.dataclass
+class Section:
+    name: str
+    chord_pattern: str
+    repeat: int = 1
+
+
+@dataclasses.dataclass
+class Song:
+    chord_pattern: str
+    key: str
+    beats_per_minute: int = 120
+    strum_pattern: str = "D-D-D-D-"
+    name: str = ""
+    sections: list[Section] = dataclasses.field(default_factory=list)
+
+    @property
+    def romans(self) -> list[str]:
+        """
+        The chords of the song in roman notation, with sections and repeats
+        expanded.
+        """
+        return [
+            roman
+            for progression, repeat in self._get_progressions()
+            for _ in range(repeat)
+            for roman in progression
+        ]
+
+    @property
+    def chord_names(self) -> list[str]:
+        """
+        The chords of the song, with sections and repeats expanded.
+        """
+        return [
+            chord
+            for progression, repeat in self._get_progressions()
+            for chord in list(progression.resolve(self.key)) * repeat
+        ]
+
+    def _get_progressions(self) -> list[tuple[Progression, int]]:
+        if not self.sections:
+            return [(parse_progression(self.chord_pattern, roman=True), 1)]
+        return [
+            (parse_progression(section.chord_pattern, roman=True), section.repeat)
+            for section in self.sections
+        ]
+
+
+def _hash_name(name: str) -> int:
+    digest = hashlib.blake2b(name.encode("utf8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def _parse_strum_pattern(pattern: str) -> list[list[Fraction]]:
+    half_beat = Fraction(1, 2)
+    strum_events: list[list[Fraction]] = []
+    for chunk in pattern.split("/"):
+        events: list[Fraction] = []
+        if not chunk or chunk[0] not in ("D", "U"):
+            raise ValueError("Strum pattern chunk must start with a strum %s" % chunk)
+        for strum in chunk:
+            if strum in ("D", "U"):
+                events.append(half_beat)
+            elif strum == "-":
+                events[-1] += half_beat
+            else:
+                raise ValueError("Could not parse strum pattern %s" % pattern)
+        strum_events.append(events)
+    return strum_events
+
+
+def _check_type(value: object, kind: type, name: str) -> None:
+    # Booleans are integers, but not valid numbers in songs.
+    if not isinstance(value, kind) or isinstance(value, bool):
+        raise TypeError("%s must be of type %s" % (name, kind.__name__))
+
+
+def _validate_song(song: Song) -> None:
+    if song.key not in _KEY_NAMES:
+        raise ValueError("Unknown key %s" % song.key)
+    if song.beats_per_minute <= 0:
+        raise ValueError("Tempo must be positive")
+    if bool(song.chord_pattern) == bool(song.sections):
+        raise ValueError("Song needs either a chord pattern or sections")
+    for section in song.sections:
+        if section.repeat <= 0:
+            raise ValueError("Section %s must be repeated at least once" % section.name)
+        if section.repeat > MAX_REPEAT:
+            raise ValueError(
+                "Section %s is repeated more than %d times" % (section.name, MAX_REPEAT)
+            )
+    # Count the chords without expanding the repeats.
+    progressions = song._get_progressions()
+    for progression, _ in progressions:
+        if any(repeat.times > MAX_REPEAT for repeat in progression.repeats):
+            raise ValueError("Chords are repeated more than %d times" % MAX_REPEAT)
+    count = sum(len(progression) * repeat for progression, repeat in progressions)
+    if not count:
+        raise ValueError("Song has no chords")
+    if count > MAX_CHORDS:
+        raise ValueError("Song has more than %d chords" % MAX_CHORDS)
+    _parse_strum_pattern(song.strum_pattern)
+
+
+def parse_song(line: str) -> Song:
+    """
+    Return the song described by a line of JSON.
+    """
+    try:
+        data = json.loads(line)
+        song = Song(
+            chord_pattern=data.get("chord_pattern", ""),
+            key=data["key"],
+            beats_per_minute=data.get("beats_per_minute", 120),
+            strum_pattern=data.get("strum_pattern", "D-D-D-D-"),
+            name=data.get("name", ""),
+            sections=[Section(**section) for section in data.get("sections", [])],
+        )
+        _check_type(song.chord_pattern, str, "chord_pattern")
+        _check_type(song.key, str, "key")
+        _check_type(song.beats_per_minute, int, "beats_per_minute")
+        _check_type(song.strum_pattern, str, "strum_pattern")
+        _check_type(song.name, str, "name")
+        for section in song.sections:
+            _check_type(section.name, str, "Section name")
+            _check_type(section.chord_pattern, str, "Section chord_pattern")
+            _check_type(section.repeat, int, "Section repeat")
+    except (AttributeError, KeyError, TypeError, ValueError) as exc:
+        raise ValueError("Could not parse song: %s" % exc) from exc
+    _validate_song(song)
+    return song
+
+
+def dump_song(song: Song) -> str:
+    """
+    Return the specified `song` as a line of JSON.
+    """
+    data: dict[str, Any] = {"name": song.name, "key": song.key}
+    if song.sections:
+        data["sections"] = [dataclasses.asdict(s) for s in song.sections]
+    else:
+        data["chord_pattern"] = song.chord_pattern
+    data["beats_per_minute"] = song.beats_per_minute
+    data["strum_pattern"] = song.strum_pattern
+    return json.dumps(data, ensure_ascii=False)
+
+
+def _iter_lines(fp: IO[bytes]) -> Iterator[tuple[int, int, bytes]]:
+    """
+    Yield the line number, offset and contents of the song lines in `fp`.
+    """
+    offset = fp.tell()
+    for lineno, line in enumerate(fp, start=1):
+        stripped = line.strip()
+        if stripped and not stripped.startswith(b"#"):
+            yield lineno, offset, stripped
+        offset += len(line)
+
+
+def load_songs(fp: IO[bytes]) -> Iterator[Song]:
+    """
+    Parse the songs in a song library one at a time.
+    """
+    for lineno, offset, line in _iter_lines(fp):
+        try:
+            yield parse_song(line.decode("utf8"))
+        except ValueError as exc:
+            raise ValueError("Line %d: %s" % (lineno, exc)) from exc
+
+
+def build_index(path: str) -> None:
+    """
+    Build the index of the song library at `path`.
+    """
+    with open(path, "rb") as fp:
+        stat = os.fstat(fp.fileno())
+        entries: dict[str, int] = {}
+        for lineno, offset, line in _iter_lines(fp):
+            try:
+                name = json.loads(line)["name"]
+            except (KeyError, TypeError, ValueError) as exc:
+                raise ValueError("Line %d: Song has no name" % lineno) from exc
+            if not isinstance(name, str):
+                raise ValueError("Line %d: Song name must be a string" % lineno)
+            if name in entries:
+                raise ValueError("Line %d: Duplicate song name %s" % (lineno, name))
+            entries[name] = offset
+
+    # Use an open-addressing table which is at most half full.
+    slot_count = 1
+    while slot_count < 2 * len(entries):
+        slot_count *= 2
+    slots = [(0, 0)] * slot_count
+    for name, offset in entries.items():
+        name_hash = _hash_name(name)
+        idx = name_hash % slot_count
+        while slots[idx][1]:
+            idx = (idx + 1) % slot_count
+        slots[idx] = (name_hash, offset + 1)
+
+    write_atomic(
+        path + INDEX_SUFFIX,
+        _INDEX_HEADER.pack(_INDEX_MAGIC, stat.st_size, stat.st_mtime_ns, slot_count)
+        + b"".join(_INDEX_SLOT.pack(*slot) for slot in slots),
+    )
+
+
+class SongLibrary:
+    """
+    A song library, whose index is built when it is missing or stale.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._fp = open(path, "rb")
+        self._index: Optional[IO[bytes]] = None
+        self._slot_count = 0
+
+    def __enter__(self) -> "SongLibrary":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self._find(name) is not None
+
+    def __getitem__(self, name: str) -> Song:
+        offset = self._find(name)
+        if offset is None:
+            raise KeyError(name)
+        return parse_song(self._read_line(offset))
+
+    def __iter__(self) -> Iterator[Song]:
+        with open(self.path, "rb") as fp:
+            yield from load_songs(fp)
+
+    def close(self) -> None:
+        self._fp.close()
+        if self._index is not None:
+            self._index.close()
+
+    def _find(self, name: str) -> Optional[int]:
+        index = self._open_index()
+        name_hash = _hash_name(name)
+        idx = name_hash % self._slot_count
+        while True:
+            index.seek(_INDEX_HEADER.size + idx * _INDEX_SLOT.size)
+            slot_hash, slot_offset = _INDEX_SLOT.unpack(index.read(_INDEX_SLOT.size))
+            if not slot_offset:
+                return None
+            # Hashes may collide, so check the name of the song.
+            offset: int = slot_offset - 1
+            if (
+                slot_hash == name_hash
+                and json.loads(self._read_line(offset)).get("name") == name
+            ):
+                return offset
+            idx = (idx + 1) % self._slot_count
+
+    def _open_index(self) -> IO[bytes]:
+        if self._index is None:
+            stat = os.fstat(self._fp.fileno())
+            index_path = self.path + INDEX_SUFFIX
+            for _ in range(2):
+                try:
+                    index = open(index_path, "rb")
+                except FileNotFoundError:
+                    build_index(self.path)
+                    continue
+                magic, size, mtime_ns, slot_count = _INDEX_HEADER.unpack(
+                    index.read(_INDEX_HEADER.size)
+                )
+                if (magic, size, mtime_ns) == (
+                    _INDEX_MAGIC,
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                ):
+                    self._index = index
+                    self._slot_count = slot_count
+                    break
+                index.close()
+                build_index(self.path)
+            else:
+                raise ValueError("Could not build index for %s" % self.path)
+        return self._index
+
+    def _read_line(self, offset: int) -> str:
+        self._fp.seek(offset)
+        return self._fp.readline().decode("utf8")
+
+
+def strum_song(song: Song, *, repeat: int = 1, voice_leading: bool = False) -> Track:
+    """
+    Return a track playing the specified `song` with its strum pattern.
+    """
+    track = Track(beats_per_minute=song.beats_per_minute)
+    strum_events = _parse_strum_pattern(song.strum_pattern)
+
+    chord_names = song.chord_names
+    if voice_leading:
+        chord_pitches = chord_names_to_voice_leading(chord_names * repeat)
+    else:
+        chord_pitches = [chord_name_to_pitches(c) for c in chord_names] * repeat
+
+    strum_index = 0
+    for chord in chord_pitches:
+        pitches = [p + 48 for p in chord]
+        for duration in strum_events[strum_index]:
+            track.add_notes(duration=duration, pitches=pitches)
+        strum_index = (strum_index + 1) % len(strum_events)
+
+    return track
@@ -0,0 +1,337 @@
+"""
+ASCII tablature, showing the string and fret on which each note of a
+track is played.
+
+Tabs are written in systems of one line per string, the highest string on
+top. Each column lasts `resolution` beats, a note being written as its
+fret in the column where it starts and lasting until the next note. Bars
+are drawn every `beats_per_bar` beats, and do not take any time:
+
+    e|--------0-------|----------------|
+    B|------1---1-----|--------0-------|
+    G|----0-------0---|------0---0-----|
+    D|--2-----------2-|----0-------0---|
+    A|3---------------|--2-----------2-|
+    E|----------------|3---------------|
+
+Tabs are written and read one system at a time, so that long songs are
+streamed in bounded memory.
+"""
+
+import bisect
+import functools
+import itertools
+import re
+from fractions import Fraction
+from typing import IO, Iterable, Iterator, Optional, Sequence, Union
+
+from pyfrets.guitar import FRETS, Tuning, _get_tuning
+from pyfrets.instrumentation import instrument
+from pyfrets.tracks import Track
+
+# Default number of beats per column.
+RESOLUTION = Fraction(1, 4)
+
+# Default maximum length of the lines of a tab.
+WIDTH = 80
+
+_PITCH_CLASS_NAMES = ("C", "C#", "D", "Eb", "E", "F", "F#", "G", "G#", "A", "Bb", "B")
+
+_TAB_LINE_REGEX = re.compile(r"\s*[A-Ga-g][#b]?\s*\|(?P<content>.*?)\|?\s*$")
+
+_TAB_TOKEN_REGEX = re.compile(r"(?P<fret>\d+)|(?P<error>[^-|])")
+
+
+def _get_labels(strings: Sequence[int]) -> list[str]:
+    """
+    Return the names of the `strings`, in lower case for strings named
+    like a lower string, padded to the same width.
+    """
+    labels: list[str] = []
+    for string_note in strings:
+        label = _PITCH_CLASS_NAMES[string_note % 12]
+        labels.append(label.lower() if label in labels else label)
+    width = max(len(label) for label in labels)
+    return [label.ljust(width) for label in labels]
+
+
+def _place_pitches(
+    pitches: tuple[int, ...],
+    strings: tuple[int, ...],
+    frets: int,
+    capo: int,
+    blocked: frozenset[int],
+) -> Optional[tuple[tuple[int, int], tuple[tuple[int, int], ...]]]:
+    """
+    Return the cost and a (fret, string) position for each of the
+    `pitches`, higher pitches being played on higher strings other than the
+    `blocked` ones, as close to the nut as possible, or None if they do not
+    fit on the fretboard.
+    """
+    order = sorted(range(len(pitches)), key=lambda idx: pitches[idx])
+    best: Optional[tuple[tuple[int, int], tuple[int, ...], tuple[int, ...]]] = None
+    for string_idxs in itertools.combinations(range(len(strings)), len(pitches)):
+        if blocked.intersection(string_idxs):
+            continue
+        placed_frets = tuple(
+            pitches[idx] - capo - strings[string_idx]
+            for idx, string_idx in zip(order, string_idxs)
+        )
+        if all(0 <= fret < frets for fret in placed_frets):
+            cost = (max(placed_frets), sum(placed_frets))
+            if best is None or cost < best[0]:
+                best = (cost, string_idxs, placed_frets)
+    if best is None:
+        return None
+
+    positions: list[tuple[int, int]] = [(0, 0)] * len(pitches)
+    for idx, string_idx, fret in zip(order, best[1], best[2]):
+        positions[idx] = (fret, string_idx)
+    return best[0], tuple(positions)
+
+
+@functools.lru_cache(maxsize=None)
+def _place_chord(
+    pitches: tuple[int, ...],
+    strings: tuple[int, ...],
+    frets: int,
+    capo: int,
+    columns: int,
+    blocked: frozenset[int],
+) -> tuple[tuple[int, ...], tuple[tuple[int, int], ...]]:
+    """
+    Return the pitches and (fret, string) positions with which to write a
+    chord lasting `columns` columns, off the `blocked` strings.
+
+    Frets which fill their columns are avoided when possible, as the next
+    note on their string could not be told apart. Notes which cannot be
+    placed are moved by an octave, moving as few as possible, and chords out
+    of the range of the fretboard by whole octaves.
+    """
+    widths = (columns - 1, columns) if columns > 1 else (columns,)
+    for width, octave in itertools.product(widths, (0, -12, 12, -24, 24, -36, 36)):
+        best: Optional[
+            tuple[tuple[int, int, int], tuple[int, ...], tuple[tuple[int, int], ...]]
+        ] = None
+        for shifts in itertools.product((0, -12, 12), repeat=len(pitches)):
+            shifted = tuple(
+                pitch + octave + shift for pitch, shift in zip(pitches, shifts)
+            )
+            placed = _place_pitches(
+                shifted, strings, min(frets, 10**width), capo, blocked
+            )
+            if placed is not None:
+                cost = (sum(1 for shift in shifts if shift), *placed[0])
+                if best is None or cost < best[0]:
+                    best = (cost, shifted, placed[1])
+        if best is not None:
+            return best[1], best[2]
+    raise ValueError("Could not place pitches %s on the fretboard" % list(pitches))
+
+
+@instrument
+def write_tab(
+    track: Track,
+    fp: IO[str],
+    *,
+    positions: Optional[Iterable[Sequence[tuple[int, int]]]] = None,
+    tuning: Union[str, Tuning] = "standard",
+    frets: int = FRETS,
+    capo: int = 0,
+    resolution: Fraction = RESOLUTION,
+    beats_per_bar: int = 4,
+    width: int = WIDTH,
+) -> None:
+    """
+    Write `track` to `fp` as an ASCII tab.
+
+    `positions` holds the (fret, string) position of each note of each
+    chord of the track, relative to the `capo`. By default each chord is
+    placed within the first `frets` frets, an octave higher or lower if it
+    cannot be played as is.
+    """
+    strings = _get_tuning(tuning).strings
+    labels = _get_labels(strings)
+    content_width = width - len(labels[0]) - 2
+    chord_positions = iter(positions) if positions is not None else None
+
+    # Contents of the lines of the current system, from the lowest string.
+    lines = [""] * len(strings)
+    first_system = True
+    time = Fraction(0)
+    # Frets of the previous chord which fill their columns, and its duration.
+    filled: dict[int, str] = {}
+    previous_duration = Fraction(0)
+
+    def write_system() -> None:
+        if not first_system:
+            fp.write("\n")
+        for label, line in zip(reversed(labels), reversed(lines)):
+            fp.write(label + "|" + line + "|\n")
+
+    for chord in track._chords:
+        # Chords without notes take no time.
+        if not chord:
+            continue
+        pitches = [note.pitch for note in chord]
+        duration = chord[0].duration
+        columns = duration / resolution
+        if columns.denominator != 1:
+            raise ValueError(
+                "Duration %s is not a multiple of the resolution %s"
+                % (duration, resolution)
+            )
+        if chord_positions is None:
+            # Strings filled by the previous chord are free after a bar.
+            blocked = frozenset(filled) if time % beats_per_bar else frozenset()
+            shifted, chosen = _place_chord(
+                tuple(pitches), strings, frets, capo, int(columns), blocked
+            )
+            pitches, placed = list(shifted), list(chosen)
+        else:
+            placed = list(next(chord_positions, ()))
+            if len(placed) != len(pitches):
+                raise ValueError("Positions do not match the notes %s" % pitches)
+        texts: dict[int, str] = {}
+        for pitch, (fret, string_idx) in zip(pitches, placed):
+            if string_idx in texts:
+                raise ValueError("Chord plays string %d twice" % string_idx)
+            if not 0 <= string_idx < len(strings) or fret < 0:
+                raise ValueError(
+                    "Position %s is not on the fretboard" % ((fret, string_idx),)
+                )
+            if strings[string_idx] + capo + fret != pitch:
+                raise ValueError(
+                    "Position %s does not play pitch %d" % ((fret, string_idx), pitch)
+                )
+            texts[string_idx] = str(fret)
+
+        if columns < max(len(text) for text in texts.values()):
+            raise ValueError("Duration %s is too short to write %s" % (duration, texts))
+
+        bar = bool(lines[0]) and time % beats_per_bar == 0
+        if len(lines[0]) + bar + columns > content_width and lines[0]:
+            write_system()
+            first_system = False
+            lines = [""] * len(strings)
+            bar = False
+        # A fret written right after another one would be read as one number.
+        if not bar and lines[0] and filled.keys() & texts.keys():
+            raise ValueError(
+                "Duration %s is too short to write %s" % (previous_duration, filled)
+            )
+        for string_idx in range(len(strings)):
+            lines[string_idx] += ("|" if bar else "") + texts.get(string_idx, "").ljust(
+                int(columns), "-"
+            )
+        time += duration
+        filled = {idx: text for idx, text in texts.items() if len(text) == columns}
+        previous_duration = duration
+
+    if lines[0]:
+        write_system()
+
+
+def _tab_error(message: str, lineno: int, column: int) -> ValueError:
+    return ValueError("%s (line %d, column %d)" % (message, lineno, column))
+
+
+def _parse_system(
+    system: list[tuple[int, int, str]], resolution: Fraction
+) -> tuple[list[tuple[Fraction, list[tuple[int, int]]]], Fraction]:
+    """
+    Return the start time and (fret, string) positions of each chord of a
+    tab system, given as its (line number, offset, content) lines from the
+    highest string, and the length of the system in beats.
+    """
+    first = system[0][2]
+    bars = [column for column, char in enumerate(first) if char == "|"]
+    onsets: dict[int, list[tuple[int, int]]] = {}
+    for string_idx, (lineno, offset, content) in enumerate(reversed(system)):
+        if len(content) != len(first):
+            raise _tab_error(
+                "Tab line has a different length", lineno, offset + len(content) + 1
+            )
+        for match in _TAB_TOKEN_REGEX.finditer(content):
+            if match.lastgroup == "error":
+                raise _tab_error(
+                    "Could not parse tab %s" % match.group(),
+                    lineno,
+                    offset + match.start() + 1,
+                )
+            onsets.setdefault(match.start(), []).append(
+                (int(match.group()), string_idx)
+            )
+        line_bars = [column for column, char in enumerate(content) if char == "|"]
+        if line_bars != bars:
+            column = min(set(line_bars) ^ set(bars))
+            raise _tab_error("Bar is not aligned", lineno, offset + column + 1)
+
+    chords = [
+        ((column - bisect.bisect(bars, column)) * resolution, onsets[column])
+        for column in sorted(onsets)
+    ]
+    return chords, (len(first) - len(bars)) * resolution
+
+
+def _iter_tab(
+    fp: Iterable[str], strings: int, resolution: Fraction
+) -> Iterator[tuple[list[tuple[int, int]], Fraction]]:
+    """
+    Parse the (fret, string) positions and duration of each chord of a tab.
+    """
+    pending: Optional[tuple[Fraction, list[tuple[int, int]]]] = None
+    system: list[tuple[int, int, str]] = []
+    start = Fraction(0)
+
+    def parse_system() -> Iterator[tuple[list[tuple[int, int]], Fraction]]:
+        nonlocal pending, start
+        if len(system) != strings:
+            raise _tab_error(
+                "Tab system has %d strings, expected %d" % (len(system), strings),
+                system[0][0],
+                1,
+            )
+        chords, length = _parse_system(system, resolution)
+        for time, positions in chords:
+            if pending is not None:
+                yield pending[1], start + time - pending[0]
+            pending = (start + time, positions)
+        start += length
+        system.clear()
+
+    for lineno, line in enumerate(fp, start=1):
+        match = _TAB_LINE_REGEX.match(line)
+        if match:
+            system.append((lineno, match.start("content"), match.group("content")))
+        elif system:
+            yield from parse_system()
+    if system:
+        yield from parse_system()
+    if pending is not None:
+        yield pending[1], start - pending[0]
+
+
+@instrument
+def read_tab(
+    fp: Iterable[str],
+    *,
+    beats_per_minute: int = 120,
+    tuning: Union[str, Tuning] = "standard",
+    capo: int = 0,
+    resolution: Fraction = RESOLUTION,
+) -> Track:
+    """
+    Read an ASCII tab from the lines of `fp` into a track.
+
+    Lines which are not part of a tab system are ignored. Rests before the
+    first note are dropped, other rests lengthen the previous note.
+    """
+    strings = _get_tuning(tuning).strings
+    track = Track(beats_per_minute=beats_per_minute)
+    for positions, duration in _iter_tab(fp, len(strings), resolution):
+        track.add_notes(
+            [strings[string_idx] + capo + fret for fret, string_idx in positions],
+            duration=duration,
+        )
+    return track
@@ -1,13 +1,25 @@
+import array
 import dataclasses
+import itertools
+import operator
+import sys
 from fractions import Fraction
+from typing import TYPE_CHECKING, Any, SupportsIndex, Union
 
-import mido
+from pyfrets.instrumentation import instrument
+
+if TYPE_CHECKING:
+    import mido
+
+# Version of the MIDI output, bump it when the output changes.
+RENDERER_VERSION = 1
 
 
 @dataclasses.dataclass
 class TrackNote:
     duration: Fraction
     pitch: int
+    velocity: int = 64
 
 
 class Track:
@@ -15,12 +27,69 @@ class Track:
         self._beats_per_minute = beats_per_minute
         self._chords: list[list[TrackNote]] = []
 
-    def add_notes(self, pitches: list[int], duration: Fraction) -> None:
+    def __reduce_ex__(self, protocol: SupportsIndex) -> Union[str, tuple[Any, ...]]:
+        # Pickle the notes as a few columns rather than as lists of
+        # objects, passing the columns out of band with protocol 5.
+        # Durations are stored as indices into a table of distinct values.
+        notes = [note for chord in self._chords for note in chord]
+        table: dict[Fraction, int] = {}
+        durations = [table.setdefault(note.duration, len(table)) for note in notes]
+        try:
+            columns: list[Any] = [
+                array.array("B", [len(chord) for chord in self._chords]),
+                array.array("B" if len(table) <= 256 else "I", durations),
+                array.array("B", [note.pitch for note in notes]),
+                array.array("B", [note.velocity for note in notes]),
+            ]
+        except OverflowError:
+            # Some values do not fit the columns.
+            return object.__reduce_ex__(self, protocol)
+
+        if operator.index(protocol) >= 5:
+            import pickle
+
+            columns = [pickle.PickleBuffer(column) for column in columns]
+        else:
+            columns = [column.tobytes() for column in columns]
+        return (
+            _restore_track,
+            (
+                self._beats_per_minute,
+                [(d.numerator, d.denominator) for d in table],
+                sys.byteorder,
+                *columns,
+            ),
+        )
+
+    @instrument
+    def add_notes(
+        self, pitches: list[int], duration: Fraction, *, velocity: int = 64
+    ) -> None:
         self._chords.append(
-            [TrackNote(duration=duration, pitch=pitch) for pitch in pitches]
+            [
+                TrackNote(duration=duration, pitch=pitch, velocity=velocity)
+                for pitch in pitches
+            ]
         )
 
-    def to_midi(self, beat_time: int = 480) -> mido.MidiTrack:
+    def dump_midi(self, beat_time: int = 480) -> bytes:
+        """
+        Write to a standard MIDI file.
+        """
+        import io
+
+        import mido
+
+        midi_file = mido.MidiFile(ticks_per_beat=beat_time)
+        midi_file.tracks.append(self.to_midi(beat_time=beat_time))
+        buffer = io.BytesIO()
+        midi_file.save(file=buffer)
+        return buffer.getvalue()
+
+    @instrument
+    def to_midi(self, beat_time: int = 480) -> "mido.MidiTrack":
+        import mido
+
         midi_track = mido.MidiTrack()
         midi_track.append(
             mido.MetaMessage(
@@ -30,7 +99,11 @@ class Track:
         midi_track.append(mido.Message("program_change", program=26, time=0))
         for chord in self._chords:
             for note in chord:
-                midi_track.append(mido.Message("note_on", note=note.pitch, time=0))
+                midi_track.append(
+                    mido.Message(
+                        "note_on", note=note.pitch, velocity=note.velocity, time=0
+                    )
+                )
             for idx, note in enumerate(chord):
                 midi_track.append(
                     mido.Message(
@@ -40,3 +113,33 @@ class Track:
                     )
                 )
         return midi_track
+
+
+def _restore_track(
+    beats_per_minute: int,
+    table: list[tuple[int, int]],
+    byteorder: str,
+    sizes: bytes,
+    durations_data: bytes,
+    pitches: bytes,
+    velocities: bytes,
+) -> Track:
+    """
+    Return the track pickled as columns by `Track.__reduce_ex__`.
+    """
+    fractions = [Fraction(numerator, denominator) for numerator, denominator in table]
+    durations = array.array("B" if len(fractions) <= 256 else "I")
+    durations.frombytes(memoryview(durations_data).cast("B"))
+    if byteorder != sys.byteorder:
+        durations.byteswap()
+
+    notes = [
+        TrackNote(duration=fractions[duration], pitch=pitch, velocity=velocity)
+        for duration, pitch, velocity in zip(
+            durations, memoryview(pitches).cast("B"), memoryview(velocities).cast("B")
+        )
+    ]
+    track = Track(beats_per_minute=beats_per_minute)
+    offsets = [0, *itertools.accumulate(memoryview(sizes).cast("B"))]
+    track._chords = [notes[start:end] for start, end in zip(offsets, offsets[1:])]
+    return track
@@ -13,6 +13,7 @@ class MetaMessage(BaseMessage):
 class MidiFile:
     tracks: list[MidiTrack]
 
+    def __init__(self, ticks_per_beat: int = 480) -> None: ...
     def save(
         self, filename: str | None = None, file: typing.BinaryIO | None = None
     ) -> None: ...
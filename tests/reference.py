@@ -0,0 +1,288 @@
+"""
+Reference implementations of the pyfrets outputs which optimised code paths
+must reproduce exactly.
+
+They are written for clarity, without caches, prebuilt tables or shared
+state, and only depend on the standard library and mido. Do not optimise
+them: the differential tests compare the library against them.
+"""
+
+import io
+import re
+from fractions import Fraction
+from typing import Optional, Sequence
+
+import mido
+
+LETTERS = "CDEFGAB"
+NATURAL_PITCHES = (0, 2, 4, 5, 7, 9, 11)
+MAJOR_SCALE = (0, 2, 4, 5, 7, 9, 11)
+MINOR_SCALE = (0, 2, 3, 5, 7, 8, 10)
+
+KEYS = (
+    ("Cb", "ab"),
+    ("Gb", "eb"),
+    ("Db", "bb"),
+    ("Ab", "f"),
+    ("Eb", "c"),
+    ("Bb", "g"),
+    ("F", "d"),
+    ("C", "a"),
+    ("G", "e"),
+    ("D", "b"),
+    ("A", "f#"),
+    ("E", "c#"),
+    ("B", "g#"),
+    ("F#", "d#"),
+    ("C#", "a#"),
+)
+
+# Intervals of the chord qualities, by notation.
+QUALITIES = {
+    "": ("1", "3", "5"),
+    "m": ("1", "b3", "5"),
+    "aug": ("1", "3", "#5"),
+    "dim": ("1", "b3", "b5"),
+    "sus2": ("1", "2", "5"),
+    "sus4": ("1", "4", "5"),
+    "6": ("1", "3", "5", "6"),
+    "m6": ("1", "b3", "5", "6"),
+    "7": ("1", "3", "5", "b7"),
+    "7b5": ("1", "3", "b5", "b7"),
+    "maj7": ("1", "3", "5", "7"),
+    "m7": ("1", "b3", "5", "b7"),
+    "m7b5": ("1", "b3", "b5", "b7"),
+    "mmaj7": ("1", "b3", "5", "7"),
+    "aug7": ("1", "3", "#5", "b7"),
+    "augmaj7": ("1", "3", "#5", "7"),
+    "dim7": ("1", "b3", "b5", "bb7"),
+    "dimmaj7": ("1", "b3", "b5", "7"),
+    "add4": ("1", "3", "4", "5"),
+    "madd4": ("1", "b3", "4", "5"),
+    "add9": ("1", "3", "4", "9"),
+    "madd9": ("1", "b3", "4", "9"),
+    "9": ("1", "3", "5", "b7", "9"),
+    "maj9": ("1", "3", "5", "7", "9"),
+    "m9": ("1", "b3", "5", "b7", "9"),
+    "7b9": ("1", "3", "5", "b7", "b9"),
+    "11": ("1", "3", "5", "b7", "9", "11"),
+    "7#11": ("1", "3", "5", "b7", "9", "#11"),
+    "maj11": ("1", "3", "5", "7", "9", "11"),
+    "m11": ("1", "b3", "5", "b7", "9", "11"),
+}
+
+# Chord roots and basses, with at most one accidental.
+ROOTS = tuple(
+    letter + accidental for letter in LETTERS for accidental in ("", "b", "#")
+)
+
+
+# Notes
+
+
+def parse_note(name: str) -> tuple[int, int]:
+    """
+    Return the letter index and alteration of a note name such as `Bbb`.
+    """
+    m = re.match(r"^([A-G])(#*|b*)$", name)
+    if not m:
+        raise ValueError("Unknown note %s" % name)
+    accidentals = m.group(2)
+    alteration = len(accidentals) if accidentals[:1] == "#" else -len(accidentals)
+    return LETTERS.index(m.group(1)), alteration
+
+
+def spell_note(letter: int, pitch_class: int) -> str:
+    """
+    Return the name of the note written with `letter` which sounds
+    `pitch_class`, using the fewest accidentals.
+    """
+    alteration = (pitch_class - NATURAL_PITCHES[letter] + 6) % 12 - 6
+    accidentals = "#" * alteration if alteration > 0 else "b" * -alteration
+    return LETTERS[letter] + accidentals
+
+
+def note_name_to_pitch(name: str) -> int:
+    letter, alteration = parse_note(name)
+    return (NATURAL_PITCHES[letter] + alteration) % 12
+
+
+# Keys
+
+
+def key_name_to_note_names(key: str) -> list[str]:
+    """
+    Return the note names in `key`, one letter per degree.
+    """
+    root = key[0].upper() + key[1:]
+    letter = parse_note(root)[0]
+    root_pitch = note_name_to_pitch(root)
+    offsets = MINOR_SCALE if key.islower() else MAJOR_SCALE
+    names = []
+    for degree, offset in enumerate(offsets):
+        name = spell_note((letter + degree) % 7, (root_pitch + offset) % 12)
+        if len(name) > 3:
+            raise ValueError(f"Scale {key} requires too many accidentals")
+        names.append(name)
+    return names
+
+
+def key_name_to_pitches(key: str) -> list[int]:
+    return [note_name_to_pitch(name) for name in key_name_to_note_names(key)]
+
+
+# Chords
+
+
+def parse_interval(interval: str) -> tuple[int, int]:
+    """
+    Return the number of degrees and semitones of an interval such as `b7`.
+    """
+    m = re.match(r"^([b#]*)(\d+)$", interval)
+    assert m, f"Invalid interval {interval}"
+    degrees = int(m.group(2)) - 1
+    semitones = MAJOR_SCALE[degrees % 7] + 12 * (degrees // 7)
+    semitones += m.group(1).count("#") - m.group(1).count("b")
+    return degrees, semitones
+
+
+def parse_chord_name(name: str) -> tuple[str, str, Optional[str]]:
+    """
+    Return the root, quality and bass of a chord name.
+    """
+    root_re = "[A-G][b#]?"
+    quality_re = "|".join(re.escape(notation) for notation in QUALITIES)
+    m = re.match(f"^({root_re})({quality_re})(?:/({root_re}))?$", name)
+    if not m:
+        raise ValueError("Could not parse chord notation %s" % name)
+    return m.group(1), m.group(2), m.group(3)
+
+
+def chord_name_to_note_names(chord: str) -> list[str]:
+    root, quality, over = parse_chord_name(chord)
+    letter = parse_note(root)[0]
+    root_pitch = note_name_to_pitch(root)
+    names = []
+    for interval in QUALITIES[quality]:
+        degrees, semitones = parse_interval(interval)
+        names.append(spell_note((letter + degrees) % 7, (root_pitch + semitones) % 12))
+    if over:
+        names.insert(0, over)
+    return names
+
+
+def chord_name_to_pitches(chord: str) -> list[int]:
+    root, quality, over = parse_chord_name(chord)
+    root_pitch = note_name_to_pitch(root)
+    pitches = [root_pitch + parse_interval(i)[1] for i in QUALITIES[quality]]
+    if over:
+        over_pitch = note_name_to_pitch(over)
+        if over_pitch >= root_pitch:
+            over_pitch -= 12
+        pitches.insert(0, over_pitch)
+    return pitches
+
+
+# Fretboards
+
+
+def dump_svg(
+    cells: Sequence[Sequence[Optional[tuple[str, str]]]],
+    *,
+    strings: int,
+    capo: int,
+    landscape: bool,
+) -> str:
+    """
+    Return the SVG image of a fretboard, given the (color, text) of the
+    cell of each string of each fret.
+    """
+    padding = 10
+    fret_spacing = 30
+    string_spacing = 20
+    font = 'font-family="arial" font-size="12px"'
+    board_width = string_spacing * (strings - 1)
+    board_height = fret_spacing * len(cells)
+    image_width = board_width + 4 * padding
+    image_height = board_height + 2 * padding
+
+    if landscape:
+        transform = f"translate(0, {image_width - 2 * padding}) rotate(-90, 0, 0)"
+        viewbox = f"0 0 {image_height} {image_width}"
+        angle = 90
+    else:
+        transform = f"translate({2 * padding}, 0)"
+        viewbox = f"0 0 {image_width} {image_height}"
+        angle = 0
+
+    parts = [
+        f'<svg viewBox="{viewbox}" xmlns="http://www.w3.org/2000/svg">',
+        f'<g transform="{transform}">',
+    ]
+    for string_idx in range(strings):
+        x = padding + string_idx * string_spacing
+        parts.append(
+            f'<line x1="{x}" y1="{padding}" x2="{x}" y2="{padding + board_height}"'
+            ' stroke="black"/>'
+        )
+    for fret_idx in range(len(cells) + 1):
+        y = padding + fret_idx * fret_spacing
+        width = 2 if fret_idx == 1 else 1
+        parts.append(
+            f'<line x1="{padding}" y1="{y}" x2="{padding + board_width}" y2="{y}"'
+            f' stroke="black" stroke-width="{width}"/>'
+        )
+    for fret_idx, row in enumerate(cells):
+        cy = padding + (fret_idx + 0.5) * fret_spacing
+        parts.append(
+            f'<text x="{-padding}" y="{cy + 4}" {font} text-anchor="middle"'
+            f' transform="rotate({angle}, {-padding}, {cy})">'
+            f"{capo + fret_idx}</text>\n"
+        )
+        for string_idx, cell in enumerate(row):
+            if cell is None:
+                continue
+            color, text = cell
+            cx = padding + string_idx * string_spacing
+            parts.append(
+                f'<circle cx="{cx}" cy="{cy}" r="{string_spacing / 2.5}"'
+                f' stroke="{color}" fill="white" />'
+                f'<text x="{cx}" y="{cy + 4}" fill="{color}" {font}'
+                f' text-anchor="middle" transform="rotate({angle}, {cx}, {cy})">'
+                f"{text}</text>"
+            )
+    parts.append("</g></svg>")
+    return "".join(parts)
+
+
+# Tracks
+
+
+def dump_midi(
+    chords: Sequence[Sequence[tuple[Fraction, int, int]]],
+    *,
+    beats_per_minute: int,
+    beat_time: int = 480,
+) -> bytes:
+    """
+    Return the standard MIDI file of a track, given the (duration, pitch,
+    velocity) of each note of each chord.
+    """
+    track = mido.MidiTrack()
+    track.append(
+        mido.MetaMessage("set_tempo", tempo=mido.bpm2tempo(beats_per_minute), time=0)
+    )
+    track.append(mido.Message("program_change", program=26, time=0))
+    for chord in chords:
+        for duration, pitch, velocity in chord:
+            track.append(mido.Message("note_on", note=pitch, velocity=velocity, time=0))
+        # Notes stop together, after the duration of the first note.
+        for idx, (duration, pitch, velocity) in enumerate(chord):
+            time = 0 if idx else int(beat_time * duration)
+            track.append(mido.Message("note_off", note=pitch, time=time))
+
+    midi_file = mido.MidiFile(ticks_per_beat=beat_time)
+    midi_file.tracks.append(track)
+    buffer = io.BytesIO()
+    midi_file.save(file=buffer)
+    return buffer.getvalue()
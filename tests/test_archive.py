@@ -0,0 +1,133 @@
+import os
+import struct
+import tempfile
+import unittest
+from fractions import Fraction
+
+from pyfrets.archive import Archive, ArchiveWriter, write_archive
+from pyfrets.songs import Song, strum_song
+from pyfrets.tracks import Track
+
+
+class ArchiveTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = os.path.join(tmpdir.name, "tracks.pyfa")
+
+    def test_write_archive(self) -> None:
+        first = Track(beats_per_minute=90)
+        first.add_notes([48, 52], duration=Fraction(1, 2))
+        first.add_notes([], duration=Fraction(1))
+        first.add_notes([55], duration=Fraction(1, 3), velocity=100)
+        first.add_notes([60], duration=Fraction(2))
+        second = Track(beats_per_minute=120)
+        self.assertEqual(write_archive(self.path, [first, second]), 2)
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["tracks.pyfa"])
+
+        with Archive(self.path) as archive:
+            self.assertEqual(len(archive), 2)
+            self.assertEqual(archive.ticks_per_beat, 480)
+
+            track = archive[0]
+            self.assertEqual(track.beats_per_minute, 90)
+            self.assertEqual(len(track), 4)
+            self.assertEqual(track.onsets.tolist(), [0, 0, 240, 400])
+            self.assertEqual(track.durations.tolist(), [240, 240, 160, 960])
+            self.assertEqual(track.chords.tolist(), [0, 2, 2, 3, 4])
+            self.assertEqual(track.pitches.tolist(), [48, 52, 55, 60])
+            self.assertEqual(track.velocities.tolist(), [64, 64, 100, 64])
+            self.assertEqual(track.to_track()._chords, first._chords)
+            del track
+
+            track = archive[-1]
+            self.assertEqual(track.beats_per_minute, 120)
+            self.assertEqual(len(track), 0)
+            self.assertEqual(track.to_track()._chords, [])
+            del track
+
+            with self.assertRaises(IndexError):
+                archive[2]
+
+    def test_write_archive_songs(self) -> None:
+        tracks = [
+            strum_song(Song(chord_pattern="I vi IV V", key=key), repeat=10)
+            for key in ["C", "G", "a", "f#"]
+        ]
+        write_archive(self.path, tracks, ticks_per_beat=2)
+        with Archive(self.path) as archive:
+            self.assertEqual(
+                [t.to_track().dump_midi() for t in archive],
+                [t.dump_midi() for t in tracks],
+            )
+
+    def test_concurrent_writers(self) -> None:
+        tracks = [Track(beats_per_minute=bpm) for bpm in (90, 120)]
+        for track in tracks:
+            track.add_notes([48], duration=Fraction(1))
+        first, second = ArchiveWriter(self.path), ArchiveWriter(self.path)
+        first.add_track(tracks[0])
+        second.add_track(tracks[1])
+        second.add_track(tracks[1])
+        second.close()
+        first.close()
+
+        # The archive closed last replaces the other one.
+        with Archive(self.path) as archive:
+            self.assertEqual([track.beats_per_minute for track in archive], [90])
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["tracks.pyfa"])
+
+    def test_views(self) -> None:
+        track = Track(beats_per_minute=120)
+        track.add_notes([48], duration=Fraction(1))
+        write_archive(self.path, [track])
+        archive = Archive(self.path)
+        pitches = archive[0].pitches
+        # The mapping outlives the archive while its views are in use.
+        archive.close()
+        self.assertEqual(pitches.tolist(), [48])
+        with self.assertRaises(TypeError):
+            pitches[0] = 50
+
+    def test_writer_errors(self) -> None:
+        track = Track(beats_per_minute=120)
+        track.add_notes([48], duration=Fraction(1, 7))
+        with self.assertRaises(ValueError) as cm:
+            write_archive(self.path, [track])
+        self.assertEqual(
+            str(cm.exception), "Duration 1/7 is not a whole number of ticks"
+        )
+        # The archive is discarded.
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), [])
+
+        track = Track(beats_per_minute=120)
+        track.add_notes([48], duration=Fraction(1), velocity=300)
+        with self.assertRaises(ValueError):
+            write_archive(self.path, [track])
+
+        writer = ArchiveWriter(self.path)
+        writer.close()
+        with self.assertRaises(ValueError) as cm:
+            writer.add_track(track)
+        self.assertEqual(str(cm.exception), "Archive writer is closed")
+
+    def test_reader_errors(self) -> None:
+        write_archive(self.path, [Track(beats_per_minute=120)])
+        with open(self.path, "rb") as fp:
+            data = fp.read()
+
+        for contents, message in [
+            (b"", f"{self.path} is not a track archive"),
+            (b"x" * len(data), f"{self.path} is not a track archive"),
+            (
+                data[:8] + struct.pack("<I", 99) + data[12:],
+                "Unsupported archive version 99",
+            ),
+            (data[:-48] + data[-24:], f"{self.path} is truncated"),
+        ]:
+            with self.subTest(message=message):
+                with open(self.path, "wb") as fp:
+                    fp.write(contents)
+                with self.assertRaises(ValueError) as cm:
+                    Archive(self.path)
+                self.assertEqual(str(cm.exception), message)
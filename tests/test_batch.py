@@ -0,0 +1,130 @@
+import json
+import os
+import tempfile
+import unittest
+from typing import Any
+from unittest import mock
+
+from pyfrets.batch import (
+    STATE_FILENAME,
+    ChordItem,
+    Item,
+    ScaleItem,
+    SongItem,
+    parse_manifest,
+    render_batch,
+)
+from pyfrets.fretboards import chord_name_to_fretboard
+from pyfrets.guitar import Orientation
+from pyfrets.songs import Song
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), "..", "examples")
+
+
+class BatchTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.output_dir = os.path.join(tmpdir.name, "output")
+
+    def test_parse_manifest(self) -> None:
+        items = parse_manifest(
+            {
+                "library": "songs.jsonl",
+                "chords": ["Am7"],
+                "scales": [{"root": "A", "scale": "blues"}],
+                "songs": ["pop", {"name": "blues", "repeat": 2}],
+                "formats": ["ansi", "svg"],
+                "portrait": True,
+            },
+            base_dir=EXAMPLES_DIR,
+        )
+        self.assertEqual(
+            [item.basename for item in items],
+            ["chord-Am7", "blues-a", "pop", "blues"],
+        )
+        self.assertEqual(
+            items[0], ChordItem(chord="Am7", formats=("ansi", "svg"), portrait=True)
+        )
+        self.assertIsInstance(items[3], SongItem)
+        assert isinstance(items[3], SongItem)
+        self.assertEqual(items[3].repeat, 2)
+
+    def test_parse_manifest_invalid(self) -> None:
+        manifests: list[tuple[dict[str, Any], str]] = [
+            ({"chords": ["H"]}, "Could not parse chord notation H"),
+            ({"chords": ["C/E"]}, "Slash chord C/E requires note names"),
+            ({"chords": ["C", "C"]}, "Duplicate output chord-C"),
+            ({"formats": ["png"]}, "Unknown format png"),
+            ({"scales": [{"root": "A", "scale": "foo"}]}, "Unknown scale foo"),
+            ({"songs": ["pop"]}, "Songs require a song library"),
+            (
+                {"library": "songs.jsonl", "songs": ["foo"]},
+                "Unknown song foo",
+            ),
+        ]
+        for data, message in manifests:
+            with self.subTest(data=data):
+                with self.assertRaises(ValueError) as cm:
+                    parse_manifest(data, base_dir=EXAMPLES_DIR)
+                self.assertEqual(str(cm.exception), message)
+
+    def test_render_batch(self) -> None:
+        items: list[Item] = [
+            ChordItem(chord="C", formats=("ansi", "svg")),
+            ChordItem(chord="Am7"),
+            ScaleItem(root="A", scale="blues"),
+            SongItem(song=Song(chord_pattern="I V", key="G", name="song")),
+        ]
+        result = render_batch(items, self.output_dir, chunksize=2, jobs=2)
+        self.assertEqual(result.rendered, ["chord-C", "chord-Am7", "blues-a", "song"])
+        self.assertEqual(result.skipped, [])
+        self.assertEqual(
+            sorted(os.listdir(self.output_dir)),
+            [
+                STATE_FILENAME,
+                "blues-a.svg",
+                "chord-Am7.svg",
+                "chord-C.ansi",
+                "chord-C.svg",
+                "song.mid",
+            ],
+        )
+        with open(os.path.join(self.output_dir, "chord-C.svg")) as fp:
+            self.assertEqual(
+                fp.read(),
+                chord_name_to_fretboard("C").dump_svg(
+                    orientation=Orientation.LANDSCAPE
+                ),
+            )
+
+        # Unchanged items are skipped, changed or missing ones are rendered.
+        os.unlink(os.path.join(self.output_dir, "chord-Am7.svg"))
+        items[2] = ScaleItem(root="A", scale="blues", portrait=True)
+        result = render_batch(items, self.output_dir, jobs=1)
+        self.assertEqual(result.rendered, ["chord-Am7", "blues-a"])
+        self.assertEqual(result.skipped, ["chord-C", "song"])
+
+        # Items are rendered again when their renderer changes.
+        with mock.patch("pyfrets.batch.FRETBOARD_RENDERER_VERSION", 1000):
+            result = render_batch(items, self.output_dir, jobs=1)
+            self.assertEqual(result.rendered, ["chord-C", "chord-Am7", "blues-a"])
+            self.assertEqual(result.skipped, ["song"])
+            with mock.patch("pyfrets.batch.TRACK_RENDERER_VERSION", 1000):
+                result = render_batch(items, self.output_dir, jobs=1)
+            self.assertEqual(result.rendered, ["song"])
+
+    def test_render_batch_failure(self) -> None:
+        items = [ChordItem(chord="C"), ChordItem(chord="D")]
+        with mock.patch.object(
+            ChordItem, "render", side_effect=[b"<svg/>", OSError("Disk full")]
+        ):
+            with self.assertRaises(OSError):
+                render_batch(items, self.output_dir, jobs=1)
+
+        # Items rendered before the failure are recorded, no partial file is left.
+        with open(os.path.join(self.output_dir, STATE_FILENAME)) as fp:
+            self.assertEqual(list(json.load(fp)), ["chord-C"])
+        self.assertEqual(
+            sorted(os.listdir(self.output_dir)), [STATE_FILENAME, "chord-C.svg"]
+        )
@@ -0,0 +1,172 @@
+import concurrent.futures
+import os
+import tempfile
+import unittest
+from fractions import Fraction
+
+from pyfrets.cache import (
+    CacheStats,
+    RenderCache,
+    fretboard_key,
+    song_key,
+    track_key,
+)
+from pyfrets.fretboards import chord_name_to_fretboard
+from pyfrets.guitar import Cell, Fretboard, Orientation
+from pyfrets.songs import Song, strum_song
+from pyfrets.tracks import Track
+
+
+def fill_cache(directory: str, worker: int) -> list[bytes]:
+    cache = RenderCache(directory, max_size=50000)
+    outputs = []
+    for idx in range(200):
+        key = f"{idx % 20:04x}"
+        data = cache.get_or_render(key, lambda: key.encode() * 1000)
+        outputs.append(data)
+    return outputs
+
+
+class CacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.directory = tmpdir.name
+
+    def test_fretboard_key(self) -> None:
+        board = Fretboard()
+        key = fretboard_key(board, "svg", Orientation.PORTRAIT)
+        self.assertEqual(key, fretboard_key(Fretboard(), "svg", Orientation.PORTRAIT))
+        self.assertNotEqual(key, fretboard_key(board, "ansi", Orientation.PORTRAIT))
+        self.assertNotEqual(key, fretboard_key(board, "svg", Orientation.LANDSCAPE))
+        for other in [
+            Fretboard(tuning="drop d"),
+            Fretboard(frets=12),
+            Fretboard(capo=1),
+        ]:
+            self.assertNotEqual(key, fretboard_key(other, "svg", Orientation.PORTRAIT))
+
+        board.set((0, 0), Cell(color="red", text="R"))
+        self.assertNotEqual(key, fretboard_key(board, "svg", Orientation.PORTRAIT))
+
+        # The key does not depend on the order in which cells were added.
+        key = fretboard_key(board, "svg", Orientation.PORTRAIT)
+        other = Fretboard()
+        other.set((1, 1), Cell(color="blue", text="3"))
+        other.set((0, 0), Cell(color="red", text="R"))
+        other.set((1, 1), None)
+        self.assertEqual(key, fretboard_key(other, "svg", Orientation.PORTRAIT))
+
+    def test_track_key(self) -> None:
+        def make_track(pitches: list[list[int]]) -> Track:
+            track = Track(beats_per_minute=120)
+            for chord in pitches:
+                track.add_notes(chord, duration=Fraction(1, 2))
+            return track
+
+        key = track_key(make_track([[48, 52], [55]]))
+        self.assertEqual(key, track_key(make_track([[48, 52], [55]])))
+        self.assertNotEqual(key, track_key(make_track([[48], [52, 55]])))
+        self.assertNotEqual(key, track_key(make_track([[48, 52], [55]]), 960))
+
+        track = make_track([[48, 52]])
+        track.add_notes([55], duration=Fraction(1, 2), velocity=100)
+        self.assertNotEqual(key, track_key(track))
+
+    def test_song_key(self) -> None:
+        song = Song(chord_pattern="I V", key="C")
+        key = song_key(song)
+        self.assertEqual(key, song_key(Song(chord_pattern="I V", key="C")))
+        self.assertNotEqual(key, song_key(song, repeat=2))
+        self.assertNotEqual(key, song_key(song, voice_leading=True))
+        self.assertNotEqual(key, song_key(Song(chord_pattern="I V", key="D")))
+
+    def test_get_put(self) -> None:
+        cache = RenderCache(self.directory)
+        self.assertIsNone(cache.get("abcd"))
+        cache.put("abcd", b"data")
+        self.assertEqual(cache.get("abcd"), b"data")
+        self.assertTrue(os.path.exists(os.path.join(self.directory, "ab", "cd")))
+        self.assertEqual(
+            cache.stats(), CacheStats(hits=1, misses=1, evictions=0, size=4)
+        )
+        self.assertEqual(cache.stats().hit_ratio, 0.5)
+
+        # Outputs are shared between cache instances.
+        other = RenderCache(self.directory)
+        self.assertEqual(other.get("abcd"), b"data")
+        self.assertEqual(other.stats().size, 4)
+
+    def test_eviction(self) -> None:
+        cache = RenderCache(self.directory, max_size=10)
+        cache.put("aa00", b"1234")
+        cache.put("bb00", b"1234")
+        for key, age in [("aa00", 100), ("bb00", 50)]:
+            path = os.path.join(self.directory, key[:2], key[2:])
+            mtime = os.stat(path).st_mtime - age
+            os.utime(path, (mtime, mtime))
+
+        # Reading an output marks it as recently used.
+        self.assertEqual(cache.get("aa00"), b"1234")
+
+        # The least recently used output is evicted.
+        cache.put("cc00", b"1234")
+        self.assertIsNone(cache.get("bb00"))
+        self.assertEqual(cache.get("aa00"), b"1234")
+        self.assertEqual(cache.get("cc00"), b"1234")
+        stats = cache.stats()
+        self.assertEqual((stats.evictions, stats.size), (1, 8))
+
+        # Replacing an output does not count it twice.
+        cache.put("cc00", b"12")
+        self.assertEqual(cache.stats().size, 6)
+
+    def test_concurrent_processes(self) -> None:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(fill_cache, [self.directory] * 4, range(4)))
+
+        # Readers never see partial outputs.
+        for outputs in results:
+            for idx, data in enumerate(outputs):
+                self.assertEqual(data, f"{idx % 20:04x}".encode() * 1000)
+        self.assertLessEqual(RenderCache(self.directory).stats().size, 50000)
+
+    def test_get_or_render(self) -> None:
+        cache = RenderCache(self.directory)
+        calls: list[None] = []
+
+        def render() -> bytes:
+            calls.append(None)
+            return b"data"
+
+        self.assertEqual(cache.get_or_render("abcd", render), b"data")
+        self.assertEqual(cache.get_or_render("abcd", render), b"data")
+        self.assertEqual(len(calls), 1)
+
+    def test_render(self) -> None:
+        cache = RenderCache(self.directory)
+        board = chord_name_to_fretboard("Am7")
+        for fmt, output in [
+            ("ansi", board.dump_ansi(orientation=Orientation.PORTRAIT)),
+            ("svg", board.dump_svg(orientation=Orientation.PORTRAIT)),
+        ]:
+            with self.subTest(fmt=fmt):
+                for _ in range(2):
+                    self.assertEqual(
+                        cache.render_fretboard(
+                            board, fmt, orientation=Orientation.PORTRAIT
+                        ),
+                        output.encode("utf8"),
+                    )
+
+        with self.assertRaises(ValueError):
+            cache.render_fretboard(board, "png", orientation=Orientation.PORTRAIT)
+
+        song = Song(chord_pattern="I V", key="C")
+        track = strum_song(song, repeat=2)
+        for _ in range(2):
+            self.assertEqual(cache.render_song(song, repeat=2), track.dump_midi())
+            self.assertEqual(cache.render_track(track), track.dump_midi())
+
+        stats = cache.stats()
+        self.assertEqual((stats.hits, stats.misses), (4, 5))
@@ -0,0 +1,159 @@
+import contextlib
+import json
+import os
+import tempfile
+import unittest
+from typing import Iterator
+from unittest import mock
+
+from pyfrets import catalogue, chords
+from pyfrets._registry import Registry
+from pyfrets.catalogue import STATE_SUFFIX, iter_catalogue, main, write_catalogue
+from pyfrets.chords import CHORD_QUALITIES, Quality, register_chord_quality
+
+
+@contextlib.contextmanager
+def qualities(*notations: str) -> Iterator[None]:
+    """
+    Replace the chord qualities by the specified ones.
+    """
+    registry = Registry(
+        [CHORD_QUALITIES[notation] for notation in notations],
+        key=lambda quality: quality.notation,
+    )
+    with (
+        mock.patch.object(chords, "CHORD_QUALITIES", registry),
+        mock.patch.object(catalogue, "CHORD_QUALITIES", registry),
+    ):
+        yield
+
+
+class CatalogueTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.tmpdir = tmpdir.name
+
+    def read(self, name: str) -> str:
+        with open(os.path.join(self.tmpdir, name), encoding="utf8") as fp:
+            return fp.read()
+
+    def test_iter_catalogue(self) -> None:
+        rows = list(iter_catalogue(qualities=[CHORD_QUALITIES["m7"]], jobs=1))
+        self.assertEqual(len(rows), 21 * 22)
+        self.assertEqual(
+            rows[0],
+            {
+                "chord": "Cm7",
+                "root": "C",
+                "quality": "m7",
+                "bass": None,
+                "description": "C minor seventh",
+                "note_names": ["C", "Eb", "G", "Bb"],
+                "intervals": ["1", "b3", "5", "b7"],
+                "pitches": [0, 3, 7, 10],
+                "voicings": rows[0]["voicings"],
+            },
+        )
+        self.assertEqual(len(rows[0]["voicings"]), 4)
+        self.assertEqual(
+            rows[0]["voicings"][0],
+            {"frets": [8, 10, 8, 8, 8, 8], "fingers": [1, 2, 1, 1, 1, 1]},
+        )
+
+        # Chords are ordered by root, then bass.
+        self.assertEqual([row["chord"] for row in rows[:3]], ["Cm7", "Cm7/C", "Cm7/Cb"])
+        self.assertEqual(rows[22]["chord"], "Cbm7")
+        self.assertEqual(rows[-1]["chord"], "B#m7/B#")
+        self.assertEqual(rows[1]["note_names"], ["C", "C", "Eb", "G", "Bb"])
+        self.assertEqual(rows[1]["pitches"], [-12, 0, 3, 7, 10])
+
+    def test_iter_catalogue_parallel(self) -> None:
+        selected = [CHORD_QUALITIES["dim7"], CHORD_QUALITIES["11"]]
+        self.assertEqual(
+            list(iter_catalogue(qualities=selected, voicings=1, jobs=2)),
+            list(iter_catalogue(qualities=selected, voicings=1, jobs=1)),
+        )
+
+    def test_write_incremental(self) -> None:
+        path = os.path.join(self.tmpdir, "catalogue.jsonl")
+        with qualities("", "m"):
+            self.assertEqual(write_catalogue(path, voicings=1, jobs=1), 2 * 462)
+            with open(path + STATE_SUFFIX) as fp:
+                state = json.load(fp)
+            self.assertEqual(
+                state["qualities"], [["", ["1", "3", "5"]], ["m", ["1", "b3", "5"]]]
+            )
+            self.assertEqual(state["size"], os.path.getsize(path))
+
+            # Nothing to do.
+            self.assertEqual(write_catalogue(path, voicings=1, jobs=1), 0)
+
+            # Only the chords of new qualities are written, even after an
+            # interrupted export.
+            with open(path, "a") as fp:
+                fp.write('{"chord": "C')
+            register_chord_quality(Quality("7", ("1", "3", "5", "b7"), "dominant"))
+            self.assertEqual(write_catalogue(path, voicings=1, jobs=1), 462)
+            full_path = os.path.join(self.tmpdir, "full.jsonl")
+            self.assertEqual(write_catalogue(full_path, voicings=1, jobs=1), 3 * 462)
+            self.assertEqual(self.read("catalogue.jsonl"), self.read("full.jsonl"))
+
+            # Changing options writes the whole catalogue.
+            self.assertEqual(write_catalogue(path, voicings=2, jobs=1), 3 * 462)
+
+        # Qualities which are not a continuation of the catalogue.
+        with qualities("m", ""):
+            self.assertEqual(write_catalogue(path, voicings=2, jobs=1), 2 * 462)
+        lines = self.read("catalogue.jsonl").splitlines()
+        self.assertEqual(len(lines), 2 * 462)
+        self.assertEqual(json.loads(lines[0])["chord"], "Cm")
+
+    def test_write_invalid_state(self) -> None:
+        path = os.path.join(self.tmpdir, "catalogue.jsonl")
+        with qualities("", "m"):
+            write_catalogue(path, voicings=1, jobs=1)
+            with open(path + STATE_SUFFIX) as fp:
+                options = json.load(fp)
+            del options["qualities"], options["size"]
+            for state in [[], options, {**options, "qualities": 1, "size": 0}]:
+                with open(path + STATE_SUFFIX, "w") as fp:
+                    json.dump(state, fp)
+                self.assertEqual(write_catalogue(path, voicings=1, jobs=1), 2 * 462)
+        self.assertEqual(
+            sorted(os.listdir(self.tmpdir)),
+            ["catalogue.jsonl", "catalogue.jsonl" + STATE_SUFFIX],
+        )
+
+    def test_write_csv(self) -> None:
+        with qualities("", "m"):
+            path = os.path.join(self.tmpdir, "catalogue.csv")
+            self.assertEqual(write_catalogue(path, voicings=2, jobs=1), 2 * 462)
+            register_chord_quality(Quality("7", ("1", "3", "5", "b7"), "dominant"))
+            self.assertEqual(write_catalogue(path, voicings=2, jobs=1), 462)
+
+        lines = self.read("catalogue.csv").splitlines()
+        self.assertEqual(len(lines), 1 + 3 * 462)
+        self.assertEqual(
+            lines[0],
+            "chord,root,quality,bass,description,note_names,intervals,pitches,voicings",
+        )
+        self.assertEqual(
+            lines[1],
+            'C,C,,,C major triad,C E G,1 3 5,0 4 7,"x,3,2,0,1,0 8,7,5,5,5,0"',
+        )
+        self.assertEqual(lines[1 + 2 * 462].split(",")[:4], ["C7", "C", "7", ""])
+
+    def test_write_invalid(self) -> None:
+        with self.assertRaises(ValueError) as cm:
+            write_catalogue(os.path.join(self.tmpdir, "catalogue.xml"), fmt="xml")
+        self.assertEqual(str(cm.exception), "Unknown catalogue format xml")
+
+    def test_main(self) -> None:
+        path = os.path.join(self.tmpdir, "catalogue.csv")
+        with qualities("sus2"), contextlib.redirect_stdout(None):
+            main([path, "--jobs", "1", "--voicings", "0"])
+        lines = self.read("catalogue.csv").splitlines()
+        self.assertEqual(
+            lines[1], "Csus2,C,sus2,,C suspended second,C D G,1 2 5,0 2 7,"
+        )
@@ -2,11 +2,16 @@ import dataclasses
 import unittest
 
 from pyfrets.chords import (
+    PROGRESSION_CACHE_SIZE,
+    Progression,
+    Repeat,
     chord_name_from_roman,
     chord_name_to_description,
     chord_name_to_interval_names,
     chord_name_to_note_names,
     chord_name_to_pitches,
+    chord_names_to_voice_leading,
+    parse_progression,
 )
 
 
@@ -69,6 +74,9 @@ class ChordsTest(unittest.TestCase):
             with self.subTest(roman=roman, key=key):
                 self.assertEqual(chord_name_from_roman(roman, key), name)
 
+        # Alterations cancel out existing accidentals.
+        self.assertEqual(chord_name_from_roman("VII#dim7", "c"), "Bdim7")
+
     def test_chords(self) -> None:
         chords = {
             # 3 notes
@@ -290,3 +298,86 @@ class ChordsTest(unittest.TestCase):
 
     def test_chord_name_to_interval_names(self) -> None:
         self.assertEqual(chord_name_to_interval_names("C"), ["1", "3", "5"])
+
+    def test_chord_names_to_voice_leading(self) -> None:
+        self.assertEqual(chord_names_to_voice_leading([]), [])
+        self.assertEqual(
+            chord_names_to_voice_leading(["C", "Am", "F", "G", "C"]),
+            [[0, 4, 7], [0, 4, 9], [0, 5, 9], [-1, 2, 7], [0, 4, 7]],
+        )
+
+    def test_chord_names_to_voice_leading_range(self) -> None:
+        # Moving down by fourths drifts downwards unless kept in range.
+        fifths = "C G D A E B F# Db Ab Eb Bb F".split()
+        for chords in [fifths * 50, fifths[::-1] * 50, ["C", "F", "Bb", "Eb"] * 20]:
+            with self.subTest(chords=chords[:4]):
+                voicings = chord_names_to_voice_leading(chords)
+                center = sum(voicings[0]) / len(voicings[0])
+                for chord in voicings:
+                    self.assertLessEqual(abs(sum(chord) / len(chord) - center), 18)
+
+    def test_chord_names_to_voice_leading_slash(self) -> None:
+        pitches = chord_names_to_voice_leading(["C", "G/B", "Am7", "D/F#", "G"])
+        self.assertEqual(
+            pitches,
+            [[0, 4, 7], [-1, 2, 7, 11], [0, 4, 7, 9], [-6, 2, 6, 9], [-1, 2, 7]],
+        )
+        # The bass of slash chords stays at the bottom.
+        self.assertEqual(pitches[1][0] % 12, 11)
+        self.assertEqual(pitches[3][0] % 12, 6)
+
+    def test_parse_progression(self) -> None:
+        progression = parse_progression(
+            "[intro] C G |\n[verse] |: Am | F G :|x3 Em\n[outro] C | G/B :|| C",
+        )
+        self.assertEqual(
+            progression,
+            Progression(
+                chords=("C", "G", "Am", "F", "G", "Em", "C", "G/B", "C"),
+                bars=(0, 2, 3, 5, 6, 7, 8),
+                repeats=(
+                    Repeat(start=2, end=5, times=3),
+                    Repeat(start=6, end=8, times=2),
+                ),
+                sections=(("intro", 0, 2), ("verse", 2, 6), ("outro", 6, 9)),
+            ),
+        )
+        chords = ["C", "G"] + ["Am", "F", "G"] * 3 + ["Em"] + ["C", "G/B"] * 2 + ["C"]
+        self.assertEqual(list(progression), chords)
+        self.assertEqual(len(progression), len(chords))
+
+        # Parsing the same chart again returns the same progression.
+        self.assertIs(parse_progression(" C G |\n"), parse_progression(" C G |\n"))
+        self.assertEqual(list(parse_progression("")), [])
+
+        # Only recent charts are kept.
+        for idx in range(PROGRESSION_CACHE_SIZE + 10):
+            parse_progression("C" + " " * idx)
+        self.assertEqual(
+            parse_progression.cache_info().currsize,
+            PROGRESSION_CACHE_SIZE,
+        )
+
+    def test_parse_progression_roman(self) -> None:
+        progression = parse_progression("I vi | IV V7 :|", roman=True)
+        self.assertEqual(progression.chords, ("I", "vi", "IV", "V7"))
+        self.assertEqual(list(progression.resolve("G")), ["G", "Em", "C", "D7"] * 2)
+
+    def test_parse_progression_invalid(self) -> None:
+        charts = {
+            "C Dm H": "Could not parse chord notation H (line 1, column 6)",
+            "C\n  C#m7b5/E I": "Could not parse chord notation I (line 2, column 12)",
+            "C [verse": "Could not parse chord notation [verse (line 1, column 3)",
+            "C |: D\n|: E :|": "Repeats cannot be nested (line 2, column 1)",
+            "C |: D": "Repeat is never closed (line 1, column 3)",
+            "|: :|": "Repeat is empty (line 1, column 4)",
+            "C :|\nD :|x0": "Repeat count must be positive (line 2, column 3)",
+            "|: C [verse] :|": (
+                "Sections cannot start inside a repeat (line 1, column 6)"
+            ),
+        }
+        for chart, message in charts.items():
+            with self.subTest(chart=chart):
+                with self.assertRaises(ValueError) as cm:
+                    parse_progression(chart)
+                self.assertEqual(str(cm.exception), message)
@@ -0,0 +1,108 @@
+import unittest
+import xml.etree.ElementTree as ElementTree
+
+from pyfrets.diagrams import (
+    chord_names_to_chord_box_sheet,
+    dump_chord_box,
+    dump_chord_box_sheet,
+)
+from pyfrets.fingering import Voicing, chord_name_to_voicings
+
+SVG = "{http://www.w3.org/2000/svg}"
+
+
+class DiagramsTest(unittest.TestCase):
+    def test_dump_chord_box(self) -> None:
+        voicing = Voicing(
+            frets=(None, 3, 2, 0, 1, 0), fingers=(None, 3, 2, None, 1, None), cost=0
+        )
+        root = ElementTree.fromstring(dump_chord_box(voicing, name="C"))
+        self.assertEqual(root.get("viewBox"), "0 0 92 94")
+        self.assertEqual(
+            [u.get("href") for u in root.iter(SVG + "use")],
+            [
+                "#pyfrets-grid-6x4",
+                "#pyfrets-muted",
+                "#pyfrets-open",
+                "#pyfrets-open",
+            ],
+        )
+        self.assertEqual(
+            [t.text for t in root.iter(SVG + "text")], ["C", "3", "2", "1"]
+        )
+        # The nut is drawn as the window starts on the first fret.
+        self.assertEqual(
+            [line.get("stroke-width") for line in root.findall(SVG + "line")], ["4"]
+        )
+
+    def test_dump_chord_box_position(self) -> None:
+        voicing = chord_name_to_voicings("C#")[0]
+        self.assertEqual(voicing.frets, (9, 11, 11, 10, 9, 9))
+        root = ElementTree.fromstring(dump_chord_box(voicing, name="C#"))
+        texts = [t.text for t in root.iter(SVG + "text")]
+        self.assertEqual(texts[:2], ["C♯", "9fr"])
+        self.assertEqual(texts[2:], ["1", "3", "4", "2", "1", "1"])
+        # The index finger bars the ninth fret.
+        self.assertEqual(
+            [line.get("stroke-width") for line in root.findall(SVG + "line")], ["10"]
+        )
+
+    def test_dump_chord_box_sheet(self) -> None:
+        chords = ["C", "F", "C#m7", "D/F#", "C", "Bb", "G"]
+        sheet = chord_names_to_chord_box_sheet(chords, columns=4)
+        self.assertEqual(
+            sheet.ids,
+            {
+                "Bb": "pyfrets-chord-Bb",
+                "C": "pyfrets-chord-C",
+                "C#m7": "pyfrets-chord-Csm7",
+                "D/F#": "pyfrets-chord-D-over-Fs",
+                "F": "pyfrets-chord-F",
+                "G": "pyfrets-chord-G",
+            },
+        )
+
+        root = ElementTree.fromstring(sheet.svg)
+        self.assertEqual(root.get("viewBox"), "0 0 368 188")
+        defs = root.find(SVG + "defs")
+        assert defs is not None
+        self.assertEqual(
+            [s.get("id") for s in defs.iter(SVG + "symbol")], list(sheet.ids.values())
+        )
+        # Shared parts are defined once.
+        self.assertEqual(
+            [g.get("id") for g in defs.findall(SVG + "g")],
+            ["pyfrets-open", "pyfrets-muted", "pyfrets-grid-6x4"],
+        )
+        self.assertEqual(
+            [(u.get("x"), u.get("y")) for u in root.findall(SVG + "use")],
+            [
+                ("0", "0"),
+                ("92", "0"),
+                ("184", "0"),
+                ("276", "0"),
+                ("0", "94"),
+                ("92", "94"),
+            ],
+        )
+
+    def test_dump_chord_box_sheet_ids(self) -> None:
+        voicings = chord_name_to_voicings("G")
+        sheet = dump_chord_box_sheet(
+            [("G", voicings[0]), ("G", voicings[1]), ("G", voicings[0])]
+        )
+        self.assertEqual(sheet.ids, {"G": "pyfrets-chord-G"})
+        root = ElementTree.fromstring(sheet.svg)
+        self.assertEqual(
+            [u.get("href") for u in root.findall(SVG + "use")],
+            ["#pyfrets-chord-G", "#pyfrets-chord-G-2"],
+        )
+
+    def test_dump_chord_box_sheet_errors(self) -> None:
+        with self.assertRaises(ValueError) as cm:
+            dump_chord_box_sheet([], columns=0)
+        self.assertEqual(str(cm.exception), "Sprite sheet needs at least one column")
+
+        with self.assertRaises(ValueError) as cm:
+            chord_names_to_chord_box_sheet(["C", "Cfoo"])
+        self.assertEqual(str(cm.exception), "Could not parse chord notation Cfoo")
@@ -0,0 +1,59 @@
+import unittest
+
+from pyfrets.fingering import chord_name_to_voicings, chord_names_to_voicings
+
+
+class FingeringTest(unittest.TestCase):
+    def test_chord_name_to_voicings(self) -> None:
+        chords = {
+            "Am": (None, 0, 2, 2, 1, 0),
+            "C": (None, 3, 2, 0, 1, 0),
+            "D": (None, None, 0, 2, 3, 2),
+            "E7": (0, 2, 0, 1, 0, 0),
+            "F": (1, 3, 3, 2, 1, 1),
+            "G": (3, 2, 0, 0, 0, 3),
+            "G/B": (None, 2, 0, 0, 0, 3),
+        }
+        for chord, frets in chords.items():
+            with self.subTest(chord=chord):
+                voicings = chord_name_to_voicings(chord)
+                self.assertEqual(voicings[0].frets, frets)
+                self.assertEqual(
+                    [v.cost for v in voicings], sorted(v.cost for v in voicings)
+                )
+
+    def test_chord_name_to_voicings_fingers(self) -> None:
+        voicing = chord_name_to_voicings("F")[0]
+        self.assertEqual(voicing.fingers, (1, 3, 4, 2, 1, 1))
+        self.assertEqual(voicing.position, 1)
+
+        voicing = chord_name_to_voicings("C")[0]
+        self.assertEqual(voicing.fingers, (None, 3, 2, None, 1, None))
+        self.assertEqual(voicing.position, 1)
+
+    def test_chord_names_to_voicings(self) -> None:
+        self.assertEqual(chord_names_to_voicings([]), [])
+
+        chords = ["C", "Am", "F", "G"]
+        voicings = chord_names_to_voicings(chords)
+        self.assertEqual(
+            [v.frets for v in voicings],
+            [
+                (None, 3, 2, 0, 1, 0),
+                (None, 0, 2, 2, 1, 0),
+                (1, 3, 3, 2, 1, 1),
+                (3, 2, 0, 0, 0, 3),
+            ],
+        )
+
+    def test_chord_names_to_voicings_stays_in_position(self) -> None:
+        chords = ["Bm7", "E7", "Amaj7"] * 10
+        voicings = chord_names_to_voicings(chords)
+        self.assertEqual(len(voicings), len(chords))
+        for chord, voicing in zip(chords, voicings):
+            self.assertIn(voicing, chord_name_to_voicings(chord))
+        self.assertEqual(voicings[:3], voicings[3:6])
+
+    def test_chord_names_to_voicings_invalid(self) -> None:
+        with self.assertRaises(ValueError):
+            chord_names_to_voicings(["C", "X"])
@@ -0,0 +1,57 @@
+import dataclasses
+import unittest
+
+from pyfrets.fretboards import (
+    chord_name_to_fretboard,
+    chord_names_to_animated_svg,
+    scale_name_to_fretboard,
+    song_to_animated_svg,
+)
+from pyfrets.guitar import Orientation
+from pyfrets.songs import Song
+
+
+class FretboardsTest(unittest.TestCase):
+    def test_chord_name_to_fretboard(self) -> None:
+        board = chord_name_to_fretboard("Am7")
+        self.assertIn(">♭3</text>", board.dump_svg(orientation=Orientation.PORTRAIT))
+
+        board = chord_name_to_fretboard("Am7", note_names=True)
+        self.assertIn(">C</text>", board.dump_svg(orientation=Orientation.PORTRAIT))
+
+    def test_scale_name_to_fretboard(self) -> None:
+        board = scale_name_to_fretboard("A", "blues")
+        svg = board.dump_svg(orientation=Orientation.PORTRAIT)
+        self.assertIn(">R</text>", svg)
+        self.assertIn(">♭5</text>", svg)
+
+    def test_chord_names_to_animated_svg(self) -> None:
+        svg = chord_names_to_animated_svg(
+            [("C", 4), ("G/B", 2), ("C", 2)],
+            beats_per_minute=120,
+            orientation=Orientation.PORTRAIT,
+        )
+        self.assertEqual(svg.count('<g id="pyfrets-frame-'), 2)
+        self.assertEqual(svg.count("<use "), 3)
+        self.assertIn(">3</text>", svg)
+        # Slash chords are shown with note names.
+        self.assertIn(">B</text>", svg)
+        self.assertIn('begin="pyfrets-clock.begin+2s" dur="1s"', svg)
+
+    def test_song_to_animated_svg(self) -> None:
+        song = Song(
+            chord_pattern="|: I V :|x50", key="C", strum_pattern="D-D-/D---D---"
+        )
+        svg = song_to_animated_svg(song, orientation=Orientation.LANDSCAPE)
+        self.assertEqual(svg.count("<use "), 100)
+        self.assertIn('begin="pyfrets-clock.begin+1s" dur="2s"', svg)
+        self.assertIn('begin="0s;pyfrets-clock.end" dur="150s"', svg)
+
+        # The image grows with the number of frames, not with the grid.
+        frame_size = len(svg) - len(
+            song_to_animated_svg(
+                dataclasses.replace(song, chord_pattern="|: I V :|x49"),
+                orientation=Orientation.LANDSCAPE,
+            )
+        )
+        self.assertLess(frame_size, 400)
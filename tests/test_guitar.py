@@ -0,0 +1,377 @@
+import dataclasses
+import json
+import pickle
+import unittest
+import xml.etree.ElementTree as ElementTree
+from typing import Any
+
+from pyfrets.fretboards import chord_name_to_fretboard
+from pyfrets.guitar import (
+    FRETS,
+    LAYOUT_CACHE_SIZE,
+    STRINGS,
+    TUNINGS,
+    Cell,
+    Fretboard,
+    Orientation,
+    Tuning,
+    _get_layout,
+    dump_animated_svg,
+)
+from pyfrets.notes import Note
+
+
+class FretboardTest(unittest.TestCase):
+    def test_get_set(self) -> None:
+        board = Fretboard()
+        self.assertIsNone(board.get((3, 2)))
+
+        board.set((3, 2), Cell(color="red", text="R"))
+        board.set((5, 0), Cell(color="red", text="R"))
+        self.assertEqual(board.get((3, 2)), Cell(color="red", text="R"))
+        self.assertEqual(board.get((5, 0)), Cell(color="red", text="R"))
+        self.assertIsNone(board.get((2, 3)))
+
+        # Identical cells share a palette entry, so cells cannot be changed.
+        self.assertEqual(len(board._palette), 2)
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            board.get((3, 2)).color = "blue"  # type: ignore[union-attr,misc]
+
+        board.set((3, 2), None)
+        self.assertIsNone(board.get((3, 2)))
+
+        for pos in [(0, 6), (0, -1), (-1, 0), (FRETS, 0)]:
+            with self.subTest(pos=pos):
+                with self.assertRaises(IndexError) as cm:
+                    board.set(pos, Cell(color="red", text="R"))
+                self.assertEqual(
+                    str(cm.exception), "Position %s is not on the fretboard" % (pos,)
+                )
+                with self.assertRaises(IndexError):
+                    board.get(pos)
+        self.assertEqual(len([pos for pos, _ in board.walk() if board.get(pos)]), 1)
+
+    def test_set_pitches(self) -> None:
+        board = Fretboard()
+        board.set((0, 0), Cell(color="blue", text="x"))
+        board.set_pitches({0: Cell(color="red", text="C"), 19: Cell("blue", "G")})
+        for pos, pitch in board.walk():
+            with self.subTest(pos=pos):
+                if pitch % 12 == 0:
+                    self.assertEqual(board.get(pos), Cell(color="red", text="C"))
+                elif pitch % 12 == 7:
+                    self.assertEqual(board.get(pos), Cell(color="blue", text="G"))
+                else:
+                    self.assertIsNone(board.get(pos))
+
+    def test_copy_clear(self) -> None:
+        board = chord_name_to_fretboard("C")
+        copy = board.copy()
+        board.clear()
+        self.assertEqual(
+            [board.get(pos) for pos, pitch in board.walk()],
+            [None] * FRETS * len(STRINGS),
+        )
+        self.assertEqual(
+            copy.dump_svg(orientation=Orientation.PORTRAIT),
+            chord_name_to_fretboard("C").dump_svg(orientation=Orientation.PORTRAIT),
+        )
+
+    def test_pickle(self) -> None:
+        board = chord_name_to_fretboard("Am7", tuning="drop d", capo=2)
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(protocol=protocol):
+                other = pickle.loads(pickle.dumps(board, protocol=protocol))
+                self.assertEqual(other.tuning, board.tuning)
+                self.assertEqual((other.frets, other.capo), (board.frets, board.capo))
+                self.assertEqual(other._cells, board._cells)
+                self.assertEqual(other._palette, board._palette)
+                self.assertEqual(other._palette_index, board._palette_index)
+
+        # Cells are passed out of band, and writable buffers are not copied.
+        buffers: list[pickle.PickleBuffer] = []
+        data = pickle.dumps(board, protocol=5, buffer_callback=buffers.append)
+        self.assertEqual(len(buffers), 1)
+        cells = bytearray(buffers[0].raw())
+        other = pickle.loads(data, buffers=[cells])
+        self.assertIs(other._cells, cells)
+        other.set((0, 0), Cell(color="red", text="X"))
+        self.assertNotEqual(board.get((0, 0)), other.get((0, 0)))
+        self.assertEqual(
+            other.dump_svg(orientation=Orientation.PORTRAIT).count(">X<"), 1
+        )
+
+    def test_palette_compaction(self) -> None:
+        board = Fretboard()
+        for idx, (pos, pitch) in enumerate(board.walk()):
+            board.set(pos, Cell(color="red", text=str(idx)))
+        for idx in range(1000):
+            board.set((0, 0), Cell(color="blue", text=str(idx)))
+        self.assertEqual(board.get((0, 0)), Cell(color="blue", text="999"))
+        self.assertEqual(board.get((0, 1)), Cell(color="red", text="16"))
+        self.assertLessEqual(len(board._palette), 256)
+
+        # Every pitch class gets a new cell each time.
+        board = Fretboard()
+        for idx in range(50):
+            board.set_pitches(
+                {
+                    pitch: Cell(color="red", text="%d.%d" % (idx, pitch))
+                    for pitch in range(12)
+                }
+            )
+            self.assertLessEqual(len(board._palette), 256)
+        for pos, pitch in board.walk():
+            with self.subTest(pos=pos):
+                self.assertEqual(
+                    board.get(pos), Cell(color="red", text="49.%d" % (pitch % 12))
+                )
+        Fretboard.parse_json(board.dump_json())
+
+    def test_tunings(self) -> None:
+        board = Fretboard(tuning="drop d", frets=5, capo=2)
+        self.assertEqual(board.tuning, TUNINGS["drop d"])
+        self.assertEqual((board.frets, board.capo), (5, 2))
+        positions = dict(board.walk())
+        self.assertEqual(len(positions), 30)
+        self.assertEqual(positions[(0, 0)], Note.E2)
+        self.assertEqual(positions[(4, 5)], Note.E4 + 6)
+        self.assertEqual(board.find(Note.E2), ((0, 0), (0, 2), (3, 4)))
+
+        bass = Fretboard(tuning="bass")
+        self.assertEqual(len(list(bass.walk())), 4 * FRETS)
+        self.assertEqual(bass.find(Note.C2), ((3, 1), (5, 3), (8, 0), (10, 2), (15, 1)))
+
+    def test_tunings_svg(self) -> None:
+        board = Fretboard(tuning="seven string", frets=3, capo=5)
+        board.set((0, 0), Cell(color="red", text="R"))
+        svg = board.dump_svg(orientation=Orientation.PORTRAIT)
+        self.assertEqual(svg.count("<line"), 7 + 4)
+        self.assertIn(">5</text>", svg)
+        self.assertIn(">7</text>", svg)
+        self.assertNotIn(">8</text>", svg)
+
+    def test_layout_cache(self) -> None:
+        # Boards with the same tuning, frets and capo share their layout.
+        self.assertIs(Fretboard()._layout, Fretboard()._layout)
+        self.assertIs(Fretboard()._layout, _get_layout(TUNINGS["standard"], FRETS, 0))
+        self.assertEqual(
+            _get_layout(TUNINGS["standard"], FRETS, 0).strings, tuple(STRINGS)
+        )
+        self.assertIsNot(Fretboard()._layout, Fretboard(capo=1)._layout)
+
+        # Only the most recent layouts are kept.
+        for capo in range(2 * LAYOUT_CACHE_SIZE):
+            Fretboard(capo=capo)
+        self.assertEqual(_get_layout.cache_info().currsize, LAYOUT_CACHE_SIZE)
+
+    def test_invalid(self) -> None:
+        cases: list[tuple[dict[str, Any], str]] = [
+            ({"tuning": "banjo"}, "Unknown tuning banjo"),
+            ({"frets": 0}, "Fretboard needs at least one fret"),
+            ({"capo": -1}, "Capo cannot be negative"),
+            ({"frets": 50}, "Fretboard has too many positions"),
+        ]
+        for kwargs, message in cases:
+            with self.subTest(**kwargs):
+                with self.assertRaises(ValueError) as cm:
+                    Fretboard(**kwargs)
+                self.assertEqual(str(cm.exception), message)
+
+    def test_json(self) -> None:
+        board = Fretboard(frets=2)
+        board.set((1, 5), Cell(color="red", text="R"))
+        board.set((0, 0), Cell(color="blue", text="x"))
+        board.set((0, 1), Cell(color="blue", text="x"))
+        board.set((1, 1), Cell(color="red", text="R"))
+        board.set((0, 0), None)
+        self.assertEqual(
+            board.dump_json(),
+            '{"tuning":"standard","frets":2,"capo":0,'
+            '"palette":[["blue","x"],["red","R"]],"cells":[1,0,1,1,5,0,1,2,3,0,1,2]}',
+        )
+        self.assertEqual(
+            Fretboard(tuning="bass", frets=3, capo=2).dump_json(),
+            '{"tuning":"bass","frets":3,"capo":2,"palette":[],"cells":[12,0]}',
+        )
+
+        for board in [
+            chord_name_to_fretboard("Am7", tuning="drop d", capo=2),
+            chord_name_to_fretboard("C", note_names=True),
+            Fretboard(tuning=Tuning("ukulele", (67, 60, 64, 69), "ukulele (GCEA)")),
+        ]:
+            with self.subTest(tuning=board.tuning.name):
+                other = Fretboard.parse_json(board.dump_json())
+                self.assertEqual(other.tuning.strings, board.tuning.strings)
+                self.assertEqual((other.frets, other.capo), (board.frets, board.capo))
+                self.assertEqual(
+                    [other.get(pos) for pos, pitch in other.walk()],
+                    [board.get(pos) for pos, pitch in board.walk()],
+                )
+                self.assertEqual(other.dump_json(), board.dump_json())
+
+        # Palette entries are interned as for other cells.
+        other.set((0, 0), Cell(color="red", text="R"))
+        other.set((0, 1), Cell(color="red", text="R"))
+        self.assertEqual(len(other._palette), 2)
+
+    def test_json_delta(self) -> None:
+        boards = [chord_name_to_fretboard(chord) for chord in ["C", "Am", "F", "G7"]]
+        boards.append(boards[-1].copy())
+        boards[-1].set((0, 0), Cell(color="red", text="X"))
+        board = Fretboard.parse_json(boards[0].dump_json())
+        for previous, current in zip(boards, boards[1:]):
+            board.apply_json_delta(current.dump_json_delta(previous))
+            self.assertEqual(
+                [board.get(pos) for pos, pitch in board.walk()],
+                [current.get(pos) for pos, pitch in current.walk()],
+            )
+        self.assertEqual(
+            boards[-1].dump_json_delta(boards[-2]),
+            '{"palette":[["red","X"]],"cells":[0,1]}',
+        )
+
+        # Only changed cells are sent, whatever their palette index.
+        board = Fretboard()
+        board.set((0, 0), Cell(color="red", text="R"))
+        board.set((1, 0), Cell(color="blue", text="x"))
+        other = Fretboard()
+        other.set((1, 0), Cell(color="blue", text="x"))
+        other.set((0, 0), Cell(color="red", text="R"))
+        self.assertEqual(other.dump_json_delta(board), '{"palette":[],"cells":[]}')
+        other.set((2, 0), Cell(color="red", text="R"))
+        self.assertEqual(
+            other.dump_json_delta(board), '{"palette":[["red","R"]],"cells":[12,1]}'
+        )
+
+        with self.assertRaises(ValueError) as cm:
+            Fretboard().dump_json_delta(Fretboard(capo=2))
+        self.assertEqual(str(cm.exception), "Fretboards must have the same layout")
+
+    def test_json_invalid(self) -> None:
+        for data, message in [
+            ("[", "Expecting value: line 1 column 2 (char 1)"),
+            ('{"tuning":"banjo"}', "Unknown tuning banjo"),
+            (
+                '{"tuning":"bass","frets":0,"capo":0}',
+                "Fretboard needs at least one fret",
+            ),
+            (
+                '{"tuning":"bass","frets":1,"capo":0,"palette":[],"cells":[3,0]}',
+                "Cells do not match the fretboard",
+            ),
+            (
+                '{"tuning":"bass","frets":1,"capo":0,"palette":[],"cells":[4,1]}',
+                "Invalid palette index 1",
+            ),
+            (
+                '{"tuning":"bass","frets":1,"capo":0,"palette":[["red"]],"cells":[]}',
+                "not enough values to unpack (expected 2, got 1)",
+            ),
+            (
+                '{"tuning":"bass","frets":1,"capo":0,"palette":[],'
+                '"cells":[10000000000,0,-9999999996,0]}',
+                "Invalid run count -9999999996",
+            ),
+            (
+                '{"tuning":"bass","frets":1,"capo":0,"palette":[],'
+                '"cells":[10000000000,0]}',
+                "Cells do not match the fretboard",
+            ),
+            (
+                '{"tuning":"bass","frets":1,"capo":0,"palette":[],"cells":[4]}',
+                "Cells must hold pairs of counts and indices",
+            ),
+            (
+                '{"tuning":"bass","frets":1,"capo":0,"palette":[],"cells":[4,-1]}',
+                "Invalid palette index -1",
+            ),
+            (
+                '{"tuning":"bass","frets":1,"capo":100,"palette":[],"cells":[4,0]}',
+                "Fretboard pitches are out of range",
+            ),
+            (
+                '{"tuning":"x","strings":[40,1000],"frets":1,"capo":0,'
+                '"palette":[],"cells":[2,0]}',
+                "Fretboard pitches are out of range",
+            ),
+            (
+                '{"tuning":"bass","frets":1.5,"capo":0,"palette":[],"cells":[4,0]}',
+                "'float' object cannot be interpreted as an integer",
+            ),
+        ]:
+            with self.subTest(data=data):
+                with self.assertRaises(ValueError) as cm:
+                    Fretboard.parse_json(data)
+                self.assertEqual(
+                    str(cm.exception), "Could not parse fretboard: " + message
+                )
+
+        board = chord_name_to_fretboard("C")
+        for changes, message in [
+            ([0, 1, 96, 0], "Invalid position 96"),
+            ([0, 1, 0, 2], "Invalid palette index 2"),
+            ([0, 1, 0, -1], "Invalid palette index -1"),
+            ([0, 1, 0], "Cells must hold pairs of positions and indices"),
+            ([0, 1, 0.5, 0], "'float' object cannot be interpreted as an integer"),
+        ]:
+            with self.subTest(changes=changes):
+                with self.assertRaises(ValueError) as cm:
+                    board.apply_json_delta(
+                        json.dumps({"palette": [["red", "R"]], "cells": changes})
+                    )
+                self.assertEqual(
+                    str(cm.exception), "Could not parse fretboard delta: " + message
+                )
+        # Invalid deltas are not applied in part.
+        self.assertEqual(board.dump_json(), chord_name_to_fretboard("C").dump_json())
+
+    def test_dump_animated_svg(self) -> None:
+        c = chord_name_to_fretboard("C")
+        g = chord_name_to_fretboard("G")
+        svg = dump_animated_svg(
+            [(c, 2), (g, 1), (chord_name_to_fretboard("C"), 0.5)],
+            orientation=Orientation.LANDSCAPE,
+        )
+        root = ElementTree.fromstring(svg)
+        ns = "{http://www.w3.org/2000/svg}"
+
+        # The grid is drawn once, each distinct fretboard is defined once.
+        self.assertEqual(len(root.findall(f".//{ns}line")), 6 + FRETS + 1)
+        groups = root.findall(f"./{ns}g/{ns}defs/{ns}g")
+        self.assertEqual(
+            [g.get("id") for g in groups], ["pyfrets-frame-0", "pyfrets-frame-1"]
+        )
+        self.assertEqual(
+            len(groups[0].findall(f"{ns}circle")),
+            c.dump_svg(orientation=Orientation.LANDSCAPE).count("<circle"),
+        )
+
+        frames = [
+            (use.get("href"), use[0].get("begin"), use[0].get("dur"))
+            for use in root.iter(f"{ns}use")
+        ]
+        self.assertEqual(
+            frames,
+            [
+                ("#pyfrets-frame-0", "pyfrets-clock.begin+0s", "2s"),
+                ("#pyfrets-frame-1", "pyfrets-clock.begin+2s", "1s"),
+                ("#pyfrets-frame-0", "pyfrets-clock.begin+3s", "0.5s"),
+            ],
+        )
+        self.assertIn('begin="0s;pyfrets-clock.end" dur="3.5s"', svg)
+
+    def test_dump_animated_svg_invalid(self) -> None:
+        board = Fretboard()
+        for frames, message in [
+            ([], "Animation needs at least one frame"),
+            ([(board, 0.0)], "Frame duration must be positive"),
+            (
+                [(board, 1.0), (Fretboard(capo=2), 1.0)],
+                "Fretboards must have the same layout",
+            ),
+        ]:
+            with self.subTest(message=message):
+                with self.assertRaises(ValueError) as cm:
+                    dump_animated_svg(frames, orientation=Orientation.PORTRAIT)
+                self.assertEqual(str(cm.exception), message)
@@ -0,0 +1,38 @@
+import subprocess
+import sys
+import unittest
+
+import pyfrets
+from pyfrets.chords import chord_name_to_pitches
+
+
+class InitTest(unittest.TestCase):
+    def test_all(self) -> None:
+        self.assertEqual(sorted(pyfrets.__all__), sorted(pyfrets._LAZY_ATTRIBUTES))
+        for name in pyfrets.__all__:
+            with self.subTest(name=name):
+                self.assertIn(name, dir(pyfrets))
+                self.assertIsNotNone(getattr(pyfrets, name))
+
+    def test_lazy_attribute(self) -> None:
+        self.assertIs(pyfrets.chord_name_to_pitches, chord_name_to_pitches)
+
+        with self.assertRaises(AttributeError) as cm:
+            pyfrets.no_such_attribute
+        self.assertEqual(
+            str(cm.exception), "module 'pyfrets' has no attribute 'no_such_attribute'"
+        )
+
+    def test_lazy_dependencies(self) -> None:
+        code = (
+            "import sys, pyfrets; "
+            "from pyfrets.guitar import Fretboard; "
+            "from pyfrets.tracks import Track; "
+            "pyfrets.chord_name_to_pitches('C'); "
+            "print(' '.join(sorted(m for m in ('colorama', 'mido') "
+            "if m in sys.modules)))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, check=True, text=True
+        )
+        self.assertEqual(result.stdout.strip(), "")
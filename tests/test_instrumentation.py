@@ -0,0 +1,143 @@
+import concurrent.futures
+import functools
+import os
+import subprocess
+import sys
+import unittest
+from typing import Any, Callable, TypeVar
+
+import pyfrets
+from pyfrets import instrumentation
+from pyfrets.chords import _get_inversions, chord_name_to_pitches
+from pyfrets.instrumentation import (
+    FunctionStats,
+    collect_stats,
+    enable_stats,
+    instrument,
+)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class InstrumentationTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.addCleanup(enable_stats, instrumentation.ENABLED)
+
+    def test_disabled(self) -> None:
+        enable_stats(False)
+        with collect_stats() as collected:
+            chord_name_to_pitches("C")
+            _get_inversions("C")
+            _get_inversions("C")
+        self.assertNotIn("pyfrets.chords.chord_name_to_pitches", collected)
+        stats = collected["pyfrets.chords._get_inversions"]
+        self.assertEqual(stats.calls, 2)
+        self.assertIsNone(stats.time)
+        self.assertEqual((stats.hits or 0) + (stats.misses or 0), 2)
+        self.assertGreaterEqual(stats.hits or 0, 1)
+
+    def test_stats(self) -> None:
+        enable_stats(False)
+        snapshot = pyfrets.stats()
+        stats = snapshot["pyfrets.chords._get_interval_pitch"]
+        self.assertIsNone(stats.time)
+        self.assertIsNotNone(stats.hits)
+        self.assertEqual(stats.calls, (stats.hits or 0) + (stats.misses or 0))
+
+    def instrument(self, func: F) -> F:
+        wrapped = instrument(func)
+        name = instrumentation._get_name(func)
+        self.addCleanup(instrumentation._calls.pop, name)
+        self.addCleanup(instrumentation._times.pop, name)
+        self.addCleanup(instrumentation._caches.pop, name, None)
+        return wrapped
+
+    def test_wrap(self) -> None:
+        @functools.lru_cache(maxsize=None)
+        def square(x: int) -> int:
+            return x * x
+
+        wrapped = self.instrument(square)
+        name = instrumentation._get_name(square)
+
+        enable_stats()
+        with collect_stats() as collected:
+            for x in [1, 2, 1, 1]:
+                self.assertEqual(wrapped(x), x * x)
+        stats = collected[name]
+        self.assertEqual(stats.calls, 4)
+        self.assertGreater(stats.time or 0, 0)
+        self.assertEqual((stats.hits, stats.misses), (2, 2))
+        self.assertEqual(stats.hit_ratio, 0.5)
+
+        # Cache controls are preserved.
+        wrapped.cache_clear()
+        self.assertEqual(wrapped.cache_info().currsize, 0)
+
+    def test_enable_stats(self) -> None:
+        def func() -> None:
+            pass
+
+        wrapped = self.instrument(func)
+        name = instrumentation._get_name(func)
+
+        # Calls are only counted while instrumentation is enabled.
+        enable_stats(False)
+        wrapped()
+        enable_stats()
+        with collect_stats() as collected:
+            wrapped()
+        self.assertEqual(collected[name].calls, 1)
+        enable_stats(False)
+        wrapped()
+        enable_stats()
+        self.assertEqual(pyfrets.stats()[name].calls, 1)
+
+    def test_threads(self) -> None:
+        def func() -> None:
+            pass
+
+        wrapped = self.instrument(func)
+        name = instrumentation._get_name(func)
+        enable_stats()
+        self.addCleanup(sys.setswitchinterval, sys.getswitchinterval())
+        sys.setswitchinterval(1e-6)
+
+        def call() -> None:
+            for _ in range(10000):
+                wrapped()
+
+        with collect_stats() as collected:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+                for future in [pool.submit(call) for _ in range(8)]:
+                    future.result()
+        self.assertEqual(collected[name].calls, 80000)
+
+    def test_hit_ratio(self) -> None:
+        self.assertIsNone(FunctionStats(calls=1, time=0.1).hit_ratio)
+        self.assertEqual(FunctionStats(calls=0, time=0, hits=0, misses=0).hit_ratio, 0)
+        self.assertEqual(
+            FunctionStats(calls=4, time=0, hits=3, misses=1).hit_ratio, 0.75
+        )
+
+    def test_enabled(self) -> None:
+        code = (
+            "import pyfrets; "
+            "from pyfrets.chords import _get_inversions, chord_name_to_pitches; "
+            "from pyfrets.guitar import Fretboard, Orientation; "
+            "from pyfrets.tracks import Track; "
+            "chord_name_to_pitches('C'); "
+            "Fretboard().dump_svg(orientation=Orientation.PORTRAIT); "
+            "stats = pyfrets.stats(); "
+            "print(stats['pyfrets.chords.chord_name_to_pitches'].calls, "
+            "stats['pyfrets.guitar.Fretboard.dump_svg'].calls, "
+            "stats['pyfrets.tracks.Track.to_midi'].calls)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            check=True,
+            env={**os.environ, "PYFRETS_STATS": "1"},
+            text=True,
+        )
+        self.assertEqual(result.stdout.strip(), "1 1 0")
@@ -1,10 +1,16 @@
+import pickle
 import unittest
 
 from pyfrets.notes import (
+    KEY_SIGNATURES,
+    Key,
+    SpelledNote,
     augment,
     diminish,
+    key_name_to_chord_names,
     key_name_to_note_names,
     key_name_to_pitches,
+    key_name_to_signature,
     note_name_from_roman,
     note_name_to_pitch,
     prettify_chord,
@@ -23,6 +29,71 @@ class NotesTest(unittest.TestCase):
         self.assertEqual(diminish("C"), "Cb")
         self.assertEqual(diminish("C#"), "C")
 
+    def test_spelled_note(self) -> None:
+        note = SpelledNote.parse("C#")
+        self.assertIs(note, SpelledNote(0, 1))
+        self.assertIs(pickle.loads(pickle.dumps(note)), note)
+        self.assertEqual(note.name, "C#")
+        self.assertEqual(note.pitch_class, 1)
+        self.assertEqual(str(note.alter(-2)), "Cb")
+        self.assertEqual(repr(note), "SpelledNote('C#')")
+        with self.assertRaises(AttributeError):
+            note.alteration = 2
+        with self.assertRaises(ValueError):
+            note.pitch
+
+        note = SpelledNote.parse("Bb3")
+        self.assertEqual((note.letter, note.alteration, note.octave), (6, -1, 3))
+        self.assertEqual(note.pitch, 58)
+        self.assertEqual(str(note), "Bb3")
+
+        for name in ["H", "C#b", "c", "C4.5"]:
+            with self.subTest(name=name):
+                with self.assertRaises(ValueError):
+                    SpelledNote.parse(name)
+
+    def test_spelled_note_intervals(self) -> None:
+        c4 = SpelledNote.parse("C4")
+        self.assertIs(c4.transpose(2, 4), SpelledNote.parse("E4"))
+        self.assertIs(c4.transpose(6, 10), SpelledNote.parse("Bb4"))
+        self.assertIs(c4.transpose(8, 13), SpelledNote.parse("Db5"))
+        self.assertIs(SpelledNote.parse("B3").transpose(1, 1), SpelledNote.parse("C4"))
+        self.assertIs(SpelledNote.parse("E").transpose(2, 4), SpelledNote.parse("G#"))
+
+        self.assertEqual(c4.interval(SpelledNote.parse("Db5")), (8, 13))
+        self.assertEqual(
+            SpelledNote.parse("B").interval(SpelledNote.parse("C")), (1, 1)
+        )
+
+        self.assertTrue(SpelledNote.parse("B#3").is_enharmonic(c4))
+        self.assertFalse(SpelledNote.parse("B#4").is_enharmonic(c4))
+        self.assertTrue(SpelledNote.parse("Dbb").is_enharmonic(SpelledNote.parse("C")))
+
+    def test_key(self) -> None:
+        key = Key.get("e")
+        self.assertIs(key, Key.get("e"))
+        self.assertIs(pickle.loads(pickle.dumps(key)), key)
+        self.assertEqual(repr(key), "Key('e')")
+        self.assertEqual(key.pitch_classes, frozenset([4, 6, 7, 9, 11, 0, 2]))
+        with self.assertRaises(AttributeError):
+            key.signature = 2
+
+    def test_key_name_to_chord_names(self) -> None:
+        self.assertEqual(
+            key_name_to_chord_names("G"),
+            ("G", "Am", "Bm", "C", "D", "Em", "F#dim"),
+        )
+        self.assertEqual(
+            key_name_to_chord_names("e"),
+            ("Em", "F#dim", "G", "Am", "Bm", "C", "D"),
+        )
+
+    def test_key_name_to_signature(self) -> None:
+        for key, signature in KEY_SIGNATURES.items():
+            with self.subTest(key=key):
+                self.assertEqual(key_name_to_signature(key), signature)
+        self.assertEqual(key_name_to_signature("G#"), 8)
+
     def test_key_name_to_note_names(self) -> None:
         # Valid scales.
         keys = {
@@ -73,7 +144,7 @@ class NotesTest(unittest.TestCase):
         }
         for key, names in keys.items():
             with self.subTest(key=key):
-                self.assertEqual(key_name_to_note_names(key), names)
+                self.assertEqual(key_name_to_note_names(key), tuple(names))
 
         # Invalid scales.
         for key in [
@@ -106,7 +177,7 @@ class NotesTest(unittest.TestCase):
         }
         for key, pitches in keys.items():
             with self.subTest(key=key):
-                self.assertEqual(key_name_to_pitches(key), pitches)
+                self.assertEqual(key_name_to_pitches(key), tuple(pitches))
 
     def test_note_name_from_roman(self) -> None:
         notes = {
@@ -125,6 +196,10 @@ class NotesTest(unittest.TestCase):
             with self.subTest(roman=roman, key=key):
                 self.assertEqual(note_name_from_roman(roman, key), name)
 
+        # Alterations cancel out existing accidentals.
+        self.assertEqual(note_name_from_roman("IV#", "F"), "B")
+        self.assertEqual(note_name_from_roman("VIIb", "D"), "C")
+
     def test_note_name_to_pitch(self) -> None:
         notes = {
             "C": 0,
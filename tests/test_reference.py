@@ -0,0 +1,191 @@
+import pickle
+import random
+import unittest
+from fractions import Fraction
+from typing import Callable, Optional, Sequence
+from unittest import mock
+
+from pyfrets.chords import (
+    CHORD_QUALITIES,
+    _get_chord_table,
+    chord_name_to_note_names,
+    chord_name_to_pitches,
+)
+from pyfrets.guitar import TUNINGS, Cell, Fretboard, Orientation
+from pyfrets.notes import (
+    Key,
+    _compute_key,
+    key_name_to_note_names,
+    key_name_to_pitches,
+)
+from pyfrets.tracks import Track
+
+from . import reference
+
+COLORS = ("red", "green", "blue", "black")
+
+
+def outcome(func: Callable[[str], Sequence[object]], name: str) -> object:
+    """
+    Return the result of `func` as a list, or its error message.
+    """
+    try:
+        return list(func(name))
+    except ValueError as exc:
+        return str(exc)
+
+
+class ChordsTest(unittest.TestCase):
+    def test_qualities(self) -> None:
+        self.assertEqual(
+            {
+                notation: CHORD_QUALITIES[notation].intervals
+                for notation in reference.QUALITIES
+            },
+            reference.QUALITIES,
+        )
+
+    def test_all_chords(self) -> None:
+        # Every root and quality, with and without every bass.
+        chords = [
+            root + notation + over
+            for root in reference.ROOTS
+            for notation in reference.QUALITIES
+            for over in [""] + ["/" + bass for bass in reference.ROOTS]
+        ]
+        expected = [
+            (
+                reference.chord_name_to_note_names(chord),
+                reference.chord_name_to_pitches(chord),
+            )
+            for chord in chords
+        ]
+
+        # Once with the prebuilt table, once computing every chord.
+        for table in (True, False):
+            with mock.patch.dict(_get_chord_table(), clear=not table):
+                for chord, (names, pitches) in zip(chords, expected):
+                    self.assertEqual(chord_name_to_note_names(chord), names, chord)
+                    self.assertEqual(chord_name_to_pitches(chord), pitches, chord)
+
+    def test_random_chord_names(self) -> None:
+        tokens = (
+            list(reference.ROOTS)
+            + list(reference.QUALITIES)
+            + ["/", "#", "b", "m", "x", " ", "H", "c"]
+        )
+        for seed in range(2000):
+            rng = random.Random(seed)
+            name = "".join(rng.choice(tokens) for _ in range(rng.randint(1, 4)))
+            for func, expected in (
+                (chord_name_to_note_names, reference.chord_name_to_note_names),
+                (chord_name_to_pitches, reference.chord_name_to_pitches),
+            ):
+                self.assertEqual(
+                    outcome(func, name), outcome(expected, name), (seed, name)
+                )
+
+
+class KeysTest(unittest.TestCase):
+    def test_all_keys(self) -> None:
+        for key in [key for pair in reference.KEYS for key in pair]:
+            with self.subTest(key=key):
+                names = reference.key_name_to_note_names(key)
+                pitches = reference.key_name_to_pitches(key)
+                self.assertEqual(list(key_name_to_note_names(key)), names)
+                self.assertEqual(list(key_name_to_pitches(key)), pitches)
+
+                # Without the prebuilt table nor interned keys.
+                self.assertEqual(list(_compute_key(key)[0]), names)
+                self.assertEqual(list(Key(key).note_names), names)
+
+
+class FretboardTest(unittest.TestCase):
+    def test_random_boards(self) -> None:
+        tunings = sorted(TUNINGS)
+        texts = [str(idx) for idx in range(300)]
+        for seed in range(200):
+            rng = random.Random(seed)
+            tuning = TUNINGS[rng.choice(tunings)]
+            strings = len(tuning.strings)
+            frets = rng.randint(1, min(24, 254 // strings))
+            capo = rng.randint(0, 7)
+            board = Fretboard(tuning=tuning.name, frets=frets, capo=capo)
+
+            # Apply random operations to the board and to a model of its cells.
+            model: dict[tuple[int, int], tuple[str, str]] = {}
+            for _ in range(rng.randint(0, 600)):
+                action = rng.random()
+                if action < 0.8:
+                    pos = (rng.randrange(frets), rng.randrange(strings))
+                    if rng.random() < 0.2:
+                        board.set(pos, None)
+                        model.pop(pos, None)
+                    else:
+                        cell = (rng.choice(COLORS), rng.choice(texts))
+                        board.set(pos, Cell(*cell))
+                        model[pos] = cell
+                elif action < 0.85:
+                    cells = {
+                        rng.randrange(128): (rng.choice(COLORS), rng.choice(texts))
+                        for _ in range(rng.randint(0, 4))
+                    }
+                    board.set_pitches({p: Cell(*cell) for p, cell in cells.items()})
+                    by_class = {p % 12: cell for p, cell in cells.items()}
+                    model = {
+                        (fret, string_idx): by_class[pitch_class]
+                        for fret in range(frets)
+                        for string_idx, string_note in enumerate(tuning.strings)
+                        if (pitch_class := (string_note + capo + fret) % 12) in by_class
+                    }
+                elif action < 0.9:
+                    board.clear()
+                    model = {}
+                elif action < 0.95:
+                    board = board.copy()
+                else:
+                    board = pickle.loads(
+                        pickle.dumps(board, protocol=rng.choice([2, 5]))
+                    )
+
+            grid: list[list[Optional[tuple[str, str]]]] = [
+                [model.get((fret, string_idx)) for string_idx in range(strings)]
+                for fret in range(frets)
+            ]
+            for orientation in Orientation:
+                self.assertEqual(
+                    board.dump_svg(orientation=orientation),
+                    reference.dump_svg(
+                        grid,
+                        strings=strings,
+                        capo=capo,
+                        landscape=orientation == Orientation.LANDSCAPE,
+                    ),
+                    (seed, orientation),
+                )
+
+
+class TrackTest(unittest.TestCase):
+    def test_random_tracks(self) -> None:
+        for seed in range(200):
+            rng = random.Random(seed)
+            beats_per_minute = rng.randint(20, 300)
+            beat_time = rng.choice([96, 480, 960])
+            track = Track(beats_per_minute=beats_per_minute)
+            chords: list[list[tuple[Fraction, int, int]]] = []
+            for _ in range(rng.randint(0, 50)):
+                duration = Fraction(rng.randint(1, 16), rng.choice([1, 2, 3, 4, 7, 8]))
+                pitches = [rng.randrange(128) for _ in range(rng.randint(0, 6))]
+                velocity = rng.randrange(128)
+                track.add_notes(pitches, duration, velocity=velocity)
+                chords.append([(duration, pitch, velocity) for pitch in pitches])
+            if rng.random() < 0.5:
+                track = pickle.loads(pickle.dumps(track, protocol=rng.choice([2, 5])))
+
+            self.assertEqual(
+                track.dump_midi(beat_time=beat_time),
+                reference.dump_midi(
+                    chords, beats_per_minute=beats_per_minute, beat_time=beat_time
+                ),
+                seed,
+            )
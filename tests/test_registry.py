@@ -0,0 +1,272 @@
+import concurrent.futures
+import contextlib
+import sys
+import threading
+import unittest
+from typing import Callable, Iterator
+from unittest import mock
+
+from pyfrets import chords, guitar, scales
+from pyfrets._registry import Registry, cached_property
+from pyfrets.chords import (
+    CHORD_QUALITIES,
+    Quality,
+    _get_chord_table,
+    chord_name_from_roman,
+    chord_name_to_pitches,
+    parse_progression,
+    register_chord_quality,
+)
+from pyfrets.guitar import TUNINGS, Fretboard, Tuning, register_tuning
+from pyfrets.notes import NOTE_ALPHABET, SpelledNote
+from pyfrets.scales import (
+    SCALES,
+    Scale,
+    chord_name_to_scale_names,
+    register_scale,
+    scale_name_to_chord_names,
+)
+
+THREADS = 8
+
+
+@contextlib.contextmanager
+def private_registries() -> Iterator[None]:
+    """
+    Replace the registries by copies, so that tests can register entries.
+    """
+    # Load the prebuilt tables before they can be found stale.
+    _get_chord_table()
+    qualities = Registry(CHORD_QUALITIES.values(), key=lambda q: q.notation)
+    with (
+        mock.patch.object(chords, "CHORD_QUALITIES", qualities),
+        mock.patch.object(scales, "CHORD_QUALITIES", qualities),
+        mock.patch.object(
+            scales, "SCALES", Registry(SCALES.values(), key=lambda s: s.name)
+        ),
+        mock.patch.object(
+            guitar, "TUNINGS", Registry(TUNINGS.values(), key=lambda t: t.name)
+        ),
+    ):
+        yield
+
+
+class RegistryTest(unittest.TestCase):
+    def test_register(self) -> None:
+        registry = Registry(["a", "bb"], key=lambda value: value[0])
+        snapshot = registry.snapshot()
+        self.assertEqual(dict(registry), {"a": "a", "b": "bb"})
+
+        registry.register("cc")
+        self.assertEqual(list(registry), ["a", "b", "c"])
+        self.assertEqual(registry["c"], "cc")
+        self.assertIsNot(registry.snapshot(), snapshot)
+
+        # Published snapshots never change.
+        self.assertEqual(list(snapshot), ["a", "b"])
+        self.assertEqual(len(snapshot), 2)
+
+        with self.assertRaises(ValueError) as cm:
+            registry.register("bbb")
+        self.assertEqual(str(cm.exception), "b is already registered")
+        self.assertEqual(registry["b"], "bb")
+
+    def test_snapshot_identity(self) -> None:
+        registry = Registry(["a"], key=str)
+        other = Registry(["a"], key=str)
+        self.assertEqual(registry.snapshot(), registry.snapshot())
+        self.assertNotEqual(registry.snapshot(), other.snapshot())
+        self.assertEqual(len({registry.snapshot(), other.snapshot()}), 2)
+
+    def test_cached_property(self) -> None:
+        calls: list[int] = []
+
+        class Counter:
+            @cached_property
+            def value(self) -> int:
+                calls.append(1)
+                return len(calls)
+
+        counter = Counter()
+        self.assertEqual((counter.value, counter.value), (1, 1))
+        self.assertEqual(Counter().value, 2)
+        self.assertIsInstance(Counter.__dict__["value"], cached_property)
+
+    def test_register_chord_quality(self) -> None:
+        with private_registries():
+            register_chord_quality(
+                Quality("13", ("1", "3", "5", "b7", "9", "13"), "dominant thirteenth")
+            )
+            self.assertEqual(
+                chord_name_to_pitches("C13"),
+                chord_name_to_pitches("C9") + [chord_name_to_pitches("C6")[3] + 12],
+            )
+            self.assertEqual(parse_progression("C13 | G7").chords, ("C13", "G7"))
+            self.assertIn("mixolydian", chord_name_to_scale_names("C13"))
+
+        with self.assertRaises(ValueError):
+            chord_name_to_pitches("C13")
+
+    def test_register_scale_tuning(self) -> None:
+        with private_registries():
+            register_scale(Scale("augmented", 0b100110011001, "augmented"))
+            names = scale_name_to_chord_names("C", "augmented")
+            self.assertEqual(
+                [name for name in names if name.endswith("aug")],
+                ["Caug", "Ebaug", "Eaug", "Gaug", "G#aug", "Baug"],
+            )
+            register_tuning(Tuning("ukulele", (67, 60, 64, 69), "ukulele (GCEA)"))
+            self.assertEqual(Fretboard(tuning="ukulele").tuning.strings[0], 67)
+
+        self.assertNotIn("augmented", SCALES)
+        self.assertNotIn("ukulele", TUNINGS)
+
+    def test_register_releases_snapshots(self) -> None:
+        with private_registries():
+            for idx in range(4):
+                register_chord_quality(Quality("x%d" % idx, ("1", "3"), ""))
+                register_scale(Scale("x%d" % idx, 0b10001 | 1 << idx + 5, ""))
+                chord_name_to_pitches("Cx%d" % idx)
+                chord_name_from_roman("Ix%d" % idx, "C")
+                parse_progression("Cx%d | G" % idx)
+                chord_name_to_scale_names("Cx%d" % idx)
+            for regex in [chords._get_chord_regex, chords._get_progression_regex]:
+                self.assertEqual(
+                    regex.cache_info().currsize, chords.SNAPSHOT_CACHE_SIZE
+                )
+            self.assertEqual(scales._get_compatibility.cache_info().currsize, 1)
+
+    def test_register_invalid(self) -> None:
+        cases: list[tuple[Callable[[], None], str]] = [
+            (
+                lambda: register_chord_quality(Quality("m", ("1", "b3", "5"), "")),
+                "m is already registered",
+            ),
+            (
+                lambda: register_chord_quality(Quality("x", ("1", "x3"), "")),
+                "Invalid interval x3",
+            ),
+            (
+                lambda: register_scale(Scale("odd", 0b110, "")),
+                "Invalid scale mask 0b110",
+            ),
+            (
+                lambda: register_tuning(Tuning("empty", (), "")),
+                "Tuning needs at least one string",
+            ),
+        ]
+        for register, message in cases:
+            with self.subTest(message=message):
+                with private_registries():
+                    with self.assertRaises(ValueError) as cm:
+                        register()
+                    self.assertEqual(str(cm.exception), message)
+
+
+class ThreadsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        # Switch threads as often as possible to expose races.
+        self.addCleanup(sys.setswitchinterval, sys.getswitchinterval())
+        sys.setswitchinterval(1e-6)
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=THREADS)
+        self.addCleanup(self.executor.shutdown)
+
+    def test_cached_property(self) -> None:
+        quality = Quality("test", ("1", "b3", "b5", "bb7"), "test")
+        barrier = threading.Barrier(THREADS)
+
+        def read() -> tuple[int, ...]:
+            barrier.wait()
+            return quality.pitches
+
+        results = list(self.executor.map(lambda _: read(), range(THREADS)))
+        self.assertEqual(results[0], (0, 3, 6, 9))
+        for result in results:
+            self.assertIs(result, results[0])
+
+    def test_spelled_notes(self) -> None:
+        names = [
+            letter + accidentals + str(octave)
+            for letter in NOTE_ALPHABET
+            for accidentals in ("bbb", "###")
+            for octave in range(10, 20)
+        ]
+        barrier = threading.Barrier(THREADS)
+
+        def parse() -> list[SpelledNote]:
+            barrier.wait()
+            return [SpelledNote.parse(name) for name in names]
+
+        results = list(self.executor.map(lambda _: parse(), range(THREADS)))
+        for notes in results:
+            for note, expected in zip(notes, results[0]):
+                self.assertIs(note, expected)
+
+    def test_stress(self) -> None:
+        chord_names = ["C", "Am7", "F#m7b5", "Bb/D", "Ebmaj9", "G7#11"]
+        chart = "[verse] |: C Am7 | F G7 :|x2 [chorus] Dm7 | G7 | C"
+        new_qualities = [
+            Quality("x%d" % idx, ("1", "3", "5", "b7"), "test") for idx in range(40)
+        ]
+        new_scales = [
+            Scale("test %d" % idx, 0b010110110101, "test") for idx in range(40)
+        ]
+
+        with private_registries():
+            pitches = {chord: chord_name_to_pitches(chord) for chord in chord_names}
+            scale_names = {
+                chord: chord_name_to_scale_names(chord) for chord in chord_names
+            }
+            progression = parse_progression(chart)
+            dominant = chord_name_to_pitches("C7")
+            barrier = threading.Barrier(THREADS)
+
+            def read() -> int:
+                barrier.wait()
+                found = 0
+                for _ in range(20):
+                    for chord in chord_names:
+                        self.assertEqual(chord_name_to_pitches(chord), pitches[chord])
+                        # Registered scales come after the others.
+                        names = chord_name_to_scale_names(chord)
+                        self.assertEqual(
+                            names[: len(scale_names[chord])], scale_names[chord]
+                        )
+                    self.assertEqual(parse_progression(chart), progression)
+                    for quality in new_qualities:
+                        try:
+                            result = chord_name_to_pitches("C" + quality.notation)
+                        except ValueError:
+                            # Not registered yet.
+                            continue
+                        self.assertEqual(result, dominant)
+                        found += 1
+                    for scale in new_scales:
+                        if scale.name in scales.SCALES:
+                            self.assertIn(
+                                "C7", scale_name_to_chord_names("C", scale.name)
+                            )
+                return found
+
+            def write() -> int:
+                barrier.wait()
+                for quality, scale in zip(new_qualities, new_scales):
+                    register_chord_quality(quality)
+                    register_scale(scale)
+                return 0
+
+            futures = [self.executor.submit(write)] + [
+                self.executor.submit(read) for _ in range(THREADS - 1)
+            ]
+            for future in futures:
+                future.result()
+
+            # Every registered entry is visible once registration is done.
+            for quality in new_qualities:
+                self.assertEqual(
+                    chord_name_to_pitches("C" + quality.notation), dominant
+                )
+            self.assertEqual(
+                len(chord_name_to_scale_names("Cx0")),
+                len(chord_name_to_scale_names("C7")),
+            )
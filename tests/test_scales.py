@@ -0,0 +1,77 @@
+import unittest
+
+from pyfrets.scales import (
+    SCALES,
+    chord_name_to_scale_names,
+    scale_name_to_chord_names,
+    scale_name_to_note_names,
+    scale_name_to_pitches,
+)
+
+
+class ScalesTest(unittest.TestCase):
+    def test_scales(self) -> None:
+        scales = {
+            "ionian": ("1", "2", "3", "4", "5", "6", "7"),
+            "dorian": ("1", "2", "b3", "4", "5", "6", "b7"),
+            "lydian": ("1", "2", "3", "#4", "5", "6", "7"),
+            "aeolian": ("1", "2", "b3", "4", "5", "b6", "b7"),
+            "locrian": ("1", "b2", "b3", "4", "b5", "b6", "b7"),
+            "harmonic minor": ("1", "2", "b3", "4", "5", "b6", "7"),
+            "altered": ("1", "b2", "b3", "b4", "b5", "b6", "b7"),
+            "major pentatonic": ("1", "2", "3", "5", "6"),
+            "minor pentatonic": ("1", "b3", "4", "5", "b7"),
+            "blues": ("1", "b3", "4", "b5", "5", "b7"),
+            "whole tone": ("1", "2", "3", "b5", "#5", "b7"),
+            "diminished": ("1", "2", "b3", "4", "b5", "#5", "6", "7"),
+        }
+        for name, intervals in scales.items():
+            with self.subTest(name=name):
+                self.assertEqual(SCALES[name].intervals, intervals)
+
+    def test_chord_name_to_scale_names(self) -> None:
+        self.assertEqual(
+            chord_name_to_scale_names("G7"),
+            [
+                "mixolydian",
+                "phrygian dominant",
+                "lydian dominant",
+                "dominant diminished",
+            ],
+        )
+        self.assertEqual(
+            chord_name_to_scale_names("Am7"),
+            [
+                "dorian",
+                "phrygian",
+                "aeolian",
+                "minor pentatonic",
+                "blues",
+                "dominant diminished",
+            ],
+        )
+        self.assertEqual(chord_name_to_scale_names("C/B"), ["ionian", "lydian"])
+
+    def test_scale_name_to_chord_names(self) -> None:
+        chords = scale_name_to_chord_names("C", "ionian")
+        for chord in ["C", "Dm", "Em", "F", "G", "Am", "Bdim", "G7", "Bm7b5"]:
+            self.assertIn(chord, chords)
+        for chord in ["Cm", "D", "C7", "Bdim7"]:
+            self.assertNotIn(chord, chords)
+
+        chords = scale_name_to_chord_names("A", "minor pentatonic")
+        self.assertEqual(chords[:4], ["Am", "Asus4", "Am7", "Amadd4"])
+
+    def test_scale_name_to_note_names(self) -> None:
+        scales = {
+            ("A", "minor pentatonic"): ["A", "C", "D", "E", "G"],
+            ("D", "dorian"): ["D", "E", "F", "G", "A", "B", "C"],
+            ("Bb", "altered"): ["Bb", "Cb", "Db", "Ebb", "Fb", "Gb", "Ab"],
+            ("E", "blues"): ["E", "G", "A", "Bb", "B", "D"],
+        }
+        for (root, name), notes in scales.items():
+            with self.subTest(root=root, name=name):
+                self.assertEqual(scale_name_to_note_names(root, name), notes)
+
+    def test_scale_name_to_pitches(self) -> None:
+        self.assertEqual(scale_name_to_pitches("A", "blues"), [9, 12, 14, 15, 16, 19])
@@ -0,0 +1,305 @@
+import asyncio
+import concurrent.futures
+import json
+import os
+import unittest
+from typing import Optional
+from unittest import mock
+
+from pyfrets.fretboards import (
+    chord_name_to_fretboard,
+    key_name_to_fretboard,
+    song_to_animated_svg,
+)
+from pyfrets.guitar import Orientation
+from pyfrets.server import MAX_HEADERS, Server
+from pyfrets.songs import Song, strum_song
+
+EXAMPLES_LIBRARY = os.path.join(
+    os.path.dirname(__file__), "..", "examples", "songs.jsonl"
+)
+
+
+async def fetch(
+    port: int,
+    target: str,
+    *,
+    headers: Optional[dict[str, str]] = None,
+    method: str = "GET",
+) -> tuple[int, dict[str, str], bytes]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    request = f"{method} {target} HTTP/1.1\r\nConnection: close\r\n"
+    for name, value in (headers or {}).items():
+        request += f"{name}: {value}\r\n"
+    writer.write((request + "\r\n").encode())
+    data = await reader.read()
+    writer.close()
+    await writer.wait_closed()
+
+    head, _, body = data.partition(b"\r\n\r\n")
+    status_line, *header_lines = head.decode().split("\r\n")
+    response_headers = {}
+    for line in header_lines:
+        name, _, value = line.partition(": ")
+        response_headers[name.lower()] = value
+    return int(status_line.split()[1]), response_headers, body
+
+
+class ServerTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        self.server = Server(
+            cache_size=2, executor=self.executor, library_path=EXAMPLES_LIBRARY
+        )
+        await self.server.start()
+
+    async def asyncTearDown(self) -> None:
+        await self.server.close()
+        self.executor.shutdown()
+
+    async def test_chord_svg(self) -> None:
+        status, headers, body = await fetch(self.server.port, "/chord/Am7.svg")
+        self.assertEqual(status, 200)
+        self.assertEqual(headers["content-type"], "image/svg+xml")
+        self.assertEqual(
+            body.decode(),
+            chord_name_to_fretboard("Am7").dump_svg(orientation=Orientation.LANDSCAPE),
+        )
+
+        status, headers, body = await fetch(
+            self.server.port, "/chord/C%23m7.svg?orientation=portrait&names=1"
+        )
+        self.assertEqual(status, 200)
+        self.assertEqual(
+            body.decode(),
+            chord_name_to_fretboard("C#m7", note_names=True).dump_svg(
+                orientation=Orientation.PORTRAIT
+            ),
+        )
+
+        status, headers, body = await fetch(
+            self.server.port, "/chord/D.svg?tuning=drop+d&capo=2"
+        )
+        self.assertEqual(status, 200)
+        self.assertEqual(
+            body.decode(),
+            chord_name_to_fretboard("D", tuning="drop d", capo=2).dump_svg(
+                orientation=Orientation.LANDSCAPE
+            ),
+        )
+
+    async def test_chord_json(self) -> None:
+        status, headers, body = await fetch(self.server.port, "/chord/C%2FE.json")
+        self.assertEqual(status, 200)
+        self.assertEqual(headers["content-type"], "application/json")
+        self.assertEqual(
+            json.loads(body),
+            {
+                "name": "C/E",
+                "description": "C major triad over E",
+                "note_names": ["E", "C", "E", "G"],
+                "pitches": [-8, 0, 4, 7],
+                "interval_names": None,
+                "scale_names": [
+                    "ionian",
+                    "lydian",
+                    "mixolydian",
+                    "phrygian dominant",
+                    "lydian dominant",
+                    "major pentatonic",
+                    "major blues",
+                    "dominant diminished",
+                ],
+            },
+        )
+
+    async def test_scale_svg(self) -> None:
+        status, headers, body = await fetch(self.server.port, "/scale/e.svg")
+        self.assertEqual(status, 200)
+        self.assertEqual(
+            body.decode(),
+            key_name_to_fretboard("e").dump_svg(orientation=Orientation.LANDSCAPE),
+        )
+
+        status, headers, body = await fetch(
+            self.server.port, "/scale/A.svg?scale=minor+pentatonic"
+        )
+        self.assertEqual(status, 200)
+        self.assertIn(b">\xe2\x99\xad3</text>", body)
+
+    async def test_song_mid(self) -> None:
+        status, headers, body = await fetch(
+            self.server.port, "/song.mid?key=C&chords=I+V&strum=D---&repeat=2"
+        )
+        self.assertEqual(status, 200)
+        self.assertEqual(headers["content-type"], "audio/midi")
+        song = Song(chord_pattern="I V", key="C", strum_pattern="D---")
+        self.assertEqual(body, strum_song(song, repeat=2).dump_midi())
+
+        status, headers, body = await fetch(self.server.port, "/song.mid?name=pop")
+        self.assertEqual(status, 200)
+        song = Song(chord_pattern="I V vi IV", key="C")
+        self.assertEqual(body, strum_song(song).dump_midi())
+
+    async def test_song_svg(self) -> None:
+        status, headers, body = await fetch(
+            self.server.port, "/song.svg?key=C&chords=I+V&capo=3&orientation=portrait"
+        )
+        self.assertEqual(status, 200)
+        self.assertEqual(headers["content-type"], "image/svg+xml")
+        song = Song(chord_pattern="I V", key="C")
+        self.assertEqual(
+            body.decode(),
+            song_to_animated_svg(song, orientation=Orientation.PORTRAIT, capo=3),
+        )
+
+    async def test_errors(self) -> None:
+        for target, expected_status, message in [
+            ("/", 404, b"Not found"),
+            ("/chord/H.svg", 400, b"Could not parse chord notation H"),
+            ("/chord/C%2FE.svg", 400, b"Slash chord C/E requires note names"),
+            ("/chord/C.svg?orientation=sideways", 400, b"Unknown orientation sideways"),
+            ("/scale/H.svg", 404, b"Unknown key H"),
+            ("/scale/C.svg?scale=foo", 400, b"Unknown scale foo"),
+            ("/scale/C.svg?tuning=banjo", 400, b"Unknown tuning banjo"),
+            ("/scale/C.svg?capo=13", 400, b"Capo must be between 0 and 12"),
+            ("/song.mid?name=foo", 404, b"Unknown song foo"),
+            ("/song.mid?key=C", 400, b"Song needs either a chord pattern or sections"),
+            (
+                "/song.mid?key=C&chords=I&repeat=0",
+                400,
+                b"Repeat must be between 1 and 100",
+            ),
+        ]:
+            with self.subTest(target=target):
+                status, headers, body = await fetch(self.server.port, target)
+                self.assertEqual(status, expected_status)
+                self.assertEqual(body, message)
+
+        status, headers, body = await fetch(self.server.port, "/", method="POST")
+        self.assertEqual(status, 405)
+
+        status, headers, body = await fetch(self.server.port, "/" + "a" * 10000)
+        self.assertEqual(status, 400)
+
+        with mock.patch("pyfrets.server.render", side_effect=RuntimeError):
+            status, headers, body = await fetch(self.server.port, "/chord/C.svg")
+        self.assertEqual(status, 500)
+
+        # Failed renders are not cached.
+        status, headers, body = await fetch(self.server.port, "/chord/C.svg")
+        self.assertEqual(status, 200)
+
+    async def test_etag(self) -> None:
+        status, headers, body = await fetch(self.server.port, "/chord/C.svg")
+        self.assertEqual(status, 200)
+        etag = headers["etag"]
+
+        status, headers, body = await fetch(
+            self.server.port, "/chord/C.svg", headers={"If-None-Match": etag}
+        )
+        self.assertEqual(status, 304)
+        self.assertEqual(headers["etag"], etag)
+        self.assertEqual(body, b"")
+
+        status, headers, body = await fetch(
+            self.server.port, "/chord/C.svg", headers={"If-None-Match": '"other"'}
+        )
+        self.assertEqual(status, 200)
+
+    async def test_head(self) -> None:
+        status, headers, body = await fetch(
+            self.server.port, "/chord/C.svg", method="HEAD"
+        )
+        self.assertEqual(status, 200)
+        self.assertGreater(int(headers["content-length"]), 0)
+        self.assertEqual(body, b"")
+
+    async def test_keep_alive(self) -> None:
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.server.port)
+        for _ in range(2):
+            writer.write(b"GET /chord/C.json HTTP/1.1\r\n\r\n")
+            status_line = await reader.readline()
+            self.assertEqual(status_line, b"HTTP/1.1 200 OK\r\n")
+            headers = {}
+            while (line := await reader.readline()) != b"\r\n":
+                name, _, value = line.decode().strip().partition(": ")
+                headers[name] = value
+            self.assertEqual(headers["Connection"], "keep-alive")
+            body = await reader.readexactly(int(headers["Content-Length"]))
+            self.assertEqual(json.loads(body)["name"], "C")
+        writer.close()
+        await writer.wait_closed()
+
+    async def test_bad_requests(self) -> None:
+        # Too many headers.
+        status, headers, body = await fetch(
+            self.server.port,
+            "/chord/C.svg",
+            headers={"X-Header-%d" % idx: "value" for idx in range(MAX_HEADERS)},
+        )
+        self.assertEqual((status, body), (400, b"Bad request"))
+
+        # Headers which never end.
+        with mock.patch("pyfrets.server.HEADERS_TIMEOUT", 0.1):
+            reader, writer = await asyncio.open_connection(
+                "127.0.0.1", self.server.port
+            )
+            writer.write(b"GET /chord/C.json HTTP/1.1\r\nX-Slow: 1\r\n")
+            self.assertEqual(await reader.read(), b"")
+            writer.close()
+            await writer.wait_closed()
+
+        # Request bodies are not read, so the connection is closed rather
+        # than parsing the body as the next request.
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.server.port)
+        body = b"GET /chord/C.json HTTP/1.1\r\n\r\n"
+        writer.write(
+            b"POST / HTTP/1.1\r\nContent-Length: %d\r\n\r\n" % len(body) + body
+        )
+        data = await reader.read()
+        self.assertTrue(data.startswith(b"HTTP/1.1 405 Method Not Allowed\r\n"))
+        self.assertIn(b"Connection: close\r\n", data)
+        self.assertEqual(data.count(b"HTTP/1.1"), 1)
+        writer.close()
+        await writer.wait_closed()
+
+    async def test_cache(self) -> None:
+        for target in ["/chord/C.svg", "/chord/D.svg", "/chord/C.svg", "/chord/E.svg"]:
+            await fetch(self.server.port, target)
+        self.assertEqual((self.server.renders, self.server.cache_hits), (3, 1))
+
+        # The least recently used response was evicted.
+        await fetch(self.server.port, "/chord/D.svg")
+        self.assertEqual((self.server.renders, self.server.cache_hits), (4, 1))
+
+        # Query parameters are normalized.
+        await fetch(self.server.port, "/chord/A.svg?names=1&orientation=portrait")
+        await fetch(self.server.port, "/chord/A.svg?orientation=portrait&names=1")
+        self.assertEqual((self.server.renders, self.server.cache_hits), (5, 2))
+
+    async def test_coalescing(self) -> None:
+        request_key = ("/chord/G7.svg", ())
+        responses = await asyncio.gather(
+            *[self.server.get_response(request_key) for _ in range(10)]
+        )
+        self.assertEqual(len(set(responses)), 1)
+        self.assertEqual((self.server.renders, self.server.coalesced), (1, 9))
+
+        # Concurrent clients also share renders.
+        results = await asyncio.gather(
+            *[fetch(self.server.port, "/chord/D7.svg") for _ in range(10)]
+        )
+        self.assertEqual({status for status, headers, body in results}, {200})
+        self.assertEqual(self.server.renders, 2)
+
+
+class ProcessPoolServerTest(unittest.IsolatedAsyncioTestCase):
+    async def test_render(self) -> None:
+        async with Server(max_workers=2) as server:
+            status, headers, body = await fetch(server.port, "/chord/Am7.svg")
+        self.assertEqual(status, 200)
+        self.assertEqual(
+            body.decode(),
+            chord_name_to_fretboard("Am7").dump_svg(orientation=Orientation.LANDSCAPE),
+        )
@@ -0,0 +1,231 @@
+import io
+import os
+import tempfile
+import unittest
+from fractions import Fraction
+
+from pyfrets.songs import (
+    INDEX_SUFFIX,
+    Section,
+    Song,
+    SongLibrary,
+    build_index,
+    dump_song,
+    load_songs,
+    parse_song,
+    strum_song,
+)
+from pyfrets.tracks import TrackNote
+
+EXAMPLES_LIBRARY = os.path.join(
+    os.path.dirname(__file__), "..", "examples", "songs.jsonl"
+)
+
+
+class SongsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = os.path.join(tmpdir.name, "songs.jsonl")
+
+    def write_library(self, songs: list[Song]) -> None:
+        with open(self.path, "w") as fp:
+            fp.write("# Test songs.\n\n")
+            for song in songs:
+                fp.write(dump_song(song) + "\n")
+
+    def test_parse_song(self) -> None:
+        song = parse_song('{"name": "pop", "key": "C", "chord_pattern": "I V vi IV"}')
+        self.assertEqual(song, Song(chord_pattern="I V vi IV", key="C", name="pop"))
+        self.assertEqual(song.romans, ["I", "V", "vi", "IV"])
+        self.assertEqual(song.chord_names, ["C", "G", "Am", "F"])
+
+    def test_parse_song_sections(self) -> None:
+        song = parse_song(
+            '{"key": "e", "sections": ['
+            '{"name": "verse", "chord_pattern": "i VII", "repeat": 2}, '
+            '{"name": "chorus", "chord_pattern": "III VII7 i"}]}'
+        )
+        self.assertEqual(
+            song.sections,
+            [
+                Section(name="verse", chord_pattern="i VII", repeat=2),
+                Section(name="chorus", chord_pattern="III VII7 i"),
+            ],
+        )
+        self.assertEqual(song.chord_names, ["Em", "D", "Em", "D", "G", "D7", "Em"])
+
+    def test_parse_song_repeats(self) -> None:
+        song = parse_song('{"key": "G", "chord_pattern": "|: I | V :|x3 IV"}')
+        self.assertEqual(song.romans, ["I", "V", "I", "V", "I", "V", "IV"])
+        self.assertEqual(song.chord_names, ["G", "D", "G", "D", "G", "D", "C"])
+
+    def test_parse_song_invalid(self) -> None:
+        lines = {
+            "not json": "Could not parse song: Expecting value: line 1 column 1 "
+            "(char 0)",
+            "[]": "Could not parse song: 'list' object has no attribute 'get'",
+            '{"chord_pattern": "I"}': "Could not parse song: 'key'",
+            '{"key": "H", "chord_pattern": "I"}': "Unknown key H",
+            '{"key": "C", "chord_pattern": "I", "beats_per_minute": 0}': (
+                "Tempo must be positive"
+            ),
+            '{"key": "C", "chord_pattern": "I", "beats_per_minute": "fast"}': (
+                "Could not parse song: beats_per_minute must be of type int"
+            ),
+            '{"key": "C", "chord_pattern": "I", "beats_per_minute": true}': (
+                "Could not parse song: beats_per_minute must be of type int"
+            ),
+            '{"key": ["C"], "chord_pattern": "I"}': (
+                "Could not parse song: key must be of type str"
+            ),
+            '{"key": "C", "chord_pattern": 1}': (
+                "Could not parse song: chord_pattern must be of type str"
+            ),
+            '{"key": "C", "sections": [{"name": "a", "chord_pattern": "I", '
+            '"repeat": "2"}]}': "Could not parse song: Section repeat must be of "
+            "type int",
+            '{"key": "C"}': "Song needs either a chord pattern or sections",
+            '{"key": "C", "sections": [{"name": "a", "chord_pattern": "I", '
+            '"repeat": 0}]}': "Section a must be repeated at least once",
+            '{"key": "C", "sections": [{"name": "a", "chord_pattern": ""}]}': (
+                "Song has no chords"
+            ),
+            '{"key": "C", "sections": [{"name": "a", "chord_pattern": "I", '
+            '"repeat": 3000000}]}': "Section a is repeated more than 100 times",
+            '{"key": "C", "chord_pattern": "|: I :|x3000000"}': (
+                "Chords are repeated more than 100 times"
+            ),
+            '{"key": "C", "sections": [{"name": "a", "chord_pattern": '
+            '"|: I V vi IV :|x100", "repeat": 100}]}': (
+                "Song has more than 10000 chords"
+            ),
+            '{"key": "C", "chord_pattern": "I IX"}': "Could not parse chord "
+            "notation IX (line 1, column 3)",
+            '{"key": "C", "chord_pattern": "|: I"}': "Repeat is never closed "
+            "(line 1, column 1)",
+            '{"key": "C", "chord_pattern": "I", "strum_pattern": "-D"}': (
+                "Strum pattern chunk must start with a strum -D"
+            ),
+            '{"key": "C", "chord_pattern": "I", "strum_pattern": "DX"}': (
+                "Could not parse strum pattern DX"
+            ),
+        }
+        for line, message in lines.items():
+            with self.subTest(line=line):
+                with self.assertRaises(ValueError) as cm:
+                    parse_song(line)
+                self.assertEqual(str(cm.exception), message)
+
+    def test_dump_song(self) -> None:
+        songs = [
+            Song(chord_pattern="I V vi IV", key="C", name="pop"),
+            Song(
+                chord_pattern="",
+                key="F",
+                beats_per_minute=150,
+                strum_pattern="D-DU",
+                name="Hey Jüde",
+                sections=[
+                    Section(name="verse", chord_pattern="I V", repeat=2),
+                    Section(name="chorus", chord_pattern="I7 IV"),
+                ],
+            ),
+        ]
+        for song in songs:
+            with self.subTest(name=song.name):
+                self.assertEqual(parse_song(dump_song(song)), song)
+
+    def test_load_songs(self) -> None:
+        buffer = io.BytesIO(
+            b'{"key": "C", "chord_pattern": "I"}\n'
+            b"\n"
+            b'{"key": "C", "chord_pattern": "I IX"}\n'
+        )
+        songs = load_songs(buffer)
+        self.assertEqual(next(songs).chord_pattern, "I")
+
+        # Songs are parsed lazily.
+        with self.assertRaises(ValueError) as cm:
+            next(songs)
+        self.assertEqual(
+            str(cm.exception),
+            "Line 3: Could not parse chord notation IX (line 1, column 3)",
+        )
+
+    def test_library(self) -> None:
+        songs = [
+            Song(chord_pattern="I IV V", key=key, name=f"song-{idx}")
+            for idx, key in enumerate(["C", "G", "a", "Eb", "f#"] * 200)
+        ]
+        self.write_library(songs)
+
+        with SongLibrary(self.path) as library:
+            self.assertEqual(library["song-0"], songs[0])
+            self.assertEqual(library["song-999"], songs[999])
+            self.assertIn("song-500", library)
+            self.assertNotIn("song-1000", library)
+            self.assertNotIn(None, library)
+            with self.assertRaises(KeyError):
+                library["song-1000"]
+            self.assertEqual(list(library), songs)
+        self.assertTrue(os.path.exists(self.path + INDEX_SUFFIX))
+
+    def test_library_stale_index(self) -> None:
+        self.write_library([Song(chord_pattern="I", key="C", name="old")])
+        build_index(self.path)
+        self.assertEqual(
+            sorted(os.listdir(os.path.dirname(self.path))),
+            ["songs.jsonl", "songs.jsonl" + INDEX_SUFFIX],
+        )
+
+        self.write_library(
+            [
+                Song(chord_pattern="I IV", key="C", name="new"),
+                Song(chord_pattern="I", key="C", name="old"),
+            ]
+        )
+        with SongLibrary(self.path) as library:
+            self.assertEqual(library["old"].chord_pattern, "I")
+            self.assertEqual(library["new"].chord_pattern, "I IV")
+
+    def test_build_index_invalid(self) -> None:
+        contents = {
+            '{"key": "C", "chord_pattern": "I"}\n': "Line 1: Song has no name",
+            '{"name": 1, "key": "C", "chord_pattern": "I"}\n': (
+                "Line 1: Song name must be a string"
+            ),
+            '{"name": "a"}\n{"name": "a"}\n': "Line 2: Duplicate song name a",
+        }
+        for content, message in contents.items():
+            with self.subTest(content=content):
+                with open(self.path, "w") as fp:
+                    fp.write(content)
+                with self.assertRaises(ValueError) as cm:
+                    build_index(self.path)
+                self.assertEqual(str(cm.exception), message)
+
+    def test_examples_library(self) -> None:
+        with open(EXAMPLES_LIBRARY, "rb") as fp:
+            names = [song.name for song in load_songs(fp)]
+        self.assertIn("heyjude", names)
+        self.assertEqual(len(names), len(set(names)))
+
+    def test_strum_song(self) -> None:
+        song = Song(chord_pattern="I V", key="C", strum_pattern="D-DU/D---")
+        track = strum_song(song, repeat=2)
+        self.assertEqual(
+            [[note.pitch for note in chord] for chord in track._chords],
+            [[48, 52, 55]] * 3 + [[55, 59, 62]] + [[48, 52, 55]] * 3 + [[55, 59, 62]],
+        )
+        self.assertEqual(
+            [chord[0].duration for chord in track._chords[:4]],
+            [Fraction(1), Fraction(1, 2), Fraction(1, 2), Fraction(2)],
+        )
+        self.assertEqual(track._chords[3][0], TrackNote(duration=Fraction(2), pitch=55))
+
+        track = strum_song(song, voice_leading=True)
+        self.assertEqual(
+            [[note.pitch for note in chord] for chord in track._chords],
+            [[48, 52, 55]] * 3 + [[47, 50, 55]],
+        )
@@ -0,0 +1,70 @@
+import sys
+import unittest
+from unittest import mock
+
+from pyfrets import _tables
+from pyfrets._build_tables import (
+    TABLES_PATH,
+    build_chord_table,
+    build_key_table,
+    render_tables,
+)
+from pyfrets.chords import (
+    _get_chord_table,
+    chord_name_to_interval_names,
+    chord_name_to_note_names,
+    chord_name_to_pitches,
+)
+from pyfrets.notes import Key, _get_key_table
+
+
+class TablesTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.addCleanup(self.clear_caches)
+        self.clear_caches()
+
+    def clear_caches(self) -> None:
+        _get_chord_table.cache_clear()
+        _get_key_table.cache_clear()
+        Key._instances.clear()
+
+    def test_up_to_date(self) -> None:
+        with open(TABLES_PATH) as fp:
+            self.assertEqual(
+                fp.read(),
+                render_tables(),
+                "Run `python -m pyfrets._build_tables` to update the tables",
+            )
+
+    def test_loaded(self) -> None:
+        self.assertEqual(_get_chord_table(), build_chord_table())
+        self.assertEqual(_get_key_table(), build_key_table())
+        self.assertEqual(len(_get_chord_table()), 21 * 30)
+        self.assertEqual(len(_get_key_table()), 30)
+
+    def test_missing(self) -> None:
+        with mock.patch.dict(sys.modules, {"pyfrets._tables": None}):
+            self.assertEqual(_get_chord_table(), {})
+            self.assertEqual(_get_key_table(), {})
+
+            self.assertEqual(chord_name_to_note_names("Dm7"), ["D", "F", "A", "C"])
+            self.assertEqual(Key.get("Bb").note_names[3], "Eb")
+
+    def test_stale(self) -> None:
+        with (
+            mock.patch.object(_tables, "CHORD_INPUTS", ()),
+            mock.patch.object(_tables, "KEY_INPUTS", ()),
+        ):
+            self.assertEqual(_get_chord_table(), {})
+            self.assertEqual(_get_key_table(), {})
+
+    def test_matches_live(self) -> None:
+        for chord in _get_chord_table():
+            with self.subTest(chord=chord):
+                names = chord_name_to_note_names(chord)
+                pitches = chord_name_to_pitches(chord)
+                intervals = chord_name_to_interval_names(chord)
+                with mock.patch.dict(_get_chord_table(), clear=True):
+                    self.assertEqual(chord_name_to_note_names(chord), names)
+                    self.assertEqual(chord_name_to_pitches(chord), pitches)
+                    self.assertEqual(chord_name_to_interval_names(chord), intervals)
@@ -0,0 +1,279 @@
+import io
+import itertools
+import os
+import unittest
+from fractions import Fraction
+
+from pyfrets.songs import Song, load_songs, strum_song
+from pyfrets.tabs import read_tab, write_tab
+from pyfrets.tracks import Track
+
+EXAMPLES_LIBRARY = os.path.join(
+    os.path.dirname(__file__), "..", "examples", "songs.jsonl"
+)
+
+ARPEGGIOS = """\
+e|--------0-------|----------------|
+B|------1---1-----|--------0-------|
+G|----0-------0---|------0---0-----|
+D|--2-----------2-|----0-------0---|
+A|3---------------|--2-----------2-|
+E|----------------|3---------------|
+"""
+
+
+def get_chords(track: Track) -> list[tuple[list[int], Fraction]]:
+    return [([n.pitch for n in chord], chord[0].duration) for chord in track._chords]
+
+
+class TabsTest(unittest.TestCase):
+    def test_write_tab(self) -> None:
+        track = Track(beats_per_minute=120)
+        for pitch in [48, 52, 55, 60, 64, 60, 55, 52, 43, 47, 50, 55, 59, 55, 50, 47]:
+            track.add_notes([pitch], duration=Fraction(1, 2))
+        fp = io.StringIO()
+        write_tab(track, fp)
+        self.assertEqual(fp.getvalue(), ARPEGGIOS)
+
+    def test_write_tab_systems(self) -> None:
+        track = Track(beats_per_minute=120)
+        track.add_notes([52, 59, 64, 69, 73, 78], duration=Fraction(3))
+        track.add_notes([], duration=Fraction(1))
+        track.add_notes([52], duration=Fraction(1))
+        track.add_notes([41], duration=Fraction(1, 4))
+        fp = io.StringIO()
+        write_tab(track, fp, tuning="drop d", capo=2, width=18, beats_per_bar=3)
+        self.assertEqual(
+            fp.getvalue(),
+            "E|12----------|\n"
+            "B|12----------|\n"
+            "G|12----------|\n"
+            "d|12----------|\n"
+            "A|12----------|\n"
+            "D|12----------|\n"
+            "\n"
+            "E|-----|\n"
+            "B|-----|\n"
+            "G|-----|\n"
+            "d|0----|\n"
+            "A|-----|\n"
+            "D|----1|\n",
+        )
+
+    def test_write_tab_positions(self) -> None:
+        track = Track(beats_per_minute=120)
+        track.add_notes([55, 59], duration=Fraction(1))
+        fp = io.StringIO()
+        write_tab(track, fp, positions=[[(17, 2), (16, 3)]], tuning="bass")
+        self.assertEqual(fp.getvalue(), "G|16--|\nD|17--|\nA|----|\nE|----|\n")
+
+        for positions, message in [
+            ([[(17, 2)]], "Positions do not match the notes [55, 59]"),
+            ([[(17, 2), (21, 2)]], "Chord plays string 2 twice"),
+            ([[(17, 2), (0, 4)]], "Position (0, 4) is not on the fretboard"),
+            ([[(17, 2), (15, 3)]], "Position (15, 3) does not play pitch 59"),
+        ]:
+            with self.subTest(positions=positions):
+                with self.assertRaises(ValueError) as cm:
+                    write_tab(track, io.StringIO(), positions=positions, tuning="bass")
+                self.assertEqual(str(cm.exception), message)
+
+    def test_write_tab_octaves(self) -> None:
+        # The chord only fits with two-digit frets filling their columns, so
+        # a note is moved by an octave.
+        track = Track(beats_per_minute=120)
+        track.add_notes([57, 58, 62, 65, 69], duration=Fraction(1, 2))
+        track.add_notes([57, 58, 62, 65, 69], duration=Fraction(1, 2))
+        track.add_notes([64], duration=Fraction(1))
+        fp = io.StringIO()
+        write_tab(track, fp)
+        self.assertEqual(
+            fp.getvalue(),
+            "e|5-5-0---|\n"
+            "B|6-6-----|\n"
+            "G|3-3-----|\n"
+            "D|7-7-----|\n"
+            "A|5-5-----|\n"
+            "E|--------|\n",
+        )
+
+    def test_write_tab_songs(self) -> None:
+        with open(EXAMPLES_LIBRARY, "rb") as fp:
+            songs = list(load_songs(fp))
+        for song, voice_leading in itertools.product(songs, [False, True]):
+            with self.subTest(song=song.name, voice_leading=voice_leading):
+                track = strum_song(song, repeat=4, voice_leading=voice_leading)
+                tab = io.StringIO()
+                write_tab(track, tab)
+                tab.seek(0)
+                self.assertEqual(
+                    [
+                        (sorted(pitch % 12 for pitch in pitches), duration)
+                        for pitches, duration in get_chords(read_tab(tab))
+                    ],
+                    [
+                        (sorted(pitch % 12 for pitch in pitches), duration)
+                        for pitches, duration in get_chords(track)
+                    ],
+                )
+
+    def test_write_tab_errors(self) -> None:
+        track = Track(beats_per_minute=120)
+        track.add_notes([200], duration=Fraction(1))
+        with self.assertRaises(ValueError) as cm:
+            write_tab(track, io.StringIO())
+        self.assertEqual(
+            str(cm.exception), "Could not place pitches [200] on the fretboard"
+        )
+
+        track = Track(beats_per_minute=120)
+        track.add_notes([40], duration=Fraction(1, 3))
+        with self.assertRaises(ValueError) as cm:
+            write_tab(track, io.StringIO())
+        self.assertEqual(
+            str(cm.exception), "Duration 1/3 is not a multiple of the resolution 1/4"
+        )
+
+        track = Track(beats_per_minute=120)
+        track.add_notes([60], duration=Fraction(1, 4))
+        with self.assertRaises(ValueError) as cm:
+            write_tab(track, io.StringIO(), positions=[[(17, 3)]], tuning="bass")
+        self.assertEqual(
+            str(cm.exception), "Duration 1/4 is too short to write {3: '17'}"
+        )
+
+        # Frets which fill their columns cannot be followed by another fret
+        # on the same string.
+        track = Track(beats_per_minute=120)
+        track.add_notes([52], duration=Fraction(1, 2))
+        track.add_notes([43], duration=Fraction(1, 2))
+        with self.assertRaises(ValueError) as cm:
+            write_tab(track, io.StringIO(), positions=[[(12, 0)], [(3, 0)]])
+        self.assertEqual(
+            str(cm.exception), "Duration 1/2 is too short to write {0: '12'}"
+        )
+
+    def test_read_tab(self) -> None:
+        track = read_tab(io.StringIO(ARPEGGIOS), beats_per_minute=90)
+        self.assertEqual(track._beats_per_minute, 90)
+        self.assertEqual(
+            [pitches for pitches, duration in get_chords(track)],
+            [[p] for p in [48, 52, 55, 60, 64, 60, 55, 52]]
+            + [[p] for p in [43, 47, 50, 55, 59, 55, 50, 47]],
+        )
+        self.assertEqual(
+            {duration for pitches, duration in get_chords(track)}, {Fraction(1, 2)}
+        )
+
+    def test_read_tab_rests(self) -> None:
+        lines = [
+            "Intro",
+            "",
+            "e|--0-----|-----|",
+            "B|--------|-----",
+            "G|--------|-2---|",
+            "D|--------|-----|",
+            "A|--------|-----|",
+            "E|--0-----|0----|",
+            "",
+            "  e |--|",
+            "  B |--|",
+            "  G |--|",
+            "  D |--|",
+            "  A |--|",
+            "  E |-3|",
+        ]
+        track = read_tab(lines, capo=1)
+        self.assertEqual(
+            get_chords(track),
+            [
+                ([41, 65], Fraction(6, 4)),
+                ([41], Fraction(1, 4)),
+                ([58], Fraction(5, 4)),
+                ([44], Fraction(1, 4)),
+            ],
+        )
+
+    def test_read_tab_errors(self) -> None:
+        system = ["e|---|", "B|---|", "G|---|", "D|---|", "A|---|", "E|---|"]
+        for lines, message in [
+            (system[:5], "Tab system has 5 strings, expected 6 (line 1, column 1)"),
+            (
+                system[:5] + ["E|-h-|"],
+                "Could not parse tab h (line 6, column 4)",
+            ),
+            (
+                system[:5] + ["E|----|"],
+                "Tab line has a different length (line 6, column 7)",
+            ),
+            (
+                system[:5] + ["E|-|-|"],
+                "Bar is not aligned (line 6, column 4)",
+            ),
+        ]:
+            with self.subTest(lines=lines):
+                with self.assertRaises(ValueError) as cm:
+                    read_tab(lines)
+                self.assertEqual(str(cm.exception), message)
+
+    def test_round_trip(self) -> None:
+        song = Song(
+            chord_pattern="I vi IV V ii7 V7 Imaj7",
+            key="G",
+            name="round-trip",
+            strum_pattern="D-DU-UDU",
+        )
+        track = strum_song(song, repeat=3)
+        for width, resolution in [
+            (80, Fraction(1, 4)),
+            (30, Fraction(1, 4)),
+            (80, Fraction(1, 8)),
+        ]:
+            with self.subTest(width=width, resolution=resolution):
+                fp = io.StringIO()
+                write_tab(track, fp, resolution=resolution, width=width)
+                fp.seek(0)
+                self.assertEqual(
+                    get_chords(read_tab(fp, resolution=resolution)), get_chords(track)
+                )
+
+    def test_round_trip_frets(self) -> None:
+        # Adjacent multi-digit frets, and frets filling their columns
+        # before a bar or a note on another string.
+        track = Track(beats_per_minute=120)
+        for pitches, duration in [
+            ([52], Fraction(1)),
+            ([43], Fraction(1, 2)),
+            ([53], Fraction(1, 2)),
+            ([45], Fraction(1, 2)),
+            ([48], Fraction(1)),
+            ([59], Fraction(1, 2)),
+            ([50, 55], Fraction(1)),
+            ([40], Fraction(1, 4)),
+            ([61], Fraction(1, 2)),
+        ]:
+            track.add_notes(pitches, duration=duration)
+        positions = [
+            [(12, 0)],
+            [(3, 0)],
+            [(13, 0)],
+            [(0, 1)],
+            [(3, 1)],
+            [(14, 1)],
+            [(10, 0), (10, 1)],
+            [(0, 0)],
+            [(11, 2)],
+        ]
+        fp = io.StringIO()
+        write_tab(track, fp, positions=positions, frets=24, width=40)
+        self.assertEqual(
+            fp.getvalue(),
+            "e|----------------|-------|\n"
+            "B|----------------|-------|\n"
+            "G|----------------|-------|\n"
+            "D|----------------|-----11|\n"
+            "A|--------0-3---14|10-----|\n"
+            "E|12--3-13--------|10--0--|\n",
+        )
+        fp.seek(0)
+        self.assertEqual(get_chords(read_tab(fp)), get_chords(track))
@@ -1,4 +1,5 @@
 import io
+import pickle
 import unittest
 from fractions import Fraction
 
@@ -18,6 +19,16 @@ class TracksTest(unittest.TestCase):
             ],
         )
 
+    def test_dump_midi(self) -> None:
+        track = Track(beats_per_minute=100)
+        track.add_notes([48], duration=Fraction(1, 4))
+        self.assertEqual(
+            track.dump_midi(),
+            bytes.fromhex(
+                "4d546864000000060001000101e04d54726b0000001600ff51030927c000c01a009030407880304000ff2f00"
+            ),
+        )
+
     def test_to_midi(self) -> None:
         track = Track(beats_per_minute=100)
         track.add_notes([48], duration=Fraction(1, 4))
@@ -33,3 +44,46 @@ class TracksTest(unittest.TestCase):
                 "4d546864000000060001000101e04d54726b0000001600ff51030927c000c01a009030407880304000ff2f00"
             ),
         )
+
+    def test_to_midi_velocity(self) -> None:
+        track = Track(beats_per_minute=100)
+        track.add_notes([48, 52], duration=Fraction(1, 4), velocity=100)
+        self.assertEqual(
+            track.dump_midi(),
+            bytes.fromhex(
+                "4d546864000000060001000101e04d54726b0000001c00ff51030927c000c01a009030640034647880304000344000ff2f00"
+            ),
+        )
+
+    def test_pickle(self) -> None:
+        track = Track(beats_per_minute=90)
+        track.add_notes([48, 52, 55], duration=Fraction(1, 2))
+        track.add_notes([], duration=Fraction(1))
+        track.add_notes([60], duration=Fraction(1, 3), velocity=100)
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(protocol=protocol):
+                other = pickle.loads(pickle.dumps(track, protocol=protocol))
+                self.assertEqual(other._beats_per_minute, 90)
+                self.assertEqual(other._chords, track._chords)
+
+        buffers: list[pickle.PickleBuffer] = []
+        data = pickle.dumps(track, protocol=5, buffer_callback=buffers.append)
+        self.assertEqual(
+            [bytes(buffer.raw()) for buffer in buffers],
+            [b"\x03\x00\x01", b"\x00\x00\x00\x01", b"047<", b"@@@d"],
+        )
+        self.assertEqual(pickle.loads(data, buffers=buffers)._chords, track._chords)
+
+    def test_pickle_large_values(self) -> None:
+        track = Track(beats_per_minute=90)
+        track.add_notes([300], duration=Fraction(1, 2))
+        for idx in range(300):
+            track.add_notes([48], duration=Fraction(1, idx + 1))
+        other = pickle.loads(pickle.dumps(track, protocol=5))
+        self.assertEqual(other._chords, track._chords)
+
+        track = Track(beats_per_minute=90)
+        for idx in range(300):
+            track.add_notes([48], duration=Fraction(1, idx + 1))
+        other = pickle.loads(pickle.dumps(track, protocol=5))
+        self.assertEqual(other._chords, track._chords)